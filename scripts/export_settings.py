@@ -17,6 +17,7 @@ from infrastructure.settings import (  # noqa: E402
     OutboxWorkerSettings,
     IAMSettings,
     OIDCSettings,
+    GraphMutationSettings,
 )
 
 
@@ -86,6 +87,7 @@ def export_settings():
         CORSSettings,
         IAMSettings,
         OutboxWorkerSettings,
+        GraphMutationSettings,
     ]
 
     data = {cls.__name__: get_model_metadata(cls) for cls in classes}
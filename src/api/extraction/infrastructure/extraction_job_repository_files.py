@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -12,9 +13,12 @@ from extraction.domain.extraction_job import (
     ExtractionTargetInstance,
 )
 from extraction.domain.prepared_job_package_source import PreparedJobPackageSource
-from shared_kernel.job_package.path_safety import validate_zip_entry_name
-from shared_kernel.job_package.reader import JobPackageReader
-from shared_kernel.job_package.value_objects import JobPackageId
+from shared_kernel.job_package.reader import (
+    JobPackageReader,
+    PackageExtraction,
+    extract_packages,
+)
+from shared_kernel.job_package.value_objects import ContentRef, JobPackageId
 
 _INSTANCE_PATH_PROPERTY_KEYS = (
     "config_file_path",
@@ -115,6 +119,26 @@ def _path_matches(requested: str, candidate: str) -> bool:
     return False
 
 
+def _changed_files(reader: JobPackageReader) -> Iterator[tuple[str, ContentRef]]:
+    """Yield ``(path, content_ref)`` for every changeset entry carrying content."""
+    for change in reader.iter_changeset():
+        if change.content_ref is None or not change.path:
+            continue
+        yield str(change.path), change.content_ref
+
+
+def _sample_paths(
+    extractions: list[PackageExtraction], repository_folders: list[str]
+) -> list[str]:
+    return [
+        f"{repository_folder}/{path}"
+        for extraction, repository_folder in zip(
+            extractions, repository_folders, strict=True
+        )
+        for path, _ in extraction.targets
+    ][:12]
+
+
 def materialize_all_repository_files(
     *,
     repository_files_dir: Path,
@@ -122,10 +146,10 @@ def materialize_all_repository_files(
     job_packages: tuple[PreparedJobPackageSource, ...],
 ) -> RepositoryFilesMaterializationResult:
     """Unpack every JobPackage changeset entry into repository-files/."""
-    files_written = 0
     packages_found = 0
     packages_missing: list[str] = []
-    sample_paths: list[str] = []
+    extractions: list[PackageExtraction] = []
+    repository_folders: list[str] = []
 
     for source in job_packages:
         archive_path = (
@@ -134,21 +158,22 @@ def materialize_all_repository_files(
         if not archive_path.is_file():
             packages_missing.append(source.package_id)
             continue
-        reader = JobPackageReader(archive_path)
-        manifest = reader.read_manifest()
-        if manifest.entry_count <= 0:
-            continue
-        packages_found += 1
-        for change in reader.iter_changeset():
-            if change.content_ref is None or not change.path:
+        with JobPackageReader(archive_path) as reader:
+            manifest = reader.read_manifest()
+            if manifest.entry_count <= 0:
                 continue
-            validate_zip_entry_name(change.path)
-            output_path = repository_files_dir / source.repository_folder / change.path
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            output_path.write_bytes(reader.read_content(change.content_ref))
-            files_written += 1
-            if len(sample_paths) < 12:
-                sample_paths.append(f"{source.repository_folder}/{change.path}")
+            packages_found += 1
+            targets = tuple(_changed_files(reader))
+        extractions.append(
+            PackageExtraction(
+                archive_path=archive_path,
+                targets=targets,
+                dest=repository_files_dir / source.repository_folder,
+            )
+        )
+        repository_folders.append(source.repository_folder)
+
+    files_written = sum(extract_packages(extractions))
 
     warnings: list[str] = []
     if job_packages and files_written == 0:
@@ -168,7 +193,7 @@ def materialize_all_repository_files(
         packages_requested=len(job_packages),
         packages_found=packages_found,
         packages_missing=tuple(packages_missing),
-        sample_paths=tuple(sample_paths),
+        sample_paths=tuple(_sample_paths(extractions, repository_folders)),
         warnings=tuple(warnings),
     )
 
@@ -184,11 +209,11 @@ def materialize_instance_repository_paths(
     if not paths:
         return RepositoryFilesMaterializationResult()
 
-    files_written = 0
     packages_found = 0
     packages_missing: list[str] = []
     paths_not_found = set(paths)
-    sample_paths: list[str] = []
+    extractions: list[PackageExtraction] = []
+    repository_folders: list[str] = []
 
     for source in job_packages:
         archive_path = (
@@ -197,29 +222,32 @@ def materialize_instance_repository_paths(
         if not archive_path.is_file():
             packages_missing.append(source.package_id)
             continue
-        reader = JobPackageReader(archive_path)
         packages_found += 1
-        for change in reader.iter_changeset():
-            if change.content_ref is None or not change.path:
-                continue
-            matched = next(
-                (
-                    requested
-                    for requested in paths
-                    if _path_matches(requested, str(change.path))
-                ),
-                None,
+        targets: list[tuple[str, ContentRef]] = []
+        with JobPackageReader(archive_path) as reader:
+            for path, content_ref in _changed_files(reader):
+                matched = next(
+                    (
+                        requested
+                        for requested in paths
+                        if _path_matches(requested, path)
+                    ),
+                    None,
+                )
+                if matched is None:
+                    continue
+                targets.append((path, content_ref))
+                paths_not_found.discard(matched)
+        extractions.append(
+            PackageExtraction(
+                archive_path=archive_path,
+                targets=tuple(targets),
+                dest=repository_files_dir / source.repository_folder,
             )
-            if matched is None:
-                continue
-            validate_zip_entry_name(change.path)
-            output_path = repository_files_dir / source.repository_folder / change.path
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            output_path.write_bytes(reader.read_content(change.content_ref))
-            files_written += 1
-            paths_not_found.discard(matched)
-            if len(sample_paths) < 12:
-                sample_paths.append(f"{source.repository_folder}/{change.path}")
+        )
+        repository_folders.append(source.repository_folder)
+
+    files_written = sum(extract_packages(extractions))
 
     warnings: list[str] = []
     if paths_not_found:
@@ -236,7 +264,7 @@ def materialize_instance_repository_paths(
         packages_missing=tuple(packages_missing),
         paths_requested=paths,
         paths_not_found=tuple(sorted(paths_not_found)),
-        sample_paths=tuple(sample_paths),
+        sample_paths=tuple(_sample_paths(extractions, repository_folders)),
         warnings=tuple(warnings),
     )
 
@@ -248,9 +276,9 @@ def materialize_target_files(
     target_files: tuple[ExtractionTargetFile, ...],
     packages_by_id: dict[str, PreparedJobPackageSource],
 ) -> RepositoryFilesMaterializationResult:
-    files_written = 0
     packages_missing: list[str] = []
-    sample_paths: list[str] = []
+    # Target paths grouped by package, so each changeset is scanned once
+    paths_by_package: dict[str, list[str]] = {}
 
     for target_file in target_files:
         source = packages_by_id.get(target_file.package_id)
@@ -262,27 +290,51 @@ def materialize_target_files(
         if not archive_path.is_file():
             packages_missing.append(target_file.package_id)
             continue
-        reader = JobPackageReader(archive_path)
-        for change in reader.iter_changeset():
-            if change.path != target_file.path or change.content_ref is None:
-                continue
-            validate_zip_entry_name(change.path)
-            output_path = repository_files_dir / source.repository_folder / change.path
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            output_path.write_bytes(reader.read_content(change.content_ref))
-            files_written += 1
-            sample_paths.append(f"{source.repository_folder}/{change.path}")
-            break
+        paths_by_package.setdefault(source.package_id, []).append(target_file.path)
+
+    extractions: list[PackageExtraction] = []
+    repository_folders: list[str] = []
+    for package_id, requested in paths_by_package.items():
+        source = packages_by_id[package_id]
+        archive_path = (
+            job_package_work_dir / JobPackageId(value=package_id).archive_name()
+        )
+        wanted = set(requested)
+        found: dict[str, ContentRef] = {}
+        with JobPackageReader(archive_path) as reader:
+            for path, content_ref in _changed_files(reader):
+                if path in wanted and path not in found:
+                    found[path] = content_ref
+                    if len(found) == len(wanted):
+                        break
+        extractions.append(
+            PackageExtraction(
+                archive_path=archive_path,
+                targets=tuple(
+                    (path, found[path])
+                    for path in dict.fromkeys(requested)
+                    if path in found
+                ),
+                dest=repository_files_dir / source.repository_folder,
+            )
+        )
+        repository_folders.append(source.repository_folder)
 
     return RepositoryFilesMaterializationResult(
-        files_written=files_written,
+        files_written=sum(extract_packages(extractions)),
         packages_requested=len(
             {target_file.package_id for target_file in target_files}
         ),
         packages_found=len({target_file.package_id for target_file in target_files})
         - len(packages_missing),
         packages_missing=tuple(packages_missing),
-        sample_paths=tuple(sample_paths),
+        sample_paths=tuple(
+            f"{repository_folder}/{path}"
+            for extraction, repository_folder in zip(
+                extractions, repository_folders, strict=True
+            )
+            for path, _ in extraction.targets
+        ),
     )
 
 
@@ -13,7 +13,7 @@ from extraction.infrastructure.extraction_job_repository_files import (
 )
 from shared_kernel.job_package.path_safety import validate_zip_entry_name
 from shared_kernel.job_package.reader import JobPackageReader
-from shared_kernel.job_package.value_objects import JobPackageId
+from shared_kernel.job_package.value_objects import ContentRef, JobPackageId
 
 BaselineContentFetcher = Callable[[str, str, str], Awaitable[bytes | None]]
 
@@ -70,35 +70,59 @@ def _write_text(path: Path, content: str) -> None:
     _write_bytes(path, content.encode("utf-8"))
 
 
-def _materialize_head_from_job_package(
+def _materialize_heads_from_job_packages(
     *,
     repository_files_dir: Path,
     job_package_work_dir: Path,
-    target_file: ExtractionTargetFile,
-    source: PreparedJobPackageSource,
-) -> bool:
-    head_commit = target_file.head_commit
-    if not head_commit:
-        return False
-    archive_path = (
-        job_package_work_dir / JobPackageId(value=source.package_id).archive_name()
-    )
-    if not archive_path.is_file():
-        return False
-    reader = JobPackageReader(archive_path)
-    for change in reader.iter_changeset():
-        if change.path != target_file.path or change.content_ref is None:
+    target_files: tuple[ExtractionTargetFile, ...],
+    packages_by_id: dict[str, PreparedJobPackageSource],
+) -> set[str]:
+    """Write the HEAD snapshot of every target file found in its JobPackage.
+
+    Each package is opened once and all of its targets are streamed with
+    :meth:`JobPackageReader.extract_many`.
+
+    Returns:
+        The written paths, relative to ``repository_files_dir``.
+    """
+    heads_by_package: dict[str, dict[str, str]] = {}
+    for target_file in target_files:
+        source = packages_by_id.get(target_file.package_id)
+        status = (target_file.change_status or "modified").lower()
+        if source is None or status not in _HEAD_STATUSES:
+            continue
+        if not target_file.head_commit:
             continue
-        validate_zip_entry_name(change.path)
-        output_path = maintenance_head_path(
-            repository_files_dir=repository_files_dir,
-            head_commit=head_commit,
+        relative_path = maintenance_head_path(
+            repository_files_dir=Path(),
+            head_commit=target_file.head_commit,
             repository_folder=source.repository_folder,
             path=target_file.path,
+        ).as_posix()
+        heads_by_package.setdefault(source.package_id, {})[relative_path] = (
+            target_file.path
         )
-        _write_bytes(output_path, reader.read_content(change.content_ref))
-        return True
-    return False
+
+    written: set[str] = set()
+    for package_id, heads in heads_by_package.items():
+        archive_path = (
+            job_package_work_dir / JobPackageId(value=package_id).archive_name()
+        )
+        if not archive_path.is_file():
+            continue
+        with JobPackageReader(archive_path) as reader:
+            content_refs: dict[str, ContentRef] = {}
+            for change in reader.iter_changeset():
+                if change.content_ref is not None:
+                    content_refs.setdefault(change.path, change.content_ref)
+            targets = [
+                (relative_path, content_refs[path])
+                for relative_path, path in heads.items()
+                if path in content_refs
+            ]
+            reader.extract_many(targets, repository_files_dir)
+        written.update(relative_path for relative_path, _ in targets)
+    return written
 
 
 async def materialize_maintenance_target_files(
@@ -114,6 +138,12 @@ async def materialize_maintenance_target_files(
     packages_missing: list[str] = []
     sample_paths: list[str] = []
     warnings: list[str] = []
+    heads_written = _materialize_heads_from_job_packages(
+        repository_files_dir=repository_files_dir,
+        job_package_work_dir=job_package_work_dir,
+        target_files=target_files,
+        packages_by_id=packages_by_id,
+    )
 
     for target_file in target_files:
         source = packages_by_id.get(target_file.package_id)
@@ -135,11 +165,10 @@ async def materialize_maintenance_target_files(
             )
             if not archive_path.is_file():
                 packages_missing.append(target_file.package_id)
-            elif head_commit and _materialize_head_from_job_package(
-                repository_files_dir=repository_files_dir,
-                job_package_work_dir=job_package_work_dir,
-                target_file=target_file,
-                source=source,
+            elif (
+                head_commit
+                and f"{head_commit}/{source.repository_folder}/{target_file.path}"
+                in heads_written
             ):
                 files_written += 1
                 sample_paths.append(
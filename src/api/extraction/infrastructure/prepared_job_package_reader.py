@@ -16,7 +16,11 @@ from shared_kernel.job_package.value_objects import JobPackageId
 
 
 class SqlPreparedJobPackageReader:
-    """Reads latest materializable JobPackage snapshots from outbox events for one KG."""
+    """Reads latest materializable JobPackage snapshots from outbox events for one KG.
+
+    Processed events are moved to ``outbox_archive`` by outbox retention, so
+    both tables are read.
+    """
 
     def __init__(
         self,
@@ -42,7 +46,11 @@ class SqlPreparedJobPackageReader:
                   payload->>'job_package_id' AS job_package_id,
                   ds.name AS data_source_name,
                   occurred_at
-                FROM outbox o
+                FROM (
+                  SELECT event_type, payload, occurred_at FROM outbox
+                  UNION ALL
+                  SELECT event_type, payload, occurred_at FROM outbox_archive
+                ) o
                 LEFT JOIN data_sources ds ON ds.id = payload->>'data_source_id'
                 WHERE o.event_type IN ('IngestionPrepared', 'JobPackageProduced')
                   AND payload->>'knowledge_graph_id' = :knowledge_graph_id
@@ -3,10 +3,8 @@
 from __future__ import annotations
 
 from pathlib import Path
-import zipfile
 
 from extraction.ports.services import ExtractionRuntimeContext
-from shared_kernel.job_package.path_safety import validate_zip_entry_name
 from shared_kernel.job_package.reader import JobPackageReader
 from shared_kernel.job_package.value_objects import JobPackageId
 
@@ -30,19 +28,18 @@ class FilesystemExtractionRuntimeContextBuilder:
         ingestion_context_dir.mkdir(parents=True, exist_ok=True)
         repository_files_dir.mkdir(parents=True, exist_ok=True)
 
-        with zipfile.ZipFile(archive_path) as archive:
-            for entry_name in archive.namelist():
-                validate_zip_entry_name(entry_name)
-                archive.extract(entry_name, path=ingestion_context_dir)
-
-        # Materialize repository-style files for agent-friendly traversal.
-        for change in reader.iter_changeset():
-            if change.content_ref is None or not change.path:
-                continue
-            validate_zip_entry_name(change.path)
-            output_path = repository_files_dir / change.path
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            output_path.write_bytes(reader.read_content(change.content_ref))
+        with reader:
+            reader.extract_archive(ingestion_context_dir)
+
+            # Materialize repository-style files for agent-friendly traversal.
+            reader.extract_many(
+                (
+                    (change.path, change.content_ref)
+                    for change in reader.iter_changeset()
+                    if change.content_ref is not None and change.path
+                ),
+                repository_files_dir,
+            )
 
         return ExtractionRuntimeContext(
             ingestion_context_dir=str(ingestion_context_dir),
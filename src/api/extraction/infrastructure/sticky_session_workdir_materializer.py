@@ -6,7 +6,6 @@ import json
 import re
 from pathlib import Path
 import shutil
-import zipfile
 
 from extraction.domain.prepared_job_package_source import PreparedJobPackageSource
 from extraction.infrastructure.extraction_job_helpers import (
@@ -22,7 +21,6 @@ from extraction.infrastructure.instance_generator_templates import (
 from extraction.infrastructure.sticky_session_workspace_permissions import (
     ensure_agent_workspace_permissions,
 )
-from shared_kernel.job_package.path_safety import validate_zip_entry_name
 from shared_kernel.job_package.reader import JobPackageReader
 from shared_kernel.job_package.value_objects import JobPackageId
 
@@ -82,29 +80,23 @@ class StickySessionWorkdirMaterializer:
             )
             if not archive_path.exists():
                 continue
-            reader = JobPackageReader(archive_path)
-            manifest = reader.read_manifest()
-            if manifest.entry_count <= 0:
-                continue
-
-            package_dir = ingestion_context_dir / source.package_id
-            package_dir.mkdir(parents=True, exist_ok=True)
-            with zipfile.ZipFile(archive_path) as archive:
-                for entry_name in archive.namelist():
-                    validate_zip_entry_name(entry_name)
-                    archive.extract(entry_name, path=package_dir)
-
             repository_folder = source.repository_folder
-            sample_paths: list[str] = []
-            for change in reader.iter_changeset():
-                if change.content_ref is None or not change.path:
+            with JobPackageReader(archive_path) as reader:
+                manifest = reader.read_manifest()
+                if manifest.entry_count <= 0:
                     continue
-                validate_zip_entry_name(change.path)
-                output_path = repository_files_dir / repository_folder / change.path
-                output_path.parent.mkdir(parents=True, exist_ok=True)
-                output_path.write_bytes(reader.read_content(change.content_ref))
-                if len(sample_paths) < 8:
-                    sample_paths.append(change.path)
+
+                package_dir = ingestion_context_dir / source.package_id
+                package_dir.mkdir(parents=True, exist_ok=True)
+                reader.extract_archive(package_dir)
+
+                targets = [
+                    (change.path, change.content_ref)
+                    for change in reader.iter_changeset()
+                    if change.content_ref is not None and change.path
+                ]
+                reader.extract_many(targets, repository_files_dir / repository_folder)
+            sample_paths = [path for path, _ in targets[:8]]
 
             index_sources.append(
                 {
@@ -85,6 +85,7 @@ class GraphMutationService:
         self,
         operations: list[MutationOperation],
         knowledge_graph_id: str | None = None,
+        resume_from: int = 0,
     ) -> MutationResult:
         """Apply a batch of mutation operations.
 
@@ -102,6 +103,9 @@ class GraphMutationService:
             knowledge_graph_id: Optional KnowledgeGraph ID to stamp on all CREATE/UPDATE
                 ops. When provided, the system enforces this value — caller-supplied
                 knowledge_graph_id values in set_properties are overwritten.
+            resume_from: Number of sorted operations already committed by an
+                earlier chunked apply of the same operations; passed through
+                to the mutation applier, which skips them.
 
         Returns:
             MutationResult with success status and operation count.
@@ -236,7 +240,9 @@ class GraphMutationService:
         del operations
 
         # Delegate to mutation applier
-        result = self._mutation_applier.apply_batch(refined_ops)
+        result = self._mutation_applier.apply_batch(
+            refined_ops, resume_from=resume_from
+        )
 
         # Schema learning: Only discover optional properties if mutations succeeded
         if result.success:
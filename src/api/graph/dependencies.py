@@ -38,7 +38,10 @@ from graph.ports.repositories import ITypeDefinitionRepository
 from infrastructure.database.connection import ConnectionFactory
 from infrastructure.database.connection_pool import ConnectionPool
 from infrastructure.dependencies import get_age_connection_pool
-from infrastructure.settings import get_database_settings
+from infrastructure.settings import (
+    get_database_settings,
+    get_graph_mutation_settings,
+)
 
 
 def get_tenant_graph_name(current_user: CurrentUser) -> str:
@@ -171,7 +174,11 @@ def get_mutation_applier(
     """
     # AgeBulkLoadingStrategy creates its own AgeIndexingStrategy by default
     strategy = AgeBulkLoadingStrategy()
-    return MutationApplier(client=client, bulk_loading_strategy=strategy)
+    return MutationApplier(
+        client=client,
+        bulk_loading_strategy=strategy,
+        chunk_size=get_graph_mutation_settings().chunk_size,
+    )
 
 
 @lru_cache
@@ -6,17 +6,26 @@ and direct SQL INSERT/UPDATE operations.
 Public API:
     - AgeBulkLoadingStrategy: Main bulk loading orchestrator
     - AgeIndexingStrategy: Transactional index creation for AGE labels
+    - GraphidLookupMode: Edge endpoint graphid resolution mode
+    - LabelCatalogCache: Process-wide cache of label catalog metadata
+    - get_shared_label_cache: Accessor for the shared LabelCatalogCache
     - validate_label_name: Label name validation utility
     - compute_stable_hash: Stable hash for advisory locks
 """
 
 from .indexing import AgeIndexingStrategy
+from .label_cache import LabelCatalogCache, LabelMetadata, get_shared_label_cache
+from .staging import GraphidLookupMode
 from .strategy import AgeBulkLoadingStrategy
 from .utils import compute_stable_hash, validate_label_name
 
 __all__ = [
     "AgeBulkLoadingStrategy",
     "AgeIndexingStrategy",
+    "GraphidLookupMode",
+    "LabelCatalogCache",
+    "LabelMetadata",
+    "get_shared_label_cache",
     "validate_label_name",
     "compute_stable_hash",
 ]
@@ -0,0 +1,59 @@
+"""Streaming source for PostgreSQL COPY FROM.
+
+Wraps a lazy iterator of COPY-formatted rows in the minimal file-like
+interface that ``cursor.copy_from`` reads from, so rows are encoded chunk by
+chunk while earlier chunks are already being sent to the server, instead of
+materializing the whole batch in a ``StringIO`` first.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+
+# Roughly the default Linux TCP send buffer: each read() hands libpq about
+# one socket buffer's worth of data.
+COPY_CHUNK_SIZE = 64 * 1024
+
+
+class CopyRowStream:
+    """Read-only, file-like view over an iterator of COPY rows.
+
+    Rows are pulled from the iterator only as ``read()`` needs them, so peak
+    memory is bounded by one chunk rather than by the whole batch.
+
+    Args:
+        rows: Iterable of complete, already-escaped COPY rows (each ending
+            with a newline)
+    """
+
+    def __init__(self, rows: Iterable[str]):
+        self._rows: Iterator[str] = iter(rows)
+        self._pending: list[str] = []
+        self._pending_len = 0
+        self._exhausted = False
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> str:
+        """Return up to ``size`` characters (everything left if negative).
+
+        An empty string signals end of data, as for regular files.
+        """
+        while not self._exhausted and (size < 0 or self._pending_len < size):
+            row = next(self._rows, None)
+            if row is None:
+                self._exhausted = True
+                break
+            self._pending.append(row)
+            self._pending_len += len(row)
+
+        data = "".join(self._pending)
+        if 0 <= size < len(data):
+            data, rest = data[:size], data[size:]
+            self._pending = [rest]
+            self._pending_len = len(rest)
+        else:
+            self._pending = []
+            self._pending_len = 0
+        return data
@@ -176,17 +176,22 @@ class AgeIndexingStrategy(TransactionalIndexingProtocol):
         Returns:
             Number of indexes created
         """
+        if not indexes:
+            return 0
+
+        # Probe the catalog once for all of the label's indexes
+        cursor.execute(
+            """
+            SELECT indexname FROM pg_indexes
+            WHERE schemaname = %s AND indexname IN %s
+            """,
+            (graph_name, tuple(idx["name"] for idx in indexes)),
+        )
+        existing = {row[0] for row in cursor.fetchall()}
+
         created = 0
         for idx in indexes:
-            # Check if index already exists
-            cursor.execute(
-                """
-                SELECT 1 FROM pg_indexes
-                WHERE schemaname = %s AND indexname = %s
-                """,
-                (graph_name, idx["name"]),
-            )
-            if cursor.fetchone() is not None:
+            if idx["name"] in existing:
                 continue
 
             # Create the index
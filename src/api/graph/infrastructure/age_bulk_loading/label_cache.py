@@ -0,0 +1,109 @@
+"""Process-wide cache of AGE label catalog metadata.
+
+Every CREATE batch needs the label id and sequence name of each label it
+touches.  With thousands of labels per tenant graph, reading them from
+``ag_catalog.ag_label`` on every batch adds hundreds of catalog round trips.
+The cache keeps that metadata per graph and is shared by every
+``AgeBulkLoadingStrategy`` in the process.
+
+Label ids and sequence names never change for the lifetime of a label, so the
+only events that make an entry stale are label creation (a new label is not
+yet cached) and DDL that drops or recreates labels.  Callers invalidate the
+graph's entry in both cases; the next lookup reloads the full catalog for the
+graph in one query.
+
+Invalidation is local to the process, so every entry is also keyed by the
+graph's id from ``ag_catalog.ag_graph``.  A graph dropped and recreated by
+another replica gets a new id, and lookups with the new id miss.
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class LabelMetadata:
+    """Catalog metadata for a single AGE label.
+
+    Attributes:
+        name: Label name (also the label table name)
+        label_id: AGE label id used to compute graphids
+        seq_name: Name of the label's id sequence
+        kind: "v" for vertex labels, "e" for edge labels
+    """
+
+    name: str
+    label_id: int
+    seq_name: str
+    kind: str
+
+
+class LabelCatalogCache:
+    """Thread-safe per-graph cache of ``LabelMetadata``.
+
+    A graph is either fully loaded (every label present in the catalog at
+    load time is cached) or absent.  This lets a lookup distinguish "label
+    does not exist" from "label not cached" without another catalog query.
+    Each entry remembers the graph id it was loaded for; a lookup with a
+    different id is a miss.
+    """
+
+    def __init__(self) -> None:
+        self._graphs: dict[str, tuple[int, dict[str, LabelMetadata]]] = {}
+        self._lock = threading.Lock()
+
+    def get_graph(
+        self, graph_name: str, graph_id: int
+    ) -> dict[str, LabelMetadata] | None:
+        """Return the cached labels for a graph, or None if not loaded.
+
+        Args:
+            graph_name: Graph name
+            graph_id: Current id of the graph in ``ag_catalog.ag_graph``
+
+        Returns:
+            Mapping of label name to metadata, or None on a cache miss
+        """
+        with self._lock:
+            entry = self._graphs.get(graph_name)
+            if entry is None or entry[0] != graph_id:
+                return None
+            return dict(entry[1])
+
+    def store_graph(
+        self, graph_name: str, graph_id: int, labels: list[LabelMetadata]
+    ) -> None:
+        """Cache the complete label catalog of a graph.
+
+        Args:
+            graph_name: Graph name
+            graph_id: Id of the graph the labels were read from
+            labels: Every label currently present in the graph
+        """
+        with self._lock:
+            self._graphs[graph_name] = (
+                graph_id,
+                {label.name: label for label in labels},
+            )
+
+    def invalidate(self, graph_name: str | None = None) -> None:
+        """Drop cached labels for one graph, or for every graph.
+
+        Args:
+            graph_name: Graph to invalidate; None clears the whole cache
+        """
+        with self._lock:
+            if graph_name is None:
+                self._graphs.clear()
+            else:
+                self._graphs.pop(graph_name, None)
+
+
+_shared_label_cache = LabelCatalogCache()
+
+
+def get_shared_label_cache() -> LabelCatalogCache:
+    """Return the process-wide label catalog cache."""
+    return _shared_label_cache
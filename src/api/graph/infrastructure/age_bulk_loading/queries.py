@@ -6,13 +6,13 @@ providing a single place to audit and maintain AGE-specific SQL patterns.
 
 from __future__ import annotations
 
-import json
 from typing import Any
 
 from psycopg2 import sql
 
 from graph.domain.value_objects import EntityType
 
+from .label_cache import LabelMetadata
 from .utils import compute_stable_hash
 
 
@@ -78,6 +78,53 @@ class AgeQueryBuilder:
         )
         return {row[0] for row in cursor.fetchall()}
 
+    @staticmethod
+    def get_graph_id(cursor: Any, graph_name: str) -> int | None:
+        """Get the id of a graph from ``ag_catalog.ag_graph``.
+
+        The id changes when a graph is dropped and recreated, so it
+        identifies one incarnation of the graph.
+
+        Args:
+            cursor: Database cursor
+            graph_name: Graph name
+
+        Returns:
+            The graph id, or None if the graph does not exist
+        """
+        cursor.execute(
+            "SELECT graphid FROM ag_catalog.ag_graph WHERE name = %s",
+            (graph_name,),
+        )
+        row = cursor.fetchone()
+        return int(row[0]) if row else None
+
+    @staticmethod
+    def get_label_catalog(cursor: Any, graph_name: str) -> list[LabelMetadata]:
+        """Get metadata for every label in the graph in one round trip.
+
+        Args:
+            cursor: Database cursor
+            graph_name: Graph name
+
+        Returns:
+            List of LabelMetadata for all user labels in the graph
+        """
+        cursor.execute(
+            """
+            SELECT l.name, l.id, l.seq_name, l.kind
+            FROM ag_catalog.ag_label l
+            JOIN ag_catalog.ag_graph g ON l.graph = g.graphid
+            WHERE g.name = %s
+            AND l.name NOT LIKE '_ag_label%%'
+            """,
+            (graph_name,),
+        )
+        return [
+            LabelMetadata(name=row[0], label_id=row[1], seq_name=row[2], kind=row[3])
+            for row in cursor.fetchall()
+        ]
+
     @staticmethod
     def acquire_advisory_lock(cursor: Any, graph_name: str, label: str) -> None:
         """Acquire an advisory lock for a label.
@@ -321,84 +368,67 @@ class AgeQueryBuilder:
     # =========================================================================
 
     @staticmethod
-    def delete_node_with_detach(cursor: Any, graph_name: str, id: str) -> int:
-        """Delete a single node and its connected edges (DETACH DELETE semantics).
-
-        Uses scalar ``= %s`` subqueries instead of ``= ANY(%s)`` to avoid
-        catastrophic query plans in AGE with large graphs (53K+ vertices,
-        218K+ edges across thousands of label tables).
+    def detach_resolved_nodes(cursor: Any, graph_name: str, resolved_table: str) -> int:
+        """Delete every edge attached to a set of resolved nodes.
 
-        WARNING: This directly manipulates AGE's internal parent tables
-        (_ag_label_vertex, _ag_label_edge). It relies on PostgreSQL table
-        inheritance where all label-specific tables inherit from parent tables.
+        Joins on graphid against a small, analyzed resolved-ID table so the
+        planner can probe each edge label's start_id/end_id indexes, rather
+        than using ``= ANY(%s)`` array predicates.  Start and end are handled
+        by separate statements to avoid an OR join.
 
         Args:
             cursor: Database cursor
             graph_name: Graph name
-            id: Logical node ID to delete
+            resolved_table: Resolved-ID table (logical_id, graphid, label) of nodes
 
         Returns:
-            Number of nodes deleted (0 or 1)
+            Number of edges deleted
         """
-        # First delete connected edges using scalar subqueries
-        query = sql.SQL(
-            """
-            DELETE FROM {}._ag_label_edge
-            WHERE start_id = (
-                SELECT id FROM {}._ag_label_vertex
-                WHERE ag_catalog.agtype_object_field_text_agtype(
-                    properties, '"id"'::ag_catalog.agtype
-                ) = %s
-            ) OR end_id = (
-                SELECT id FROM {}._ag_label_vertex
-                WHERE ag_catalog.agtype_object_field_text_agtype(
-                    properties, '"id"'::ag_catalog.agtype
-                ) = %s
+        deleted = 0
+        for column in ("start_id", "end_id"):
+            query = sql.SQL(
+                """
+                DELETE FROM {}._ag_label_edge AS e
+                USING {} AS r
+                WHERE e.{} = r.graphid
+                """
+            ).format(
+                sql.Identifier(graph_name),
+                sql.Identifier(resolved_table),
+                sql.Identifier(column),
             )
-            """
-        ).format(
-            sql.Identifier(graph_name),
-            sql.Identifier(graph_name),
-            sql.Identifier(graph_name),
-        )
-        cursor.execute(query, (id, id))
-
-        # Then delete the node
-        query = sql.SQL(
-            """
-            DELETE FROM {}._ag_label_vertex
-            WHERE ag_catalog.agtype_object_field_text_agtype(
-                properties, '"id"'::ag_catalog.agtype
-            ) = %s
-            """
-        ).format(sql.Identifier(graph_name))
-        cursor.execute(query, (id,))
-        return cursor.rowcount
+            cursor.execute(query)
+            deleted += cursor.rowcount
+        return deleted
 
     @staticmethod
-    def delete_edge(cursor: Any, graph_name: str, id: str) -> int:
-        """Delete a single edge by its logical ID.
-
-        Uses scalar ``= %s`` instead of ``= ANY(%s)`` to avoid
-        catastrophic query plans in AGE with large graphs.
+    def delete_resolved_in_label(
+        cursor: Any, graph_name: str, label: str, resolved_table: str
+    ) -> int:
+        """Delete the resolved entities that live in one label table.
 
         Args:
             cursor: Database cursor
             graph_name: Graph name
-            id: Logical edge ID to delete
+            label: Label name (table)
+            resolved_table: Resolved-ID table (logical_id, graphid, label)
 
         Returns:
-            Number of edges deleted (0 or 1)
+            Number of entities deleted
         """
         query = sql.SQL(
             """
-            DELETE FROM {}._ag_label_edge
-            WHERE ag_catalog.agtype_object_field_text_agtype(
-                properties, '"id"'::ag_catalog.agtype
-            ) = %s
+            DELETE FROM {}.{} AS t
+            USING {} AS r
+            WHERE r.label = %s
+            AND t.id = r.graphid
             """
-        ).format(sql.Identifier(graph_name))
-        cursor.execute(query, (id,))
+        ).format(
+            sql.Identifier(graph_name),
+            sql.Identifier(label),
+            sql.Identifier(resolved_table),
+        )
+        cursor.execute(query, (label,))
         return cursor.rowcount
 
     # =========================================================================
@@ -406,92 +436,48 @@ class AgeQueryBuilder:
     # =========================================================================
 
     @staticmethod
-    def find_entity_table(
-        cursor: Any, graph_name: str, entity_id: str, entity_type: EntityType
-    ) -> str | None:
-        """Find the actual label table for an entity by its logical ID.
+    def apply_property_patches_in_label(
+        cursor: Any,
+        graph_name: str,
+        label: str,
+        resolved_table: str,
+        staging_table: str,
+    ) -> int:
+        """Apply staged property patches to the resolved entities of one label.
+
+        Each patch merges ``set_properties`` into the existing properties and
+        then drops ``remove_properties``, matching a SET followed by a REMOVE.
 
         Args:
             cursor: Database cursor
             graph_name: Graph name
-            entity_id: Logical entity ID
-            entity_type: EntityType.NODE or EntityType.EDGE
+            label: Label name (table)
+            resolved_table: Resolved-ID table (logical_id, graphid, label)
+            staging_table: UPDATE staging table (id, set_properties, remove_properties)
 
         Returns:
-            Table name as returned by regclass (e.g., '"graph"."label"'), or None
+            Number of entities updated
         """
-        parent_table = (
-            "_ag_label_vertex" if entity_type == EntityType.NODE else "_ag_label_edge"
-        )
         query = sql.SQL(
             """
-            SELECT tableoid::regclass
-            FROM {}.{}
-            WHERE ag_catalog.agtype_object_field_text_agtype(
-                properties, '"id"'::ag_catalog.agtype
-            ) = %s
-            """
-        ).format(sql.Identifier(graph_name), sql.Identifier(parent_table))
-        cursor.execute(query, (entity_id,))
-        row = cursor.fetchone()
-        if not row:
-            return None
-        return str(row[0])
-
-    @staticmethod
-    def update_properties(
-        cursor: Any, table_name: str, entity_id: str, properties: dict[str, Any]
-    ) -> None:
-        """Merge new properties into an entity's existing properties.
-
-        Args:
-            cursor: Database cursor
-            table_name: Fully qualified table name from regclass
-            entity_id: Logical entity ID
-            properties: Properties to merge
-        """
-        props_json = json.dumps(properties)
-        # table_name from regclass is pre-formatted (e.g., "graph"."label")
-        # It's safe to use sql.SQL() since it comes from the database itself
-        query = sql.SQL(
-            """
-            UPDATE {} AS t
-            SET properties = (
-                (t.properties::text)::jsonb || %s::jsonb
-            )::text::ag_catalog.agtype
-            WHERE ag_catalog.agtype_object_field_text_agtype(
-                t.properties, '"id"'::ag_catalog.agtype
-            ) = %s
-            """
-        ).format(sql.SQL(table_name))
-        cursor.execute(query, (props_json, entity_id))
-
-    @staticmethod
-    def remove_properties(
-        cursor: Any, table_name: str, entity_id: str, property_names: list[str]
-    ) -> None:
-        """Remove properties from an entity.
-
-        Args:
-            cursor: Database cursor
-            table_name: Fully qualified table name from regclass
-            entity_id: Logical entity ID
-            property_names: Names of properties to remove
-        """
-        # table_name from regclass is pre-formatted (e.g., "graph"."label")
-        # It's safe to use sql.SQL() since it comes from the database itself
-        query = sql.SQL(
-            """
-            UPDATE {} AS t
+            UPDATE {}.{} AS t
             SET properties = (
-                (t.properties::text)::jsonb - %s::text[]
+                ((t.properties::text)::jsonb || s.set_properties)
+                - ARRAY(SELECT jsonb_array_elements_text(s.remove_properties))
             )::text::ag_catalog.agtype
-            WHERE ag_catalog.agtype_object_field_text_agtype(
-                t.properties, '"id"'::ag_catalog.agtype
-            ) = %s
+            FROM {} AS r
+            JOIN {} AS s ON s.id = r.logical_id
+            WHERE r.label = %s
+            AND t.id = r.graphid
             """
-        ).format(sql.SQL(table_name))
-        cursor.execute(query, (property_names, entity_id))
+        ).format(
+            sql.Identifier(graph_name),
+            sql.Identifier(label),
+            sql.Identifier(resolved_table),
+            sql.Identifier(staging_table),
+        )
+        cursor.execute(query, (label,))
+        return cursor.rowcount
 
     # =========================================================================
     # Utility Queries
@@ -6,15 +6,30 @@ during bulk loading.
 
 from __future__ import annotations
 
-import io
 import json
+from collections.abc import Iterator
+from enum import StrEnum
 from typing import Any
 
 from psycopg2 import sql
 
-from graph.domain.value_objects import MutationOperation
+from graph.domain.value_objects import EntityType, MutationOperation
 
-from .utils import escape_copy_value
+from .copy_stream import COPY_CHUNK_SIZE, CopyRowStream
+from .utils import escape_copy_value, validate_label_name
+
+
+class GraphidLookupMode(StrEnum):
+    """How edge endpoint logical IDs are resolved to graphids.
+
+    FULL_SCAN materializes every vertex in the graph into the lookup table.
+    INCREMENTAL resolves only the distinct endpoint IDs referenced by the
+    edge staging table, driving the join from staging into the per-label
+    ``prop_id_text_btree`` indexes.
+    """
+
+    FULL_SCAN = "full_scan"
+    INCREMENTAL = "incremental"
 
 
 class StagingTableManager:
@@ -61,38 +76,25 @@ class StagingTableManager:
         operations: list[MutationOperation],
         graph_name: str,
     ) -> int:
-        """COPY node data to staging table using StringIO.
+        """COPY node data to staging table, streaming rows as they are encoded.
 
         Uses proper escaping for COPY format to handle tabs, newlines, and
         backslashes in property values.
         """
-        buffer = io.StringIO()
-
+        # Validate before streaming so malformed operations fail before COPY
+        # starts rather than aborting it halfway through.
         for op in operations:
-            props = dict(op.set_properties or {})
-            props["id"] = op.id
-            props["graph_id"] = graph_name
-
-            # json.dumps already escapes special characters within the JSON,
-            # but we also need to escape COPY format special characters
-            # (tab, newline, backslash) in the resulting string
-            props_json = escape_copy_value(json.dumps(props))
-            # Also escape the ID and label fields (these should never be None for CREATE)
             if op.id is None:
                 raise ValueError("Node CREATE operation must have an ID")
             if op.label is None:
                 raise ValueError("Node CREATE operation must have a label")
-            escaped_id = escape_copy_value(op.id)
-            escaped_label = escape_copy_value(op.label)
-            row = f"{escaped_id}\t{escaped_label}\t{props_json}\n"
-            buffer.write(row)
 
-        buffer.seek(0)
         cursor.copy_from(
-            buffer,
+            CopyRowStream(self._node_rows(operations, graph_name)),
             table_name,
             columns=("id", "label", "properties"),
             sep="\t",
+            size=COPY_CHUNK_SIZE,
         )
         return len(operations)
 
@@ -103,24 +105,13 @@ class StagingTableManager:
         operations: list[MutationOperation],
         graph_name: str,
     ) -> int:
-        """COPY edge data to staging table using StringIO.
+        """COPY edge data to staging table, streaming rows as they are encoded.
 
         Uses proper escaping for COPY format to handle tabs, newlines, and
         backslashes in property values.
         """
-        buffer = io.StringIO()
-
+        # These should never be None for edge CREATE operations
         for op in operations:
-            props = dict(op.set_properties or {})
-            props["id"] = op.id
-            props["graph_id"] = graph_name
-
-            # json.dumps already escapes special characters within the JSON,
-            # but we also need to escape COPY format special characters
-            # (tab, newline, backslash) in the resulting string
-            props_json = escape_copy_value(json.dumps(props))
-            # Also escape the ID, label, start_id, and end_id fields
-            # These should never be None for edge CREATE operations
             if op.id is None:
                 raise ValueError("Edge CREATE operation must have an ID")
             if op.label is None:
@@ -129,22 +120,52 @@ class StagingTableManager:
                 raise ValueError("Edge CREATE operation must have a start_id")
             if op.end_id is None:
                 raise ValueError("Edge CREATE operation must have an end_id")
-            escaped_id = escape_copy_value(op.id)
-            escaped_label = escape_copy_value(op.label)
-            escaped_start_id = escape_copy_value(op.start_id)
-            escaped_end_id = escape_copy_value(op.end_id)
-            row = f"{escaped_id}\t{escaped_label}\t{escaped_start_id}\t{escaped_end_id}\t{props_json}\n"
-            buffer.write(row)
-
-        buffer.seek(0)
+
         cursor.copy_from(
-            buffer,
+            CopyRowStream(self._edge_rows(operations, graph_name)),
             table_name,
             columns=("id", "label", "start_id", "end_id", "properties"),
             sep="\t",
+            size=COPY_CHUNK_SIZE,
         )
         return len(operations)
 
+    @staticmethod
+    def _properties_json(op: MutationOperation, graph_name: str) -> str:
+        props = dict(op.set_properties or {})
+        props["id"] = op.id
+        props["graph_id"] = graph_name
+
+        # json.dumps already escapes special characters within the JSON,
+        # but we also need to escape COPY format special characters
+        # (tab, newline, backslash) in the resulting string
+        return escape_copy_value(json.dumps(props))
+
+    def _node_rows(
+        self, operations: list[MutationOperation], graph_name: str
+    ) -> Iterator[str]:
+        """Lazily encode node CREATE operations as COPY rows."""
+        for op in operations:
+            props_json = self._properties_json(op, graph_name)
+            escaped_id = escape_copy_value(op.id or "")
+            escaped_label = escape_copy_value(op.label or "")
+            yield f"{escaped_id}\t{escaped_label}\t{props_json}\n"
+
+    def _edge_rows(
+        self, operations: list[MutationOperation], graph_name: str
+    ) -> Iterator[str]:
+        """Lazily encode edge CREATE operations as COPY rows."""
+        for op in operations:
+            props_json = self._properties_json(op, graph_name)
+            escaped_id = escape_copy_value(op.id or "")
+            escaped_label = escape_copy_value(op.label or "")
+            escaped_start_id = escape_copy_value(op.start_id or "")
+            escaped_end_id = escape_copy_value(op.end_id or "")
+            yield (
+                f"{escaped_id}\t{escaped_label}\t{escaped_start_id}\t"
+                f"{escaped_end_id}\t{props_json}\n"
+            )
+
     def fetch_distinct_labels(self, cursor: Any, table_name: str) -> list[str]:
         """Fetch distinct labels from staging table."""
         query = sql.SQL("SELECT DISTINCT label FROM {}").format(
@@ -246,6 +267,313 @@ class StagingTableManager:
 
         return lookup_table, row_count
 
+    def create_incremental_graphid_lookup_table(
+        self, cursor: Any, graph_name: str, table_name: str, session_id: str
+    ) -> tuple[str, int]:
+        """Create a lookup table holding only the endpoints referenced by a batch.
+
+        Unlike create_graphid_lookup_table, the cost is proportional to the
+        number of distinct start_id/end_id values in the edge staging table
+        rather than to the total number of vertices in the graph.  See
+        resolve_logical_ids for how each endpoint is located.
+
+        Args:
+            cursor: Database cursor
+            graph_name: Graph name (schema)
+            table_name: Edge staging table name
+            session_id: Unique session identifier for table naming
+
+        Returns:
+            Tuple of (table_name, row_count) where row_count is the number of
+            endpoints that were resolved
+        """
+        lookup_table = f"_graphid_lookup_{session_id}"
+        endpoints_table = f"_edge_endpoints_{session_id}"
+
+        query = sql.SQL(
+            """
+            CREATE TEMP TABLE {} ON COMMIT DROP AS
+            SELECT
+                ids.logical_id,
+                lower(split_part(ids.logical_id, ':', 1)) AS label_hint
+            FROM (
+                SELECT start_id AS logical_id FROM {}
+                UNION
+                SELECT end_id FROM {}
+            ) AS ids
+            """
+        ).format(
+            sql.Identifier(endpoints_table),
+            sql.Identifier(table_name),
+            sql.Identifier(table_name),
+        )
+        cursor.execute(query)
+
+        row_count = self.resolve_logical_ids(
+            cursor, graph_name, endpoints_table, lookup_table, EntityType.NODE
+        )
+        return lookup_table, row_count
+
+    def create_resolved_id_table(
+        self,
+        cursor: Any,
+        graph_name: str,
+        table_name: str,
+        entity_type: EntityType,
+    ) -> tuple[str, int]:
+        """Resolve the IDs of a DELETE/UPDATE staging table to graphids and labels.
+
+        Args:
+            cursor: Database cursor
+            graph_name: Graph name (schema)
+            table_name: DELETE or UPDATE staging table name
+            entity_type: EntityType.NODE or EntityType.EDGE
+
+        Returns:
+            Tuple of (resolved_table, row_count) where row_count is the number
+            of IDs that exist in the graph
+        """
+        ids_table = f"{table_name}_ids"
+        resolved_table = f"{table_name}_resolved"
+
+        query = sql.SQL(
+            """
+            CREATE TEMP TABLE {} ON COMMIT DROP AS
+            SELECT DISTINCT
+                id AS logical_id,
+                lower(split_part(id, ':', 1)) AS label_hint
+            FROM {}
+            """
+        ).format(sql.Identifier(ids_table), sql.Identifier(table_name))
+        cursor.execute(query)
+
+        row_count = self.resolve_logical_ids(
+            cursor, graph_name, ids_table, resolved_table, entity_type
+        )
+        return resolved_table, row_count
+
+    def resolve_logical_ids(
+        self,
+        cursor: Any,
+        graph_name: str,
+        ids_table: str,
+        lookup_table: str,
+        entity_type: EntityType,
+    ) -> int:
+        """Resolve logical IDs to (graphid, label) into a new lookup table.
+
+        Entity IDs follow the ``{type}:{16_hex_chars}`` format where the type
+        names the label, so each ID is first resolved against the label table
+        its prefix names.  AGE label names are case-sensitive while the
+        prefix's case need not match, so ``label_hint`` holds the lowercased
+        prefix and is compared with the lowercased label name; the label's
+        real name is used for its table.  Each of those joins is driven from
+        the (analyzed) IDs table into the label's ``prop_id_text_btree``
+        expression index.  IDs whose prefix does not name an existing label
+        fall back to a join against the parent label table, which is only
+        issued when such IDs remain.
+
+        No ``= ANY(%s)`` array predicates are used: those produce
+        catastrophic plans against AGE's inherited label tables.
+
+        Args:
+            cursor: Database cursor
+            graph_name: Graph name (schema)
+            ids_table: Temp table with (logical_id, label_hint) columns
+            lookup_table: Name of the lookup table to create
+            entity_type: EntityType.NODE or EntityType.EDGE
+
+        Returns:
+            Number of IDs that were resolved
+        """
+        if entity_type == EntityType.NODE:
+            label_kind, parent_table = "v", "_ag_label_vertex"
+        else:
+            label_kind, parent_table = "e", "_ag_label_edge"
+
+        # Temp tables have no statistics until analyzed; without them the
+        # planner cannot tell that the staging side is the small one.
+        cursor.execute(sql.SQL("ANALYZE {}").format(sql.Identifier(ids_table)))
+
+        query = sql.SQL(
+            """
+            CREATE TEMP TABLE {} (
+                logical_id TEXT NOT NULL,
+                graphid ag_catalog.graphid NOT NULL,
+                label TEXT NOT NULL
+            ) ON COMMIT DROP
+            """
+        ).format(sql.Identifier(lookup_table))
+        cursor.execute(query)
+        query = sql.SQL("CREATE INDEX {} ON {} (logical_id)").format(
+            sql.Identifier(f"{lookup_table}_logical_id_idx"),
+            sql.Identifier(lookup_table),
+        )
+        cursor.execute(query)
+
+        # Labels of the right kind named by an ID prefix
+        query = sql.SQL(
+            """
+            SELECT DISTINCT l.name
+            FROM {} AS i
+            JOIN ag_catalog.ag_label l ON lower(l.name) = i.label_hint
+            JOIN ag_catalog.ag_graph g ON l.graph = g.graphid
+            WHERE g.name = %s
+            AND l.kind = %s
+            AND l.name NOT LIKE '_ag_label%%'
+            """
+        ).format(sql.Identifier(ids_table))
+        cursor.execute(query, (graph_name, label_kind))
+        hinted_labels = sorted(row[0] for row in cursor.fetchall())
+
+        for label in hinted_labels:
+            validate_label_name(label)
+            query = sql.SQL(
+                """
+                INSERT INTO {} (logical_id, graphid, label)
+                SELECT i.logical_id, t.id, {}
+                FROM {} AS i
+                JOIN {}.{} AS t
+                ON ag_catalog.agtype_object_field_text_agtype(
+                    t.properties, '"id"'::ag_catalog.agtype
+                ) = i.logical_id
+                WHERE i.label_hint = %s
+                """
+            ).format(
+                sql.Identifier(lookup_table),
+                sql.Literal(label),
+                sql.Identifier(ids_table),
+                sql.Identifier(graph_name),
+                sql.Identifier(label),
+            )
+            cursor.execute(query, (label.lower(),))
+
+        # IDs whose prefix did not lead to a match
+        query = sql.SQL(
+            """
+            SELECT COUNT(*) FROM {} AS i
+            WHERE NOT EXISTS (
+                SELECT 1 FROM {} AS lk WHERE lk.logical_id = i.logical_id
+            )
+            """
+        ).format(sql.Identifier(ids_table), sql.Identifier(lookup_table))
+        cursor.execute(query)
+        unresolved = cursor.fetchone()[0]
+
+        if unresolved:
+            query = sql.SQL(
+                """
+                INSERT INTO {} (logical_id, graphid, label)
+                SELECT i.logical_id, t.id, c.relname
+                FROM {} AS i
+                JOIN {}.{} AS t
+                ON ag_catalog.agtype_object_field_text_agtype(
+                    t.properties, '"id"'::ag_catalog.agtype
+                ) = i.logical_id
+                JOIN pg_catalog.pg_class AS c ON c.oid = t.tableoid
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM {} AS lk WHERE lk.logical_id = i.logical_id
+                )
+                """
+            ).format(
+                sql.Identifier(lookup_table),
+                sql.Identifier(ids_table),
+                sql.Identifier(graph_name),
+                sql.Identifier(parent_table),
+                sql.Identifier(lookup_table),
+            )
+            cursor.execute(query)
+
+        cursor.execute(
+            sql.SQL("SELECT COUNT(*) FROM {}").format(sql.Identifier(lookup_table))
+        )
+        row_count = cursor.fetchone()[0]
+        # Later set-based statements join against this table
+        cursor.execute(sql.SQL("ANALYZE {}").format(sql.Identifier(lookup_table)))
+        return row_count
+
+    def fetch_resolved_labels(self, cursor: Any, resolved_table: str) -> list[str]:
+        """Fetch the distinct labels of a resolved ID table, in sorted order."""
+        query = sql.SQL("SELECT DISTINCT label FROM {} ORDER BY label").format(
+            sql.Identifier(resolved_table)
+        )
+        cursor.execute(query)
+        return [row[0] for row in cursor.fetchall()]
+
+    def create_delete_staging_table(
+        self, cursor: Any, session_id: str, entity_type: EntityType
+    ) -> str:
+        """Create a temporary staging table for the IDs of DELETE operations."""
+        table_name = f"_staging_delete_{entity_type.value}s_{session_id}"
+        query = sql.SQL(
+            """
+            CREATE TEMP TABLE {} (
+                id TEXT NOT NULL
+            ) ON COMMIT DROP
+            """
+        ).format(sql.Identifier(table_name))
+        cursor.execute(query)
+        return table_name
+
+    def create_update_staging_table(
+        self, cursor: Any, session_id: str, entity_type: EntityType
+    ) -> str:
+        """Create a temporary staging table for UPDATE property patches."""
+        table_name = f"_staging_update_{entity_type.value}s_{session_id}"
+        query = sql.SQL(
+            """
+            CREATE TEMP TABLE {} (
+                id TEXT NOT NULL,
+                set_properties JSONB NOT NULL,
+                remove_properties JSONB NOT NULL
+            ) ON COMMIT DROP
+            """
+        ).format(sql.Identifier(table_name))
+        cursor.execute(query)
+        return table_name
+
+    def copy_ids_to_staging(self, cursor: Any, table_name: str, ids: list[str]) -> int:
+        """COPY entity IDs to a DELETE staging table, streaming rows."""
+        cursor.copy_from(
+            CopyRowStream(f"{escape_copy_value(entity_id)}\n" for entity_id in ids),
+            table_name,
+            columns=("id",),
+            sep="\t",
+            size=COPY_CHUNK_SIZE,
+        )
+        return len(ids)
+
+    def copy_updates_to_staging(
+        self,
+        cursor: Any,
+        table_name: str,
+        patches: dict[str, tuple[dict[str, Any], list[str]]],
+    ) -> int:
+        """COPY property patches to an UPDATE staging table, streaming rows.
+
+        Args:
+            cursor: Database cursor
+            table_name: UPDATE staging table name
+            patches: Mapping of entity ID to (set_properties, remove_properties)
+
+        Returns:
+            Number of rows copied
+        """
+        rows = (
+            f"{escape_copy_value(entity_id)}\t"
+            f"{escape_copy_value(json.dumps(set_properties))}\t"
+            f"{escape_copy_value(json.dumps(remove_properties))}\n"
+            for entity_id, (set_properties, remove_properties) in patches.items()
+        )
+        cursor.copy_from(
+            CopyRowStream(rows),
+            table_name,
+            columns=("id", "set_properties", "remove_properties"),
+            sep="\t",
+            size=COPY_CHUNK_SIZE,
+        )
+        return len(patches)
+
     def resolve_edge_graphids(
         self,
         cursor: Any,
@@ -27,8 +27,9 @@ from graph.ports.observability import MutationProbe
 from graph.ports.protocols import GraphClientProtocol, TransactionalIndexingProtocol
 
 from .indexing import AgeIndexingStrategy
+from .label_cache import LabelCatalogCache, LabelMetadata, get_shared_label_cache
 from .queries import AgeQueryBuilder
-from .staging import StagingTableManager
+from .staging import GraphidLookupMode, StagingTableManager
 from .utils import validate_label_name
 
 
@@ -42,6 +43,13 @@ class AgeBulkLoadingStrategy(BulkLoadingStrategy):
     acquisition fails (e.g. deadlock detected by PostgreSQL), the transaction
     is rolled back — releasing all held ``pg_advisory_xact_lock`` locks — and
     the entire batch is retried up to ``max_retries`` additional times.
+
+    Edge endpoints are resolved with ``graphid_lookup_mode``:
+    ``INCREMENTAL`` (default) looks up only the endpoints referenced by the
+    batch, while ``FULL_SCAN`` materializes every vertex of the graph.
+
+    Label ids and sequence names are read through ``label_cache``, which is
+    shared by every strategy in the process unless one is injected.
     """
 
     DEFAULT_BATCH_SIZE = 1000
@@ -53,6 +61,8 @@ class AgeBulkLoadingStrategy(BulkLoadingStrategy):
         batch_size: int | None = None,
         bulk_loading_probe: AgeBulkLoadingProbe | None = None,
         max_retries: int = DEFAULT_MAX_RETRIES,
+        graphid_lookup_mode: GraphidLookupMode = GraphidLookupMode.INCREMENTAL,
+        label_cache: LabelCatalogCache | None = None,
     ):
         self._indexing_strategy = indexing_strategy or AgeIndexingStrategy()
         self._batch_size = batch_size or self.DEFAULT_BATCH_SIZE
@@ -60,6 +70,8 @@ class AgeBulkLoadingStrategy(BulkLoadingStrategy):
         self._staging = StagingTableManager()
         self._queries = AgeQueryBuilder
         self._max_retries = max_retries
+        self._graphid_lookup_mode = graphid_lookup_mode
+        self._label_cache = label_cache or get_shared_label_cache()
 
     def apply_batch(
         self,
@@ -140,11 +152,21 @@ class AgeBulkLoadingStrategy(BulkLoadingStrategy):
                     # Execute DELETEs first (edges before nodes for referential integrity)
                     if delete_edges:
                         total_batches += self._execute_deletes(
-                            cursor, delete_edges, EntityType.EDGE, probe, graph_name
+                            cursor,
+                            delete_edges,
+                            EntityType.EDGE,
+                            probe,
+                            graph_name,
+                            session_id,
                         )
                     if delete_nodes:
                         total_batches += self._execute_deletes(
-                            cursor, delete_nodes, EntityType.NODE, probe, graph_name
+                            cursor,
+                            delete_nodes,
+                            EntityType.NODE,
+                            probe,
+                            graph_name,
+                            session_id,
                         )
 
                     # Execute CREATEs (nodes before edges for referential integrity)
@@ -170,7 +192,7 @@ class AgeBulkLoadingStrategy(BulkLoadingStrategy):
                     # Execute UPDATEs
                     if update_ops:
                         total_batches += self._execute_updates(
-                            cursor, update_ops, graph_name, probe
+                            cursor, update_ops, graph_name, probe, session_id
                         )
 
                     conn.commit()
@@ -194,6 +216,9 @@ class AgeBulkLoadingStrategy(BulkLoadingStrategy):
                     client.raw_connection.rollback()
                 except Exception:
                     pass
+                # The failure may come from stale label metadata (e.g. a
+                # label dropped by DDL), so reload the catalog on retry.
+                self._label_cache.invalidate(graph_name)
                 # Loop continues to next attempt (or falls through when exhausted).
 
         # All attempts exhausted — report the last error to the caller.
@@ -218,10 +243,34 @@ class AgeBulkLoadingStrategy(BulkLoadingStrategy):
         graph_name: str,
         labels: list[str],
         entity_type: EntityType,
-    ) -> set[str]:
-        """Pre-create all new labels and their indexes in batch."""
-        existing_labels = self._queries.get_existing_labels(cursor, graph_name)
-        new_labels = set(labels) - existing_labels
+    ) -> tuple[dict[str, LabelMetadata], set[str]]:
+        """Pre-create all new labels and their indexes in batch.
+
+        Returns:
+            Tuple of (metadata for every label in ``labels``, newly created labels)
+        """
+        graph_id = self._queries.get_graph_id(cursor, graph_name)
+        cached = (
+            self._label_cache.get_graph(graph_name, graph_id)
+            if graph_id is not None
+            else None
+        )
+        cache_hit = cached is not None and not set(labels) - cached.keys()
+        if cached is not None and cache_hit:
+            catalog = cached
+        else:
+            # Unknown or recreated graph, or labels created elsewhere since
+            # it was cached
+            catalog = {
+                info.name: info
+                for info in self._queries.get_label_catalog(cursor, graph_name)
+            }
+            if graph_id is not None:
+                self._label_cache.store_graph(
+                    graph_name, graph_id, list(catalog.values())
+                )
+
+        new_labels = set(labels) - catalog.keys()
 
         for label in new_labels:
             self._queries.create_label(cursor, graph_name, label, entity_type)
@@ -231,7 +280,29 @@ class AgeBulkLoadingStrategy(BulkLoadingStrategy):
                 cursor, graph_name, label, entity_type
             )
 
-        return new_labels
+        if new_labels:
+            # New labels are only visible to other transactions once this one
+            # commits, so they are not cached until the next catalog load.
+            self._label_cache.invalidate(graph_name)
+            for label in new_labels:
+                label_info = self._queries.get_label_info(cursor, graph_name, label)
+                if label_info is None:
+                    raise ValueError(
+                        f"Label '{label}' not found in graph '{graph_name}'"
+                    )
+                catalog[label] = LabelMetadata(
+                    name=label,
+                    label_id=label_info[0],
+                    seq_name=label_info[1],
+                    kind="v" if entity_type == EntityType.NODE else "e",
+                )
+
+        self._bulk_probe.label_cache_checked(
+            graph_name,
+            hits=len(labels) if cache_hit else 0,
+            misses=0 if cache_hit else len(labels),
+        )
+        return {label: catalog[label] for label in labels}, new_labels
 
     def _execute_creates(
         self,
@@ -291,11 +362,22 @@ class AgeBulkLoadingStrategy(BulkLoadingStrategy):
             )
 
             lookup_start = time.perf_counter()
-            lookup_table, lookup_row_count = self._staging.create_graphid_lookup_table(
-                cursor, graph_name, session_id
-            )
+            if self._graphid_lookup_mode == GraphidLookupMode.INCREMENTAL:
+                lookup_table, lookup_row_count = (
+                    self._staging.create_incremental_graphid_lookup_table(
+                        cursor, graph_name, table_name, session_id
+                    )
+                )
+            else:
+                lookup_table, lookup_row_count = (
+                    self._staging.create_graphid_lookup_table(
+                        cursor, graph_name, session_id
+                    )
+                )
             self._bulk_probe.graphid_lookup_table_created(
-                lookup_row_count, (time.perf_counter() - lookup_start) * 1000
+                lookup_row_count,
+                (time.perf_counter() - lookup_start) * 1000,
+                lookup_mode=self._graphid_lookup_mode.value,
             )
 
             resolve_start = time.perf_counter()
@@ -335,7 +417,7 @@ class AgeBulkLoadingStrategy(BulkLoadingStrategy):
         )
 
         labels_start = time.perf_counter()
-        new_labels = self._pre_create_labels_and_indexes(
+        label_metadata, new_labels = self._pre_create_labels_and_indexes(
             cursor, graph_name, labels, entity_type
         )
         self._bulk_probe.labels_pre_created(
@@ -350,17 +432,13 @@ class AgeBulkLoadingStrategy(BulkLoadingStrategy):
         for label in labels:
             batch_start = time.perf_counter()
 
-            label_info = self._queries.get_label_info(cursor, graph_name, label)
-            if label_info is None:
-                raise ValueError(f"Label '{label}' not found in graph '{graph_name}'")
-
-            label_id, seq_name = label_info
+            metadata = label_metadata[label]
             updated, inserted = self._queries.execute_label_upsert(
                 cursor=cursor,
                 graph_name=graph_name,
                 label=label,
-                label_id=label_id,
-                seq_name=seq_name,
+                label_id=metadata.label_id,
+                seq_name=metadata.seq_name,
                 staging_table=table_name,
                 entity_type=entity_type,
                 is_new_label=label in new_labels,
@@ -384,13 +462,17 @@ class AgeBulkLoadingStrategy(BulkLoadingStrategy):
         entity_type: EntityType,
         probe: MutationProbe,
         graph_name: str,
+        session_id: str,
     ) -> int:
-        """Execute DELETE operations one ID at a time.
+        """Execute DELETE operations as set-based statements per label.
 
-        Uses per-ID scalar subqueries instead of batch ``= ANY(%s)`` to
-        avoid catastrophic query plans in AGE with large graphs.
+        IDs are COPYed into a staging table and resolved to graphids once;
+        nodes are then detached from their edges and deleted with one
+        statement per label.  No ``= ANY(%s)`` predicates are issued, which
+        avoids catastrophic query plans in AGE with large graphs.
         """
-        batches = 0
+        if not operations:
+            return 0
 
         for op in operations:
             if op.id is None:
@@ -398,19 +480,40 @@ class AgeBulkLoadingStrategy(BulkLoadingStrategy):
                     "Detected malformed DELETE operation. At least one operation missing an ID."
                 )
 
-            batch_start = time.perf_counter()
+        entity_name = entity_type.value
+        table_name = self._staging.create_delete_staging_table(
+            cursor, session_id, entity_type
+        )
+        self._bulk_probe.staging_table_created(table_name, entity_name)
 
-            if entity_type == EntityType.NODE:
-                deleted = self._queries.delete_node_with_detach(
-                    cursor, graph_name, op.id
-                )
-            else:
-                deleted = self._queries.delete_edge(cursor, graph_name, op.id)
+        copy_start = time.perf_counter()
+        row_count = self._staging.copy_ids_to_staging(
+            cursor, table_name, [op.id for op in operations if op.id is not None]
+        )
+        self._bulk_probe.staging_data_copied(
+            table_name,
+            entity_name,
+            row_count,
+            (time.perf_counter() - copy_start) * 1000,
+        )
 
+        resolved_table = self._resolve_staged_ids(
+            cursor, graph_name, table_name, entity_type
+        )
+
+        if entity_type == EntityType.NODE:
+            self._queries.detach_resolved_nodes(cursor, graph_name, resolved_table)
+
+        batches = 0
+        for label in self._staging.fetch_resolved_labels(cursor, resolved_table):
+            batch_start = time.perf_counter()
+            deleted = self._queries.delete_resolved_in_label(
+                cursor, graph_name, label, resolved_table
+            )
             probe.batch_applied(
                 operation=MutationOperationType.DELETE,
-                entity_type=str(entity_type),
-                label=None,
+                entity_type=entity_name,
+                label=label,
                 count=deleted,
                 duration_ms=(time.perf_counter() - batch_start) * 1000,
             )
@@ -424,39 +527,113 @@ class AgeBulkLoadingStrategy(BulkLoadingStrategy):
         operations: list[MutationOperation],
         graph_name: str,
         probe: MutationProbe,
+        session_id: str,
     ) -> int:
-        """Execute UPDATE operations."""
-        batches = 0
+        """Execute UPDATE operations as set-based statements per label.
 
+        Property patches are COPYed into one staging table per entity type,
+        resolved to graphids once and applied with one UPDATE per label.
+        Entities that do not exist are skipped.
+        """
+        patches_by_type: dict[
+            EntityType, dict[str, tuple[dict[str, Any], list[str]]]
+        ] = {}
         for op in operations:
             if op.id is None:
                 raise RuntimeError("Malformed UPDATE operation, missing ID.")
-
-            batch_start = time.perf_counter()
-
-            table_name = self._queries.find_entity_table(
-                cursor, graph_name, op.id, op.type
+            patches = patches_by_type.setdefault(op.type, {})
+            patches[op.id] = _fold_property_patch(
+                patches.get(op.id),
+                op.set_properties or {},
+                op.remove_properties or [],
             )
-            if not table_name:
+
+        batches = 0
+        for entity_type in (EntityType.NODE, EntityType.EDGE):
+            type_patches = patches_by_type.get(entity_type)
+            if not type_patches:
                 continue
 
-            if op.set_properties:
-                self._queries.update_properties(
-                    cursor, table_name, op.id, op.set_properties
-                )
+            entity_name = entity_type.value
+            table_name = self._staging.create_update_staging_table(
+                cursor, session_id, entity_type
+            )
+            self._bulk_probe.staging_table_created(table_name, entity_name)
 
-            if op.remove_properties:
-                self._queries.remove_properties(
-                    cursor, table_name, op.id, list(op.remove_properties)
-                )
+            copy_start = time.perf_counter()
+            row_count = self._staging.copy_updates_to_staging(
+                cursor, table_name, type_patches
+            )
+            self._bulk_probe.staging_data_copied(
+                table_name,
+                entity_name,
+                row_count,
+                (time.perf_counter() - copy_start) * 1000,
+            )
 
-            probe.batch_applied(
-                operation=MutationOperationType.UPDATE,
-                entity_type=str(op.type),
-                label=None,
-                count=1,
-                duration_ms=(time.perf_counter() - batch_start) * 1000,
+            resolved_table = self._resolve_staged_ids(
+                cursor, graph_name, table_name, entity_type
             )
-            batches += 1
+
+            for label in self._staging.fetch_resolved_labels(cursor, resolved_table):
+                batch_start = time.perf_counter()
+                updated = self._queries.apply_property_patches_in_label(
+                    cursor, graph_name, label, resolved_table, table_name
+                )
+                probe.batch_applied(
+                    operation=MutationOperationType.UPDATE,
+                    entity_type=entity_name,
+                    label=label,
+                    count=updated,
+                    duration_ms=(time.perf_counter() - batch_start) * 1000,
+                )
+                batches += 1
 
         return batches
+
+    def _resolve_staged_ids(
+        self,
+        cursor: Any,
+        graph_name: str,
+        table_name: str,
+        entity_type: EntityType,
+    ) -> str:
+        """Resolve the IDs of a DELETE/UPDATE staging table, reporting timings."""
+        resolve_start = time.perf_counter()
+        resolved_table, resolved_count = self._staging.create_resolved_id_table(
+            cursor, graph_name, table_name, entity_type
+        )
+        self._bulk_probe.ids_resolved(
+            table_name,
+            entity_type.value,
+            resolved_count,
+            (time.perf_counter() - resolve_start) * 1000,
+        )
+        return resolved_table
+
+
+def _fold_property_patch(
+    patch: tuple[dict[str, Any], list[str]] | None,
+    set_properties: dict[str, Any],
+    remove_properties: list[str],
+) -> tuple[dict[str, Any], list[str]]:
+    """Fold one UPDATE into the accumulated patch for the same entity.
+
+    A patch ``(set, remove)`` is applied as ``(properties || set) - remove``.
+    Folding keeps that single-statement form equivalent to applying every
+    UPDATE for the entity in batch order, so one staging row per entity
+    suffices.
+    """
+    accumulated_set, accumulated_remove = patch or ({}, [])
+    removed = set(remove_properties)
+
+    merged_set = {
+        key: value
+        for key, value in {**accumulated_set, **set_properties}.items()
+        if key not in removed
+    }
+    merged_remove = [name for name in accumulated_remove if name not in set_properties]
+    merged_remove.extend(
+        name for name in remove_properties if name not in merged_remove
+    )
+    return merged_set, merged_remove
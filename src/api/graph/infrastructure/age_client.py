@@ -6,13 +6,14 @@ using psycopg2 with Apache AGE extension and AGType parsing.
 
 from __future__ import annotations
 
+import threading
 import typing
 from contextlib import contextmanager
 from typing import TYPE_CHECKING, Any, Iterator
 
 import age  # type: ignore
 import psycopg2
-from psycopg2 import sql
+from psycopg2 import extensions, sql
 
 from graph.infrastructure.cypher_utils import generate_cypher_nonce
 from graph.infrastructure.exceptions import InsecureCypherQueryError
@@ -32,6 +33,34 @@ from infrastructure.settings import DatabaseSettings
 if TYPE_CHECKING:
     from psycopg2.extensions import connection as PsycopgConnection
 
+_agtype_parser_lock = threading.Lock()
+_agtype_parser_registered = False
+
+
+def _register_agtype_parser(conn: PsycopgConnection) -> None:
+    """Register the AGType result parser once per process.
+
+    ``age.setUpAge`` registers the parser globally on every call and also
+    checks (and creates) the graph.  Pooled connections already have AGE
+    loaded, so callers that verified the graph themselves only need the
+    parser, and only the first time.
+    """
+    global _agtype_parser_registered
+    if _agtype_parser_registered:
+        return
+    with _agtype_parser_lock:
+        if _agtype_parser_registered:
+            return
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT typelem FROM pg_type WHERE typname='_agtype'")
+            row = cursor.fetchone()
+        if row is None or row[0] is None:
+            raise age.age.AgeNotSet()
+        extensions.register_type(
+            extensions.new_type((row[0],), "AGETYPE", age.age.parseAgeValue)
+        )
+        _agtype_parser_registered = True
+
 
 class AgeGraphClient(GraphClientProtocol):
     """Apache AGE implementation of the GraphClientProtocol.
@@ -60,6 +89,7 @@ class AgeGraphClient(GraphClientProtocol):
         probe: GraphClientProbe | None = None,
         graph_name: str | None = None,
         auto_create: bool = False,
+        check_graph: bool = True,
     ):
         """Initialize the AGE graph client.
 
@@ -75,11 +105,17 @@ class AgeGraphClient(GraphClientProtocol):
                 graph provisioning during normal API request handling. Pass
                 ``auto_create=True`` only in administrative / provisioning code
                 paths (e.g. dev setup, migration scripts, integration test fixtures).
+            check_graph: When True (default), ``connect()`` runs
+                ``age.setUpAge``, which checks the graph on every connection.
+                Pass False when the caller has already verified the graph
+                (e.g. via a cached tenant graph check); only the AGType parser
+                is then registered, once per process.
         """
         self._settings = settings
         self._connection_factory = connection_factory
         self._graph_name = graph_name if graph_name is not None else settings.graph_name
         self._auto_create = auto_create
+        self._check_graph = check_graph
         self._connected = False
         self._current_connection: PsycopgConnection | None = None
         self._probe = probe or DefaultGraphClientProbe()
@@ -130,7 +166,10 @@ class AgeGraphClient(GraphClientProtocol):
             if self._auto_create:
                 self._ensure_graph_exists()
             # Register AGType parser for automatic conversion of Vertex, Edge, Path objects
-            age.setUpAge(self._current_connection, self._graph_name)
+            if self._check_graph:
+                age.setUpAge(self._current_connection, self._graph_name)
+            else:
+                _register_agtype_parser(self._current_connection)
             self._connected = True
             self._probe.connected_to_graph(self._graph_name)
         except Exception as e:
@@ -3,13 +3,17 @@
 Fetches all nodes and edges from an AGE graph using direct SQL queries
 on label tables. This bypasses the Cypher layer for maximum performance
 with large graphs.
+
+Rows are read through a server-side cursor in batches, so memory stays
+bounded by the batch size rather than the size of the graph.
 """
 
 from __future__ import annotations
 
 import json
 import logging
-from typing import Any
+from collections.abc import Callable, Generator
+from typing import Any, Literal
 
 from psycopg2 import sql
 
@@ -17,22 +21,124 @@ from infrastructure.database.connection_pool import ConnectionPool
 
 logger = logging.getLogger(__name__)
 
+#: Rows fetched from the server-side cursor per round trip.
+STREAM_BATCH_SIZE = 5000
 
-def fetch_bulk_graph_data(pool: ConnectionPool, graph_name: str) -> dict[str, Any]:
-    """Fetch all nodes and edges from the graph using direct SQL.
+EntityKind = Literal["nodes", "edges"]
 
-    Uses direct SQL queries on AGE label tables instead of Cypher for
-    maximum performance with large graphs. Cypher MATCH scans everything
-    through the AGE layer which is slow for large datasets.
+_RESERVED_KEYS = frozenset({"id", "label", "type", "domainId", "source", "target"})
+
+
+def _node_from_row(row: tuple[Any, ...]) -> dict[str, Any] | None:
+    """Convert a vertex row into the Cosmograph node format."""
+    age_id, label, props_str = row
+    try:
+        props = json.loads(props_str) if props_str else {}
+    except json.JSONDecodeError:
+        return None
+    domain_id = props.get("id", "")
+    props_copy = {k: v for k, v in props.items() if k not in _RESERVED_KEYS}
+    return {
+        "id": age_id,
+        "domainId": domain_id,
+        "label": props.get("name") or props.get("slug") or domain_id or label,
+        "type": label,
+        **props_copy,
+    }
+
+
+def _edge_from_row(row: tuple[Any, ...]) -> dict[str, Any] | None:
+    """Convert an edge row into the Cosmograph edge format."""
+    age_id, source, target, label, props_str = row
+    try:
+        props = json.loads(props_str) if props_str else {}
+    except json.JSONDecodeError:
+        return None
+    domain_id = props.get("id", "")
+    props_copy = {k: v for k, v in props.items() if k not in _RESERVED_KEYS}
+    return {
+        "id": age_id,
+        "domainId": domain_id,
+        "source": source,
+        "target": target,
+        "type": label,
+        **props_copy,
+    }
+
+
+def _label_union_query(
+    graph_name: str,
+    labels: list[str],
+    columns: sql.SQL,
+    knowledge_graph_id: str | None,
+) -> tuple[sql.Composed, list[str]]:
+    """Build a UNION ALL over the label tables, optionally filtered by KG.
+
+    An empty ``knowledge_graph_id`` applies no filter, like ``None``.
+    """
+    where = sql.SQL("")
+    if knowledge_graph_id:
+        where = sql.SQL(
+            """
+            WHERE ag_catalog.agtype_object_field_text_agtype(
+                properties, '"knowledge_graph_id"'::ag_catalog.agtype
+            ) = %s
+            """
+        )
+    union_parts = [
+        sql.SQL("""
+            SELECT
+                {columns},
+                {label_lit} AS label,
+                ag_catalog.agtype_out(properties) AS props
+            FROM {schema}.{table}
+            {where}
+        """).format(
+            columns=columns,
+            label_lit=sql.Literal(label),
+            schema=sql.Identifier(graph_name),
+            table=sql.Identifier(label),
+            where=where,
+        )
+        for label in labels
+    ]
+    params = [knowledge_graph_id] * len(labels) if knowledge_graph_id else []
+    return sql.SQL(" UNION ALL ").join(union_parts), params
+
+
+_VERTEX_COLUMNS = sql.SQL("id::text AS age_id")
+_EDGE_COLUMNS = sql.SQL(
+    "id::text AS age_id, start_id::text AS source, end_id::text AS target"
+)
+
+
+def iter_bulk_graph_batches(
+    pool: ConnectionPool,
+    graph_name: str,
+    knowledge_graph_id: str | None = None,
+    batch_size: int = STREAM_BATCH_SIZE,
+) -> Generator[tuple[EntityKind, list[dict[str, Any]]], None, None]:
+    """Stream the graph's nodes, then its edges, in batches.
+
+    Each label table is read through a server-side (named) cursor with
+    ``fetchmany``, so at most ``batch_size`` rows are held in memory. When
+    ``knowledge_graph_id`` is given, the filter is applied in SQL rather than
+    after loading.
+
+    The pooled connection is held until the generator is exhausted or
+    closed; callers that stop early must call ``close()``.
 
     Args:
         pool: AGE connection pool.
         graph_name: The AGE graph name (e.g. ``tenant_{tenant_id}``).
+        knowledge_graph_id: Optional KnowledgeGraph to restrict entities to.
+        batch_size: Rows fetched per round trip.
 
-    Returns:
-        Dict with ``nodes`` and ``edges`` lists in Cosmograph-compatible format.
+    Yields:
+        ``("nodes", batch)`` tuples, followed by ``("edges", batch)`` tuples,
+        in Cosmograph-compatible format. Batches are never empty.
     """
-    logger.info(f"Fetching graph data for graph: {graph_name}")
+    logger.info(f"Streaming graph data for graph: {graph_name}")
 
     conn = pool.get_connection()
     try:
@@ -47,109 +153,70 @@ def fetch_bulk_graph_data(pool: ConnectionPool, graph_name: str) -> dict[str, An
             )
             labels = [(row[0], row[1]) for row in cur.fetchall()]
 
-            vertex_labels = [name for name, kind in labels if kind == "v"]
-            edge_labels = [name for name, kind in labels if kind == "e"]
-
-            logger.info(
-                f"Found {len(vertex_labels)} vertex labels, {len(edge_labels)} edge labels"
+        vertex_labels = [name for name, kind in labels if kind == "v"]
+        edge_labels = [name for name, kind in labels if kind == "e"]
+
+        logger.info(
+            f"Found {len(vertex_labels)} vertex labels, {len(edge_labels)} edge labels"
+        )
+
+        sections: list[
+            tuple[
+                EntityKind,
+                list[str],
+                sql.SQL,
+                Callable[[tuple[Any, ...]], dict[str, Any] | None],
+            ]
+        ] = [
+            ("nodes", vertex_labels, _VERTEX_COLUMNS, _node_from_row),
+            ("edges", edge_labels, _EDGE_COLUMNS, _edge_from_row),
+        ]
+        for kind, section_labels, columns, convert in sections:
+            if not section_labels:
+                continue
+            query, params = _label_union_query(
+                graph_name, section_labels, columns, knowledge_graph_id
             )
-
-            reserved_keys = {"id", "label", "type", "domainId", "source", "target"}
-            graph_ident = sql.Identifier(graph_name)
-
-            nodes: list[dict[str, Any]] = []
-            if vertex_labels:
-                union_parts = []
-                for label in vertex_labels:
-                    union_parts.append(
-                        sql.SQL("""
-                            SELECT
-                                id::text AS age_id,
-                                {label_lit} AS label,
-                                ag_catalog.agtype_out(properties) AS props
-                            FROM {schema}.{table}
-                        """).format(
-                            label_lit=sql.Literal(label),
-                            schema=graph_ident,
-                            table=sql.Identifier(label),
-                        )
-                    )
-
-                cur.execute(sql.SQL(" UNION ALL ").join(union_parts))
-
-                for row in cur.fetchall():
-                    age_id, label, props_str = row
-                    try:
-                        props = json.loads(props_str) if props_str else {}
-                        domain_id = props.get("id", "")
-                        props_copy = {
-                            k: v for k, v in props.items() if k not in reserved_keys
-                        }
-                        nodes.append(
-                            {
-                                "id": age_id,
-                                "domainId": domain_id,
-                                "label": props.get("name")
-                                or props.get("slug")
-                                or domain_id
-                                or label,
-                                "type": label,
-                                **props_copy,
-                            }
-                        )
-                    except json.JSONDecodeError:
-                        continue
-
-            logger.info(f"Fetched {len(nodes)} nodes")
-
-            edges: list[dict[str, Any]] = []
-            if edge_labels:
-                union_parts = []
-                for label in edge_labels:
-                    union_parts.append(
-                        sql.SQL("""
-                            SELECT
-                                id::text AS age_id,
-                                start_id::text AS source,
-                                end_id::text AS target,
-                                {label_lit} AS label,
-                                ag_catalog.agtype_out(properties) AS props
-                            FROM {schema}.{table}
-                        """).format(
-                            label_lit=sql.Literal(label),
-                            schema=graph_ident,
-                            table=sql.Identifier(label),
-                        )
-                    )
-
-                cur.execute(sql.SQL(" UNION ALL ").join(union_parts))
-
-                for row in cur.fetchall():
-                    age_id, source, target, label, props_str = row
-                    try:
-                        props = json.loads(props_str) if props_str else {}
-                        domain_id = props.get("id", "")
-                        props_copy = {
-                            k: v for k, v in props.items() if k not in reserved_keys
-                        }
-                        edges.append(
-                            {
-                                "id": age_id,
-                                "domainId": domain_id,
-                                "source": source,
-                                "target": target,
-                                "type": label,
-                                **props_copy,
-                            }
-                        )
-                    except json.JSONDecodeError:
-                        continue
-
-            logger.info(f"Fetched {len(edges)} edges")
-
-        return {"nodes": nodes, "edges": edges}
+            total = 0
+            with conn.cursor(name=f"bulk_graph_{kind}") as cur:
+                cur.itersize = batch_size
+                cur.execute(query, params)
+                while rows := cur.fetchmany(batch_size):
+                    batch = [e for e in map(convert, rows) if e is not None]
+                    total += len(batch)
+                    if batch:
+                        yield kind, batch
+            logger.info(f"Streamed {total} {kind}")
     except Exception as e:
         logger.exception(f"Error fetching graph data: {e}")
         raise
     finally:
+        # End the read transaction the named cursors ran in
+        try:
+            conn.rollback()
+        except Exception as e:
+            logger.warning(f"Rollback after graph data read failed: {e}")
         pool.return_connection(conn)
+
+
+def fetch_bulk_graph_data(pool: ConnectionPool, graph_name: str) -> dict[str, Any]:
+    """Fetch all nodes and edges from the graph using direct SQL.
+
+    Uses direct SQL queries on AGE label tables instead of Cypher for
+    maximum performance with large graphs. Cypher MATCH scans everything
+    through the AGE layer which is slow for large datasets.
+
+    Collects :func:`iter_bulk_graph_batches` into memory; prefer streaming
+    the batches for large graphs.
+
+    Args:
+        pool: AGE connection pool.
+        graph_name: The AGE graph name (e.g. ``tenant_{tenant_id}``).
+
+    Returns:
+        Dict with ``nodes`` and ``edges`` lists in Cosmograph-compatible format.
+    """
+    result: dict[str, Any] = {"nodes": [], "edges": []}
+    for kind, batch in iter_bulk_graph_batches(pool, graph_name):
+        result[kind].extend(batch)
+    return result
@@ -0,0 +1,23 @@
+"""SQLAlchemy model for chunked mutation apply checkpoints."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, Integer, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from infrastructure.database.models import Base
+
+
+class GraphMutationCheckpointModel(Base):
+    """Operations committed so far for one mutation log of a knowledge graph."""
+
+    __tablename__ = "graph_mutation_checkpoints"
+
+    knowledge_graph_id: Mapped[str] = mapped_column(String(26), primary_key=True)
+    log_digest: Mapped[str] = mapped_column(String(64), primary_key=True)
+    operations_committed: Mapped[int] = mapped_column(Integer, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
@@ -5,7 +5,8 @@ bulk loading strategy. Uses Domain-Oriented Observability for tracking.
 
 The MutationApplier is a thin coordinator that:
 1. Validates operations
-2. Delegates execution to a database-specific BulkLoadingStrategy
+2. Delegates execution to a database-specific BulkLoadingStrategy,
+   optionally in fixed-size chunks that each commit in their own transaction
 
 Different strategies optimize for their target database:
 - AgeBulkLoadingStrategy: PostgreSQL COPY + staging tables for AGE
@@ -14,9 +15,12 @@ Different strategies optimize for their target database:
 
 from __future__ import annotations
 
+import time
+
 from graph.domain.value_objects import EntityType, MutationOperation, MutationResult
 from graph.infrastructure.observability import DefaultMutationProbe
 from graph.ports.bulk_loading import BulkLoadingStrategy
+from graph.ports.mutation_checkpoint import IMutationCheckpoint
 from graph.ports.observability import MutationProbe
 from graph.ports.protocols import GraphClientProtocol
 
@@ -28,6 +32,14 @@ class MutationApplier:
     execution to a database-specific BulkLoadingStrategy.
 
     Uses Domain-Oriented Observability for tracking.
+
+    With ``chunk_size`` set, the sorted operations are applied in chunks of at
+    most that many operations, each in its own transaction.  Locks are then
+    held for one chunk at a time, a failed chunk is retried by the strategy
+    on its own, and progress is reported after every commit.  With a
+    ``checkpoint`` the committed operation count is also persisted after
+    every chunk, and a later ``apply_batch(..., resume_from=...)`` of the
+    same operations skips the operations already committed.
     """
 
     def __init__(
@@ -35,6 +47,8 @@ class MutationApplier:
         client: GraphClientProtocol,
         bulk_loading_strategy: BulkLoadingStrategy,
         probe: MutationProbe | None = None,
+        chunk_size: int | None = None,
+        checkpoint: IMutationCheckpoint | None = None,
     ):
         """Initialize the mutation applier.
 
@@ -42,10 +56,19 @@ class MutationApplier:
             client: Graph database client for executing queries
             bulk_loading_strategy: Database-specific strategy for bulk loading
             probe: Domain probe for observability (optional, defaults to DefaultMutationProbe)
+            chunk_size: Maximum operations per transaction.  None or 0 applies
+                the whole batch in a single transaction.
+            checkpoint: Durable progress marker for the batch being applied.
+                Saved after every committed chunk and cleared once the whole
+                batch is applied; unused without ``chunk_size``.
         """
+        if chunk_size is not None and chunk_size < 0:
+            raise ValueError("chunk_size must be a positive integer or None")
         self._client = client
         self._strategy = bulk_loading_strategy
         self._probe = probe or DefaultMutationProbe()
+        self._chunk_size = chunk_size or None
+        self._checkpoint = checkpoint
 
     def _sort_operations(
         self, operations: list[MutationOperation]
@@ -81,20 +104,30 @@ class MutationApplier:
         return sorted(operations, key=sort_key)
 
     def apply_batch(
-        self,
-        operations: list[MutationOperation],
+        self, operations: list[MutationOperation], resume_from: int = 0
     ) -> MutationResult:
-        """Apply a batch of mutations atomically.
+        """Apply a batch of mutations.
 
         Validates operations, sorts them into correct execution order, and
-        delegates execution to the bulk loading strategy.
+        delegates execution to the bulk loading strategy.  Without chunking
+        the batch is atomic.  With chunking each chunk is atomic, and a
+        failed result's ``operations_applied`` counts the operations
+        committed before the failing chunk.
 
         Args:
             operations: List of mutation operations to apply (order does not matter)
+            resume_from: Number of sorted operations already committed by an
+                earlier chunked apply of the same operations; those are
+                skipped.
 
         Returns:
             MutationResult with success status and operation count
+
+        Raises:
+            ValueError: If resume_from is outside the batch
         """
+        if not 0 <= resume_from <= len(operations):
+            raise ValueError("resume_from must be between 0 and the batch size")
         if not operations:
             self._probe.apply_batch_completed(
                 total_operations=0,
@@ -124,13 +157,69 @@ class MutationApplier:
                 errors=[str(e)],
             )
 
-        # Sort operations to respect referential integrity
+        # Sort operations to respect referential integrity.  The sort is
+        # stable, so the same input always yields the same chunk boundaries.
         sorted_ops = self._sort_operations(operations)
 
-        # Delegate to the bulk loading strategy (passes pre-sorted operations)
-        return self._strategy.apply_batch(
-            client=self._client,
-            operations=sorted_ops,
-            probe=self._probe,
-            graph_name=self._client.graph_name,
-        )
+        if self._chunk_size is None:
+            # Delegate to the bulk loading strategy (passes pre-sorted operations)
+            return self._strategy.apply_batch(
+                client=self._client,
+                operations=sorted_ops[resume_from:],
+                probe=self._probe,
+                graph_name=self._client.graph_name,
+            )
+
+        return self._apply_chunked(sorted_ops, self._chunk_size, resume_from)
+
+    def _apply_chunked(
+        self, sorted_ops: list[MutationOperation], chunk_size: int, resume_from: int
+    ) -> MutationResult:
+        """Apply pre-sorted operations chunk by chunk, committing each chunk.
+
+        Chunks are contiguous slices of the sorted operations starting at
+        ``resume_from``, so the DELETE → CREATE → UPDATE and node/edge
+        ordering is preserved across chunk boundaries and across resumes.
+        """
+        total = len(sorted_ops)
+        chunk_starts = list(range(resume_from, total, chunk_size))
+        committed = resume_from
+
+        for chunk_index, start in enumerate(chunk_starts):
+            chunk = sorted_ops[start : start + chunk_size]
+            chunk_start = time.perf_counter()
+
+            result = self._strategy.apply_batch(
+                client=self._client,
+                operations=chunk,
+                probe=self._probe,
+                graph_name=self._client.graph_name,
+            )
+            if not result.success:
+                return MutationResult(
+                    success=False,
+                    operations_applied=committed,
+                    errors=[
+                        *result.errors,
+                        (
+                            f"Chunk {chunk_index + 1} of {len(chunk_starts)} failed; "
+                            f"{committed} of {total} operations are committed."
+                        ),
+                    ],
+                    error_kind=result.error_kind,
+                )
+
+            committed += len(chunk)
+            self._probe.chunk_committed(
+                chunk_index=chunk_index,
+                chunk_count=len(chunk_starts),
+                operations_committed=committed,
+                total_operations=total,
+                duration_ms=(time.perf_counter() - chunk_start) * 1000,
+            )
+            if self._checkpoint is not None:
+                self._checkpoint.save(committed)
+
+        if self._checkpoint is not None:
+            self._checkpoint.clear()
+        return MutationResult(success=True, operations_applied=committed)
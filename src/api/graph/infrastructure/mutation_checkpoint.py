@@ -0,0 +1,91 @@
+"""Postgres-backed checkpoints for chunked mutation apply.
+
+Checkpoints live in ``graph_mutation_checkpoints`` in the same database as
+the tenant AGE graphs, and are written on the graph client's connection
+right after each chunk commits.  A crash between the two commits leaves
+the checkpoint one chunk behind; resuming then re-applies that chunk,
+which is safe because CREATE merges and DELETE and UPDATE are idempotent.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Any
+
+from psycopg2 import sql
+
+from graph.domain.value_objects import MutationOperation
+from graph.infrastructure.models.graph_mutation_checkpoint import (
+    GraphMutationCheckpointModel,
+)
+
+_TABLE = sql.Identifier(GraphMutationCheckpointModel.__tablename__)
+
+
+def mutation_log_digest(operations: list[MutationOperation]) -> str:
+    """Return a stable SHA-256 digest identifying a mutation log's contents."""
+    digest = hashlib.sha256()
+    for operation in operations:
+        digest.update(operation.model_dump_json().encode())
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+class PostgresMutationCheckpoint:
+    """Checkpoint of one mutation log, stored per knowledge graph and log digest."""
+
+    def __init__(
+        self, connection: Any, *, knowledge_graph_id: str, log_digest: str
+    ) -> None:
+        """Bind the checkpoint to a mutation log.
+
+        Args:
+            connection: psycopg2 connection to the graph database.  Every
+                call runs and commits its own short transaction, so it must
+                not be used while a chunk's transaction is open.
+            knowledge_graph_id: Knowledge graph the log is applied to
+            log_digest: ``mutation_log_digest`` of the log's operations
+        """
+        self._connection = connection
+        self._key = (knowledge_graph_id, log_digest)
+
+    def load(self) -> int:
+        """Return the number of operations already committed (0 if none)."""
+        with self._connection.cursor() as cursor:
+            cursor.execute(
+                sql.SQL(
+                    "SELECT operations_committed FROM {} "
+                    "WHERE knowledge_graph_id = %s AND log_digest = %s"
+                ).format(_TABLE),
+                self._key,
+            )
+            row = cursor.fetchone()
+        self._connection.commit()
+        return int(row[0]) if row else 0
+
+    def save(self, operations_committed: int) -> None:
+        """Record that the first ``operations_committed`` operations are committed."""
+        with self._connection.cursor() as cursor:
+            cursor.execute(
+                sql.SQL(
+                    "INSERT INTO {} "
+                    "(knowledge_graph_id, log_digest, operations_committed, updated_at) "
+                    "VALUES (%s, %s, %s, NOW()) "
+                    "ON CONFLICT (knowledge_graph_id, log_digest) DO UPDATE SET "
+                    "operations_committed = EXCLUDED.operations_committed, "
+                    "updated_at = EXCLUDED.updated_at"
+                ).format(_TABLE),
+                (*self._key, operations_committed),
+            )
+        self._connection.commit()
+
+    def clear(self) -> None:
+        """Delete the checkpoint once the whole log is applied."""
+        with self._connection.cursor() as cursor:
+            cursor.execute(
+                sql.SQL(
+                    "DELETE FROM {} WHERE knowledge_graph_id = %s AND log_digest = %s"
+                ).format(_TABLE),
+                self._key,
+            )
+        self._connection.commit()
@@ -8,7 +8,9 @@ from graph.domain.value_objects import MutationOperation, MutationResult
 class NoOpMutationApplier:
     """Accept mutation batches without touching the graph database."""
 
-    def apply_batch(self, operations: list[MutationOperation]) -> MutationResult:
+    def apply_batch(
+        self, operations: list[MutationOperation], resume_from: int = 0
+    ) -> MutationResult:
         """Report success for schema-only batches."""
-        _ = operations
+        _ = operations, resume_from
         return MutationResult(success=True, operations_applied=0)
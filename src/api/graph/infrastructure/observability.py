@@ -219,6 +219,25 @@ class DefaultMutationProbe:
             **self._get_context_kwargs(),
         )
 
+    def chunk_committed(
+        self,
+        chunk_index: int,
+        chunk_count: int,
+        operations_committed: int,
+        total_operations: int,
+        duration_ms: float,
+    ) -> None:
+        """Record that one chunk of a chunked apply was committed."""
+        self._logger.info(
+            "mutation_chunk_committed",
+            chunk_index=chunk_index,
+            chunk_count=chunk_count,
+            operations_committed=operations_committed,
+            total_operations=total_operations,
+            duration_ms=round(duration_ms, 2),
+            **self._get_context_kwargs(),
+        )
+
     def duplicate_ids_detected(
         self,
         duplicate_ids: list[str],
@@ -318,6 +337,22 @@ class DefaultAgeBulkLoadingProbe:
             duration_ms=round(duration_ms, 2),
         )
 
+    def ids_resolved(
+        self,
+        table_name: str,
+        entity_type: str,
+        resolved_count: int,
+        duration_ms: float,
+    ) -> None:
+        """Record that DELETE/UPDATE staging IDs were resolved to graphids."""
+        self._logger.debug(
+            "age_ids_resolved",
+            table_name=table_name,
+            entity_type=entity_type,
+            resolved_count=resolved_count,
+            duration_ms=round(duration_ms, 2),
+        )
+
     def labels_pre_created(
         self,
         entity_type: str,
@@ -334,6 +369,20 @@ class DefaultAgeBulkLoadingProbe:
             duration_ms=round(duration_ms, 2),
         )
 
+    def label_cache_checked(
+        self,
+        graph_name: str,
+        hits: int,
+        misses: int,
+    ) -> None:
+        """Record label catalog cache usage for a batch of labels."""
+        self._logger.debug(
+            "age_label_cache_checked",
+            graph_name=graph_name,
+            hits=hits,
+            misses=misses,
+        )
+
     def indexes_pre_created(
         self,
         entity_type: str,
@@ -354,11 +403,13 @@ class DefaultAgeBulkLoadingProbe:
         self,
         row_count: int,
         duration_ms: float,
+        lookup_mode: str = "full_scan",
     ) -> None:
         """Record that a graphid lookup table was created for edge resolution."""
         self._logger.debug(
             "age_graphid_lookup_table_created",
             row_count=row_count,
+            lookup_mode=lookup_mode,
             duration_ms=round(duration_ms, 2),
         )
 
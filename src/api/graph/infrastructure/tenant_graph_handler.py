@@ -2,6 +2,8 @@
 
 When a TenantCreated event is processed from the outbox, this handler
 provisions a dedicated Apache AGE graph named `tenant_{tenant_id}`.
+When a TenantDeleted event is processed, cached state for that graph is
+invalidated.
 
 The provisioning uses create-if-not-exists semantics, making the handler
 safe for idempotent replay (as required by the outbox pattern).
@@ -13,12 +15,66 @@ Scenario: Tenant graph provisioning
 from __future__ import annotations
 
 import asyncio
+import threading
+import time
+from collections.abc import Callable
 from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 
+from graph.infrastructure.age_bulk_loading import get_shared_label_cache
+
 if TYPE_CHECKING:
     from infrastructure.database.connection import ConnectionFactory
 
 
+class OperationalGraphCache:
+    """Remembers tenant graphs recently verified as operational.
+
+    Verifying a graph takes an advisory lock, a catalog lookup and a Cypher
+    probe.  Callers that hit the same tenant graph many times per job can
+    skip that work while an entry is fresh.  Entries expire after the TTL
+    passed to ``is_operational`` and are invalidated when the graph is
+    dropped or its tenant is deleted.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._verified_at: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def is_operational(self, graph_name: str, ttl_seconds: float) -> bool:
+        """Return True if the graph was verified less than ``ttl_seconds`` ago."""
+        with self._lock:
+            verified_at = self._verified_at.get(graph_name)
+        return verified_at is not None and (self._clock() - verified_at < ttl_seconds)
+
+    def mark_operational(self, graph_name: str) -> None:
+        """Record that the graph was just verified as operational."""
+        with self._lock:
+            self._verified_at[graph_name] = self._clock()
+
+    def invalidate(self, graph_name: str | None = None) -> None:
+        """Forget one graph, or every graph when ``graph_name`` is None."""
+        with self._lock:
+            if graph_name is None:
+                self._verified_at.clear()
+            else:
+                self._verified_at.pop(graph_name, None)
+
+
+_operational_graphs = OperationalGraphCache()
+
+
+def get_operational_graph_cache() -> OperationalGraphCache:
+    """Return the process-wide cache of operational tenant graphs."""
+    return _operational_graphs
+
+
+def invalidate_tenant_graph(graph_name: str) -> None:
+    """Drop every process-wide cache entry for a tenant graph."""
+    _operational_graphs.invalidate(graph_name)
+    get_shared_label_cache().invalidate(graph_name)
+
+
 @runtime_checkable
 class GraphProvisioner(Protocol):
     """Protocol for provisioning AGE graph databases.
@@ -140,6 +196,8 @@ class AGEGraphProvisioner:
                 self._create_graph(cursor, graph_name)
 
             conn.commit()
+            # Cached state of a dropped graph must not outlive it
+            invalidate_tenant_graph(graph_name)
 
         except Exception:
             conn.rollback()
@@ -152,10 +210,21 @@ class AGEGraphProvisioner:
 def ensure_tenant_graph_operational(
     connection_factory: "ConnectionFactory",
     tenant_id: str,
+    *,
+    cache_ttl_seconds: float = 0.0,
 ) -> str:
-    """Ensure ``tenant_{tenant_id}`` exists and accepts Cypher queries."""
+    """Ensure ``tenant_{tenant_id}`` exists and accepts Cypher queries.
+
+    With a positive ``cache_ttl_seconds`` the check is skipped while the
+    graph was verified within that window by this process.
+    """
     graph_name = f"tenant_{tenant_id}"
+    if cache_ttl_seconds > 0 and _operational_graphs.is_operational(
+        graph_name, cache_ttl_seconds
+    ):
+        return graph_name
     AGEGraphProvisioner(connection_factory).ensure_graph_exists(graph_name)
+    _operational_graphs.mark_operational(graph_name)
     return graph_name
 
 
@@ -165,6 +234,8 @@ class TenantAGEGraphHandler:
     Handles TenantCreated events from the transactional outbox.
     For each new tenant, ensures a dedicated AGE graph named
     `tenant_{tenant_id}` is created (create-if-not-exists, idempotent).
+    TenantDeleted events invalidate the process-wide caches for the
+    tenant's graph; the graph itself is left in place.
 
     This handler is safe for replay: if the graph already exists,
     the provisioner performs a no-op, so retrying after a partial
@@ -189,21 +260,22 @@ class TenantAGEGraphHandler:
         """Return the event types this handler processes.
 
         Returns:
-            Frozenset containing only "TenantCreated".
+            Frozenset containing "TenantCreated" and "TenantDeleted".
         """
-        return frozenset({"TenantCreated"})
+        return frozenset({"TenantCreated", "TenantDeleted"})
 
     async def handle(self, event_type: str, payload: dict[str, Any]) -> None:
         """Provision an AGE graph for the newly created tenant.
 
         Extracts the tenant_id from the payload, computes the graph name
-        as `tenant_{tenant_id}`, and delegates to the provisioner.
+        as `tenant_{tenant_id}`, and delegates to the provisioner. For
+        TenantDeleted, only the cached state for the graph is invalidated.
 
         The provisioner's synchronous call is run in the default thread
         executor so it does not block the event loop (psycopg2 is sync).
 
         Args:
-            event_type: Must be "TenantCreated".
+            event_type: "TenantCreated" or "TenantDeleted".
             payload: Serialized event dict containing at minimum "tenant_id".
 
         Raises:
@@ -214,6 +286,10 @@ class TenantAGEGraphHandler:
         tenant_id = payload["tenant_id"]
         graph_name = f"tenant_{tenant_id}"
 
+        if event_type == "TenantDeleted":
+            invalidate_tenant_graph(graph_name)
+            return
+
         loop = asyncio.get_event_loop()
         await loop.run_in_executor(
             None, self._graph_provisioner.ensure_graph_exists, graph_name
@@ -83,6 +83,23 @@ class AgeBulkLoadingProbe(Protocol):
         """
         ...
 
+    def ids_resolved(
+        self,
+        table_name: str,
+        entity_type: str,
+        resolved_count: int,
+        duration_ms: float,
+    ) -> None:
+        """Record that DELETE/UPDATE staging IDs were resolved to graphids.
+
+        Args:
+            table_name: Name of the DELETE or UPDATE staging table
+            entity_type: "node" or "edge"
+            resolved_count: Number of IDs that exist in the graph
+            duration_ms: Time taken for resolution
+        """
+        ...
+
     def labels_pre_created(
         self,
         entity_type: str,
@@ -100,6 +117,21 @@ class AgeBulkLoadingProbe(Protocol):
         """
         ...
 
+    def label_cache_checked(
+        self,
+        graph_name: str,
+        hits: int,
+        misses: int,
+    ) -> None:
+        """Record label catalog cache usage for a batch of labels.
+
+        Args:
+            graph_name: Graph whose labels were looked up
+            hits: Labels resolved from the process-wide label cache
+            misses: Labels that required reading ag_catalog.ag_label
+        """
+        ...
+
     def indexes_pre_created(
         self,
         entity_type: str,
@@ -121,12 +153,15 @@ class AgeBulkLoadingProbe(Protocol):
         self,
         row_count: int,
         duration_ms: float,
+        lookup_mode: str = "full_scan",
     ) -> None:
         """Record that a graphid lookup table was created for edge resolution.
 
         Args:
             row_count: Number of nodes in the lookup table
             duration_ms: Time taken to create and index the lookup table
+            lookup_mode: "full_scan" (every vertex) or "incremental"
+                (only endpoints referenced by the batch)
         """
         ...
 
@@ -0,0 +1,27 @@
+"""Port protocol for chunked mutation apply checkpoints in the Graph bounded context."""
+
+from __future__ import annotations
+
+from typing import Protocol
+
+
+class IMutationCheckpoint(Protocol):
+    """Durable progress marker for one mutation log applied in chunks.
+
+    A checkpoint is bound to a single mutation log.  It records how many of
+    the log's sorted operations are committed so that a crashed or failed
+    apply can resume after the last committed chunk instead of starting
+    over.
+    """
+
+    def load(self) -> int:
+        """Return the number of operations already committed (0 if none)."""
+        ...
+
+    def save(self, operations_committed: int) -> None:
+        """Durably record that the first ``operations_committed`` operations are committed."""
+        ...
+
+    def clear(self) -> None:
+        """Forget the checkpoint once the whole log is applied."""
+        ...
@@ -46,7 +46,7 @@ class MutationProbe(Protocol):
         Args:
             operation: The operation type (CREATE, UPDATE, DELETE)
             entity_type: The entity type (node or edge)
-            label: The label for CREATE operations (None for UPDATE/DELETE)
+            label: The label the statement targeted (None if not label-scoped)
             count: Number of operations in the batch
             duration_ms: Time taken to execute the batch in milliseconds
         """
@@ -69,6 +69,25 @@ class MutationProbe(Protocol):
         """
         ...
 
+    def chunk_committed(
+        self,
+        chunk_index: int,
+        chunk_count: int,
+        operations_committed: int,
+        total_operations: int,
+        duration_ms: float,
+    ) -> None:
+        """Record that one chunk of a chunked apply was committed.
+
+        Args:
+            chunk_index: Zero-based index of the committed chunk
+            chunk_count: Total number of chunks in the apply
+            operations_committed: Operations committed so far, in execution order
+            total_operations: Total number of operations in the apply
+            duration_ms: Time taken to apply and commit the chunk
+        """
+        ...
+
     def duplicate_ids_detected(
         self,
         duplicate_ids: list[str],
@@ -232,6 +232,7 @@ class IMutationApplier(Protocol):
     def apply_batch(
         self,
         operations: list[MutationOperation],
+        resume_from: int = 0,
     ) -> MutationResult:
         """Apply a batch of mutations atomically.
 
@@ -240,6 +241,8 @@ class IMutationApplier(Protocol):
 
         Args:
             operations: List of mutation operations to apply
+            resume_from: Number of sorted operations already committed by an
+                earlier chunked apply of the same batch; those are skipped
 
         Returns:
             MutationResult with success status and operation count
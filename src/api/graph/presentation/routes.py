@@ -5,11 +5,15 @@ Provides REST API for manual testing and future external integrations.
 
 from __future__ import annotations
 
-import gzip
+import asyncio
+import json
+import zlib
+from collections.abc import AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
 from typing import Annotated, Any
 
 from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request, status
-from fastapi.responses import Response
+from fastapi.responses import StreamingResponse
 from starlette.concurrency import run_in_threadpool
 
 from iam.application.value_objects import CurrentUser
@@ -17,7 +21,7 @@ from iam.dependencies.user import get_current_user
 from infrastructure.authorization_dependencies import get_spicedb_client
 from infrastructure.database.connection_pool import ConnectionPool
 from infrastructure.dependencies import get_age_connection_pool
-from shared_kernel.authorization.protocols import AuthorizationProvider
+from shared_kernel.authorization.protocols import AuthorizationProvider, CheckRequest
 from shared_kernel.authorization.types import (
     Permission,
     ResourceType,
@@ -43,7 +47,10 @@ from graph.domain.value_objects import (
     SchemaLabelsResponse,
     TypeDefinition,
 )
-from graph.infrastructure.bulk_data_reader import fetch_bulk_graph_data
+from graph.infrastructure.bulk_data_reader import (
+    EntityKind,
+    iter_bulk_graph_batches,
+)
 
 router = APIRouter(
     prefix="/graph",
@@ -316,6 +323,96 @@ async def get_edge_schema_endpoint(
     return schema
 
 
+def _redact_visualizer_entity(
+    kind: EntityKind, entity: dict[str, Any], granted: dict[str, bool]
+) -> dict[str, Any]:
+    """Return the entity, or its redacted stub when its KG is not viewable."""
+    kg = _visualizer_kg_id(entity)
+    if kg is not None and granted.get(kg, False):
+        return entity
+    if kind == "nodes":
+        return {
+            "id": entity["id"],
+            "domainId": entity.get("domainId", ""),
+            "type": entity.get("type", "unknown"),
+            "label": "",
+            "_redacted": True,
+        }
+    return {
+        "id": entity["id"],
+        "domainId": entity.get("domainId", ""),
+        "source": entity["source"],
+        "target": entity["target"],
+        "type": entity.get("type", "unknown"),
+        "_redacted": True,
+    }
+
+
+def _visualizer_kg_id(entity: dict[str, Any]) -> str | None:
+    val = entity.get("knowledge_graph_id")
+    return val if isinstance(val, str) and val else None
+
+
+class _VisualizerEncoder:
+    """Incrementally encodes visualizer batches as JSON or NDJSON.
+
+    JSON output has the same ``{"nodes": [...], "edges": [...]}`` shape as a
+    single document would; NDJSON output emits one ``{"node": {...}}`` or
+    ``{"edge": {...}}`` object per line. Output is optionally gzip-framed
+    chunk by chunk.
+    """
+
+    def __init__(self, ndjson: bool, compress: bool) -> None:
+        self._ndjson = ndjson
+        self._compressor = (
+            zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+            if compress
+            else None
+        )
+        self._section: EntityKind | None = None
+        self._first_in_section = True
+
+    def batch(
+        self, kind: EntityKind, batch: list[dict[str, Any]], granted: dict[str, bool]
+    ) -> bytes:
+        entities = [_redact_visualizer_entity(kind, e, granted) for e in batch]
+        if self._ndjson:
+            key = "node" if kind == "nodes" else "edge"
+            text = "".join(json.dumps({key: e}) + "\n" for e in entities)
+        else:
+            text = self._enter_section(kind)
+            if not self._first_in_section:
+                text += ","
+            text += ",".join(json.dumps(e) for e in entities)
+            self._first_in_section = False
+        return self._encode(text)
+
+    def finish(self) -> bytes:
+        text = ""
+        if not self._ndjson:
+            text = self._enter_section("edges") + "]}"
+        data = self._encode(text)
+        if self._compressor is not None:
+            data += self._compressor.flush()
+        return data
+
+    def _enter_section(self, kind: EntityKind) -> str:
+        if self._section == kind:
+            return ""
+        prefix = '{"nodes":[' if self._section is None else ""
+        if kind == "edges":
+            prefix += '],"edges":['
+        self._section = kind
+        self._first_in_section = True
+        return prefix
+
+    def _encode(self, text: str) -> bytes:
+        data = text.encode("utf-8")
+        if self._compressor is not None:
+            data = self._compressor.compress(data)
+        return data
+
+
 @router.get("/visualizer/data")
 async def get_visualizer_data(
     request: Request,
@@ -323,8 +420,8 @@ async def get_visualizer_data(
     current_user: Annotated[CurrentUser, Depends(get_current_user)],
     authz: Annotated[AuthorizationProvider, Depends(get_spicedb_client)],
     knowledge_graph_id: Annotated[str | None, Query()] = None,
-) -> Response:
-    """Fetch all nodes and edges for the tenant graph (bulk read for visualization).
+) -> StreamingResponse:
+    """Stream all nodes and edges for the tenant graph (bulk read for visualization).
 
     Applies Secure Enclave redaction: entities belonging to KnowledgeGraphs
     the caller does not have VIEW permission on are redacted to preserve
@@ -332,90 +429,79 @@ async def get_visualizer_data(
     ``id`` and ``type`` set to ``"_redacted"``; redacted edges carry ``id``,
     ``source``, ``target``, and ``type`` set to ``"_redacted"``.
 
-    Response is gzip-compressed when the client accepts it.
+    The graph is read and sent in batches, so server memory does not grow
+    with graph size. The body is a ``{"nodes": [...], "edges": [...]}`` JSON
+    document, or NDJSON (one ``{"node": ...}``/``{"edge": ...}`` per line)
+    when the client sends ``Accept: application/x-ndjson``. Response is
+    gzip-compressed when the client accepts it.
 
     Query parameters:
-        knowledge_graph_id: Optional filter to a single KnowledgeGraph.
+        knowledge_graph_id: Optional filter to a single KnowledgeGraph,
+            applied in the database query.
     """
-    import json as json_mod
-
     graph_name = get_tenant_graph_name(current_user)
-    graph_data = await run_in_threadpool(fetch_bulk_graph_data, pool, graph_name)
+    batches = iter_bulk_graph_batches(
+        pool, graph_name, knowledge_graph_id=knowledge_graph_id
+    )
 
     subject = format_subject(ResourceType.USER, current_user.user_id.value)
     kg_cache: dict[str, bool] = {}
 
-    async def has_view(kg_id: str) -> bool:
-        if kg_id in kg_cache:
-            return kg_cache[kg_id]
+    async def resolve_permissions(batch: list[dict[str, Any]]) -> None:
+        # One bulk check for the knowledge graphs first seen in this batch
+        resources = {
+            kg_id: format_resource(ResourceType.KNOWLEDGE_GRAPH, kg_id)
+            for kg_id in {_visualizer_kg_id(entity) for entity in batch}
+            if kg_id is not None and kg_id not in kg_cache
+        }
+        if not resources:
+            return
         try:
-            resource = format_resource(ResourceType.KNOWLEDGE_GRAPH, kg_id)
-            granted = await authz.check_permission(resource, Permission.VIEW, subject)
-        except Exception:
-            granted = False
-        kg_cache[kg_id] = granted
-        return granted
-
-    def get_kg_id(entity: dict[str, Any]) -> str | None:
-        val = entity.get("knowledge_graph_id")
-        return val if isinstance(val, str) and val else None
-
-    result_nodes = []
-    for node in graph_data.get("nodes", []):
-        kg = get_kg_id(node)
-        if knowledge_graph_id and (kg is None or kg != knowledge_graph_id):
-            continue
-        if kg is not None and await has_view(kg):
-            result_nodes.append(node)
-        else:
-            result_nodes.append(
-                {
-                    "id": node["id"],
-                    "domainId": node.get("domainId", ""),
-                    "type": node.get("type", "unknown"),
-                    "label": "",
-                    "_redacted": True,
-                }
-            )
-
-    result_edges = []
-    for edge in graph_data.get("edges", []):
-        kg = get_kg_id(edge)
-        if knowledge_graph_id and (kg is None or kg != knowledge_graph_id):
-            continue
-        if kg is not None and await has_view(kg):
-            result_edges.append(edge)
-        else:
-            result_edges.append(
-                {
-                    "id": edge["id"],
-                    "domainId": edge.get("domainId", ""),
-                    "source": edge["source"],
-                    "target": edge["target"],
-                    "type": edge.get("type", "unknown"),
-                    "_redacted": True,
-                }
+            permitted = await authz.bulk_check_permission(
+                [
+                    CheckRequest(
+                        resource=resource, permission=Permission.VIEW, subject=subject
+                    )
+                    for resource in resources.values()
+                ]
             )
-
-    result = {"nodes": result_nodes, "edges": result_edges}
-    json_bytes = json_mod.dumps(result).encode("utf-8")
-
-    accept_encoding = request.headers.get("accept-encoding", "")
-    if "gzip" in accept_encoding:
-        compressed = gzip.compress(json_bytes, compresslevel=6)
-        return Response(
-            content=compressed,
-            media_type="application/json",
-            headers={
-                "Content-Encoding": "gzip",
-                "Cache-Control": "no-cache, no-store, must-revalidate",
-            },
-        )
-
-    return Response(
-        content=json_bytes,
-        media_type="application/json",
-        headers={
-            "Cache-Control": "no-cache, no-store, must-revalidate",
-        },
+        except Exception:
+            permitted = set()
+        for kg_id, resource in resources.items():
+            kg_cache[kg_id] = resource in permitted
+
+    ndjson = "application/x-ndjson" in request.headers.get("accept", "")
+    compress = "gzip" in request.headers.get("accept-encoding", "")
+    encoder = _VisualizerEncoder(ndjson=ndjson, compress=compress)
+
+    async def body() -> AsyncIterator[bytes]:
+        # The generator is advanced and closed on one dedicated thread, so a
+        # close after a client disconnect waits for a still-running next()
+        # instead of failing with "generator already executing".
+        loop = asyncio.get_running_loop()
+        reader = ThreadPoolExecutor(max_workers=1)
+        try:
+            while item := await loop.run_in_executor(reader, next, batches, None):
+                kind, batch = item
+                await resolve_permissions(batch)
+                # Redaction and JSON encoding are CPU-bound; keep them off
+                # the event loop along with the database reads.
+                chunk = await run_in_threadpool(encoder.batch, kind, batch, kg_cache)
+                if chunk:
+                    yield chunk
+            yield encoder.finish()
+        finally:
+            try:
+                # Returns the pooled connection if the client went away early
+                await loop.run_in_executor(reader, batches.close)
+            finally:
+                reader.shutdown(wait=False)
+
+    headers = {"Cache-Control": "no-cache, no-store, must-revalidate"}
+    if compress:
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(
+        body(),
+        media_type="application/x-ndjson" if ndjson else "application/json",
+        headers=headers,
     )
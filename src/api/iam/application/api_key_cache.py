@@ -0,0 +1,130 @@
+"""In-process caches that keep bcrypt off the API key hot path.
+
+Verifying an API key secret with bcrypt costs ~250ms of CPU by design. Agents
+authenticating with the same key hundreds of times a minute would otherwise
+pay that on every request, and also write ``last_used_at`` on every request.
+
+``VerifiedAPIKeyCache`` remembers successful verifications for a short TTL,
+keyed by an HMAC of the secret (the plaintext secret is never stored).
+``APIKeyUsageRecorder`` coalesces ``last_used_at`` updates so they can be
+flushed in the background.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import hmac
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from datetime import datetime
+
+from iam.domain.aggregates import APIKey
+
+
+class VerifiedAPIKeyCache:
+    """Bounded LRU of recently verified API keys with a time-to-live.
+
+    Only keys that were valid when verified are cached; callers must still
+    check ``is_valid()`` on hits since a key may expire while cached.
+    Revocation and deletion purge entries via ``invalidate``.
+
+    Thread-safe.
+
+    Args:
+        max_entries: Entries kept before the least recently used is evicted.
+        ttl_seconds: Seconds a verification may be reused.
+        clock: Monotonic clock, injectable for tests.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        # Per-process key: digests are useless outside this process
+        self._hmac_key = secrets.token_bytes(32)
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[bytes, tuple[APIKey, float]] = OrderedDict()
+
+    def _digest(self, secret: str) -> bytes:
+        return hmac.new(self._hmac_key, secret.encode(), hashlib.sha256).digest()
+
+    def get(self, secret: str) -> APIKey | None:
+        """Return a copy of the key verified for ``secret``, if cached and fresh."""
+        digest = self._digest(secret)
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is None:
+                return None
+            api_key, expires_at = entry
+            if expires_at <= self._clock():
+                del self._entries[digest]
+                return None
+            self._entries.move_to_end(digest)
+        return dataclasses.replace(api_key, _pending_events=[])
+
+    def put(self, secret: str, api_key: APIKey) -> None:
+        """Cache a successful verification of ``secret``."""
+        cached = dataclasses.replace(api_key, _pending_events=[])
+        digest = self._digest(secret)
+        with self._lock:
+            self._entries[digest] = (cached, self._clock() + self._ttl_seconds)
+            self._entries.move_to_end(digest)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, api_key_id: str) -> None:
+        """Drop every cached verification of the given key."""
+        with self._lock:
+            stale = [
+                digest
+                for digest, (api_key, _) in self._entries.items()
+                if api_key.id.value == api_key_id
+            ]
+            for digest in stale:
+                del self._entries[digest]
+
+    def clear(self) -> None:
+        """Drop every cached verification."""
+        with self._lock:
+            self._entries.clear()
+
+
+class APIKeyUsageRecorder:
+    """Coalesces ``last_used_at`` updates until they are flushed.
+
+    Each key keeps only its latest usage time, so a key used a thousand
+    times between flushes costs a single update.
+
+    Thread-safe.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._pending: dict[str, datetime] = {}
+
+    def record(self, api_key_id: str, used_at: datetime) -> None:
+        """Record that a key was used at ``used_at``."""
+        with self._lock:
+            current = self._pending.get(api_key_id)
+            if current is None or used_at > current:
+                self._pending[api_key_id] = used_at
+
+    def drain(self) -> dict[str, datetime]:
+        """Return and forget the pending usage times, keyed by API key ID."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        return pending
+
+    def restore(self, pending: dict[str, datetime]) -> None:
+        """Put back usage times whose flush failed, keeping newer ones."""
+        for api_key_id, used_at in pending.items():
+            self.record(api_key_id, used_at)
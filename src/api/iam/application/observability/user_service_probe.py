@@ -36,6 +36,10 @@ class UserServiceProbe(Protocol):
         """Record that user provisioning failed."""
         ...
 
+    def user_provisioning_skipped(self, user_id: str, skipped_total: int) -> None:
+        """Record that provisioning was skipped for a recently seen user."""
+        ...
+
     def with_context(self, context: ObservationContext) -> UserServiceProbe:
         """Create a new probe with observation context bound."""
         ...
@@ -93,3 +97,12 @@ class DefaultUserServiceProbe:
             error=error,
             **self._get_context_kwargs(),
         )
+
+    def user_provisioning_skipped(self, user_id: str, skipped_total: int) -> None:
+        """Record that provisioning was skipped for a recently seen user."""
+        self._logger.debug(
+            "user_provisioning_skipped",
+            user_id=user_id,
+            skipped_total=skipped_total,
+            **self._get_context_kwargs(),
+        )
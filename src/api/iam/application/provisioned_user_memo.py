@@ -0,0 +1,78 @@
+"""Process-local memo of users recently provisioned from SSO claims.
+
+JIT provisioning reads (and possibly writes) the user row on every
+JWT-authenticated request. Once a user's row is known to match the
+profile in their token, repeat requests carrying the same profile can skip
+the database until the entry expires.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+
+#: (username, name, email) as carried by the SSO token
+Profile = tuple[str, str | None, str | None]
+
+
+class ProvisionedUserMemo:
+    """Bounded LRU of user ID to last provisioned profile, with a TTL.
+
+    A hit means the user row existed with exactly this profile within the
+    last ``ttl_seconds``, so provisioning would have been a no-op. A changed
+    profile is a miss and goes to the database as before.
+
+    Thread-safe.
+
+    Args:
+        max_entries: Entries kept before the least recently used is evicted.
+        ttl_seconds: Seconds a provisioned profile is trusted.
+        clock: Monotonic clock, injectable for tests.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[Profile, float]] = OrderedDict()
+        self._skipped = 0
+
+    @property
+    def skipped(self) -> int:
+        """Provisioning round trips avoided since the memo was created."""
+        return self._skipped
+
+    def is_current(self, user_id: str, profile: Profile) -> bool:
+        """Whether ``profile`` was provisioned for the user within the TTL.
+
+        Counts a skipped round trip on every hit.
+        """
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return False
+            remembered, expires_at = entry
+            if expires_at <= self._clock():
+                del self._entries[user_id]
+                return False
+            if remembered != profile:
+                return False
+            self._entries.move_to_end(user_id)
+            self._skipped += 1
+            return True
+
+    def remember(self, user_id: str, profile: Profile) -> None:
+        """Record that the user row now matches ``profile``."""
+        with self._lock:
+            self._entries[user_id] = (profile, self._clock() + self._ttl_seconds)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
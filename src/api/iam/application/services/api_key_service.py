@@ -18,6 +18,7 @@ from shared_kernel.authorization.types import (
     format_subject,
 )
 from shared_kernel.authorization.protocols import AuthorizationProvider
+from iam.application.api_key_cache import APIKeyUsageRecorder, VerifiedAPIKeyCache
 from iam.application.observability.api_key_service_probe import (
     APIKeyServiceProbe,
     DefaultAPIKeyServiceProbe,
@@ -47,6 +48,8 @@ class APIKeyService:
         api_key_repository: IAPIKeyRepository,
         authz: AuthorizationProvider,
         probe: APIKeyServiceProbe | None = None,
+        verified_key_cache: VerifiedAPIKeyCache | None = None,
+        usage_recorder: APIKeyUsageRecorder | None = None,
     ):
         """Initialize APIKeyService with dependencies.
 
@@ -54,11 +57,18 @@ class APIKeyService:
             session: Database session for transaction management
             api_key_repository: Repository for API key persistence
             probe: Optional domain probe for observability
+            verified_key_cache: Optional cache of recent successful
+                verifications, so bcrypt is skipped for repeat secrets
+            usage_recorder: Optional recorder that defers last_used_at
+                writes to a background flush; when omitted, usage is
+                written and committed on every validation
         """
         self._session = session
         self._api_key_repository = api_key_repository
         self._probe = probe or DefaultAPIKeyServiceProbe()
         self._authz = authz
+        self._verified_key_cache = verified_key_cache
+        self._usage_recorder = usage_recorder
 
     async def create_api_key(
         self,
@@ -228,6 +238,8 @@ class APIKeyService:
                 api_key.revoke()
                 await self._api_key_repository.save(api_key)
 
+            if self._verified_key_cache is not None:
+                self._verified_key_cache.invalidate(api_key_id.value)
             self._probe.api_key_revoked(
                 api_key_id=api_key_id.value,
                 user_id=user_id.value,
@@ -246,25 +258,43 @@ class APIKeyService:
         Delegates prefix extraction and hash verification to the repository,
         then checks validity (not revoked, not expired) and updates last_used_at.
 
+        Secrets verified recently are answered from the verified key cache
+        without touching the database or bcrypt. With a usage recorder,
+        last_used_at is recorded for the next background flush instead of
+        being committed here.
+
         Args:
             secret: The plaintext API key secret to validate
 
         Returns:
             The APIKey aggregate if valid, None otherwise
         """
-        # Repository handles prefix-based lookup; we inject verification functions
-        api_key = await self._api_key_repository.get_verified_key(
-            secret=secret,
-            extract_prefix_fn=extract_prefix,
-            verify_hash_fn=verify_api_key_secret,
-        )
+        api_key = None
+        if self._verified_key_cache is not None:
+            api_key = self._verified_key_cache.get(secret)
+
         if api_key is None:
-            return None
+            # Repository handles prefix-based lookup; we inject verification functions
+            api_key = await self._api_key_repository.get_verified_key(
+                secret=secret,
+                extract_prefix_fn=extract_prefix,
+                verify_hash_fn=verify_api_key_secret,
+            )
+            if api_key is None:
+                return None
+            if api_key.is_valid() and self._verified_key_cache is not None:
+                self._verified_key_cache.put(secret, api_key)
 
         # Check if key is valid (not revoked, not expired)
         if not api_key.is_valid():
             return None
 
+        if self._usage_recorder is not None:
+            api_key.record_usage()
+            assert api_key.last_used_at is not None  # set by record_usage()
+            self._usage_recorder.record(api_key.id.value, api_key.last_used_at)
+            return api_key
+
         # Update last_used_at
         # Note: We don't call begin() here because SQLAlchemy auto-begins
         # a transaction when we executed the query above. We just commit
@@ -1,4 +1,5 @@
-from typing import Annotated
+from functools import lru_cache
+from typing import Annotated, Any
 
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -6,6 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from infrastructure.authorization_dependencies import get_spicedb_client
 from shared_kernel.authorization.protocols import AuthorizationProvider
 from iam.dependencies.outbox import get_outbox_repository
+from iam.application.api_key_cache import APIKeyUsageRecorder, VerifiedAPIKeyCache
 from iam.application.observability.api_key_service_probe import (
     APIKeyServiceProbe,
     DefaultAPIKeyServiceProbe,
@@ -14,6 +16,7 @@ from iam.application.services.api_key_service import APIKeyService
 from iam.infrastructure.api_key_repository import APIKeyRepository
 from infrastructure.database.dependencies import get_write_session
 from infrastructure.outbox.repository import OutboxRepository
+from infrastructure.settings import get_iam_settings
 
 
 def get_api_key_service_probe() -> APIKeyServiceProbe:
@@ -25,6 +28,32 @@ def get_api_key_service_probe() -> APIKeyServiceProbe:
     return DefaultAPIKeyServiceProbe()
 
 
+@lru_cache
+def get_verified_api_key_cache() -> VerifiedAPIKeyCache | None:
+    """Get the process-wide cache of verified API key secrets.
+
+    Returns:
+        VerifiedAPIKeyCache, or None when disabled by a TTL of 0
+    """
+    settings = get_iam_settings()
+    if settings.api_key_cache_ttl_seconds <= 0:
+        return None
+    return VerifiedAPIKeyCache(
+        max_entries=settings.api_key_cache_max_entries,
+        ttl_seconds=settings.api_key_cache_ttl_seconds,
+    )
+
+
+@lru_cache
+def get_api_key_usage_recorder() -> APIKeyUsageRecorder:
+    """Get the process-wide recorder of API key usage awaiting a flush.
+
+    Returns:
+        APIKeyUsageRecorder flushed by the application's background task
+    """
+    return APIKeyUsageRecorder()
+
+
 def get_api_key_repository(
     session: Annotated[AsyncSession, Depends(get_write_session)],
     outbox: Annotated[OutboxRepository, Depends(get_outbox_repository)],
@@ -58,5 +87,41 @@ def get_api_key_service(
         APIKeyService instance
     """
     return APIKeyService(
-        session=session, api_key_repository=api_key_repo, probe=probe, authz=authz
+        session=session,
+        api_key_repository=api_key_repo,
+        probe=probe,
+        authz=authz,
+        verified_key_cache=get_verified_api_key_cache(),
+        usage_recorder=get_api_key_usage_recorder(),
     )
+
+
+async def flush_api_key_usage(session_factory: Any) -> int:
+    """Persist the last_used_at timestamps recorded since the previous flush.
+
+    Runs outside FastAPI's DI system (from the application's background
+    task), so it opens its own session. On failure the drained timestamps
+    are restored to the recorder so the next flush retries them.
+
+    Args:
+        session_factory: SQLAlchemy async sessionmaker for database access
+
+    Returns:
+        Number of API keys updated
+    """
+    recorder = get_api_key_usage_recorder()
+    pending = recorder.drain()
+    if not pending:
+        return 0
+
+    try:
+        async with session_factory() as session:
+            repo = APIKeyRepository(
+                session=session, outbox=OutboxRepository(session=session)
+            )
+            await repo.update_last_used_at(pending)
+            await session.commit()
+    except BaseException:
+        recorder.restore(pending)
+        raise
+    return len(pending)
@@ -1,3 +1,4 @@
+from datetime import timedelta
 from functools import lru_cache
 
 from fastapi.security import OAuth2AuthorizationCodeBearer
@@ -41,7 +42,7 @@ def get_jwt_validator() -> JWTValidator:
     """Get cached JWT validator.
 
     Uses lru_cache to ensure a single JWTValidator instance is reused across
-    requests, enabling reuse of the instance-level JWKS cache.
+    requests, enabling reuse of the instance-level JWKS and claims caches.
 
     Returns:
         JWTValidator instance configured from OIDC settings.
@@ -54,6 +55,9 @@ def get_jwt_validator() -> JWTValidator:
         probe=probe,
         user_id_claim=settings.user_id_claim,
         username_claim=settings.username_claim,
+        jwks_refresh_ahead=timedelta(seconds=settings.jwks_refresh_ahead_seconds),
+        claims_cache_max_entries=settings.claims_cache_max_entries,
+        claims_cache_ttl=timedelta(seconds=settings.claims_cache_ttl_seconds),
     )
 
 
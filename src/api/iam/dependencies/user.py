@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Annotated
 
 from fastapi import Depends, Header, HTTPException, status
@@ -9,6 +10,7 @@ from iam.application.observability import (
     DefaultUserServiceProbe,
     UserServiceProbe,
 )
+from iam.application.provisioned_user_memo import ProvisionedUserMemo
 from iam.application.services import UserService
 from iam.application.services.api_key_service import APIKeyService
 from iam.application.value_objects import AuthenticatedUser, CurrentUser
@@ -24,16 +26,21 @@ from iam.domain.aggregates import User
 from iam.domain.value_objects import TenantId, UserId
 from iam.infrastructure.tenant_repository import TenantRepository
 from iam.infrastructure.user_repository import UserRepository
-from infrastructure.authorization_dependencies import get_spicedb_client
+from infrastructure.authorization_dependencies import (
+    get_spicedb_client,
+    get_zed_token_store,
+)
 from infrastructure.database.dependencies import (
     get_tenant_context_session,
     get_write_session,
 )
 from infrastructure.outbox.repository import OutboxRepository
-from infrastructure.settings import get_iam_settings
+from infrastructure.outbox.zed_tokens import TenantZedTokenRepository
+from infrastructure.settings import get_iam_settings, get_spicedb_settings
 from iam.ports.exceptions import ProvisioningConflictError
 from shared_kernel.auth import InvalidTokenError
 from shared_kernel.authorization.protocols import AuthorizationProvider
+from shared_kernel.authorization.spicedb.consistency import ConsistencyMode
 from shared_kernel.middleware.observability import DefaultTenantContextProbe
 from shared_kernel.middleware.observability.tenant_context_probe import (
     TenantContextProbe,
@@ -170,6 +177,7 @@ async def _ensure_user_exists(
     *,
     name: str | None = None,
     email: str | None = None,
+    memo: ProvisionedUserMemo | None = None,
 ) -> None:
     """Ensure user exists in database (find-or-create with SSO profile sync).
 
@@ -178,6 +186,9 @@ async def _ensure_user_exists(
     but can be used in contexts where no tenant is available (e.g.
     ``get_authenticated_user``).
 
+    Users provisioned recently with the same profile are found in ``memo``
+    and skip the database entirely.
+
     Args:
         user_id: The user's ID (from SSO)
         username: The user's username (from SSO)
@@ -186,7 +197,15 @@ async def _ensure_user_exists(
         probe: Domain probe for observability
         name: The user's display name (from SSO)
         email: The user's email address (from SSO)
+        memo: Optional memo of recently provisioned users
     """
+    profile = (username, name, email)
+    if memo is not None and memo.is_current(user_id.value, profile):
+        probe.user_provisioning_skipped(
+            user_id=user_id.value, skipped_total=memo.skipped
+        )
+        return
+
     try:
         async with session.begin():
             existing = await user_repo.get_by_id(user_id)
@@ -212,16 +231,15 @@ async def _ensure_user_exists(
                         was_created=False,
                         was_updated=False,
                     )
-                return
-
-            user = User(id=user_id, username=username, name=name, email=email)
-            await user_repo.save(user)
-            probe.user_ensured(
-                user_id=user_id.value,
-                username=username,
-                was_created=True,
-                was_updated=False,
-            )
+            else:
+                user = User(id=user_id, username=username, name=name, email=email)
+                await user_repo.save(user)
+                probe.user_ensured(
+                    user_id=user_id.value,
+                    username=username,
+                    was_created=True,
+                    was_updated=False,
+                )
 
     except ProvisioningConflictError as e:
         probe.user_provision_failed(
@@ -242,6 +260,10 @@ async def _ensure_user_exists(
         )
         raise
 
+    # Only remembered once the transaction has committed
+    if memo is not None:
+        memo.remember(user_id.value, profile)
+
 
 # ---------------------------------------------------------------------------
 # Dependency providers
@@ -257,6 +279,22 @@ def get_user_service_probe() -> UserServiceProbe:
     return DefaultUserServiceProbe()
 
 
+@lru_cache
+def get_provisioned_user_memo() -> ProvisionedUserMemo | None:
+    """Get the process-wide memo of recently provisioned users.
+
+    Returns:
+        ProvisionedUserMemo, or None when disabled by a TTL of 0
+    """
+    settings = get_iam_settings()
+    if settings.user_provisioning_memo_ttl_seconds <= 0:
+        return None
+    return ProvisionedUserMemo(
+        max_entries=settings.user_provisioning_memo_max_entries,
+        ttl_seconds=settings.user_provisioning_memo_ttl_seconds,
+    )
+
+
 def get_user_repository(
     session: Annotated[AsyncSession, Depends(get_write_session)],
 ) -> UserRepository:
@@ -397,6 +435,9 @@ async def get_authenticated_user(
     user_repo: Annotated[UserRepository, Depends(get_user_repository)],
     session: Annotated[AsyncSession, Depends(get_write_session)],
     probe: Annotated[UserServiceProbe, Depends(get_user_service_probe)],
+    memo: Annotated[
+        ProvisionedUserMemo | None, Depends(get_provisioned_user_memo)
+    ] = None,
 ) -> AuthenticatedUser:
     """Authenticate via JWT Bearer token or X-API-Key header without tenant context.
 
@@ -412,6 +453,7 @@ async def get_authenticated_user(
         user_repo: Repository for JIT user provisioning
         session: Database session for JIT user provisioning
         probe: Domain probe for JIT provisioning observability
+        memo: Memo of recently provisioned users
 
     Returns:
         AuthenticatedUser with user_id and username (no tenant_id)
@@ -425,6 +467,7 @@ async def get_authenticated_user(
             probe,
             name=auth_result.name,
             email=auth_result.email,
+            memo=memo,
         )
 
     return AuthenticatedUser(
@@ -436,6 +479,9 @@ async def get_authenticated_user(
 async def get_current_user_no_jit(
     auth_result: Annotated[_AuthResult, Depends(_authenticate)],
     tenant_context: Annotated[TenantContext, Depends(resolve_tenant_context)],
+    zed_token_session: Annotated[
+        AsyncSession | None, Depends(get_tenant_context_session)
+    ] = None,
 ) -> CurrentUser:
     """Authenticate and resolve tenant context without JIT provisioning.
 
@@ -447,9 +493,14 @@ async def get_current_user_no_jit(
     (``_AuthResult.api_key_tenant_id``). For JWT auth, it comes from
     the resolved ``TenantContext``.
 
+    With ``at_least_as_fresh`` SpiceDB reads, the tenant's newest ZedToken
+    is loaded so that the rest of the request reads at or after the
+    tenant's latest relationship change, whichever replica applied it.
+
     Args:
         auth_result: Cached authentication result from ``_authenticate``
         tenant_context: Resolved tenant context from ``resolve_tenant_context``
+        zed_token_session: Session used to load the tenant's ZedToken
 
     Returns:
         CurrentUser with user_id, username, and tenant_id
@@ -458,6 +509,13 @@ async def get_current_user_no_jit(
         value=tenant_context.tenant_id
     )
 
+    if (
+        zed_token_session is not None
+        and get_spicedb_settings().consistency is ConsistencyMode.AT_LEAST_AS_FRESH
+    ):
+        token = await TenantZedTokenRepository(zed_token_session).get(tenant_id.value)
+        get_zed_token_store().read_at_least_as_fresh(token)
+
     return CurrentUser(
         user_id=auth_result.user_id,
         username=auth_result.username,
@@ -497,6 +555,9 @@ async def get_current_user(
     session: Annotated[AsyncSession, Depends(get_write_session)],
     probe: Annotated[UserServiceProbe, Depends(get_user_service_probe)],
     token: Annotated[str | None, Depends(oauth2_scheme)] = None,
+    memo: Annotated[
+        ProvisionedUserMemo | None, Depends(get_provisioned_user_memo)
+    ] = None,
 ) -> CurrentUser:
     """Authenticate with tenant context and JIT user provisioning.
 
@@ -513,6 +574,7 @@ async def get_current_user(
         session: Database session for JIT user provisioning
         probe: Domain probe for JIT provisioning observability
         token: Bearer token (present for JWT auth, None for API key auth)
+        memo: Memo of recently provisioned users
 
     Returns:
         CurrentUser with user_id, username, and tenant_id
@@ -526,6 +588,7 @@ async def get_current_user(
             probe,
             name=auth_result.name,
             email=auth_result.email,
+            memo=memo,
         )
 
     return current_user
@@ -11,9 +11,11 @@ writing directly to external services.
 
 from __future__ import annotations
 
+import asyncio
+from datetime import datetime
 from typing import TYPE_CHECKING, Callable
 
-from sqlalchemy import ColumnElement, and_, select
+from sqlalchemy import ColumnElement, and_, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql.elements import BinaryExpression
 from iam.domain.aggregates import APIKey
@@ -208,9 +210,9 @@ class APIKeyRepository(IAPIKeyRepository):
         if len(models) > 1:
             self._probe.api_key_prefix_collision(prefix, len(models))
 
-        # Verify hash for each candidate
+        # Verify hash for each candidate (bcrypt is CPU-bound: keep it off the loop)
         for model in models:
-            if verify_hash_fn(secret, model.key_hash):
+            if await asyncio.to_thread(verify_hash_fn, secret, model.key_hash):
                 self._probe.api_key_retrieved(model.id)
                 return self._to_aggregate(model)
 
@@ -218,6 +220,21 @@ class APIKeyRepository(IAPIKeyRepository):
         self._probe.api_key_verification_failed()
         return None
 
+    async def update_last_used_at(self, last_used: dict[str, datetime]) -> None:
+        """Advance last_used_at for each key, never moving it backwards."""
+        for api_key_id, used_at in last_used.items():
+            await self._session.execute(
+                update(APIKeyModel)
+                .where(
+                    APIKeyModel.id == api_key_id,
+                    or_(
+                        APIKeyModel.last_used_at.is_(None),
+                        APIKeyModel.last_used_at < used_at,
+                    ),
+                )
+                .values(last_used_at=used_at)
+            )
+
     async def list(
         self,
         tenant_id: TenantId,
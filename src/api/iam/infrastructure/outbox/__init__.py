@@ -1,10 +1,20 @@
 """IAM-specific outbox infrastructure.
 
-Contains the translator and serializer implementations for IAM domain events.
+Contains the translator and serializer implementations for IAM domain events,
+and the handler that keeps the verified API key cache in step with them.
 These are registered with the composite handlers at application startup.
 """
 
+from iam.infrastructure.outbox.api_key_cache_handler import (
+    API_KEY_INVALIDATION_CHANNEL,
+    APIKeyCacheInvalidationHandler,
+)
 from iam.infrastructure.outbox.serializer import IAMEventSerializer
 from iam.infrastructure.outbox.translator import IAMEventTranslator
 
-__all__ = ["IAMEventSerializer", "IAMEventTranslator"]
+__all__ = [
+    "API_KEY_INVALIDATION_CHANNEL",
+    "APIKeyCacheInvalidationHandler",
+    "IAMEventSerializer",
+    "IAMEventTranslator",
+]
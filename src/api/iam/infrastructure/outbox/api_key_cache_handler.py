@@ -0,0 +1,94 @@
+"""Outbox handler that purges revoked and deleted API keys from the cache.
+
+APIKeyService already invalidates the verified key cache of the process that
+revokes a key. This handler covers every other process: the outbox worker
+that processes the APIKeyRevoked or APIKeyDeleted event purges its own cache
+and broadcasts the key ID with ``pg_notify`` on
+``API_KEY_INVALIDATION_CHANNEL``. Each replica's outbox event source listens
+on that channel and passes the ID to ``on_notification``, which purges the
+replica's cache. A replica that misses the notification (e.g. while its
+listener reconnects) still drops the entry when the cache TTL runs out.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
+
+from sqlalchemy import text
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+#: NOTIFY channel carrying the IDs of API keys to drop from every cache.
+API_KEY_INVALIDATION_CHANNEL = "api_key_invalidations"
+
+
+@runtime_checkable
+class APIKeyInvalidator(Protocol):
+    """Anything holding per-API-key state that must be dropped."""
+
+    def invalidate(self, api_key_id: str) -> None:
+        """Drop every entry for the given API key."""
+        ...
+
+
+class APIKeyCacheInvalidationHandler:
+    """Outbox event handler dropping cached verifications of an API key.
+
+    Idempotent: invalidating a key that is not cached is a no-op, and a
+    repeated broadcast only repeats that no-op on every replica.
+    """
+
+    def __init__(
+        self,
+        cache: APIKeyInvalidator,
+        session_factory: async_sessionmaker[AsyncSession] | None = None,
+    ) -> None:
+        """Initialize the handler.
+
+        Args:
+            cache: The process-wide verified API key cache
+                (iam.application.api_key_cache.VerifiedAPIKeyCache).
+            session_factory: Sessions used to broadcast invalidations to
+                other replicas. Without it only this process is purged.
+        """
+        self._cache = cache
+        self._session_factory = session_factory
+
+    def supported_event_types(self) -> frozenset[str]:
+        """Return the event types this handler processes.
+
+        Returns:
+            Frozenset containing "APIKeyRevoked" and "APIKeyDeleted".
+        """
+        return frozenset({"APIKeyRevoked", "APIKeyDeleted"})
+
+    async def handle(self, event_type: str, payload: dict[str, Any]) -> None:
+        """Drop the cached verifications of the key named in the payload.
+
+        Args:
+            event_type: "APIKeyRevoked" or "APIKeyDeleted".
+            payload: Serialized event dict containing "api_key_id".
+
+        Raises:
+            KeyError: If the payload is missing "api_key_id".
+        """
+        api_key_id = payload["api_key_id"]
+        self._cache.invalidate(api_key_id)
+        if self._session_factory is None:
+            return
+        async with self._session_factory() as session:
+            await session.execute(
+                text("SELECT pg_notify(:channel, :api_key_id)"),
+                {"channel": API_KEY_INVALIDATION_CHANNEL, "api_key_id": api_key_id},
+            )
+            await session.commit()
+
+    async def on_notification(self, api_key_id: str) -> None:
+        """Drop the cached verifications of a key broadcast by another replica.
+
+        Args:
+            api_key_id: Payload of a notification on
+                ``API_KEY_INVALIDATION_CHANNEL``.
+        """
+        self._cache.invalidate(api_key_id)
@@ -7,6 +7,7 @@ aggregates. Implementations coordinate PostgreSQL (metadata) and SpiceDB
 
 from __future__ import annotations
 
+from datetime import datetime
 from typing import Callable, Protocol, runtime_checkable
 
 from iam.domain.aggregates import APIKey, Group, Tenant, User, Workspace
@@ -388,6 +389,9 @@ class IAPIKeyRepository(Protocol):
 
         If a collision is detected, an ERROR-level probe event is logged.
 
+        ``verify_hash_fn`` is CPU-bound (bcrypt) and is run in a worker
+        thread so it does not block the event loop.
+
         Args:
             secret: The plaintext API key secret to verify
             extract_prefix_fn: Function to extract prefix from secret
@@ -398,6 +402,17 @@ class IAPIKeyRepository(Protocol):
         """
         ...
 
+    async def update_last_used_at(self, last_used: dict[str, datetime]) -> None:
+        """Advance ``last_used_at`` for several keys without loading them.
+
+        A key's timestamp is only moved forward, never back. Unknown IDs are
+        ignored. Does not emit domain events.
+
+        Args:
+            last_used: Mapping of API key ID to the time it was last used
+        """
+        ...
+
     async def list(
         self,
         tenant_id: TenantId,
@@ -5,30 +5,71 @@ endpoints and application services.
 
 Note: Each call creates a new SpiceDBClient instance, but the underlying
 gRPC AsyncClient is lazily initialized once per instance and handles
-connection pooling internally. No singleton/locking needed.
+connection pooling internally. No singleton/locking needed. All clients
+share one ZedTokenStore, which reports write tokens to the outbox SpiceDB
+handler and holds the request tenant's token for at_least_as_fresh reads.
+
+Clients are wrapped in CachingAuthorizationProvider, which memoizes
+permission decisions per request and, when enabled, in a short-TTL cache
+shared across requests.
 """
 
 from __future__ import annotations
 
+from functools import lru_cache
+
+from shared_kernel.authorization.caching import (
+    CachingAuthorizationProvider,
+    PermissionDecisionCache,
+)
 from shared_kernel.authorization.protocols import AuthorizationProvider
 from shared_kernel.authorization.spicedb.client import SpiceDBClient
+from shared_kernel.authorization.spicedb.consistency import ZedTokenStore
 from infrastructure.settings import get_spicedb_settings
 
 
+@lru_cache
+def get_zed_token_store() -> ZedTokenStore:
+    """Get the process-wide tracker of SpiceDB ZedTokens."""
+    return ZedTokenStore()
+
+
+@lru_cache
+def get_permission_decision_cache() -> PermissionDecisionCache | None:
+    """Get the process-wide cross-request permission decision cache.
+
+    Returns:
+        The shared cache, or None when SPICEDB_DECISION_CACHE_TTL_SECONDS is 0.
+    """
+    settings = get_spicedb_settings()
+    if settings.decision_cache_ttl_seconds <= 0:
+        return None
+    return PermissionDecisionCache(
+        max_entries=settings.decision_cache_max_entries,
+        ttl_seconds=settings.decision_cache_ttl_seconds,
+    )
+
+
 def get_spicedb_client() -> AuthorizationProvider:
     """Get a SpiceDB authorization client.
 
     Creates a new SpiceDBClient instance configured from settings.
     The underlying gRPC connection is managed internally by the client
-    with lazy initialization and connection pooling.
+    with lazy initialization and connection pooling. Permission decisions
+    are cached by CachingAuthorizationProvider.
 
     Returns:
         Configured SpiceDB client implementing AuthorizationProvider protocol
     """
     settings = get_spicedb_settings()
-    return SpiceDBClient(
+    client = SpiceDBClient(
         endpoint=settings.endpoint,
         preshared_key=settings.preshared_key.get_secret_value(),
         use_tls=settings.use_tls,
         cert_path=settings.cert_path,
+        consistency=settings.consistency,
+        token_store=get_zed_token_store(),
+    )
+    return CachingAuthorizationProvider(
+        client, shared_cache=get_permission_decision_cache()
     )
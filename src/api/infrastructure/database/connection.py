@@ -7,7 +7,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-
+from infrastructure.database.connection_pool import WorkloadClass
 from infrastructure.observability.probes import (
     ConnectionProbe,
     DefaultConnectionProbe,
@@ -32,6 +32,7 @@ class ConnectionFactory:
         settings: DatabaseSettings,
         pool: ConnectionPool,
         probe: ConnectionProbe | None = None,
+        workload: WorkloadClass = WorkloadClass.INTERACTIVE,
     ):
         """Initialize the connection factory.
 
@@ -39,10 +40,12 @@ class ConnectionFactory:
             settings: Database connection settings
             pool: Connection pool (required)
             probe: Optional observability probe
+            workload: Pool quota the factory's connections are charged to
         """
         self._settings = settings
         self._pool = pool
         self._probe = probe or DefaultConnectionProbe()
+        self._workload = workload
 
     def get_connection(self) -> PsycopgConnection:
         """Get a connection from the pool.
@@ -53,7 +56,7 @@ class ConnectionFactory:
         Raises:
             DatabaseConnectionError: If connection cannot be obtained.
         """
-        return self._pool.get_connection()
+        return self._pool.get_connection(workload=self._workload)
 
     def return_connection(self, conn: PsycopgConnection) -> None:
         """Return a connection to the pool.
@@ -1,13 +1,23 @@
 """Connection pool for Apache AGE/PostgreSQL.
 
 This module provides connection pooling using psycopg2.pool.ThreadedConnectionPool.
+Callers that find every connection checked out wait in a FIFO queue for up to
+``pool_acquire_timeout_seconds`` instead of failing immediately, and each
+workload class can be capped to a share of the pool.
 """
 
 from __future__ import annotations
 
+import contextlib
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from enum import StrEnum
 from typing import TYPE_CHECKING
 
 import psycopg2
+from psycopg2 import extensions
 from psycopg2 import pool as psycopg2_pool
 
 from infrastructure.database.exceptions import DatabaseConnectionError
@@ -22,12 +32,53 @@ if TYPE_CHECKING:
     from infrastructure.settings import DatabaseSettings
 
 
+class WorkloadClass(StrEnum):
+    """Kind of work a pooled connection is checked out for.
+
+    Each class can be given its own connection quota so that a burst of
+    bulk mutations or background jobs cannot starve interactive queries.
+    """
+
+    INTERACTIVE = "interactive"
+    MUTATION = "mutation"
+    BACKGROUND = "background"
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    """Point-in-time view of pool usage."""
+
+    max_connections: int
+    in_use: int
+    waiting: int
+    in_use_by_workload: dict[WorkloadClass, int]
+
+    @property
+    def saturation(self) -> float:
+        """Fraction of the pool currently checked out."""
+        return self.in_use / self.max_connections
+
+
+class _Waiter:
+    """A caller queued for a connection slot."""
+
+    __slots__ = ("workload",)
+
+    def __init__(self, workload: WorkloadClass) -> None:
+        self.workload = workload
+
+
 class ConnectionPool:
     """Thread-safe connection pool for PostgreSQL/AGE.
 
     Wraps psycopg2.pool.ThreadedConnectionPool and ensures all connections
     have the AGE extension properly configured.
 
+    Checkout is gated by slot accounting kept here rather than in psycopg2,
+    which raises as soon as the pool is empty. Waiters are served in arrival
+    order; a waiter whose workload quota is full does not block waiters of
+    other workload classes behind it.
+
     Attributes:
         _settings: Database configuration settings
         _pool: The underlying ThreadedConnectionPool instance
@@ -51,6 +102,23 @@ class ConnectionPool:
         self._age_setup_connections: set[int] = (
             set()
         )  # Track connection IDs with AGE setup
+        self._quotas: dict[WorkloadClass, int] = {
+            workload: quota
+            for workload, quota in (
+                (WorkloadClass.INTERACTIVE, settings.pool_interactive_max_connections),
+                (WorkloadClass.MUTATION, settings.pool_mutation_max_connections),
+                (WorkloadClass.BACKGROUND, settings.pool_background_max_connections),
+            )
+            if quota is not None
+        }
+        self._slots = threading.Condition()
+        self._waiters: deque[_Waiter] = deque()
+        self._in_use = 0
+        self._in_use_by_workload: dict[WorkloadClass, int] = dict.fromkeys(
+            WorkloadClass, 0
+        )
+        self._checked_out: dict[int, WorkloadClass] = {}
+        self._idle_since: dict[int, float] = {}
         self._initialize_pool()
 
     def _initialize_pool(self) -> None:
@@ -75,33 +143,65 @@ class ConnectionPool:
                 f"Failed to initialize connection pool: {e}"
             ) from e
 
-    def get_connection(self) -> PsycopgConnection:
+    def get_connection(
+        self,
+        workload: WorkloadClass = WorkloadClass.INTERACTIVE,
+        timeout: float | None = None,
+    ) -> PsycopgConnection:
         """Get a connection from the pool.
 
-        The connection will have AGE extension configured.
+        The connection will have AGE extension configured. When the pool or
+        the workload's quota is fully checked out, the caller waits in line
+        until a connection is returned or the timeout expires.
+
+        Args:
+            workload: Workload class the connection is charged to.
+            timeout: Seconds to wait for a connection. Defaults to
+                ``settings.pool_acquire_timeout_seconds``; 0 fails immediately.
 
         Returns:
             A configured psycopg2 connection.
 
         Raises:
-            DatabaseConnectionError: If connection fails or pool not initialized.
+            DatabaseConnectionError: If connection fails, no connection became
+                available in time, or pool not initialized.
         """
         if self._pool is None:
             raise DatabaseConnectionError(
                 "Connection pool not initialized. Pool initialization failed during __init__."
             )
 
+        if timeout is None:
+            timeout = self._settings.pool_acquire_timeout_seconds
+        self._acquire_slot(workload, timeout)
+
         try:
-            conn = self._pool.getconn()
-            # Setup AGE extension on first use of this connection
-            self._ensure_age_setup(conn)
-            self._probe.connection_acquired_from_pool()
-            return conn
+            conn = self._checkout()
         except psycopg2_pool.PoolError as e:
+            self._release_slot(workload)
             self._probe.pool_exhausted()
             raise DatabaseConnectionError(
                 f"Pool exhausted, cannot get connection: {e}"
             ) from e
+        except BaseException:
+            self._release_slot(workload)
+            raise
+
+        try:
+            # Setup AGE extension on first use of this connection
+            self._ensure_age_setup(conn)
+        except BaseException:
+            # Hand the connection back to psycopg2 too, or it stays counted
+            # as checked out there while its slot is free here.
+            with contextlib.suppress(Exception):
+                self._discard(conn)
+            self._release_slot(workload)
+            raise
+
+        with self._slots:
+            self._checked_out[id(conn)] = workload
+        self._probe.connection_acquired_from_pool()
+        return conn
 
     def return_connection(self, conn: PsycopgConnection) -> None:
         """Return a connection to the pool.
@@ -109,6 +209,9 @@ class ConnectionPool:
         Args:
             conn: The connection to return.
         """
+        with self._slots:
+            workload = self._checked_out.pop(id(conn), None)
+
         if self._pool is None:
             self._probe.connection_return_failed(
                 error=Exception("Pool not initialized")
@@ -117,10 +220,29 @@ class ConnectionPool:
 
         try:
             self._pool.putconn(conn)
+            if conn.closed:
+                # psycopg2 closes connections beyond its idle minimum instead
+                # of keeping them; a later connection may reuse this id().
+                self._age_setup_connections.discard(id(conn))
+            else:
+                self._idle_since[id(conn)] = time.monotonic()
             self._probe.connection_returned_to_pool()
         except Exception as e:
             self._probe.connection_return_failed(error=e)
             # Don't raise - connection will be discarded
+        finally:
+            if workload is not None:
+                self._release_slot(workload)
+
+    def stats(self) -> PoolStats:
+        """Return current usage of the pool."""
+        with self._slots:
+            return PoolStats(
+                max_connections=self._settings.pool_max_connections,
+                in_use=self._in_use,
+                waiting=len(self._waiters),
+                in_use_by_workload=dict(self._in_use_by_workload),
+            )
 
     def close_all(self) -> None:
         """Close all connections in the pool."""
@@ -129,6 +251,125 @@ class ConnectionPool:
             self._probe.pool_closed()
             self._pool = None
             self._age_setup_connections.clear()
+            self._idle_since.clear()
+
+    def _acquire_slot(self, workload: WorkloadClass, timeout: float) -> None:
+        """Reserve a connection slot, waiting in FIFO order up to ``timeout``."""
+        waiter = _Waiter(workload)
+        started = time.monotonic()
+        deadline = started + timeout
+        with self._slots:
+            self._waiters.append(waiter)
+            try:
+                if not self._is_next(waiter):
+                    self._probe.pool_saturated(
+                        workload=workload,
+                        in_use=self._in_use,
+                        max_conn=self._settings.pool_max_connections,
+                        waiting=len(self._waiters),
+                    )
+                    while not self._is_next(waiter):
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            waited = time.monotonic() - started
+                            self._probe.pool_wait_timed_out(
+                                workload=workload,
+                                wait_seconds=waited,
+                                waiting=len(self._waiters) - 1,
+                            )
+                            raise DatabaseConnectionError(
+                                f"Pool exhausted, no {workload} connection "
+                                f"available after {waited:.2f}s"
+                            )
+                        self._slots.wait(remaining)
+                    self._probe.pool_wait_completed(
+                        workload=workload,
+                        wait_seconds=time.monotonic() - started,
+                        in_use=self._in_use + 1,
+                        max_conn=self._settings.pool_max_connections,
+                    )
+                self._in_use += 1
+                self._in_use_by_workload[workload] += 1
+            finally:
+                self._waiters.remove(waiter)
+                # Whether served or timed out, leaving the queue may unblock
+                # the waiters behind this one.
+                self._slots.notify_all()
+
+    def _release_slot(self, workload: WorkloadClass) -> None:
+        """Give a connection slot back and wake the waiters."""
+        with self._slots:
+            self._in_use -= 1
+            self._in_use_by_workload[workload] -= 1
+            self._slots.notify_all()
+
+    def _is_next(self, waiter: _Waiter) -> bool:
+        """Whether ``waiter`` may take a slot now.
+
+        Must be called with ``_slots`` held. A waiter is served once the pool
+        has a free slot, its workload is under quota, and no earlier waiter
+        could take that slot instead.
+        """
+        if self._in_use >= self._settings.pool_max_connections:
+            return False
+        for queued in self._waiters:
+            if self._has_quota(queued.workload):
+                return queued is waiter
+        return False
+
+    def _has_quota(self, workload: WorkloadClass) -> bool:
+        quota = self._quotas.get(workload)
+        return quota is None or self._in_use_by_workload[workload] < quota
+
+    def _checkout(self) -> PsycopgConnection:
+        """Take a connection from psycopg2, replacing it once if it is broken."""
+        assert self._pool is not None
+        conn = self._pool.getconn()
+        error: Exception | None = None
+        try:
+            if self._is_healthy(conn):
+                return conn
+        except psycopg2.Error as e:
+            error = e
+        self._discard(conn)
+        self._probe.unhealthy_connection_discarded(error=error)
+        return self._pool.getconn()
+
+    def _is_healthy(self, conn: PsycopgConnection) -> bool:
+        """Check a connection that is about to be handed out.
+
+        Only connections that went back to the pool are checked; fresh ones
+        were just opened. A ``SELECT 1`` round trip is spent only on
+        connections idle for at least ``pool_health_check_idle_seconds``.
+
+        Raises:
+            psycopg2.Error: If the connection fails while being checked.
+        """
+        idle_since = self._idle_since.pop(id(conn), None)
+        if idle_since is None:
+            return True
+        if conn.closed:
+            return False
+        status = conn.get_transaction_status()
+        if status == extensions.TRANSACTION_STATUS_UNKNOWN:
+            return False
+        if status != extensions.TRANSACTION_STATUS_IDLE:
+            # Returned mid-transaction; do not leak that state to the next user.
+            conn.rollback()
+        idle_for = time.monotonic() - idle_since
+        if idle_for < self._settings.pool_health_check_idle_seconds:
+            return True
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT 1")
+        conn.rollback()
+        return True
+
+    def _discard(self, conn: PsycopgConnection) -> None:
+        """Close a broken connection and forget its per-connection state."""
+        assert self._pool is not None
+        self._age_setup_connections.discard(id(conn))
+        self._idle_since.pop(id(conn), None)
+        self._pool.putconn(conn, close=True)
 
     def _ensure_age_setup(self, conn: PsycopgConnection) -> None:
         """Ensure AGE extension is configured on the connection.
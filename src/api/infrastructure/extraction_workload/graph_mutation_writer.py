@@ -12,18 +12,22 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from graph.application.services.graph_mutation_service import GraphMutationService
 from graph.domain.value_objects import MutationOperation, MutationOperationType
 from graph.infrastructure.age_bulk_loading import AgeBulkLoadingStrategy
-from graph.infrastructure.age_client import AgeGraphClient
-from graph.infrastructure.tenant_graph_handler import ensure_tenant_graph_operational
 from graph.infrastructure.mutation_applier import MutationApplier
+from graph.infrastructure.mutation_checkpoint import (
+    PostgresMutationCheckpoint,
+    mutation_log_digest,
+)
 from graph.infrastructure.postgres_kg_type_definition_store import (
     PostgresKnowledgeGraphTypeDefinitionStore,
 )
 from graph.infrastructure.type_definition_repository import (
     InMemoryTypeDefinitionRepository,
 )
-from infrastructure.database.connection import ConnectionFactory
-from infrastructure.database.connection_pool import ConnectionPool
-from infrastructure.settings import DatabaseSettings
+from infrastructure.database.connection_pool import ConnectionPool, WorkloadClass
+from infrastructure.extraction_workload.tenant_graph_clients import (
+    TenantGraphClientProvider,
+)
+from infrastructure.settings import DatabaseSettings, get_graph_mutation_settings
 from management.ports.exceptions import CanonicalSchemaMutationError
 
 _INSTANCE_OPS = frozenset(
@@ -48,6 +52,9 @@ class GraphWorkloadGraphMutationWriter:
         self._pool = pool
         self._settings = settings
         self._session = session
+        self._clients = TenantGraphClientProvider(
+            pool=pool, settings=settings, workload=WorkloadClass.MUTATION
+        )
         self._type_store = PostgresKnowledgeGraphTypeDefinitionStore(session)
 
     @staticmethod
@@ -116,19 +123,24 @@ class GraphWorkloadGraphMutationWriter:
         operations: list[MutationOperation],
         type_repo: InMemoryTypeDefinitionRepository,
     ) -> dict[str, Any]:
-        graph_name = f"tenant_{tenant_id}"
-        factory = ConnectionFactory(self._settings, pool=self._pool)
-        ensure_tenant_graph_operational(factory, tenant_id)
-        client = AgeGraphClient(
-            self._settings,
-            connection_factory=factory,
-            graph_name=graph_name,
-        )
-        client.connect()
+        client = self._clients.connect(tenant_id)
         try:
+            chunk_size = get_graph_mutation_settings().chunk_size
+            checkpoint = None
+            resume_from = 0
+            if chunk_size:
+                # A retry of the same log resumes after its last committed chunk.
+                checkpoint = PostgresMutationCheckpoint(
+                    client.raw_connection,
+                    knowledge_graph_id=knowledge_graph_id,
+                    log_digest=mutation_log_digest(operations),
+                )
+                resume_from = checkpoint.load()
             applier = MutationApplier(
                 client=client,
                 bulk_loading_strategy=AgeBulkLoadingStrategy(),
+                chunk_size=chunk_size,
+                checkpoint=checkpoint,
             )
             service = GraphMutationService(
                 mutation_applier=applier,
@@ -137,6 +149,7 @@ class GraphWorkloadGraphMutationWriter:
             result = service.apply_mutations(
                 operations,
                 knowledge_graph_id=knowledge_graph_id,
+                resume_from=resume_from,
             )
             if not result.success:
                 errors = list(result.errors or ["mutation failed"])
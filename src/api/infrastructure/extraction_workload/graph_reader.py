@@ -8,9 +8,10 @@ from graph.application.observability import DefaultGraphServiceProbe
 from graph.application.services import GraphQueryService
 from graph.infrastructure.age_client import AgeGraphClient
 from graph.infrastructure.graph_repository import GraphExtractionReadOnlyRepository
-from graph.infrastructure.tenant_graph_handler import ensure_tenant_graph_operational
-from infrastructure.database.connection import ConnectionFactory
 from infrastructure.database.connection_pool import ConnectionPool
+from infrastructure.extraction_workload.tenant_graph_clients import (
+    TenantGraphClientProvider,
+)
 from infrastructure.settings import DatabaseSettings
 
 from extraction.ports.workload_graph import (
@@ -31,15 +32,10 @@ class GraphWorkloadGraphReader(IWorkloadGraphReader):
     ) -> None:
         self._pool = pool
         self._settings = settings
+        self._clients = TenantGraphClientProvider(pool=pool, settings=settings)
 
     def _connect_for_tenant(self, tenant_id: str) -> AgeGraphClient:
-        factory = ConnectionFactory(self._settings, pool=self._pool)
-        graph_name = ensure_tenant_graph_operational(factory, tenant_id)
-        client = AgeGraphClient(
-            self._settings, connection_factory=factory, graph_name=graph_name
-        )
-        client.connect()
-        return client
+        return self._clients.connect(tenant_id)
 
     async def search_by_slug(
         self,
@@ -0,0 +1,47 @@
+"""Tenant AGE graph clients for extraction workload adapters."""
+
+from __future__ import annotations
+
+from graph.infrastructure.age_client import AgeGraphClient
+from graph.infrastructure.tenant_graph_handler import ensure_tenant_graph_operational
+from infrastructure.database.connection import ConnectionFactory
+from infrastructure.database.connection_pool import ConnectionPool, WorkloadClass
+from infrastructure.settings import DatabaseSettings
+
+
+class TenantGraphClientProvider:
+    """Hand out connected AGE clients for tenant graphs.
+
+    Extraction agents issue hundreds of small reads per job against the
+    same tenant graph.  The graph operational check is cached per graph
+    name for ``settings.tenant_graph_cache_ttl_seconds`` and the AGType
+    parser is registered once per process, so a warm call costs a single
+    pool checkout.  Clients are not shared between calls because each one
+    holds a pooled connection; callers must ``disconnect()`` to return it.
+    """
+
+    def __init__(
+        self,
+        *,
+        pool: ConnectionPool,
+        settings: DatabaseSettings,
+        workload: WorkloadClass = WorkloadClass.BACKGROUND,
+    ) -> None:
+        self._settings = settings
+        self._factory = ConnectionFactory(settings, pool=pool, workload=workload)
+
+    def connect(self, tenant_id: str) -> AgeGraphClient:
+        """Return a connected client for ``tenant_{tenant_id}``."""
+        graph_name = ensure_tenant_graph_operational(
+            self._factory,
+            tenant_id,
+            cache_ttl_seconds=self._settings.tenant_graph_cache_ttl_seconds,
+        )
+        client = AgeGraphClient(
+            self._settings,
+            connection_factory=self._factory,
+            graph_name=graph_name,
+            check_graph=False,
+        )
+        client.connect()
+        return client
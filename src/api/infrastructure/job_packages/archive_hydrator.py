@@ -185,8 +185,11 @@ class JobPackageArchiveHydrator:
             )
 
         ingestion_service = IngestionService(
-            adapter_registry={"github": GitHubAdapter()},
+            adapter_registry={
+                "github": GitHubAdapter(spool_dir=self._job_package_work_dir / "spool")
+            },
             work_dir=self._job_package_work_dir,
+            use_content_blob_store=True,
         )
         sync_run_id = str(ULID())
         ingestion_result = await ingestion_service.run(
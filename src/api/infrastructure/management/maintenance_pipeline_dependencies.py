@@ -12,7 +12,10 @@ from extraction.infrastructure.repositories.extraction_job_repository import (
 )
 from iam.application.value_objects import CurrentUser
 from iam.dependencies.user import get_current_user
-from infrastructure.authorization_dependencies import get_spicedb_client
+from infrastructure.authorization_dependencies import (
+    get_spicedb_client,
+    get_zed_token_store,
+)
 from infrastructure.database.dependencies import get_write_session
 from infrastructure.management.maintenance_pipeline_service import (
     MaintenancePipelineService,
@@ -75,6 +78,8 @@ def build_maintenance_pipeline_for_background(
         preshared_key=spicedb_settings.preshared_key.get_secret_value(),
         use_tls=spicedb_settings.use_tls,
         cert_path=spicedb_settings.cert_path,
+        consistency=spicedb_settings.consistency,
+        token_store=get_zed_token_store(),
     )
     return MaintenancePipelineService(
         session=session,
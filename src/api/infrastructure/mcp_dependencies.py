@@ -112,6 +112,10 @@ async def validate_mcp_api_key(secret: str) -> APIKey | None:
     from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
     from iam.application.services.api_key_service import APIKeyService
+    from iam.dependencies.api_key import (
+        get_api_key_usage_recorder,
+        get_verified_api_key_cache,
+    )
     from iam.infrastructure.api_key_repository import APIKeyRepository
     from infrastructure.outbox.repository import OutboxRepository
 
@@ -133,6 +137,8 @@ async def validate_mcp_api_key(secret: str) -> APIKey | None:
             session=session,
             api_key_repository=repo,
             authz=cast(AuthorizationProvider, _NoOpAuthz()),
+            verified_key_cache=get_verified_api_key_cache(),
+            usage_recorder=get_api_key_usage_recorder(),
         )
         return await service.validate_and_get_key(secret)
 
@@ -188,6 +194,9 @@ class _NoOpAuthz:
     async def delete_relationships(self, relationships: list) -> None:
         pass
 
+    async def update_relationships(self, writes: list, deletes: list) -> None:
+        pass
+
     async def delete_relationships_by_filter(
         self,
         resource_type: str,
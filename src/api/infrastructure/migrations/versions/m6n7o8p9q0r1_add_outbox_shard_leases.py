@@ -0,0 +1,68 @@
+"""Add outbox shard leases and route NOTIFY payloads by aggregate.
+
+Creates the tables replicas use to share the outbox by hash shard:
+``outbox_worker_heartbeats`` records live workers, ``outbox_shard_leases``
+records which worker owns each shard until its lease expires.
+
+The outbox NOTIFY payload becomes ``<entry id>:<hashtext(aggregate_id)>`` so
+a sharded worker can ignore notifications for shards it does not own.
+Listeners still accept bare entry ids.
+
+Revision ID: m6n7o8p9q0r1
+Revises: l5m6n7o8p9q0
+Create Date: 2026-10-17
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "m6n7o8p9q0r1"
+down_revision: Union[str, Sequence[str], None] = "l5m6n7o8p9q0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "outbox_worker_heartbeats",
+        sa.Column("worker_id", sa.String(length=255), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("worker_id"),
+    )
+    op.create_table(
+        "outbox_shard_leases",
+        sa.Column("shard", sa.Integer(), nullable=False),
+        sa.Column("worker_id", sa.String(length=255), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("shard"),
+    )
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION notify_outbox_insert()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            PERFORM pg_notify(
+                'outbox_events',
+                NEW.id::text || ':' || hashtext(NEW.aggregate_id)::text
+            );
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+
+
+def downgrade() -> None:
+    op.execute("""
+        CREATE OR REPLACE FUNCTION notify_outbox_insert()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            PERFORM pg_notify('outbox_events', NEW.id::text);
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+
+    op.drop_table("outbox_shard_leases")
+    op.drop_table("outbox_worker_heartbeats")
@@ -0,0 +1,85 @@
+"""Add the outbox archive and index the worker's head query.
+
+Processed outbox entries are moved to ``outbox_archive`` by the retention
+job so the hot ``outbox`` table stays small.
+
+``idx_outbox_unprocessed`` (``processed_at IS NULL``) also covered entries
+in the dead letter queue, which are never fetched again. It is replaced by
+``idx_outbox_pending``, whose predicate matches the worker's head query
+exactly. ``idx_outbox_processed`` lets the retention job find old processed
+entries without scanning the table.
+
+Revision ID: n7o8p9q0r1s2
+Revises: m6n7o8p9q0r1
+Create Date: 2026-10-17
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "n7o8p9q0r1s2"
+down_revision: Union[str, Sequence[str], None] = "m6n7o8p9q0r1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "outbox_archive",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("aggregate_type", sa.String(length=255), nullable=False),
+        sa.Column("aggregate_id", sa.String(length=26), nullable=False),
+        sa.Column("event_type", sa.String(length=255), nullable=False),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.Column("occurred_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("processed_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("retry_count", sa.Integer(), nullable=False),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column(
+            "archived_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("NOW()"),
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "idx_outbox_archive_processed_at",
+        "outbox_archive",
+        ["processed_at"],
+        unique=False,
+    )
+
+    op.drop_index("idx_outbox_unprocessed", table_name="outbox")
+    op.create_index(
+        "idx_outbox_pending",
+        "outbox",
+        ["created_at"],
+        unique=False,
+        postgresql_where=sa.text("processed_at IS NULL AND failed_at IS NULL"),
+    )
+    op.create_index(
+        "idx_outbox_processed",
+        "outbox",
+        ["processed_at"],
+        unique=False,
+        postgresql_where=sa.text("processed_at IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_outbox_processed", table_name="outbox")
+    op.drop_index("idx_outbox_pending", table_name="outbox")
+    op.create_index(
+        "idx_outbox_unprocessed",
+        "outbox",
+        ["created_at"],
+        unique=False,
+        postgresql_where=sa.text("processed_at IS NULL"),
+    )
+
+    op.drop_index("idx_outbox_archive_processed_at", table_name="outbox_archive")
+    op.drop_table("outbox_archive")
@@ -0,0 +1,40 @@
+"""Create graph_mutation_checkpoints for resumable chunked mutation apply.
+
+A chunked mutation apply records how many operations of a mutation log are
+committed after every chunk, keyed by knowledge graph and a digest of the
+log, so a retry of the same log resumes after the last committed chunk.
+
+Revision ID: o8p9q0r1s2t3
+Revises: n7o8p9q0r1s2
+Create Date: 2026-10-17
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "o8p9q0r1s2t3"
+down_revision: Union[str, Sequence[str], None] = "n7o8p9q0r1s2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "graph_mutation_checkpoints",
+        sa.Column("knowledge_graph_id", sa.String(length=26), nullable=False),
+        sa.Column("log_digest", sa.String(length=64), nullable=False),
+        sa.Column("operations_committed", sa.Integer(), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("NOW()"),
+        ),
+        sa.PrimaryKeyConstraint("knowledge_graph_id", "log_digest"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("graph_mutation_checkpoints")
@@ -0,0 +1,40 @@
+"""Create spicedb_zed_tokens for cross-replica at_least_as_fresh reads.
+
+The outbox SpiceDB handler records the ZedToken of each tenant's newest
+relationship write here; every replica reads its request tenant's token to
+issue SpiceDB reads ``at_least_as_fresh`` that write.
+
+Revision ID: p9q0r1s2t3u4
+Revises: o8p9q0r1s2t3
+Create Date: 2026-10-17
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "p9q0r1s2t3u4"
+down_revision: Union[str, Sequence[str], None] = "o8p9q0r1s2t3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "spicedb_zed_tokens",
+        sa.Column("tenant_id", sa.String(length=26), nullable=False),
+        sa.Column("token", sa.Text(), nullable=True),
+        sa.Column("writes", sa.BigInteger(), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("NOW()"),
+        ),
+        sa.PrimaryKeyConstraint("tenant_id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("spicedb_zed_tokens")
@@ -61,6 +61,28 @@ class ConnectionProbe(Protocol):
         """Record that the connection pool was closed."""
         ...
 
+    def pool_saturated(
+        self, workload: str, in_use: int, max_conn: int, waiting: int
+    ) -> None:
+        """Record that a caller has to wait for a pooled connection."""
+        ...
+
+    def pool_wait_completed(
+        self, workload: str, wait_seconds: float, in_use: int, max_conn: int
+    ) -> None:
+        """Record that a waiting caller acquired a pooled connection."""
+        ...
+
+    def pool_wait_timed_out(
+        self, workload: str, wait_seconds: float, waiting: int
+    ) -> None:
+        """Record that a caller gave up waiting for a pooled connection."""
+        ...
+
+    def unhealthy_connection_discarded(self, error: Exception | None) -> None:
+        """Record that a broken pooled connection was closed on checkout."""
+        ...
+
     def with_context(self, context: ObservationContext) -> ConnectionProbe:
         """Create a new probe with observation context bound."""
         ...
@@ -170,6 +192,52 @@ class DefaultConnectionProbe:
             **self._get_context_kwargs(),
         )
 
+    def pool_saturated(
+        self, workload: str, in_use: int, max_conn: int, waiting: int
+    ) -> None:
+        """Record that a caller has to wait for a pooled connection."""
+        self._logger.info(
+            "connection_pool_saturated",
+            workload=workload,
+            in_use=in_use,
+            max_connections=max_conn,
+            waiting=waiting,
+            **self._get_context_kwargs(),
+        )
+
+    def pool_wait_completed(
+        self, workload: str, wait_seconds: float, in_use: int, max_conn: int
+    ) -> None:
+        """Record that a waiting caller acquired a pooled connection."""
+        self._logger.debug(
+            "connection_pool_wait_completed",
+            workload=workload,
+            wait_seconds=wait_seconds,
+            in_use=in_use,
+            max_connections=max_conn,
+            **self._get_context_kwargs(),
+        )
+
+    def pool_wait_timed_out(
+        self, workload: str, wait_seconds: float, waiting: int
+    ) -> None:
+        """Record that a caller gave up waiting for a pooled connection."""
+        self._logger.warning(
+            "connection_pool_wait_timed_out",
+            workload=workload,
+            wait_seconds=wait_seconds,
+            waiting=waiting,
+            **self._get_context_kwargs(),
+        )
+
+    def unhealthy_connection_discarded(self, error: Exception | None) -> None:
+        """Record that a broken pooled connection was closed on checkout."""
+        self._logger.warning(
+            "unhealthy_connection_discarded",
+            error=str(error) if error is not None else None,
+            **self._get_context_kwargs(),
+        )
+
 
 class MigrationProbe(Protocol):
     """Domain probe for database migration observability.
@@ -3,12 +3,17 @@
 This module provides an event source that listens for PostgreSQL NOTIFY
 events and invokes callbacks when outbox entries are created. It uses
 asyncpg-listen for reliable connection handling and automatic reconnection.
+
+The same connection can carry broadcast channels whose notifications every
+replica must see (e.g. cache invalidations); their raw payloads are passed
+to the handler registered for the channel.
 """
 
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Coroutine, Mapping
+from typing import Any
 from uuid import UUID
 
 from asyncpg_listen import (
@@ -41,6 +46,9 @@ class PostgresNotifyEventSource(OutboxEventSource):
         db_url: str,
         channel: str = "outbox_events",
         probe: EventSourceProbe | None = None,
+        routing_filter: Callable[[int], bool] | None = None,
+        broadcast_handlers: Mapping[str, Callable[[str], Awaitable[None]]]
+        | None = None,
     ) -> None:
         """Initialize the NOTIFY event source.
 
@@ -48,10 +56,19 @@ class PostgresNotifyEventSource(OutboxEventSource):
             db_url: PostgreSQL connection URL
             channel: NOTIFY channel name (default: "outbox_events")
             probe: Optional observability probe (default: DefaultEventSourceProbe)
+            routing_filter: Optional predicate on a notification's routing
+                key (``hashtext(aggregate_id)``); notifications it rejects
+                are dropped without invoking the callback. Used by sharded
+                workers to wake only for their own shards.
+            broadcast_handlers: Optional handlers for further channels,
+                keyed by channel name. Each non-empty payload is passed to
+                its channel's handler as is, regardless of shard ownership.
         """
         self._db_url = db_url
         self._channel = channel
         self._probe = probe or DefaultEventSourceProbe()
+        self._routing_filter = routing_filter
+        self._broadcast_handlers = dict(broadcast_handlers or {})
         self._on_event: Callable[[UUID], Awaitable[None]] | None = None
         self._running = False
         self._listener: NotificationListener | None = None
@@ -62,6 +79,7 @@ class PostgresNotifyEventSource(OutboxEventSource):
 
         This method blocks until stop() is called. It creates a NotificationListener
         and processes NOTIFY events, invoking the callback for each valid UUID.
+        Payloads are ``<uuid>`` or ``<uuid>:<routing key>``.
 
         Args:
             on_event: Async callback to invoke when an event occurs
@@ -91,7 +109,14 @@ class PostgresNotifyEventSource(OutboxEventSource):
             # Process the notification payload
             if notification.payload:
                 try:
-                    entry_id = UUID(notification.payload)
+                    entry_part, _, routing_part = notification.payload.partition(":")
+                    entry_id = UUID(entry_part)
+                    if (
+                        routing_part
+                        and self._routing_filter is not None
+                        and not self._routing_filter(int(routing_part))
+                    ):
+                        return
                     self._probe.notification_received(entry_id)
                     if self._on_event is not None:
                         await self._on_event(entry_id)
@@ -102,6 +127,27 @@ class PostgresNotifyEventSource(OutboxEventSource):
                         notification.payload, "Invalid UUID format"
                     )
 
+        def broadcast(
+            channel: str, on_payload: Callable[[str], Awaitable[None]]
+        ) -> Callable[[NotificationOrTimeout], Coroutine[Any, Any, None]]:
+            async def handle_broadcast(notification: NotificationOrTimeout) -> None:
+                if not self._running or isinstance(notification, Timeout):
+                    return
+                if not notification.payload:
+                    self._probe.invalid_notification_ignored(
+                        payload="", reason=f"Empty payload on {channel}"
+                    )
+                    return
+                await on_payload(notification.payload)
+
+            return handle_broadcast
+
+        channels = {
+            channel: broadcast(channel, on_payload)
+            for channel, on_payload in self._broadcast_handlers.items()
+        }
+        channels[self._channel] = handle_notification
+
         try:
             self._listener = NotificationListener(connect_func(self._db_url))
             self._probe.event_source_started(self._channel)
@@ -109,7 +155,7 @@ class PostgresNotifyEventSource(OutboxEventSource):
             # Run the listener - this blocks until cancelled
             self._listener_task = asyncio.create_task(
                 self._listener.run(
-                    {self._channel: handle_notification},
+                    channels,
                     policy=ListenPolicy.ALL,
                 )
             )
@@ -9,7 +9,7 @@ from __future__ import annotations
 from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import DateTime, Integer, String, Text, text
+from sqlalchemy import BigInteger, DateTime, Integer, String, Text, text
 from sqlalchemy.dialects.postgresql import JSON
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column
@@ -25,8 +25,11 @@ class OutboxModel(Base):
     applied to SpiceDB for authorization consistency.
 
     The table uses partial indexes for efficient polling:
-    - idx_outbox_unprocessed: For fetching pending entries
+    - idx_outbox_pending: For fetching pending entries (the worker's head query)
+    - idx_outbox_processed: For finding processed entries to archive
     - idx_outbox_failed: For monitoring failed entries (DLQ)
+
+    Processed entries are moved to ``outbox_archive`` by the retention job.
     """
 
     __tablename__ = "outbox"
@@ -98,3 +101,84 @@ class OutboxModel(Base):
             f"retry_count={self.retry_count}"
             f")>"
         )
+
+
+class OutboxArchiveModel(Base):
+    """ORM model for processed outbox entries kept after leaving the outbox.
+
+    Rows are moved here by the retention job and purged once older than the
+    configured archive retention.
+    """
+
+    __tablename__ = "outbox_archive"
+
+    id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), primary_key=True)
+    aggregate_type: Mapped[str] = mapped_column(String(255), nullable=False)
+    aggregate_id: Mapped[str] = mapped_column(String(26), nullable=False)
+    event_type: Mapped[str] = mapped_column(String(255), nullable=False)
+    payload: Mapped[dict] = mapped_column(JSON, nullable=False)
+    occurred_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+    processed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+    retry_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    archived_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=text("NOW()"),
+    )
+
+
+class OutboxWorkerHeartbeatModel(Base):
+    """ORM model for live outbox workers when the outbox is sharded.
+
+    Each worker refreshes its row on every heartbeat; rows whose
+    ``expires_at`` has passed belong to workers presumed dead.
+    """
+
+    __tablename__ = "outbox_worker_heartbeats"
+
+    worker_id: Mapped[str] = mapped_column(String(255), primary_key=True)
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+
+
+class OutboxShardLeaseModel(Base):
+    """ORM model for ownership of one outbox shard.
+
+    A worker owns a shard until ``expires_at``; an expired lease may be
+    claimed by any other worker.
+    """
+
+    __tablename__ = "outbox_shard_leases"
+
+    shard: Mapped[int] = mapped_column(Integer, primary_key=True)
+    worker_id: Mapped[str] = mapped_column(String(255), nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+
+
+class TenantZedTokenModel(Base):
+    """ORM model for the newest SpiceDB ZedToken covering a tenant's writes.
+
+    ``writes`` counts the outbox events whose SpiceDB writes were recorded
+    for the tenant. ``token`` is NULL when the order of the latest writes is
+    unknown, in which case reads for the tenant are fully consistent.
+    """
+
+    __tablename__ = "spicedb_zed_tokens"
+
+    tenant_id: Mapped[str] = mapped_column(String(26), primary_key=True)
+    token: Mapped[str | None] = mapped_column(Text, nullable=True)
+    writes: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=text("NOW()")
+    )
@@ -0,0 +1,154 @@
+"""Retention for processed outbox entries.
+
+The worker only marks entries as processed, so without retention the
+``outbox`` table and its indexes grow forever. ``OutboxRetention`` moves
+entries processed longer ago than a configured age into ``outbox_archive``
+and optionally purges old archive rows. Both run in small batches, each in
+its own transaction, so row locks are short and autovacuum keeps up.
+
+Dead-lettered entries (``failed_at`` set) are never processed and therefore
+stay in the outbox for inspection. Archived JobPackage events are never
+purged: extraction and management resolve each data source's latest
+JobPackage from them.
+"""
+
+from __future__ import annotations
+
+import time
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any, cast
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.engine import CursorResult
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from infrastructure.outbox.models import OutboxArchiveModel, OutboxModel
+
+if TYPE_CHECKING:
+    from shared_kernel.outbox.observability import OutboxWorkerProbe
+
+#: Events that name a produced JobPackage; kept in the archive for good.
+_JOB_PACKAGE_EVENT_TYPES = ("IngestionPrepared", "JobPackageProduced")
+
+#: Columns copied from ``outbox`` into ``outbox_archive``.
+_ARCHIVED_COLUMNS = (
+    "id",
+    "aggregate_type",
+    "aggregate_id",
+    "event_type",
+    "payload",
+    "occurred_at",
+    "processed_at",
+    "created_at",
+    "retry_count",
+    "last_error",
+)
+
+
+class OutboxRetention:
+    """Archives processed outbox entries and purges the archive.
+
+    Args:
+        session_factory: Factory for creating database sessions
+        probe: Observability probe for logging/metrics
+        archive_after: Age after processing at which entries are archived
+        purge_after: Age after processing at which archived entries other
+            than JobPackage events are deleted; None keeps the archive forever
+        batch_size: Rows moved or deleted per transaction
+        max_batches: Batches per step and run, bounding the work done by one
+            run; the remainder is picked up by the next run
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        probe: OutboxWorkerProbe,
+        archive_after: timedelta,
+        purge_after: timedelta | None = None,
+        batch_size: int = 5000,
+        max_batches: int = 100,
+    ) -> None:
+        if archive_after <= timedelta(0):
+            raise ValueError(f"archive_after must be positive, got {archive_after}")
+        if purge_after is not None and purge_after <= timedelta(0):
+            raise ValueError(f"purge_after must be positive, got {purge_after}")
+        if batch_size <= 0:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
+        if max_batches <= 0:
+            raise ValueError(f"max_batches must be positive, got {max_batches}")
+
+        self._session_factory = session_factory
+        self._probe = probe
+        self._archive_after = archive_after
+        self._purge_after = purge_after
+        self._batch_size = batch_size
+        self._max_batches = max_batches
+
+    async def run(self) -> tuple[int, int]:
+        """Archive old processed entries, then purge the archive.
+
+        Returns:
+            The number of entries archived and the number purged
+        """
+        started = time.perf_counter()
+        try:
+            archived = await self._repeat(self._archive_batch)
+            purged = (
+                await self._repeat(self._purge_batch)
+                if self._purge_after is not None
+                else 0
+            )
+        except Exception as e:
+            self._probe.retention_failed(str(e))
+            raise
+        self._probe.retention_completed(archived, purged, time.perf_counter() - started)
+        return archived, purged
+
+    async def _repeat(self, step) -> int:
+        """Run ``step`` in its own transaction until it runs out of rows."""
+        total = 0
+        for _ in range(self._max_batches):
+            async with self._session_factory() as session:
+                count = await step(session)
+                await session.commit()
+            total += count
+            if count < self._batch_size:
+                break
+        return total
+
+    async def _archive_batch(self, session: AsyncSession) -> int:
+        """Move one batch of old processed entries into the archive."""
+        batch = (
+            select(OutboxModel.id)
+            .where(OutboxModel.processed_at.is_not(None))
+            .where(OutboxModel.processed_at < func.now() - self._archive_after)
+            .order_by(OutboxModel.processed_at)
+            .limit(self._batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        moved = (
+            delete(OutboxModel)
+            .where(OutboxModel.id.in_(batch))
+            .returning(*(OutboxModel.__table__.c[name] for name in _ARCHIVED_COLUMNS))
+            .cte("moved")
+        )
+        stmt = insert(OutboxArchiveModel).from_select(
+            list(_ARCHIVED_COLUMNS),
+            select(*(moved.c[name] for name in _ARCHIVED_COLUMNS)),
+        )
+        result = await session.execute(stmt)
+        return int(cast(CursorResult[Any], result).rowcount or 0)
+
+    async def _purge_batch(self, session: AsyncSession) -> int:
+        """Delete one batch of archived entries older than the retention."""
+        assert self._purge_after is not None
+        batch = (
+            select(OutboxArchiveModel.id)
+            .where(OutboxArchiveModel.processed_at < func.now() - self._purge_after)
+            .where(OutboxArchiveModel.event_type.not_in(_JOB_PACKAGE_EVENT_TYPES))
+            .limit(self._batch_size)
+        )
+        result = await session.execute(
+            delete(OutboxArchiveModel).where(OutboxArchiveModel.id.in_(batch))
+        )
+        return int(cast(CursorResult[Any], result).rowcount or 0)
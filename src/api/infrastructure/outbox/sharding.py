@@ -0,0 +1,249 @@
+"""Hash sharding of the outbox across worker replicas.
+
+Every outbox entry belongs to the shard
+``(hashtext(aggregate_id) & 0x7FFFFFFF) % shard_count``. Postgres computes
+the hash, so the polling query, the NOTIFY trigger (which sends it as the
+routing key) and this module always agree, and all entries of one aggregate
+land on one shard.
+
+Workers announce themselves in ``outbox_worker_heartbeats`` and hold leases
+on shards in ``outbox_shard_leases``. On each heartbeat a worker claims at
+most its fair share, ``ceil(shard_count / live workers)``:
+
+- when a replica joins, the others release their surplus for it to claim;
+- when a replica dies, its leases expire and the survivors claim them.
+
+Heartbeat rows of replicas that died without releasing them are deleted by
+the survivors once they are long expired, so the table does not keep a row
+per replica ever started.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import socket
+import time
+from collections.abc import Callable
+from datetime import timedelta
+from uuid import uuid4
+
+from sqlalchemy import ColumnElement, delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from infrastructure.outbox.models import (
+    OutboxModel,
+    OutboxShardLeaseModel,
+    OutboxWorkerHeartbeatModel,
+)
+
+#: Clears the sign bit of Postgres' int4 ``hashtext`` so shards are non-negative.
+_HASH_MASK = 0x7FFFFFFF
+
+
+#: Heartbeats expired for this many lease TTLs belong to workers that are gone.
+_STALE_HEARTBEAT_TTLS = 10
+
+
+def shard_for_routing_key(routing_key: int, shard_count: int) -> int:
+    """Return the shard of a ``hashtext(aggregate_id)`` routing key."""
+    return (routing_key & _HASH_MASK) % shard_count
+
+
+def shard_expression(shard_count: int) -> ColumnElement[int]:
+    """SQL expression computing an outbox row's shard."""
+    return func.hashtext(OutboxModel.aggregate_id).op("&")(_HASH_MASK) % shard_count
+
+
+class OutboxShardCoordinator:
+    """Maintains this worker's heartbeat and shard leases in Postgres.
+
+    Ownership is only trusted for one lease TTL after the start of the last
+    successful heartbeat; if heartbeats fail for longer, ``owned_shards``
+    becomes empty so the worker stops processing shards others may have
+    claimed.
+
+    Args:
+        session_factory: Factory for creating database sessions
+        shard_count: Number of shards the outbox is split into
+        lease_ttl_seconds: How long a heartbeat or lease stays valid
+        heartbeat_interval_seconds: How often the worker should heartbeat;
+            must be shorter than the lease TTL
+        worker_id: Unique identity of this worker (default: host, pid and
+            a random suffix)
+        clock: Monotonic clock, injectable for tests
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        shard_count: int,
+        lease_ttl_seconds: float = 30,
+        heartbeat_interval_seconds: float = 10,
+        worker_id: str | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if shard_count <= 0:
+            raise ValueError(f"shard_count must be positive, got {shard_count}")
+        if lease_ttl_seconds <= 0:
+            raise ValueError(
+                f"lease_ttl_seconds must be positive, got {lease_ttl_seconds}"
+            )
+        if not 0 < heartbeat_interval_seconds < lease_ttl_seconds:
+            raise ValueError(
+                "heartbeat_interval_seconds must be positive and shorter than "
+                f"lease_ttl_seconds, got {heartbeat_interval_seconds}"
+            )
+
+        self._session_factory = session_factory
+        self._shard_count = shard_count
+        self._lease_ttl = timedelta(seconds=lease_ttl_seconds)
+        self._heartbeat_interval = heartbeat_interval_seconds
+        self._worker_id = (
+            worker_id or f"{socket.gethostname()}-{os.getpid()}-{uuid4().hex[:8]}"
+        )
+        self._clock = clock
+        self._owned: frozenset[int] = frozenset()
+        self._owned_until = 0.0
+
+    @property
+    def worker_id(self) -> str:
+        """This worker's identity in the lease tables."""
+        return self._worker_id
+
+    @property
+    def shard_count(self) -> int:
+        """Number of shards the outbox is split into."""
+        return self._shard_count
+
+    @property
+    def heartbeat_interval(self) -> float:
+        """Seconds between heartbeats."""
+        return self._heartbeat_interval
+
+    @property
+    def owned_shards(self) -> frozenset[int]:
+        """Shards this worker may process, empty once its leases may have lapsed."""
+        if self._clock() >= self._owned_until:
+            return frozenset()
+        return self._owned
+
+    def owns_routing_key(self, routing_key: int) -> bool:
+        """Whether an entry with this NOTIFY routing key is on an owned shard."""
+        return (
+            shard_for_routing_key(routing_key, self._shard_count) in self.owned_shards
+        )
+
+    async def heartbeat(self) -> frozenset[int]:
+        """Refresh this worker's heartbeat and rebalance its shard leases.
+
+        Returns:
+            The shards owned after rebalancing
+        """
+        started = self._clock()
+        expires_at = func.now() + self._lease_ttl
+
+        async with self._session_factory() as session:
+            await session.execute(
+                insert(OutboxWorkerHeartbeatModel)
+                .values(worker_id=self._worker_id, expires_at=expires_at)
+                .on_conflict_do_update(
+                    index_elements=[OutboxWorkerHeartbeatModel.worker_id],
+                    set_={"expires_at": expires_at},
+                )
+            )
+            await session.execute(
+                delete(OutboxWorkerHeartbeatModel).where(
+                    OutboxWorkerHeartbeatModel.expires_at
+                    < func.now() - self._lease_ttl * _STALE_HEARTBEAT_TTLS
+                )
+            )
+            live_workers = await session.scalar(
+                select(func.count()).where(
+                    OutboxWorkerHeartbeatModel.expires_at > func.now()
+                )
+            )
+            fair_share = math.ceil(self._shard_count / max(live_workers or 1, 1))
+
+            result = await session.execute(
+                update(OutboxShardLeaseModel)
+                .where(OutboxShardLeaseModel.worker_id == self._worker_id)
+                .values(expires_at=expires_at)
+                .returning(OutboxShardLeaseModel.shard)
+            )
+            owned = set(result.scalars().all())
+
+            if len(owned) > fair_share:
+                surplus = sorted(owned)[fair_share:]
+                await session.execute(
+                    delete(OutboxShardLeaseModel)
+                    .where(OutboxShardLeaseModel.worker_id == self._worker_id)
+                    .where(OutboxShardLeaseModel.shard.in_(surplus))
+                )
+                owned.difference_update(surplus)
+            elif len(owned) < fair_share:
+                owned.update(
+                    await self._claim_free_shards(
+                        session, fair_share - len(owned), expires_at
+                    )
+                )
+
+            await session.commit()
+
+        self._owned = frozenset(owned)
+        self._owned_until = started + self._lease_ttl.total_seconds()
+        return self._owned
+
+    async def _claim_free_shards(
+        self,
+        session: AsyncSession,
+        wanted: int,
+        expires_at: ColumnElement,
+    ) -> set[int]:
+        """Claim up to ``wanted`` shards that are unleased or whose lease expired."""
+        result = await session.execute(
+            select(OutboxShardLeaseModel.shard).where(
+                OutboxShardLeaseModel.expires_at > func.now()
+            )
+        )
+        leased = set(result.scalars().all())
+
+        claimed: set[int] = set()
+        for shard in range(self._shard_count):
+            if len(claimed) >= wanted:
+                break
+            if shard in leased:
+                continue
+            # Only takes over an existing row if its lease has expired, so two
+            # workers racing for one shard cannot both win it.
+            result = await session.execute(
+                insert(OutboxShardLeaseModel)
+                .values(shard=shard, worker_id=self._worker_id, expires_at=expires_at)
+                .on_conflict_do_update(
+                    index_elements=[OutboxShardLeaseModel.shard],
+                    set_={"worker_id": self._worker_id, "expires_at": expires_at},
+                    where=OutboxShardLeaseModel.expires_at <= func.now(),
+                )
+                .returning(OutboxShardLeaseModel.shard)
+            )
+            if result.scalar_one_or_none() is not None:
+                claimed.add(shard)
+        return claimed
+
+    async def release(self) -> None:
+        """Give up all leases and the heartbeat so other workers rebalance now."""
+        self._owned = frozenset()
+        self._owned_until = 0.0
+        async with self._session_factory() as session:
+            await session.execute(
+                delete(OutboxShardLeaseModel).where(
+                    OutboxShardLeaseModel.worker_id == self._worker_id
+                )
+            )
+            await session.execute(
+                delete(OutboxWorkerHeartbeatModel).where(
+                    OutboxWorkerHeartbeatModel.worker_id == self._worker_id
+                )
+            )
+            await session.commit()
@@ -4,23 +4,98 @@ Wraps the existing translator pattern, translating domain events to
 SpiceDB operations and applying them via the authorization provider.
 This extracts the _apply_operation pattern match from OutboxWorker into
 a standalone, reusable EventHandler implementation.
+
+Contiguous relationship writes and deletes are applied together through a
+single ``update_relationships`` call, so an event expanding to many
+operations costs one atomic request instead of one RPC per operation.
+
+When given the process's PermissionDecisionCache, the handler drops the
+cached decisions each applied operation may have changed. With a session
+factory it also broadcasts those invalidations with ``pg_notify`` on
+``DECISION_INVALIDATION_CHANNEL``; each replica's outbox event source
+listens on that channel and passes the payload to ``on_notification``,
+which drops the same decisions from the replica's cache.
+
+With a session factory and the process's ZedTokenStore, the handler also
+records the ZedToken of each event's last write for the event's tenant in
+``spicedb_zed_tokens`` (see ``infrastructure.outbox.zed_tokens``), so that
+``at_least_as_fresh`` reads on every replica see the change. Events whose
+payload names no tenant clear every tenant's token instead.
 """
 
 from __future__ import annotations
 
+import json
+from collections.abc import Iterator
+from contextlib import contextmanager
 from typing import TYPE_CHECKING, Any
 
+from sqlalchemy import text
+
+from infrastructure.outbox.zed_tokens import TenantZedTokenRepository
+from shared_kernel.authorization.types import RelationshipSpec
 from shared_kernel.outbox.operations import (
     DeleteRelationship,
     DeleteRelationshipsByFilter,
+    SpiceDBOperation,
     WriteRelationship,
 )
 
 if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    from shared_kernel.authorization.caching import PermissionDecisionCache
     from shared_kernel.authorization.protocols import AuthorizationProvider
+    from shared_kernel.authorization.spicedb.consistency import ZedTokenStore
     from shared_kernel.outbox.ports import EventTranslator
 
 
+#: NOTIFY channel carrying relationship changes whose cached decisions
+#: every replica must drop.
+DECISION_INVALIDATION_CHANNEL = "permission_decision_invalidations"
+
+# Postgres rejects NOTIFY payloads of 8000 bytes or more; larger broadcasts
+# are sent as a single "clear everything" invalidation instead.
+_MAX_NOTIFY_PAYLOAD_BYTES = 7900
+
+#: (resource, subject) of a relationship change; (None, None) clears the cache.
+Invalidation = tuple[str | None, str | None]
+
+_CLEAR_ALL: Invalidation = (None, None)
+
+
+def _group_operations(
+    operations: list[SpiceDBOperation],
+) -> Iterator[list[SpiceDBOperation]]:
+    """Split operations into groups that can each be applied in one request.
+
+    Contiguous WriteRelationship/DeleteRelationship operations form a group,
+    which is closed early if the same relationship appears twice (SpiceDB
+    rejects duplicate updates within one request, and applying both in a
+    single request would lose their order). Any other operation forms a
+    group of its own.
+    """
+    group: list[SpiceDBOperation] = []
+    seen: set[tuple[str, str, str]] = set()
+    for operation in operations:
+        if isinstance(operation, WriteRelationship | DeleteRelationship):
+            key = (operation.resource, operation.relation_name, operation.subject)
+            if key in seen:
+                yield group
+                group, seen = [], set()
+            group.append(operation)
+            seen.add(key)
+            continue
+
+        if group:
+            yield group
+            group, seen = [], set()
+        yield [operation]
+
+    if group:
+        yield group
+
+
 class SpiceDBEventHandler:
     """Adapts EventTranslator + AuthorizationProvider into an EventHandler.
 
@@ -33,9 +108,15 @@ class SpiceDBEventHandler:
         self,
         translator: EventTranslator,
         authz: AuthorizationProvider,
+        decision_cache: PermissionDecisionCache | None = None,
+        session_factory: async_sessionmaker[AsyncSession] | None = None,
+        token_store: ZedTokenStore | None = None,
     ) -> None:
         self._translator = translator
         self._authz = authz
+        self._decision_cache = decision_cache
+        self._session_factory = session_factory
+        self._token_store = token_store
 
     def supported_event_types(self) -> frozenset[str]:
         """Return the event types supported by the underlying translator."""
@@ -53,14 +134,85 @@ class SpiceDBEventHandler:
             Exception: If the authorization provider fails
         """
         operations = self._translator.translate(event_type, payload)
+        if not operations:
+            return
 
-        for operation in operations:
-            await self._apply_operation(operation)
+        tenant_id = payload.get("tenant_id") or None
+        writes_seen = await self._tenant_writes(tenant_id)
+        invalidations: dict[Invalidation, None] = {}
+        written: list[str] = []
+        applied = False
+        try:
+            with self._capture_writes() as written:
+                for group in _group_operations(operations):
+                    try:
+                        await self._apply_group(group)
+                    finally:
+                        for operation in group:
+                            invalidation = _invalidation(operation)
+                            self._invalidate_decisions(invalidation)
+                            invalidations[invalidation] = None
+            applied = True
+        finally:
+            if invalidations:
+                await self._broadcast(list(invalidations))
+            await self._record_zed_token(
+                tenant_id,
+                writes_seen,
+                written[-1] if applied and written else None,
+            )
 
-    async def _apply_operation(
-        self,
-        operation: WriteRelationship | DeleteRelationship | DeleteRelationshipsByFilter,
-    ) -> None:
+    async def on_notification(self, payload: str) -> None:
+        """Drop the cached decisions named in another replica's broadcast.
+
+        Args:
+            payload: Payload of a notification on
+                ``DECISION_INVALIDATION_CHANNEL``: a JSON list of
+                ``[resource, subject]`` pairs. An unreadable payload clears
+                the cache.
+        """
+        try:
+            invalidations = [
+                (resource, subject) for resource, subject in json.loads(payload)
+            ]
+        except (TypeError, ValueError):
+            invalidations = [_CLEAR_ALL]
+        for invalidation in invalidations:
+            self._invalidate_decisions(invalidation)
+
+    async def _apply_group(self, group: list[SpiceDBOperation]) -> None:
+        """Apply a group of operations, batching relationship updates."""
+        if len(group) == 1:
+            await self._apply_operation(group[0])
+            return
+
+        writes: list[RelationshipSpec] = []
+        deletes: list[RelationshipSpec] = []
+        for operation in group:
+            match operation:
+                case WriteRelationship():
+                    writes.append(
+                        RelationshipSpec(
+                            operation.resource,
+                            operation.relation_name,
+                            operation.subject,
+                        )
+                    )
+                case DeleteRelationship():
+                    deletes.append(
+                        RelationshipSpec(
+                            operation.resource,
+                            operation.relation_name,
+                            operation.subject,
+                        )
+                    )
+                case _:
+                    raise TypeError(
+                        f"Cannot batch operation type: {type(operation).__name__}"
+                    )
+        await self._authz.update_relationships(writes=writes, deletes=deletes)
+
+    async def _apply_operation(self, operation: SpiceDBOperation) -> None:
         """Apply a single SpiceDB operation via the authorization provider."""
         match operation:
             case WriteRelationship():
@@ -92,3 +244,68 @@ class SpiceDBEventHandler:
                 raise TypeError(
                     f"Unsupported operation type: {type(operation).__name__}"
                 )
+
+    def _invalidate_decisions(self, invalidation: Invalidation) -> None:
+        """Drop cached permission decisions a relationship change may affect."""
+        if self._decision_cache is None:
+            return
+        resource, subject = invalidation
+        self._decision_cache.invalidate(resource=resource, subject=subject)
+
+    async def _broadcast(self, invalidations: list[Invalidation]) -> None:
+        """Send invalidations to every replica's decision cache."""
+        if self._session_factory is None:
+            return
+        payload = json.dumps(invalidations, separators=(",", ":"))
+        if len(payload.encode("utf-8")) > _MAX_NOTIFY_PAYLOAD_BYTES:
+            payload = json.dumps([_CLEAR_ALL])
+        async with self._session_factory() as session:
+            await session.execute(
+                text("SELECT pg_notify(:channel, :payload)"),
+                {"channel": DECISION_INVALIDATION_CHANNEL, "payload": payload},
+            )
+            await session.commit()
+
+    @contextmanager
+    def _capture_writes(self) -> Iterator[list[str]]:
+        """Collect the ZedTokens of the writes made inside the block."""
+        if self._token_store is None:
+            yield []
+            return
+        with self._token_store.capture_writes() as tokens:
+            yield tokens
+
+    def _tracks_zed_tokens(self) -> bool:
+        return self._token_store is not None and self._session_factory is not None
+
+    async def _tenant_writes(self, tenant_id: str | None) -> int:
+        """Return the tenant's recorded write count before writing."""
+        if tenant_id is None or not self._tracks_zed_tokens():
+            return 0
+        assert self._session_factory is not None
+        async with self._session_factory() as session:
+            return await TenantZedTokenRepository(session).writes(tenant_id)
+
+    async def _record_zed_token(
+        self, tenant_id: str | None, writes_seen: int, token: str | None
+    ) -> None:
+        """Record the token covering this event's writes for its tenant."""
+        if not self._tracks_zed_tokens():
+            return
+        assert self._session_factory is not None
+        async with self._session_factory() as session:
+            tokens = TenantZedTokenRepository(session)
+            if tenant_id is None:
+                await tokens.forget_all()
+            else:
+                await tokens.record(tenant_id, writes_seen=writes_seen, token=token)
+            await session.commit()
+
+
+def _invalidation(operation: SpiceDBOperation) -> Invalidation:
+    """Return the relationship change an operation makes."""
+    match operation:
+        case WriteRelationship() | DeleteRelationship():
+            return (operation.resource, operation.subject)
+        case _:
+            return _CLEAR_ALL
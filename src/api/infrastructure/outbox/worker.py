@@ -11,6 +11,7 @@ always runs to ensure reliability.
 from __future__ import annotations
 
 import asyncio
+import time
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 from uuid import UUID
@@ -19,10 +20,12 @@ from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from infrastructure.outbox.models import OutboxModel
+from infrastructure.outbox.sharding import shard_expression
 from shared_kernel.outbox.ports import EventHandler
 from shared_kernel.outbox.value_objects import OutboxEntry
 
 if TYPE_CHECKING:
+    from infrastructure.outbox.sharding import OutboxShardCoordinator
     from shared_kernel.outbox.observability import OutboxWorkerProbe
     from shared_kernel.outbox.ports import OutboxEventSource
 
@@ -39,6 +42,9 @@ class OutboxWorker:
 
     The worker delegates all event processing to the injected EventHandler,
     keeping the worker generic and bounded-context agnostic.
+
+    With a shard coordinator, replicas split the outbox by aggregate hash
+    and each worker only fetches entries on the shards it holds leases for.
     """
 
     def __init__(
@@ -51,6 +57,8 @@ class OutboxWorker:
         batch_size: int = 100,
         max_retries: int = 5,
         sync_started_max_concurrency: int = 1,
+        partition_max_concurrency: int = 1,
+        shard_coordinator: OutboxShardCoordinator | None = None,
     ) -> None:
         """Initialize the worker.
 
@@ -66,6 +74,13 @@ class OutboxWorker:
             max_retries: Maximum retry attempts before moving to DLQ
             sync_started_max_concurrency: Maximum parallel SyncStarted handlers
                 per batch. Other events remain serial to preserve lifecycle order.
+            partition_max_concurrency: Maximum aggregates processed in parallel
+                per batch. Entries for the same (aggregate_type, aggregate_id)
+                are always handled in order; 1 processes the whole batch
+                serially in created_at order.
+            shard_coordinator: Optional shard lease coordinator. When given,
+                the worker heartbeats its leases and only processes entries
+                on owned shards; otherwise it processes the whole outbox.
         """
         if session_factory is None:
             raise ValueError("session_factory is required")
@@ -87,6 +102,11 @@ class OutboxWorker:
                 "sync_started_max_concurrency must be positive, "
                 f"got {sync_started_max_concurrency}"
             )
+        if partition_max_concurrency <= 0:
+            raise ValueError(
+                "partition_max_concurrency must be positive, "
+                f"got {partition_max_concurrency}"
+            )
 
         self._session_factory = session_factory
         self._handler = handler
@@ -96,6 +116,8 @@ class OutboxWorker:
         self._batch_size = batch_size
         self._max_retries = max_retries
         self._sync_started_max_concurrency = sync_started_max_concurrency
+        self._partition_max_concurrency = partition_max_concurrency
+        self._shard_coordinator = shard_coordinator
         self._running = False
         self._tasks: list[asyncio.Task[None]] = []
         # Used by stop() to interrupt the poll-loop's inter-batch sleep without
@@ -111,6 +133,11 @@ class OutboxWorker:
         self._running = True
         self._probe.worker_started()
 
+        # Claim shards before the first poll so it has something to fetch
+        if self._shard_coordinator is not None:
+            await self._heartbeat()
+            self._tasks.append(asyncio.create_task(self._heartbeat_loop()))
+
         # Start poll loop (always runs as fallback)
         poll_task = asyncio.create_task(self._poll_loop())
         self._tasks.append(poll_task)
@@ -155,6 +182,14 @@ class OutboxWorker:
                 pass
 
         self._tasks.clear()
+
+        # Hand our shards to the remaining replicas without waiting for expiry
+        if self._shard_coordinator is not None:
+            try:
+                await self._shard_coordinator.release()
+            except Exception as e:
+                self._probe.shard_heartbeat_failed(str(e))
+
         self._probe.worker_stopped()
 
     def _on_event_source_done(self, task: asyncio.Task[None]) -> None:
@@ -201,6 +236,34 @@ class OutboxWorker:
             except asyncio.TimeoutError:
                 pass  # Normal: poll interval elapsed, continue to next batch
 
+    async def _heartbeat_loop(self) -> None:
+        """Heartbeat shard leases until shutdown."""
+        assert self._shard_coordinator is not None
+        while self._running:
+            try:
+                await asyncio.wait_for(
+                    self._shutdown_event.wait(),
+                    timeout=self._shard_coordinator.heartbeat_interval,
+                )
+            except asyncio.TimeoutError:
+                pass
+            if self._running:
+                await self._heartbeat()
+
+    async def _heartbeat(self) -> None:
+        """Renew shard leases, reporting ownership changes and failures."""
+        assert self._shard_coordinator is not None
+        previous = self._shard_coordinator.owned_shards
+        try:
+            owned = await self._shard_coordinator.heartbeat()
+        except Exception as e:
+            self._probe.shard_heartbeat_failed(str(e))
+            return
+        if owned != previous:
+            self._probe.shards_assigned(
+                sorted(owned), self._shard_coordinator.shard_count
+            )
+
     async def _process_batch(self) -> None:
         """Fetch and process a batch of unprocessed entries."""
         async with self._session_factory() as session:
@@ -213,6 +276,13 @@ class OutboxWorker:
                 .limit(self._batch_size)
                 .with_for_update(skip_locked=True)
             )
+            if self._shard_coordinator is not None:
+                owned = self._shard_coordinator.owned_shards
+                if not owned:
+                    return
+                stmt = stmt.where(
+                    shard_expression(self._shard_coordinator.shard_count).in_(owned)
+                )
 
             result = await session.execute(stmt)
             models = result.scalars().all()
@@ -220,9 +290,18 @@ class OutboxWorker:
             entries = [model.to_value_object() for model in models]
 
             if entries:
+                # Entries are fetched in created_at order, so the first is oldest
+                lag_seconds = (
+                    datetime.now(UTC) - entries[0].created_at
+                ).total_seconds()
+                started = time.perf_counter()
                 await self._process_entries(entries, session)
                 await session.commit()
-                self._probe.batch_processed(len(entries))
+                self._probe.batch_processed(
+                    len(entries),
+                    duration_seconds=time.perf_counter() - started,
+                    lag_seconds=lag_seconds,
+                )
 
     async def _process_single(self, entry_id: UUID) -> None:
         """Process a single entry by ID (from NOTIFY)."""
@@ -234,6 +313,13 @@ class OutboxWorker:
                 .where(OutboxModel.failed_at.is_(None))
                 .with_for_update(skip_locked=True)
             )
+            if self._shard_coordinator is not None:
+                # Covers notifications without a routing key
+                stmt = stmt.where(
+                    shard_expression(self._shard_coordinator.shard_count).in_(
+                        self._shard_coordinator.owned_shards
+                    )
+                )
 
             result = await session.execute(stmt)
             model = result.scalar_one_or_none()
@@ -248,7 +334,41 @@ class OutboxWorker:
         entries: list[OutboxEntry],
         session: AsyncSession,
     ) -> None:
-        """Process a list of entries by delegating to the event handler."""
+        """Process a list of entries by delegating to the event handler.
+
+        Handlers run first; their outcomes are then written through the
+        session in one pass, with all successes marked by a single UPDATE.
+        Entries that were not dispatched are left untouched for a later batch.
+        """
+        if self._partition_max_concurrency > 1:
+            errors = await self._dispatch_partitions(entries)
+        else:
+            errors = await self._dispatch_serially(entries)
+
+        succeeded = [
+            entry
+            for entry in entries
+            if entry.id in errors and errors[entry.id] is None
+        ]
+        if succeeded:
+            await self._mark_processed([entry.id for entry in succeeded], session)
+            for entry in succeeded:
+                self._probe.event_processed(entry.id, entry.event_type)
+
+        for entry in entries:
+            error = errors.get(entry.id)
+            if error is not None:
+                await self._handle_processing_failure(entry, str(error), session)
+
+    async def _dispatch_serially(
+        self,
+        entries: list[OutboxEntry],
+    ) -> dict[UUID, Exception | None]:
+        """Dispatch entries one at a time in created_at order.
+
+        Contiguous SyncStarted entries still fan out with bounded parallelism.
+        """
+        errors: dict[UUID, Exception | None] = {}
         sync_started_block: list[OutboxEntry] = []
         for entry in entries:
             if (
@@ -259,54 +379,95 @@ class OutboxWorker:
                 continue
 
             if sync_started_block:
-                await self._process_sync_started_block(sync_started_block, session)
+                errors.update(
+                    await self._dispatch_sync_started_block(sync_started_block)
+                )
                 sync_started_block = []
 
-            await self._process_entry(entry, session)
+            errors[entry.id] = await self._dispatch(entry)
 
         if sync_started_block:
-            await self._process_sync_started_block(sync_started_block, session)
-
-    async def _process_entry(self, entry: OutboxEntry, session: AsyncSession) -> None:
-        """Process one outbox entry serially."""
-        try:
-            self._probe.event_dispatching(entry.id, entry.event_type)
-            await self._handler.handle(entry.event_type, entry.payload)
-            await self._mark_processed(entry.id, session)
-            self._probe.event_processed(entry.id, entry.event_type)
-        except Exception as e:
-            await self._handle_processing_failure(entry, str(e), session)
+            errors.update(await self._dispatch_sync_started_block(sync_started_block))
+        return errors
 
-    async def _process_sync_started_block(
+    async def _dispatch_sync_started_block(
         self,
         entries: list[OutboxEntry],
-        session: AsyncSession,
-    ) -> None:
-        """Process contiguous SyncStarted entries with bounded parallelism."""
+    ) -> dict[UUID, Exception | None]:
+        """Dispatch contiguous SyncStarted entries with bounded parallelism."""
         semaphore = asyncio.Semaphore(self._sync_started_max_concurrency)
+        results = await asyncio.gather(
+            *(self._dispatch(entry, semaphore) for entry in entries)
+        )
+        return {entry.id: error for entry, error in zip(entries, results, strict=True)}
 
-        async def _dispatch(entry: OutboxEntry) -> Exception | None:
-            self._probe.event_dispatching(entry.id, entry.event_type)
-            try:
-                async with semaphore:
+    async def _dispatch_partitions(
+        self,
+        entries: list[OutboxEntry],
+    ) -> dict[UUID, Exception | None]:
+        """Dispatch entries partitioned by aggregate, partitions in parallel.
+
+        Each partition holds one aggregate's entries in created_at order and
+        is dispatched sequentially, so per-aggregate ordering is preserved
+        while unrelated aggregates proceed concurrently. SyncStarted handlers
+        are additionally bounded by sync_started_max_concurrency.
+
+        A partition stops at its first failure. Its remaining entries are
+        absent from the returned mapping and stay unprocessed, so a later
+        batch picks them up after the failed entry, in order.
+        """
+        partitions: dict[tuple[str, str], list[OutboxEntry]] = {}
+        for entry in entries:
+            key = (entry.aggregate_type, entry.aggregate_id)
+            partitions.setdefault(key, []).append(entry)
+
+        partition_semaphore = asyncio.Semaphore(self._partition_max_concurrency)
+        sync_started_semaphore = asyncio.Semaphore(self._sync_started_max_concurrency)
+        errors: dict[UUID, Exception | None] = {}
+
+        async def _dispatch_partition(partition: list[OutboxEntry]) -> None:
+            async with partition_semaphore:
+                for entry in partition:
+                    error = await self._dispatch(entry, sync_started_semaphore)
+                    errors[entry.id] = error
+                    if error is not None:
+                        break
+
+        await asyncio.gather(
+            *(_dispatch_partition(partition) for partition in partitions.values())
+        )
+        return errors
+
+    async def _dispatch(
+        self,
+        entry: OutboxEntry,
+        sync_started_semaphore: asyncio.Semaphore | None = None,
+    ) -> Exception | None:
+        """Hand one entry to the event handler, returning any error raised.
+
+        Args:
+            entry: The outbox entry to dispatch
+            sync_started_semaphore: Optional limit applied to SyncStarted
+                handlers only
+        """
+        self._probe.event_dispatching(entry.id, entry.event_type)
+        try:
+            if sync_started_semaphore is not None and entry.event_type == "SyncStarted":
+                async with sync_started_semaphore:
                     await self._handler.handle(entry.event_type, entry.payload)
-                return None
-            except Exception as exc:  # pragma: no cover - covered via caller paths
-                return exc
-
-        errors = await asyncio.gather(*(_dispatch(entry) for entry in entries))
-        for entry, error in zip(entries, errors, strict=True):
-            if error is None:
-                await self._mark_processed(entry.id, session)
-                self._probe.event_processed(entry.id, entry.event_type)
             else:
-                await self._handle_processing_failure(entry, str(error), session)
+                await self._handler.handle(entry.event_type, entry.payload)
+        except Exception as exc:
+            return exc
+        return None
 
-    async def _mark_processed(self, entry_id: UUID, session: AsyncSession) -> None:
-        """Mark an entry as successfully processed."""
+    async def _mark_processed(
+        self, entry_ids: list[UUID], session: AsyncSession
+    ) -> None:
+        """Mark entries as successfully processed with a single UPDATE."""
         stmt = (
             update(OutboxModel)
-            .where(OutboxModel.id == entry_id)
+            .where(OutboxModel.id.in_(entry_ids))
             .values(processed_at=datetime.now(UTC))
         )
         await session.execute(stmt)
@@ -0,0 +1,89 @@
+"""Per-tenant SpiceDB ZedTokens shared by every replica.
+
+The outbox SpiceDB handler records, after applying an event's relationship
+changes, the ZedToken of its last write for the event's tenant. Requests
+load their tenant's token and issue ``at_least_as_fresh`` reads with it, so
+a change applied by the outbox on any replica is visible to reads on every
+replica.
+
+ZedTokens are opaque and cannot be compared, so a recorded token must cover
+every earlier write to the tenant by construction. A handler notes the
+tenant's ``writes`` count before writing and keeps its token only if no
+other handler recorded writes for the tenant in the meantime: its writes
+then started after every earlier recorded write committed. Otherwise the
+order is unknown and the token is cleared, and reads for the tenant are
+fully consistent until the next write that did not overlap another.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import case, func, literal, null, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from infrastructure.outbox.models import TenantZedTokenModel
+
+
+class TenantZedTokenRepository:
+    """Reads and records per-tenant ZedTokens in ``spicedb_zed_tokens``."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def get(self, tenant_id: str) -> str | None:
+        """Return the token covering every write to the tenant, if known."""
+        result = await self._session.execute(
+            select(TenantZedTokenModel.token).where(
+                TenantZedTokenModel.tenant_id == tenant_id
+            )
+        )
+        return result.scalar_one_or_none()
+
+    async def writes(self, tenant_id: str) -> int:
+        """Return how many writes have been recorded for the tenant."""
+        result = await self._session.execute(
+            select(TenantZedTokenModel.writes).where(
+                TenantZedTokenModel.tenant_id == tenant_id
+            )
+        )
+        return result.scalar_one_or_none() or 0
+
+    async def record(
+        self, tenant_id: str, *, writes_seen: int, token: str | None
+    ) -> None:
+        """Record a completed write for the tenant.
+
+        Args:
+            tenant_id: Tenant whose relationships were written
+            writes_seen: :meth:`writes` taken before the write was sent; the
+                token is kept only if no other write was recorded since
+            token: ZedToken of the write, or None if the write failed or
+                returned no token
+        """
+        stmt = insert(TenantZedTokenModel).values(
+            tenant_id=tenant_id,
+            token=token if writes_seen == 0 else None,
+            writes=1,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[TenantZedTokenModel.tenant_id],
+            set_={
+                "token": case(
+                    (TenantZedTokenModel.writes == writes_seen, literal(token)),
+                    else_=null(),
+                ),
+                "writes": TenantZedTokenModel.writes + 1,
+                "updated_at": func.now(),
+            },
+        )
+        await self._session.execute(stmt)
+
+    async def forget_all(self) -> None:
+        """Clear every tenant's token after a write whose tenant is unknown."""
+        await self._session.execute(
+            update(TenantZedTokenModel).values(
+                token=None,
+                writes=TenantZedTokenModel.writes + 1,
+                updated_at=func.now(),
+            )
+        )
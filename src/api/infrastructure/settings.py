@@ -10,6 +10,8 @@ from typing import Literal
 from pydantic import Field, SecretStr, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from shared_kernel.authorization.spicedb.consistency import ConsistencyMode
+
 # Valid SSL modes for asyncpg connections
 SslMode = Literal["disable", "allow", "prefer", "require", "verify-ca", "verify-full"]
 
@@ -26,6 +28,18 @@ class DatabaseSettings(BaseSettings):
         KARTOGRAPH_DB_GRAPH_NAME: AGE graph name (default: kartograph_graph) TODO: Single graph only for tracer bullet
         KARTOGRAPH_DB_POOL_MIN_CONNECTIONS: Minimum connections in pool (default: 2)
         KARTOGRAPH_DB_POOL_MAX_CONNECTIONS: Maximum connections in pool (default: 10)
+        KARTOGRAPH_DB_TENANT_GRAPH_CACHE_TTL_SECONDS: How long a tenant graph
+            stays verified as operational before it is checked again (default: 300, 0 disables)
+        KARTOGRAPH_DB_POOL_ACQUIRE_TIMEOUT_SECONDS: How long a caller waits for a
+            pooled connection before failing (default: 5, 0 fails immediately)
+        KARTOGRAPH_DB_POOL_INTERACTIVE_MAX_CONNECTIONS: Cap on connections held by
+            interactive queries (default: unset, limited only by the pool size)
+        KARTOGRAPH_DB_POOL_MUTATION_MAX_CONNECTIONS: Cap on connections held by
+            bulk graph mutations (default: unset)
+        KARTOGRAPH_DB_POOL_BACKGROUND_MAX_CONNECTIONS: Cap on connections held by
+            background workers (default: unset)
+        KARTOGRAPH_DB_POOL_HEALTH_CHECK_IDLE_SECONDS: Ping connections idle for at
+            least this long before handing them out (default: 30, 0 pings every checkout)
     """
 
     model_config = SettingsConfigDict(
@@ -63,15 +77,56 @@ class DatabaseSettings(BaseSettings):
         default="prefer",
         description="SSL mode for asyncpg connections (disable, allow, prefer, require, verify-ca, verify-full)",
     )
+    tenant_graph_cache_ttl_seconds: float = Field(
+        default=300.0,
+        description="Seconds a tenant graph stays verified as operational (0 disables caching)",
+        ge=0,
+    )
+    pool_acquire_timeout_seconds: float = Field(
+        default=5.0,
+        description="Seconds to wait for a pooled connection (0 fails immediately)",
+        ge=0,
+    )
+    pool_interactive_max_connections: int | None = Field(
+        default=None,
+        description="Maximum pooled connections held by interactive queries",
+        ge=1,
+    )
+    pool_mutation_max_connections: int | None = Field(
+        default=None,
+        description="Maximum pooled connections held by bulk graph mutations",
+        ge=1,
+    )
+    pool_background_max_connections: int | None = Field(
+        default=None,
+        description="Maximum pooled connections held by background workers",
+        ge=1,
+    )
+    pool_health_check_idle_seconds: float = Field(
+        default=30.0,
+        description="Ping pooled connections idle at least this long before reuse",
+        ge=0,
+    )
 
     @model_validator(mode="after")
     def validate_pool_settings(self) -> "DatabaseSettings":
-        """Validate pool max >= min."""
+        """Validate pool max >= min and workload quotas <= pool max."""
         if self.pool_max_connections < self.pool_min_connections:
             raise ValueError(
                 f"pool_max_connections ({self.pool_max_connections}) must be >= "
                 f"pool_min_connections ({self.pool_min_connections})"
             )
+        for name in (
+            "pool_interactive_max_connections",
+            "pool_mutation_max_connections",
+            "pool_background_max_connections",
+        ):
+            quota = getattr(self, name)
+            if quota is not None and quota > self.pool_max_connections:
+                raise ValueError(
+                    f"{name} ({quota}) must be <= "
+                    f"pool_max_connections ({self.pool_max_connections})"
+                )
         return self
 
 
@@ -149,6 +204,16 @@ class SpiceDBSettings(BaseSettings):
         SPICEDB_PRESHARED_KEY: Pre-shared authentication key (required)
         SPICEDB_USE_TLS: Use TLS for connection (default: true for production)
         SPICEDB_CERT_PATH: Path to custom TLS root certificate (for self-signed certs)
+        SPICEDB_CONSISTENCY: Read consistency: at_least_as_fresh (default)
+            reads at or after the request tenant's newest write, whose token
+            the outbox records in Postgres, and reads the datastore when no
+            token is recorded; fully_consistent always reads the datastore;
+            minimize_latency reads SpiceDB's cache
+        SPICEDB_DECISION_CACHE_TTL_SECONDS: Seconds a permission decision is
+            cached across requests (default: 0, which disables the shared
+            cache; decisions are always memoized within a request)
+        SPICEDB_DECISION_CACHE_MAX_ENTRIES: Maximum decisions in the shared
+            cache (default: 10000)
     """
 
     model_config = SettingsConfigDict(
@@ -173,6 +238,20 @@ class SpiceDBSettings(BaseSettings):
         default=None,
         description="Path to custom TLS root certificate (for self-signed certs)",
     )
+    consistency: ConsistencyMode = Field(
+        default=ConsistencyMode.AT_LEAST_AS_FRESH,
+        description="Read consistency for permission checks and lookups",
+    )
+    decision_cache_ttl_seconds: float = Field(
+        default=0.0,
+        ge=0.0,
+        description="Seconds a permission decision is cached across requests (0 disables)",
+    )
+    decision_cache_max_entries: int = Field(
+        default=10000,
+        ge=1,
+        description="Maximum permission decisions held in the cross-request cache",
+    )
 
 
 class Settings(BaseSettings):
@@ -249,6 +328,23 @@ class OutboxWorkerSettings(BaseSettings):
         KARTOGRAPH_OUTBOX_BATCH_SIZE: Maximum entries per batch (default: 100)
         KARTOGRAPH_OUTBOX_SYNC_STARTED_MAX_CONCURRENCY: Maximum concurrent
             SyncStarted handlers (default: 5)
+        KARTOGRAPH_OUTBOX_PARTITION_MAX_CONCURRENCY: Maximum aggregates
+            processed in parallel per batch; entries of one aggregate stay
+            ordered (default: 10, 1 = fully serial)
+        KARTOGRAPH_OUTBOX_SHARD_COUNT: Split the outbox into this many hash
+            shards leased across replicas (default: 0, disabled)
+        KARTOGRAPH_OUTBOX_SHARD_LEASE_TTL_SECONDS: Seconds a shard lease
+            survives without a heartbeat (default: 30)
+        KARTOGRAPH_OUTBOX_SHARD_HEARTBEAT_INTERVAL_SECONDS: Seconds between
+            lease heartbeats; must be below the TTL (default: 10)
+        KARTOGRAPH_OUTBOX_ARCHIVE_AFTER_HOURS: Hours after processing at which
+            entries move to the outbox archive (default: 24)
+        KARTOGRAPH_OUTBOX_ARCHIVE_RETENTION_DAYS: Days archived entries are
+            kept (default: 30, 0 = forever)
+        KARTOGRAPH_OUTBOX_RETENTION_INTERVAL_SECONDS: Seconds between
+            retention runs (default: 600)
+        KARTOGRAPH_OUTBOX_RETENTION_BATCH_SIZE: Rows archived or purged per
+            transaction (default: 5000)
     """
 
     model_config = SettingsConfigDict(
@@ -286,6 +382,54 @@ class OutboxWorkerSettings(BaseSettings):
         ge=1,
         le=100,
     )
+    partition_max_concurrency: int = Field(
+        default=10,
+        description="Maximum aggregates processed in parallel per outbox batch",
+        ge=1,
+        le=100,
+    )
+    shard_count: int = Field(
+        default=0,
+        description="Number of outbox hash shards leased across replicas (0 = off)",
+        ge=0,
+        le=1024,
+    )
+    shard_lease_ttl_seconds: int = Field(
+        default=30,
+        description="Seconds a shard lease survives without a heartbeat",
+        ge=2,
+        le=3600,
+    )
+    shard_heartbeat_interval_seconds: int = Field(
+        default=10,
+        description="Seconds between shard lease heartbeats",
+        ge=1,
+        le=3600,
+    )
+    archive_after_hours: int = Field(
+        default=24,
+        description="Hours after processing at which entries are archived",
+        ge=1,
+        le=24 * 365,
+    )
+    archive_retention_days: int = Field(
+        default=30,
+        description="Days archived entries are kept (0 = forever)",
+        ge=0,
+        le=3650,
+    )
+    retention_interval_seconds: int = Field(
+        default=600,
+        description="Seconds between outbox retention runs",
+        ge=10,
+        le=86400,
+    )
+    retention_batch_size: int = Field(
+        default=5000,
+        description="Rows archived or purged per retention transaction",
+        ge=1,
+        le=100000,
+    )
 
 
 @lru_cache
@@ -297,6 +441,41 @@ def get_outbox_worker_settings() -> OutboxWorkerSettings:
     return OutboxWorkerSettings()
 
 
+class GraphMutationSettings(BaseSettings):
+    """Graph mutation apply settings.
+
+    Environment variables:
+        KARTOGRAPH_GRAPH_MUTATION_CHUNK_SIZE: Maximum operations applied per
+            transaction; 0 applies each mutation log in a single transaction
+            (default: 0)
+    """
+
+    model_config = SettingsConfigDict(
+        env_prefix="KARTOGRAPH_GRAPH_MUTATION_",
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra="ignore",
+    )
+
+    chunk_size: int = Field(
+        default=0,
+        description=(
+            "Maximum operations applied per transaction (0 = whole mutation "
+            "log in one transaction)"
+        ),
+        ge=0,
+    )
+
+
+@lru_cache
+def get_graph_mutation_settings() -> GraphMutationSettings:
+    """Get cached graph mutation settings.
+
+    Uses lru_cache to ensure settings are only loaded once.
+    """
+    return GraphMutationSettings()
+
+
 class IAMSettings(BaseSettings):
     """IAM (Identity and Access Management) settings.
 
@@ -304,6 +483,11 @@ class IAMSettings(BaseSettings):
         KARTOGRAPH_IAM_DEFAULT_TENANT_NAME: Default tenant name for single-tenant mode (default: default)
         KARTOGRAPH_IAM_DEFAULT_WORKSPACE_NAME: Default root workspace name (default: None, uses tenant name)
         KARTOGRAPH_IAM_SINGLE_TENANT_MODE: Enable single-tenant dev mode (default: true)
+        KARTOGRAPH_IAM_API_KEY_CACHE_TTL_SECONDS: Seconds a verified API key secret is reused without bcrypt (default: 60, 0 disables)
+        KARTOGRAPH_IAM_API_KEY_CACHE_MAX_ENTRIES: Verified API key secrets kept in memory (default: 10000)
+        KARTOGRAPH_IAM_API_KEY_USAGE_FLUSH_INTERVAL_SECONDS: Seconds between background last_used_at flushes (default: 30)
+        KARTOGRAPH_IAM_USER_PROVISIONING_MEMO_TTL_SECONDS: Seconds an unchanged SSO user skips JIT provisioning (default: 300, 0 disables)
+        KARTOGRAPH_IAM_USER_PROVISIONING_MEMO_MAX_ENTRIES: Users remembered as provisioned (default: 10000)
     """
 
     model_config = SettingsConfigDict(
@@ -338,6 +522,42 @@ class IAMSettings(BaseSettings):
         "are auto-added as regular members.",
     )
 
+    api_key_cache_ttl_seconds: float = Field(
+        default=60.0,
+        ge=0,
+        description="Seconds a successfully verified API key secret is reused "
+        "without re-running bcrypt. Revocation and deletion purge entries "
+        "immediately and are broadcast to other replicas through Postgres "
+        "NOTIFY; the TTL bounds staleness on a replica that misses the "
+        "broadcast. 0 disables the cache.",
+    )
+
+    api_key_cache_max_entries: int = Field(
+        default=10000,
+        ge=1,
+        description="Maximum verified API key secrets kept in memory",
+    )
+
+    api_key_usage_flush_interval_seconds: float = Field(
+        default=30.0,
+        gt=0,
+        description="Seconds between background flushes of API key last_used_at "
+        "timestamps",
+    )
+
+    user_provisioning_memo_ttl_seconds: float = Field(
+        default=300.0,
+        ge=0,
+        description="Seconds a user provisioned with an unchanged SSO profile "
+        "skips the JIT provisioning database round trip. 0 disables.",
+    )
+
+    user_provisioning_memo_max_entries: int = Field(
+        default=10000,
+        ge=1,
+        description="Maximum users remembered as provisioned",
+    )
+
 
 @lru_cache
 def get_iam_settings() -> IAMSettings:
@@ -359,6 +579,9 @@ class OIDCSettings(BaseSettings):
         KARTOGRAPH_OIDC_USER_ID_CLAIM: Claim to use for user ID (default: sub)
         KARTOGRAPH_OIDC_USERNAME_CLAIM: Claim to use for username (default: preferred_username)
         KARTOGRAPH_OIDC_AUDIENCE: Expected audience claim (default: None, uses client_id)
+        KARTOGRAPH_OIDC_CLAIMS_CACHE_MAX_ENTRIES: Validated tokens whose claims are cached (default: 10000, 0 disables)
+        KARTOGRAPH_OIDC_CLAIMS_CACHE_TTL_SECONDS: Longest a token's claims are cached (default: 300)
+        KARTOGRAPH_OIDC_JWKS_REFRESH_AHEAD_SECONDS: Seconds before JWKS cache expiry to refresh it in the background (default: 300)
     """
 
     model_config = SettingsConfigDict(
@@ -396,6 +619,24 @@ class OIDCSettings(BaseSettings):
         default=None,
         description="Expected audience claim (defaults to client_id if None)",
     )
+    claims_cache_max_entries: int = Field(
+        default=10000,
+        ge=0,
+        description="Validated tokens whose claims are cached until they "
+        "expire, so repeat requests skip signature verification. 0 disables.",
+    )
+    claims_cache_ttl_seconds: float = Field(
+        default=300.0,
+        ge=0,
+        description="Longest a token's claims are served from the cache, "
+        "even if the token expires later",
+    )
+    jwks_refresh_ahead_seconds: float = Field(
+        default=300.0,
+        ge=0,
+        description="Seconds before the JWKS cache expires to start "
+        "refreshing it in the background",
+    )
 
     @property
     def effective_audience(self) -> str:
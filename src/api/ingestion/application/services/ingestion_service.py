@@ -6,6 +6,8 @@ The service is stateless; all context flows via method parameters.
 
 from __future__ import annotations
 
+import asyncio
+import shutil
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -14,9 +16,11 @@ from ingestion.ports.adapters import IDatasourceAdapter
 
 if TYPE_CHECKING:
     from shared_kernel.credential_reader import ICredentialReader
+from shared_kernel.job_package.blob_store import ContentBlobStore
 from shared_kernel.job_package.builder import JobPackageBuilder
 from shared_kernel.job_package.value_objects import (
     AdapterCheckpoint,
+    ContentRef,
     SyncMode,
 )
 
@@ -38,6 +42,10 @@ class IngestionService:
         adapter_registry: Mapping of adapter_type strings to IDatasourceAdapter
             implementations. The service raises ValueError for unknown types.
         work_dir: Directory where JobPackage ZIP files will be written.
+        use_content_blob_store: Write content to the tenant's content blob
+            store under ``work_dir`` instead of embedding it in each package,
+            so content unchanged since an earlier sync is not written again.
+            Only applies to runs with a ``tenant_id``.
     """
 
     def __init__(
@@ -45,10 +53,12 @@ class IngestionService:
         adapter_registry: dict[str, IDatasourceAdapter],
         work_dir: Path,
         credential_reader: "ICredentialReader | None" = None,
+        use_content_blob_store: bool = False,
     ) -> None:
         self._adapter_registry = adapter_registry
         self._work_dir = work_dir
         self._credential_reader = credential_reader
+        self._use_content_blob_store = use_content_blob_store
 
     async def run(
         self,
@@ -127,25 +137,40 @@ class IngestionService:
         )
 
         # Build the JobPackage
+        blob_store = None
+        if self._use_content_blob_store and tenant_id:
+            blob_store = ContentBlobStore(work_dir=self._work_dir, tenant_id=tenant_id)
         builder = JobPackageBuilder(
             data_source_id=data_source_id,
             knowledge_graph_id=knowledge_graph_id,
             sync_mode=sync_mode,
+            blob_store=blob_store,
         )
 
-        # Register content blobs (deduplication is handled by the builder)
-        for hex_digest, content_bytes in result.content_blobs.items():
-            builder.add_content(content_bytes)
+        try:
+            # Register content blobs (deduplication is handled by the builder)
+            for hex_digest, content_bytes in result.content_blobs.items():
+                builder.add_content(content_bytes)
 
-        # Add the pre-built changeset entries
-        for entry in result.changeset_entries:
-            builder.add_changeset_entry(entry)
+            # Register spooled content; it is streamed into the archive
+            for hex_digest, content_path in result.content_files.items():
+                builder.add_content_file(
+                    content_path, ContentRef(hex_digest=hex_digest)
+                )
+
+            # Add the pre-built changeset entries
+            for entry in result.changeset_entries:
+                builder.add_changeset_entry(entry)
 
-        builder.set_checkpoint(result.new_checkpoint)
+            builder.set_checkpoint(result.new_checkpoint)
 
-        # Write the ZIP archive to work_dir
-        self._work_dir.mkdir(parents=True, exist_ok=True)
-        builder.build(self._work_dir)
+            # Write the ZIP archive to work_dir; hashing and compression are
+            # CPU-bound, so keep them off the event loop
+            self._work_dir.mkdir(parents=True, exist_ok=True)
+            await asyncio.to_thread(builder.build, self._work_dir)
+        finally:
+            if result.spool_dir is not None:
+                shutil.rmtree(result.spool_dir, ignore_errors=True)
 
         prepared_commit_sha = None
         if result.new_checkpoint is not None:
@@ -4,9 +4,17 @@ Extracts file content from GitHub repositories via the GitHub REST API,
 producing raw content and changeset entries for packaging into a JobPackage.
 
 Supports:
-- Full refresh: downloads a repository tarball (one archive fetch).
+- Full refresh: downloads a repository tarball (one archive fetch). With a
+  spool directory configured, the tarball is streamed and unpacked in a
+  worker thread into content-addressed files, so peak memory is bounded by
+  the download chunk size rather than the repository size.
 - Incremental sync: uses the GitHub Compare API to find only files that
-  changed since the previous checkpoint commit SHA.
+  changed since the previous checkpoint commit SHA, falling back to a diff
+  of the trees at both commits when the comparison is truncated.
+
+All requests go through a per-token scheduler shared across syncs (see
+``github_scheduler``), which adapts concurrency to GitHub's rate limits and
+revalidates branch, tree, and compare responses with cached ETags.
 
 API endpoints used:
 - GET /repos/{owner}/{repo}/branches/{branch}  — resolve branch to commit SHA
@@ -26,14 +34,29 @@ from __future__ import annotations
 
 import asyncio
 import base64
+import hashlib
 import io
 import json
 import mimetypes
+import os
+import shutil
 import tarfile
+import tempfile
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from pathlib import Path
 from typing import Any
 
 import httpx
 
+from ingestion.infrastructure.adapters.github_scheduler import (
+    GitHubRequestSchedulers,
+    GitHubRequestSession,
+)
+from ingestion.infrastructure.observability import (
+    DefaultGitHubRequestProbe,
+    GitHubRequestProbe,
+)
 from ingestion.ports.adapters import ExtractionResult
 from shared_kernel.job_package.value_objects import (
     AdapterCheckpoint,
@@ -67,6 +90,16 @@ _MODIFY_STATUSES = frozenset({"modified", "renamed", "changed", "copied"})
 # GitHub file statuses to ignore (deletions handled downstream via staleness)
 _IGNORED_STATUSES = frozenset({"removed", "unchanged"})
 
+# Chunk size for reading tarball members while spooling them to disk.
+_SPOOL_CHUNK_SIZE = 1024 * 1024
+
+# Most files the Compare API lists for one comparison; a list this large
+# may have been truncated.
+_COMPARE_MAX_FILES = 300
+
+# Request schedulers shared by all adapter instances in this process.
+_SHARED_SCHEDULERS = GitHubRequestSchedulers()
+
 
 class GitHubAdapter:
     """GitHub repository adapter implementing IDatasourceAdapter.
@@ -78,6 +111,18 @@ class GitHubAdapter:
         http_client: Optional pre-configured httpx.AsyncClient.  When omitted,
             a default client is created per extract() call.  Inject a client
             with a custom transport for testing.
+        blob_fetch_max_concurrency: Maximum concurrent blob fetches during
+            incremental syncs.  Requests are further limited by the shared
+            per-token scheduler, which adapts to GitHub's rate limits.
+        spool_dir: Optional directory under which full refreshes spool file
+            content.  When set, the tarball is streamed to disk and the
+            ExtractionResult carries ``content_files`` and ``spool_dir``
+            instead of ``content_blobs``; when omitted, the tarball is
+            unpacked in memory.
+        schedulers: Per-token request schedulers.  Defaults to the
+            process-wide registry, so rate-limit state and cached ETags are
+            shared by every adapter instance and carried across syncs.
+        probe: Observability probe for request scheduling events.
     """
 
     def __init__(
@@ -85,11 +130,17 @@ class GitHubAdapter:
         http_client: httpx.AsyncClient | None = None,
         *,
         blob_fetch_max_concurrency: int = 16,
+        spool_dir: Path | None = None,
+        schedulers: GitHubRequestSchedulers | None = None,
+        probe: GitHubRequestProbe | None = None,
     ) -> None:
         if blob_fetch_max_concurrency <= 0:
             raise ValueError("blob_fetch_max_concurrency must be positive")
         self._http_client = http_client
         self._blob_fetch_max_concurrency = blob_fetch_max_concurrency
+        self._spool_dir = spool_dir
+        self._schedulers = schedulers or _SHARED_SCHEDULERS
+        self._probe = probe or DefaultGitHubRequestProbe()
 
     @staticmethod
     def _parse_connection_config(
@@ -159,7 +210,10 @@ class GitHubAdapter:
 
         For an incremental run (sync_mode=INCREMENTAL with a checkpoint), uses
         the GitHub Compare API to find only files added/modified/renamed since
-        the checkpoint commit SHA, and fetches only their content.
+        the checkpoint commit SHA, and fetches only their content.  If the
+        Compare API truncates its file list, the changed files are derived
+        from the trees at both commits instead; if those are truncated too,
+        the run falls back to a full refresh.
 
         Args:
             connection_config: Repository parameters. Accepts either:
@@ -187,20 +241,59 @@ class GitHubAdapter:
         )
 
         client = self._http_client or httpx.AsyncClient(follow_redirects=True)
+        session = GitHubRequestSession(client, self._schedulers)
         headers = self._github_headers(token)
+        content_files: dict[str, Path] = {}
+        spool_dir: Path | None = None
+        files_to_fetch: list[dict[str, Any]] | None = None
 
         try:
             head_sha = await self._get_branch_head_sha(
-                client, headers, owner, repo, branch
+                session, headers, owner, repo, branch
             )
 
-            if use_full_refresh:
+            if not use_full_refresh:
+                assert checkpoint is not None
+                base_sha = checkpoint.data[_COMMIT_SHA_KEY]
+                files_to_fetch = await self._get_changed_files(
+                    session, headers, owner, repo, base_sha, head_sha
+                )
+                if files_to_fetch is None:
+                    self._probe.incremental_fallback_to_full_refresh(
+                        owner, repo, "repository tree truncated"
+                    )
+                    use_full_refresh = True
+
+            if use_full_refresh and self._spool_dir is not None:
+                content_blobs: dict[str, bytes] = {}
+                self._spool_dir.mkdir(parents=True, exist_ok=True)
+                spool_dir = Path(
+                    tempfile.mkdtemp(prefix=f"{repo}-", dir=self._spool_dir)
+                )
+                try:
+                    (
+                        changeset_entries,
+                        content_files,
+                        branch_file_count,
+                    ) = await self._extract_full_refresh_via_spool(
+                        session,
+                        headers,
+                        owner,
+                        repo,
+                        branch,
+                        head_sha,
+                        spool_dir,
+                    )
+                except BaseException:
+                    shutil.rmtree(spool_dir, ignore_errors=True)
+                    raise
+            elif use_full_refresh:
                 (
                     changeset_entries,
                     content_blobs,
                     branch_file_count,
                 ) = await self._extract_full_refresh_via_tarball(
-                    client,
+                    session,
                     headers,
                     owner,
                     repo,
@@ -208,22 +301,25 @@ class GitHubAdapter:
                     head_sha,
                 )
             else:
-                assert checkpoint is not None
-                base_sha = checkpoint.data[_COMMIT_SHA_KEY]
-                files_to_fetch = await self._get_changed_files(
-                    client, headers, owner, repo, base_sha, head_sha
-                )
+                assert files_to_fetch is not None
                 branch_file_count = await self._count_tree_blobs(
-                    client, headers, owner, repo, head_sha
+                    session, headers, owner, repo, head_sha
                 )
                 changeset_entries, content_blobs = await self._fetch_file_contents(
-                    client, headers, owner, repo, files_to_fetch
+                    session, headers, owner, repo, files_to_fetch
                 )
 
         finally:
             # Only close the client if we created it ourselves
             if self._http_client is None:
                 await client.aclose()
+            self._probe.sync_requests_completed(
+                owner,
+                repo,
+                requests=session.stats.requests,
+                not_modified=session.stats.not_modified,
+                throttle_seconds=session.stats.throttle_seconds,
+            )
 
         new_checkpoint = AdapterCheckpoint(
             schema_version=_CHECKPOINT_SCHEMA_VERSION,
@@ -235,6 +331,8 @@ class GitHubAdapter:
             content_blobs=content_blobs,
             new_checkpoint=new_checkpoint,
             branch_file_count=branch_file_count,
+            content_files=content_files,
+            spool_dir=spool_dir,
         )
 
     # ------------------------------------------------------------------
@@ -243,7 +341,7 @@ class GitHubAdapter:
 
     async def _get_branch_head_sha(
         self,
-        client: httpx.AsyncClient,
+        session: GitHubRequestSession,
         headers: dict[str, str],
         owner: str,
         repo: str,
@@ -252,7 +350,7 @@ class GitHubAdapter:
         """Resolve a branch name to its current HEAD commit SHA.
 
         Args:
-            client: httpx async client.
+            session: Request session of the current sync.
             headers: GitHub API request headers.
             owner: Repository owner.
             repo: Repository name.
@@ -265,12 +363,14 @@ class GitHubAdapter:
             httpx.HTTPStatusError: If the GitHub API returns a non-2xx status.
         """
         url = f"{_GITHUB_API_BASE}/repos/{owner}/{repo}/branches/{branch}"
-        data = await self._get_json_with_auth_fallback(client, url, headers=headers)
+        data = await self._get_json_with_auth_fallback(
+            session, url, headers=headers, conditional=True
+        )
         return str(data["commit"]["sha"])
 
     async def _get_all_tree_blobs(
         self,
-        client: httpx.AsyncClient,
+        session: GitHubRequestSession,
         headers: dict[str, str],
         owner: str,
         repo: str,
@@ -281,7 +381,7 @@ class GitHubAdapter:
         Non-blob entries (e.g., directories) are excluded.
 
         Args:
-            client: httpx async client.
+            session: Request session of the current sync.
             headers: GitHub API request headers.
             owner: Repository owner.
             repo: Repository name.
@@ -291,12 +391,7 @@ class GitHubAdapter:
             List of dicts with ``path``, ``sha``, and ``operation`` keys, where
             operation is always ``ChangeOperation.ADD``.
         """
-        url = (
-            f"{_GITHUB_API_BASE}/repos/{owner}/{repo}/git/trees/{tree_sha}?recursive=1"
-        )
-        tree_data = await self._get_json_with_auth_fallback(
-            client, url, headers=headers
-        )
+        tree_data = await self._get_tree(session, headers, owner, repo, tree_sha)
 
         result: list[dict[str, Any]] = []
         for item in tree_data.get("tree", []):
@@ -312,42 +407,59 @@ class GitHubAdapter:
             )
         return result
 
-    async def _count_tree_blobs(
+    async def _get_tree(
         self,
-        client: httpx.AsyncClient,
+        session: GitHubRequestSession,
         headers: dict[str, str],
         owner: str,
         repo: str,
         tree_sha: str,
-    ) -> int:
-        """Count blob entries in the repository tree at a commit."""
+    ) -> dict[str, Any]:
+        """Fetch the recursive tree at a commit, revalidating any cached copy."""
         url = (
             f"{_GITHUB_API_BASE}/repos/{owner}/{repo}/git/trees/{tree_sha}?recursive=1"
         )
-        tree_data = await self._get_json_with_auth_fallback(
-            client, url, headers=headers
+        return await self._get_json_with_auth_fallback(
+            session, url, headers=headers, conditional=True
         )
+
+    async def _count_tree_blobs(
+        self,
+        session: GitHubRequestSession,
+        headers: dict[str, str],
+        owner: str,
+        repo: str,
+        tree_sha: str,
+    ) -> int:
+        """Count blob entries in the repository tree at a commit."""
+        tree_data = await self._get_tree(session, headers, owner, repo, tree_sha)
         return sum(
             1 for item in tree_data.get("tree", []) if item.get("type") == "blob"
         )
 
     async def _get_changed_files(
         self,
-        client: httpx.AsyncClient,
+        session: GitHubRequestSession,
         headers: dict[str, str],
         owner: str,
         repo: str,
         base_sha: str,
         head_sha: str,
-    ) -> list[dict[str, Any]]:
+    ) -> list[dict[str, Any]] | None:
         """Fetch files changed between two commits using the Compare API.
 
         Only ADD and MODIFY statuses are returned. REMOVE is excluded because
         staleness detection is handled downstream by comparing ``last_synced_at``
         timestamps.
 
+        Only the first page of the comparison is read: later pages list
+        further commits, not further files. GitHub lists at most
+        ``_COMPARE_MAX_FILES`` files per comparison, so a list of that size is
+        treated as truncated and the changed files are derived from the trees
+        at both commits instead.
+
         Args:
-            client: httpx async client.
+            session: Request session of the current sync.
             headers: GitHub API request headers.
             owner: Repository owner.
             repo: Repository name.
@@ -356,15 +468,23 @@ class GitHubAdapter:
 
         Returns:
             List of dicts with ``path``, ``sha``, ``operation``, and
-            ``previous_path`` keys.
+            ``previous_path`` keys, or None if the changes cannot be
+            determined without a full refresh.
         """
         url = f"{_GITHUB_API_BASE}/repos/{owner}/{repo}/compare/{base_sha}...{head_sha}"
-        compare_data = await self._get_json_with_auth_fallback(
-            client, url, headers=headers
+        response = await self._get_with_auth_fallback(
+            session, url, headers=headers, conditional=True
         )
+        files: list[dict[str, Any]] = response.json().get("files") or []
+
+        if len(files) >= _COMPARE_MAX_FILES:
+            self._probe.compare_truncated(owner, repo, base_sha, head_sha, len(files))
+            return await self._get_changed_files_from_trees(
+                session, headers, owner, repo, base_sha, head_sha
+            )
 
         result: list[dict[str, Any]] = []
-        for file_info in compare_data.get("files", []):
+        for file_info in files:
             status: str = file_info.get("status", "")
             filename: str = file_info["filename"]
             blob_sha: str = file_info["sha"]
@@ -388,9 +508,58 @@ class GitHubAdapter:
             )
         return result
 
+    async def _get_changed_files_from_trees(
+        self,
+        session: GitHubRequestSession,
+        headers: dict[str, str],
+        owner: str,
+        repo: str,
+        base_sha: str,
+        head_sha: str,
+    ) -> list[dict[str, Any]] | None:
+        """Derive changed files by diffing the recursive trees at two commits.
+
+        Blobs whose path is new are ADDs and blobs whose SHA changed are
+        MODIFYs. Renames cannot be detected and appear as ADDs.
+
+        Returns:
+            The changed files in the format of :meth:`_get_changed_files`, or
+            None if GitHub truncated either tree.
+        """
+        base_tree = await self._get_tree(session, headers, owner, repo, base_sha)
+        head_tree = await self._get_tree(session, headers, owner, repo, head_sha)
+        if base_tree.get("truncated") or head_tree.get("truncated"):
+            return None
+
+        base_blobs = {
+            item["path"]: item["sha"]
+            for item in base_tree.get("tree", [])
+            if item.get("type") == "blob"
+        }
+        result: list[dict[str, Any]] = []
+        for item in head_tree.get("tree", []):
+            if item.get("type") != "blob":
+                continue
+            base_blob_sha = base_blobs.get(item["path"])
+            if base_blob_sha == item["sha"]:
+                continue
+            result.append(
+                {
+                    "path": item["path"],
+                    "sha": item["sha"],
+                    "operation": (
+                        ChangeOperation.ADD
+                        if base_blob_sha is None
+                        else ChangeOperation.MODIFY
+                    ),
+                    "previous_path": None,
+                }
+            )
+        return result
+
     async def _extract_full_refresh_via_tarball(
         self,
-        client: httpx.AsyncClient,
+        session: GitHubRequestSession,
         headers: dict[str, str],
         owner: str,
         repo: str,
@@ -400,13 +569,13 @@ class GitHubAdapter:
         """Download repository tarball and build ADD changeset entries."""
         url = f"{_GITHUB_API_BASE}/repos/{owner}/{repo}/tarball/{branch}"
         archive_bytes = await self._get_bytes_with_auth_fallback(
-            client,
+            session,
             url,
             headers=headers,
         )
         try:
             branch_file_count = await self._count_tree_blobs(
-                client, headers, owner, repo, head_sha
+                session, headers, owner, repo, head_sha
             )
         except httpx.HTTPStatusError:
             # Tarball extraction already succeeded; tree count is metadata only.
@@ -461,6 +630,109 @@ class GitHubAdapter:
 
         return changeset_entries, content_blobs, branch_file_count or file_count
 
+    async def _extract_full_refresh_via_spool(
+        self,
+        session: GitHubRequestSession,
+        headers: dict[str, str],
+        owner: str,
+        repo: str,
+        branch: str,
+        head_sha: str,
+        spool_dir: Path,
+    ) -> tuple[list[ChangesetEntry], dict[str, Path], int]:
+        """Stream the repository tarball into content-addressed files.
+
+        The HTTP body is read on the event loop one chunk at a time, while
+        decompression, hashing, and file writes run in a worker thread, so
+        neither the whole archive nor any whole file is held in memory.
+        """
+        url = f"{_GITHUB_API_BASE}/repos/{owner}/{repo}/tarball/{branch}"
+        async with self._stream_with_auth_fallback(
+            session, url, headers=headers
+        ) as response:
+            reader = io.BufferedReader(
+                _AsyncByteStreamReader(
+                    response.aiter_bytes(), asyncio.get_running_loop()
+                ),
+                buffer_size=_SPOOL_CHUNK_SIZE,
+            )
+            changeset_entries, content_files = await asyncio.to_thread(
+                self._spool_tarball, reader, spool_dir
+            )
+        try:
+            branch_file_count = await self._count_tree_blobs(
+                session, headers, owner, repo, head_sha
+            )
+        except httpx.HTTPStatusError:
+            # Tarball extraction already succeeded; tree count is metadata only.
+            branch_file_count = 0
+        return (
+            changeset_entries,
+            content_files,
+            branch_file_count or len(changeset_entries),
+        )
+
+    @staticmethod
+    def _spool_tarball(
+        fileobj: io.BufferedIOBase,
+        spool_dir: Path,
+    ) -> tuple[list[ChangesetEntry], dict[str, Path]]:
+        """Unpack a gzipped tarball stream into ``spool_dir/{hex_digest}`` files.
+
+        Runs in a worker thread.  Members are read sequentially (``r|gz``),
+        hashed while being written to a temporary file, then renamed to
+        their digest; identical content is stored once.
+        """
+        changeset_entries: list[ChangesetEntry] = []
+        content_files: dict[str, Path] = {}
+        root_prefix: str | None = None
+
+        with tarfile.open(fileobj=fileobj, mode="r|gz") as archive:
+            for member in archive:
+                if not member.isfile():
+                    continue
+                if root_prefix is None:
+                    root_prefix = member.name.split("/", 1)[0] + "/"
+                if not member.name.startswith(root_prefix):
+                    continue
+                relative_path = member.name[len(root_prefix) :]
+                if not relative_path or relative_path.endswith("/"):
+                    continue
+                extracted = archive.extractfile(member)
+                if extracted is None:
+                    continue
+
+                hasher = hashlib.sha256()
+                fd, partial_name = tempfile.mkstemp(dir=spool_dir, suffix=".part")
+                with os.fdopen(fd, "wb") as partial:
+                    while chunk := extracted.read(_SPOOL_CHUNK_SIZE):
+                        hasher.update(chunk)
+                        partial.write(chunk)
+                content_ref = ContentRef(hex_digest=hasher.hexdigest())
+                if content_ref.hex_digest in content_files:
+                    os.unlink(partial_name)
+                else:
+                    content_path = spool_dir / content_ref.hex_digest
+                    os.replace(partial_name, content_path)
+                    content_files[content_ref.hex_digest] = content_path
+
+                content_type, _ = mimetypes.guess_type(relative_path)
+                if content_type is None:
+                    content_type = "application/octet-stream"
+                changeset_entries.append(
+                    ChangesetEntry(
+                        operation=ChangeOperation.ADD,
+                        id=content_ref.hex_digest,
+                        type=_ENTRY_TYPE_FILE,
+                        path=relative_path,
+                        content_ref=content_ref,
+                        content_type=content_type,
+                        metadata={},
+                    )
+                )
+
+        return changeset_entries, content_files
+
     @staticmethod
     def _unauthenticated_headers(headers: dict[str, str]) -> dict[str, str]:
         return {
@@ -471,16 +743,18 @@ class GitHubAdapter:
 
     async def _get_with_auth_fallback(
         self,
-        client: httpx.AsyncClient,
+        session: GitHubRequestSession,
         url: str,
         *,
         headers: dict[str, str],
+        conditional: bool = False,
     ) -> httpx.Response:
-        response = await client.get(url, headers=headers)
+        response = await session.get(url, headers=headers, conditional=conditional)
         if response.status_code == 403 and headers.get("Authorization"):
-            response = await client.get(
+            response = await session.get(
                 url,
                 headers=self._unauthenticated_headers(headers),
+                conditional=conditional,
             )
         if response.status_code >= 400:
             raise httpx.HTTPStatusError(
@@ -490,24 +764,56 @@ class GitHubAdapter:
             )
         return response
 
+    @asynccontextmanager
+    async def _stream_with_auth_fallback(
+        self,
+        session: GitHubRequestSession,
+        url: str,
+        *,
+        headers: dict[str, str],
+    ) -> AsyncIterator[httpx.Response]:
+        """Streaming counterpart of ``_get_with_auth_fallback``."""
+        async with session.stream(url, headers=headers) as response:
+            if not (response.status_code == 403 and headers.get("Authorization")):
+                await self._raise_for_streamed_status(response)
+                yield response
+                return
+        async with session.stream(
+            url, headers=self._unauthenticated_headers(headers)
+        ) as response:
+            await self._raise_for_streamed_status(response)
+            yield response
+
+    async def _raise_for_streamed_status(self, response: httpx.Response) -> None:
+        if response.status_code >= 400:
+            await response.aread()
+            raise httpx.HTTPStatusError(
+                self._github_error_detail(response),
+                request=response.request,
+                response=response,
+            )
+
     async def _get_json_with_auth_fallback(
         self,
-        client: httpx.AsyncClient,
+        session: GitHubRequestSession,
         url: str,
         *,
         headers: dict[str, str],
+        conditional: bool = False,
     ) -> dict[str, Any]:
-        response = await self._get_with_auth_fallback(client, url, headers=headers)
+        response = await self._get_with_auth_fallback(
+            session, url, headers=headers, conditional=conditional
+        )
         return response.json()
 
     async def _get_bytes_with_auth_fallback(
         self,
-        client: httpx.AsyncClient,
+        session: GitHubRequestSession,
         url: str,
         *,
         headers: dict[str, str],
     ) -> bytes:
-        response = await self._get_with_auth_fallback(client, url, headers=headers)
+        response = await self._get_with_auth_fallback(session, url, headers=headers)
         return response.content
 
     @staticmethod
@@ -524,7 +830,7 @@ class GitHubAdapter:
 
     async def _fetch_file_contents(
         self,
-        client: httpx.AsyncClient,
+        session: GitHubRequestSession,
         headers: dict[str, str],
         owner: str,
         repo: str,
@@ -539,7 +845,7 @@ class GitHubAdapter:
         content, only one blob is stored.
 
         Args:
-            client: httpx async client.
+            session: Request session of the current sync.
             headers: GitHub API request headers.
             owner: Repository owner.
             repo: Repository name.
@@ -560,7 +866,7 @@ class GitHubAdapter:
 
             async with semaphore:
                 raw_bytes = await self._fetch_blob(
-                    client, headers, owner, repo, blob_sha
+                    session, headers, owner, repo, blob_sha
                 )
 
             content_ref = ContentRef.from_bytes(raw_bytes)
@@ -600,7 +906,7 @@ class GitHubAdapter:
 
     async def _fetch_blob(
         self,
-        client: httpx.AsyncClient,
+        session: GitHubRequestSession,
         headers: dict[str, str],
         owner: str,
         repo: str,
@@ -612,7 +918,7 @@ class GitHubAdapter:
         fetches the blob and decodes it to raw bytes.
 
         Args:
-            client: httpx async client.
+            session: Request session of the current sync.
             headers: GitHub API request headers.
             owner: Repository owner.
             repo: Repository name.
@@ -627,7 +933,7 @@ class GitHubAdapter:
         """
         url = f"{_GITHUB_API_BASE}/repos/{owner}/{repo}/git/blobs/{blob_sha}"
         blob_data = await self._get_json_with_auth_fallback(
-            client, url, headers=headers
+            session, url, headers=headers
         )
 
         encoding: str = blob_data.get("encoding", "base64")
@@ -640,3 +946,40 @@ class GitHubAdapter:
         # GitHub may include newlines in the base64 content; strip before decoding
         raw_b64: str = blob_data["content"].replace("\n", "")
         return base64.b64decode(raw_b64)
+
+
+class _AsyncByteStreamReader(io.RawIOBase):
+    """Blocking, read-only file object over an async byte iterator.
+
+    For use from a worker thread: each refill schedules the next chunk on
+    the event loop and waits for it, so only one chunk is buffered at a time.
+    """
+
+    def __init__(
+        self, chunks: AsyncIterator[bytes], loop: asyncio.AbstractEventLoop
+    ) -> None:
+        self._chunks = chunks
+        self._loop = loop
+        self._buffer = memoryview(b"")
+        self._eof = False
+
+    def readable(self) -> bool:
+        return True
+
+    async def _next_chunk(self) -> bytes:
+        return await anext(self._chunks)
+
+    def readinto(self, buffer: Any) -> int:
+        while not self._buffer and not self._eof:
+            try:
+                chunk = asyncio.run_coroutine_threadsafe(
+                    self._next_chunk(), self._loop
+                ).result()
+            except StopAsyncIteration:
+                self._eof = True
+            else:
+                self._buffer = memoryview(chunk)
+        size = min(len(buffer), len(self._buffer))
+        buffer[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
@@ -0,0 +1,457 @@
+"""Rate-limit-aware request scheduling for the GitHub adapter.
+
+GitHub enforces a primary rate limit per token (reported on every response
+through ``X-RateLimit-Remaining``/``X-RateLimit-Reset``) and secondary limits
+on bursts of concurrent requests (signalled by a 403 or 429, usually with
+``Retry-After``). A fixed semaphore per sync ignores both: concurrent syncs
+for the same token add up, and a throttled sync fails instead of waiting.
+
+``GitHubRequestScheduler`` is shared by every sync using the same token
+(see ``GitHubRequestSchedulers``) and:
+
+- Limits concurrent requests, halving the limit when GitHub throttles,
+  dropping to one request at a time when the remaining budget runs low, and
+  growing it back by one per window of successful requests.
+- Pauses all requests for the token until ``Retry-After`` or the rate-limit
+  reset has passed, then retries the throttled request.
+- Caches ``ETag`` validators and response bodies for conditional requests.
+  GitHub answers a matching ``If-None-Match`` with 304, which does not count
+  against the primary rate limit. The schedulers of a registry keep their
+  entries in one ``GitHubETagCache``, so the process holds at most one byte
+  budget of cached bodies however many tokens are in use.
+
+``GitHubRequestSession`` binds an HTTP client and the shared schedulers to
+one sync and collects that sync's request statistics.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+
+import httpx
+
+from ingestion.infrastructure.observability import (
+    DefaultGitHubRequestProbe,
+    GitHubRequestProbe,
+)
+
+# Status codes GitHub uses for primary and secondary rate limits.
+_RATE_LIMIT_STATUSES = frozenset({403, 429})
+
+# Wait applied to a secondary rate limit without Retry-After, per GitHub's
+# guidance to wait at least one minute.
+_DEFAULT_RETRY_AFTER_SECONDS = 60.0
+
+# Default byte budget of cached response bodies.
+_DEFAULT_ETAG_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+
+@dataclass
+class GitHubRequestStats:
+    """Request counters for one sync.
+
+    Attributes:
+        requests: Requests sent to GitHub, including retries.
+        not_modified: Conditional requests answered with 304 from the cache.
+        throttle_seconds: Time spent waiting for rate limits to clear.
+    """
+
+    requests: int = 0
+    not_modified: int = 0
+    throttle_seconds: float = 0.0
+
+
+class GitHubETagCache:
+    """Least-recently-used cache of conditional responses under a byte budget.
+
+    Entries are keyed by a namespace as well as the URL, so schedulers for
+    different tokens can share the budget without seeing each other's
+    responses.
+
+    Args:
+        max_bytes: Upper bound on the total size of cached response bodies.
+    """
+
+    def __init__(self, *, max_bytes: int = _DEFAULT_ETAG_CACHE_MAX_BYTES) -> None:
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[
+            tuple[str, str], tuple[str, httpx.Headers, bytes]
+        ] = OrderedDict()
+        self._size = 0
+
+    @property
+    def size(self) -> int:
+        """Total bytes of cached response bodies."""
+        return self._size
+
+    def get(self, namespace: str, url: str) -> tuple[str, httpx.Headers, bytes] | None:
+        """Return the cached ``(etag, headers, body)`` for a URL, if any."""
+        return self._entries.get((namespace, url))
+
+    def touch(self, namespace: str, url: str) -> None:
+        """Mark an entry as recently used."""
+        if (namespace, url) in self._entries:
+            self._entries.move_to_end((namespace, url))
+
+    def put(self, namespace: str, url: str, response: httpx.Response) -> None:
+        """Cache a response that carries an ``ETag``."""
+        etag = response.headers.get("etag")
+        content = response.content
+        if not etag or len(content) > self._max_bytes:
+            return
+        previous = self._entries.pop((namespace, url), None)
+        if previous is not None:
+            self._size -= len(previous[2])
+        headers = httpx.Headers(
+            {
+                key: value
+                for key, value in response.headers.items()
+                if key.lower() in ("content-type", "etag", "link")
+            }
+        )
+        self._entries[(namespace, url)] = (etag, headers, content)
+        self._size += len(content)
+        while self._size > self._max_bytes:
+            _, (_, _, evicted) = self._entries.popitem(last=False)
+            self._size -= len(evicted)
+
+
+class GitHubRequestScheduler:
+    """Schedules GitHub API requests for one token.
+
+    Args:
+        max_concurrency: Upper bound on concurrent requests.
+        low_watermark: Remaining primary budget below which requests are
+            sent one at a time.
+        max_retries: Retries of a request rejected by a rate limit.
+        max_wait_seconds: Longest rate-limit pause honoured; a throttled
+            request that would have to wait longer is returned as is.
+        etag_cache: Cache for conditional responses, usually shared with
+            the schedulers of other tokens (default: a private cache).
+        etag_namespace: Key separating this scheduler's entries in a shared
+            ``etag_cache``.
+        probe: Observability probe for rate-limit events.
+        clock: Wall clock in epoch seconds, comparable to
+            ``X-RateLimit-Reset``.
+        sleep: Coroutine used to wait.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_concurrency: int = 16,
+        low_watermark: int = 100,
+        max_retries: int = 3,
+        max_wait_seconds: float = 900.0,
+        etag_cache: GitHubETagCache | None = None,
+        etag_namespace: str = "",
+        probe: GitHubRequestProbe | None = None,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        if max_concurrency <= 0:
+            raise ValueError("max_concurrency must be positive")
+        if max_retries < 0:
+            raise ValueError("max_retries must not be negative")
+        self._max_concurrency = max_concurrency
+        self._low_watermark = low_watermark
+        self._max_retries = max_retries
+        self._max_wait_seconds = max_wait_seconds
+        self._etag_cache = etag_cache or GitHubETagCache()
+        self._etag_namespace = etag_namespace
+        self._probe = probe or DefaultGitHubRequestProbe()
+        self._clock = clock
+        self._sleep = sleep
+
+        self._limit = max_concurrency
+        self._in_flight = 0
+        self._successes = 0
+        self._blocked_until = 0.0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+
+    @property
+    def concurrency_limit(self) -> int:
+        """Current limit on concurrent requests."""
+        return self._limit
+
+    async def get(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        *,
+        headers: dict[str, str],
+        stats: GitHubRequestStats,
+        conditional: bool = False,
+    ) -> httpx.Response:
+        """Send a GET request, waiting out and retrying rate limits.
+
+        Args:
+            client: HTTP client to send the request with.
+            url: Request URL.
+            headers: Request headers.
+            stats: Counters of the sync the request belongs to.
+            conditional: Revalidate a cached response with ``If-None-Match``
+                and cache the response if it carries an ``ETag``. Use only
+                for JSON metadata, never for large content.
+
+        Returns:
+            The response. A 304 is replaced by the cached 200 response.
+        """
+        cached = (
+            self._etag_cache.get(self._etag_namespace, url) if conditional else None
+        )
+        if cached is not None:
+            headers = {**headers, "If-None-Match": cached[0]}
+        for attempt in range(self._max_retries + 1):
+            await self._acquire(stats)
+            try:
+                response = await client.get(url, headers=headers)
+            finally:
+                self._release()
+            stats.requests += 1
+            if self._throttled(response) and attempt < self._max_retries:
+                continue
+            break
+
+        if cached is not None and response.status_code == 304:
+            self._etag_cache.touch(self._etag_namespace, url)
+            stats.not_modified += 1
+            _, cached_headers, content = cached
+            return httpx.Response(
+                200, headers=cached_headers, content=content, request=response.request
+            )
+        if conditional and response.status_code == 200:
+            self._etag_cache.put(self._etag_namespace, url, response)
+        return response
+
+    @asynccontextmanager
+    async def stream(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        *,
+        headers: dict[str, str],
+        stats: GitHubRequestStats,
+    ) -> AsyncIterator[httpx.Response]:
+        """Streaming counterpart of :meth:`get`, without caching.
+
+        The request holds one concurrency slot until the body is consumed.
+        """
+        for attempt in range(self._max_retries + 1):
+            await self._acquire(stats)
+            try:
+                async with client.stream("GET", url, headers=headers) as response:
+                    stats.requests += 1
+                    if self._throttled(response) and attempt < self._max_retries:
+                        continue
+                    yield response
+                    return
+            finally:
+                self._release()
+
+    # ------------------------------------------------------------------
+    # Concurrency
+    # ------------------------------------------------------------------
+
+    async def _acquire(self, stats: GitHubRequestStats) -> None:
+        while True:
+            delay = self._blocked_until - self._clock()
+            if delay > 0:
+                stats.throttle_seconds += delay
+                await self._sleep(delay)
+                continue
+            if self._in_flight < self._limit:
+                self._in_flight += 1
+                return
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            finally:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+
+    def _release(self) -> None:
+        self._in_flight -= 1
+        self._wake_waiters()
+
+    def _wake_waiters(self) -> None:
+        free = self._limit - self._in_flight
+        while free > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            # Waiters left behind by a finished event loop cannot be woken
+            if waiter.done() or waiter.get_loop().is_closed():
+                continue
+            waiter.set_result(None)
+            free -= 1
+
+    def _set_limit(self, limit: int, remaining: int | None) -> None:
+        if limit != self._limit:
+            self._probe.concurrency_adjusted(self._limit, limit, remaining)
+            self._limit = limit
+            self._successes = 0
+            self._wake_waiters()
+
+    # ------------------------------------------------------------------
+    # Rate limits
+    # ------------------------------------------------------------------
+
+    def _throttled(self, response: httpx.Response) -> bool:
+        """Adapt to the response's rate-limit headers.
+
+        Returns:
+            True if the request was rejected by a rate limit and should be
+            retried once the pause set here has passed.
+        """
+        remaining = _int_header(response, "x-ratelimit-remaining")
+        reset = _float_header(response, "x-ratelimit-reset")
+        retry_after = _float_header(response, "retry-after")
+        now = self._clock()
+
+        if response.status_code in _RATE_LIMIT_STATUSES and (
+            retry_after is not None or remaining == 0
+        ):
+            if retry_after is not None:
+                wait = retry_after
+            elif reset is not None:
+                wait = max(reset - now, 1.0)
+            else:
+                wait = _DEFAULT_RETRY_AFTER_SECONDS
+            self._probe.rate_limited(
+                str(response.request.url), response.status_code, wait, remaining
+            )
+            self._set_limit(max(1, self._limit // 2), remaining)
+            if wait > self._max_wait_seconds:
+                return False
+            self._blocked_until = max(self._blocked_until, now + wait)
+            return True
+
+        if (
+            remaining == 0
+            and reset is not None
+            and reset - now <= self._max_wait_seconds
+        ):
+            # Budget spent by this response; hold the next request until reset
+            self._blocked_until = max(self._blocked_until, reset)
+        if remaining is not None and remaining < self._low_watermark:
+            self._set_limit(1, remaining)
+        elif response.status_code < 400 and self._limit < self._max_concurrency:
+            self._successes += 1
+            if self._successes >= self._limit:
+                self._set_limit(self._limit + 1, remaining)
+        return False
+
+
+def _new_scheduler(
+    etag_cache: GitHubETagCache, namespace: str
+) -> GitHubRequestScheduler:
+    return GitHubRequestScheduler(etag_cache=etag_cache, etag_namespace=namespace)
+
+
+class GitHubRequestSchedulers:
+    """Process-wide registry of schedulers, one per token.
+
+    Tokens are keyed by digest, and the least recently used schedulers are
+    dropped beyond ``max_tokens``. All schedulers share one ETag cache, so
+    cached bodies stay within ``etag_cache_max_bytes`` in total.
+
+    Args:
+        max_tokens: Number of tokens to keep schedulers for.
+        etag_cache_max_bytes: Byte budget of the shared ETag cache.
+        scheduler_factory: Creates the scheduler for a new token from the
+            shared ETag cache and the token's namespace in it.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_tokens: int = 256,
+        etag_cache_max_bytes: int = _DEFAULT_ETAG_CACHE_MAX_BYTES,
+        scheduler_factory: Callable[
+            [GitHubETagCache, str], GitHubRequestScheduler
+        ] = _new_scheduler,
+    ) -> None:
+        self._max_tokens = max_tokens
+        self._etag_cache = GitHubETagCache(max_bytes=etag_cache_max_bytes)
+        self._scheduler_factory = scheduler_factory
+        self._schedulers: OrderedDict[str, GitHubRequestScheduler] = OrderedDict()
+
+    def for_authorization(self, authorization: str) -> GitHubRequestScheduler:
+        """Return the scheduler for an ``Authorization`` header value.
+
+        Unauthenticated requests (empty value) share one scheduler, matching
+        GitHub's per-client limit for anonymous access.
+        """
+        key = hashlib.sha256(authorization.encode("utf-8")).hexdigest()
+        scheduler = self._schedulers.get(key)
+        if scheduler is None:
+            scheduler = self._scheduler_factory(self._etag_cache, key)
+            self._schedulers[key] = scheduler
+            while len(self._schedulers) > self._max_tokens:
+                self._schedulers.popitem(last=False)
+        else:
+            self._schedulers.move_to_end(key)
+        return scheduler
+
+
+class GitHubRequestSession:
+    """One sync's view of the shared schedulers.
+
+    Routes each request to the scheduler for its ``Authorization`` header,
+    so unauthenticated fallbacks are accounted separately from the token.
+
+    Args:
+        client: HTTP client used for the sync.
+        schedulers: Shared per-token schedulers.
+    """
+
+    def __init__(
+        self, client: httpx.AsyncClient, schedulers: GitHubRequestSchedulers
+    ) -> None:
+        self._client = client
+        self._schedulers = schedulers
+        self.stats = GitHubRequestStats()
+
+    async def get(
+        self, url: str, *, headers: dict[str, str], conditional: bool = False
+    ) -> httpx.Response:
+        scheduler = self._schedulers.for_authorization(headers.get("Authorization", ""))
+        return await scheduler.get(
+            self._client,
+            url,
+            headers=headers,
+            stats=self.stats,
+            conditional=conditional,
+        )
+
+    @asynccontextmanager
+    async def stream(
+        self, url: str, *, headers: dict[str, str]
+    ) -> AsyncIterator[httpx.Response]:
+        scheduler = self._schedulers.for_authorization(headers.get("Authorization", ""))
+        async with scheduler.stream(
+            self._client, url, headers=headers, stats=self.stats
+        ) as response:
+            yield response
+
+
+def _int_header(response: httpx.Response, name: str) -> int | None:
+    value = response.headers.get(name)
+    try:
+        return int(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def _float_header(response: httpx.Response, name: str) -> float | None:
+    value = response.headers.get(name)
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
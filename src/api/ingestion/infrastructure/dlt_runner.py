@@ -21,6 +21,7 @@ from __future__ import annotations
 import asyncio
 import functools
 import json
+import shutil
 from pathlib import Path
 from typing import Any
 
@@ -277,11 +278,13 @@ def _write_output_files(output_dir: Path, result: ExtractionResult) -> None:
         result: The extraction result to serialise.
     """
     # Write content blobs as individual files named by SHA-256 hex digest.
-    if result.content_blobs:
+    if result.content_blobs or result.content_files:
         blobs_dir = output_dir / _BLOBS_SUBDIR
         blobs_dir.mkdir(exist_ok=True)
         for hex_digest, raw_bytes in result.content_blobs.items():
             (blobs_dir / hex_digest).write_bytes(raw_bytes)
+        for hex_digest, content_path in result.content_files.items():
+            shutil.copyfile(content_path, blobs_dir / hex_digest)
 
     # Write changeset.jsonl (one JSON object per line).
     changeset_path = output_dir / _CHANGESET_FILENAME
@@ -0,0 +1,15 @@
+"""Ingestion infrastructure observability probes.
+
+Domain probes for data source API access following the
+Domain Oriented Observability pattern.
+"""
+
+from ingestion.infrastructure.observability.github_request_probe import (
+    DefaultGitHubRequestProbe,
+    GitHubRequestProbe,
+)
+
+__all__ = [
+    "DefaultGitHubRequestProbe",
+    "GitHubRequestProbe",
+]
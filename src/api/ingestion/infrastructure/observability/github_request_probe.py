@@ -0,0 +1,143 @@
+"""Domain probe for GitHub API request scheduling.
+
+Following Domain-Oriented Observability patterns, this probe captures
+domain-significant events related to GitHub rate limiting, conditional
+requests, and changed-file discovery during syncs.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Protocol
+
+import structlog
+
+if TYPE_CHECKING:
+    from shared_kernel.observability_context import ObservationContext
+
+
+class GitHubRequestProbe(Protocol):
+    """Domain probe for GitHub API request scheduling."""
+
+    def rate_limited(
+        self, url: str, status_code: int, wait_seconds: float, remaining: int | None
+    ) -> None:
+        """Record that GitHub rejected a request for exceeding a rate limit."""
+        ...
+
+    def concurrency_adjusted(
+        self, previous: int, current: int, remaining: int | None
+    ) -> None:
+        """Record that the concurrent request limit for a token changed."""
+        ...
+
+    def compare_truncated(
+        self, owner: str, repo: str, base_sha: str, head_sha: str, file_count: int
+    ) -> None:
+        """Record that a Compare API response was truncated."""
+        ...
+
+    def incremental_fallback_to_full_refresh(
+        self, owner: str, repo: str, reason: str
+    ) -> None:
+        """Record that changed files could not be determined incrementally."""
+        ...
+
+    def sync_requests_completed(
+        self,
+        owner: str,
+        repo: str,
+        requests: int,
+        not_modified: int,
+        throttle_seconds: float,
+    ) -> None:
+        """Record the GitHub API usage of one sync."""
+        ...
+
+    def with_context(self, context: ObservationContext) -> GitHubRequestProbe:
+        """Create a new probe with observation context bound."""
+        ...
+
+
+class DefaultGitHubRequestProbe:
+    """Default implementation of GitHubRequestProbe using structlog."""
+
+    def __init__(
+        self,
+        logger: structlog.stdlib.BoundLogger | None = None,
+        context: ObservationContext | None = None,
+    ) -> None:
+        self._logger = logger or structlog.get_logger()
+        self._context = context
+
+    def _get_context_kwargs(self) -> dict[str, Any]:
+        if self._context is None:
+            return {}
+        return self._context.as_dict()
+
+    def with_context(self, context: ObservationContext) -> DefaultGitHubRequestProbe:
+        return DefaultGitHubRequestProbe(logger=self._logger, context=context)
+
+    def rate_limited(
+        self, url: str, status_code: int, wait_seconds: float, remaining: int | None
+    ) -> None:
+        self._logger.warning(
+            "github_rate_limited",
+            url=url,
+            status_code=status_code,
+            wait_seconds=wait_seconds,
+            remaining=remaining,
+            **self._get_context_kwargs(),
+        )
+
+    def concurrency_adjusted(
+        self, previous: int, current: int, remaining: int | None
+    ) -> None:
+        self._logger.debug(
+            "github_concurrency_adjusted",
+            previous=previous,
+            current=current,
+            remaining=remaining,
+            **self._get_context_kwargs(),
+        )
+
+    def compare_truncated(
+        self, owner: str, repo: str, base_sha: str, head_sha: str, file_count: int
+    ) -> None:
+        self._logger.warning(
+            "github_compare_truncated",
+            owner=owner,
+            repo=repo,
+            base_sha=base_sha,
+            head_sha=head_sha,
+            file_count=file_count,
+            **self._get_context_kwargs(),
+        )
+
+    def incremental_fallback_to_full_refresh(
+        self, owner: str, repo: str, reason: str
+    ) -> None:
+        self._logger.warning(
+            "github_incremental_fallback_to_full_refresh",
+            owner=owner,
+            repo=repo,
+            reason=reason,
+            **self._get_context_kwargs(),
+        )
+
+    def sync_requests_completed(
+        self,
+        owner: str,
+        repo: str,
+        requests: int,
+        not_modified: int,
+        throttle_seconds: float,
+    ) -> None:
+        self._logger.info(
+            "github_sync_requests_completed",
+            owner=owner,
+            repo=repo,
+            requests=requests,
+            not_modified=not_modified,
+            throttle_seconds=throttle_seconds,
+            **self._get_context_kwargs(),
+        )
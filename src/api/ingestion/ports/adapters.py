@@ -11,7 +11,8 @@ Only shared_kernel types are permitted as external dependencies.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Protocol, runtime_checkable
 
 from shared_kernel.job_package.value_objects import (
@@ -27,7 +28,8 @@ class ExtractionResult:
 
     Holds all output produced by a single extraction run:
     - The list of changeset entries (what changed and how).
-    - The raw content blobs keyed by SHA-256 hex digest (for deduplication).
+    - The raw content keyed by SHA-256 hex digest (for deduplication), either
+      in memory or spooled to disk.
     - The updated checkpoint to be persisted for the next incremental run.
 
     Attributes:
@@ -42,12 +44,20 @@ class ExtractionResult:
             persisted by the caller so the next incremental run starts here.
         branch_file_count: Total blob files on the source branch at the
             extraction HEAD commit, when the adapter can determine it.
+        content_files: Content-addressed map of hex_digest → path of a file
+            holding the raw bytes, for content spooled to disk instead of
+            held in memory.  A digest appears in ``content_blobs`` or here,
+            not both.
+        spool_dir: Directory holding ``content_files``, owned by the caller
+            once the result is returned; remove it after packaging.
     """
 
     changeset_entries: list[ChangesetEntry]
     content_blobs: dict[str, bytes]
     new_checkpoint: AdapterCheckpoint
     branch_file_count: int | None = None
+    content_files: dict[str, Path] = field(default_factory=dict)
+    spool_dir: Path | None = None
 
 
 @runtime_checkable
@@ -1,7 +1,9 @@
 """Main FastAPI application entry point."""
 
 import asyncio
+from collections.abc import Awaitable, Callable
 from contextlib import asynccontextmanager
+from datetime import timedelta
 from pathlib import Path
 from typing import Any
 from urllib.parse import urlparse
@@ -16,6 +18,10 @@ from graph.presentation import routes as graph_routes
 from iam.presentation import router as iam_router
 from management.presentation import router as management_router
 from extraction.presentation import router as extraction_router
+from infrastructure.authorization_dependencies import (
+    get_permission_decision_cache,
+    get_zed_token_store,
+)
 from infrastructure.database.dependencies import (
     close_database_engines,
     init_database_engines,
@@ -33,33 +39,54 @@ from infrastructure.settings import (
     get_spicedb_settings,
 )
 from infrastructure.version import __version__
+from shared_kernel.middleware.permission_decision_scope import (
+    PermissionDecisionScopeMiddleware,
+)
 from graph.infrastructure.tenant_graph_handler import (
     AGEGraphProvisioner,
     TenantAGEGraphHandler,
 )
-from iam.infrastructure.outbox import IAMEventTranslator
+from iam.dependencies.api_key import flush_api_key_usage, get_verified_api_key_cache
+from iam.infrastructure.outbox import (
+    API_KEY_INVALIDATION_CHANNEL,
+    APIKeyCacheInvalidationHandler,
+    IAMEventTranslator,
+)
 from management.infrastructure.outbox import ManagementEventTranslator
 from infrastructure.outbox.composite import CompositeEventHandler
-from infrastructure.outbox.spicedb_handler import SpiceDBEventHandler
+from infrastructure.outbox.spicedb_handler import (
+    DECISION_INVALIDATION_CHANNEL,
+    SpiceDBEventHandler,
+)
 from infrastructure.outbox.event_sources.postgres_notify import (
     PostgresNotifyEventSource,
 )
+from infrastructure.outbox.retention import OutboxRetention
+from infrastructure.outbox.sharding import OutboxShardCoordinator
 from infrastructure.outbox.worker import OutboxWorker
 from shared_kernel.authorization.spicedb.client import SpiceDBClient
+from shared_kernel.job_package.blob_store import collect_garbage_in
 from shared_kernel.outbox.observability import (
     DefaultEventSourceProbe,
     DefaultOutboxWorkerProbe,
 )
 from infrastructure.mcp_dependencies import dispose_mcp_auth_engine
+from query.dependencies import get_query_executor
 from query.presentation.mcp import mcp_http_app_proxy, query_mcp_app
 from graph.ports.mutation_log import MutationLogApplyResult
 
 # Default work directory for JobPackage ZIP archives
 _JOB_PACKAGE_WORK_DIR = Path("/tmp/kartograph/job_packages")  # noqa: S108
 
+# Where full-refresh extractions spool file content before packaging
+_INGESTION_SPOOL_DIR = _JOB_PACKAGE_WORK_DIR / "spool"
+
 # Scheduler polling interval (seconds)
 _SCHEDULER_POLL_INTERVAL_SECONDS = 60
 
+# Interval between content blob store garbage collections (seconds)
+_CONTENT_BLOB_GC_INTERVAL_SECONDS = 3600
+
 
 # ---------------------------------------------------------------------------
 # Session-aware outbox handler wrappers
@@ -257,9 +284,12 @@ class _SessionedIngestionEventHandler:
                 )
 
             ingestion_service = IngestionService(
-                adapter_registry={"github": GitHubAdapter()},
+                adapter_registry={
+                    "github": GitHubAdapter(spool_dir=_INGESTION_SPOOL_DIR)
+                },
                 work_dir=_JOB_PACKAGE_WORK_DIR,
                 credential_reader=credential_reader,
+                use_content_blob_store=True,
             )
             ingestion_handler = IngestionEventHandler(
                 ingestion_service=ingestion_service,
@@ -521,6 +551,86 @@ async def _run_scheduler_loop(session_factory: Any, poll_interval: int) -> None:
             break
 
 
+async def _run_api_key_usage_flush_loop(
+    session_factory: Any, flush_interval: float
+) -> None:
+    """Background asyncio task that persists coalesced API key usage.
+
+    Writes the last_used_at timestamps recorded by API key authentication
+    since the previous flush. Runs until the event loop is stopped (app
+    shutdown); shutdown performs a final flush.
+
+    Args:
+        session_factory: SQLAlchemy async sessionmaker for database access
+        flush_interval: Seconds between flushes
+    """
+    while True:
+        try:
+            await asyncio.sleep(flush_interval)
+        except asyncio.CancelledError:
+            break
+
+        try:
+            await flush_api_key_usage(session_factory)
+        except asyncio.CancelledError:
+            break
+        except Exception:
+            # Pending usage was restored by the flush; retry next interval
+            pass
+
+
+async def _run_outbox_retention_loop(
+    retention: OutboxRetention, interval: float
+) -> None:
+    """Background asyncio task that archives and purges processed outbox entries.
+
+    Runs until the event loop is stopped (app shutdown).
+
+    Args:
+        retention: Retention job to run
+        interval: Seconds between runs
+    """
+    while True:
+        try:
+            await asyncio.sleep(interval)
+        except asyncio.CancelledError:
+            break
+
+        try:
+            await retention.run()
+        except asyncio.CancelledError:
+            break
+        except Exception:
+            # Failures are reported by the retention probe; retry next interval
+            pass
+
+
+async def _run_content_blob_gc_loop(work_dir: Path, interval: float) -> None:
+    """Background asyncio task that deletes content blobs no package uses.
+
+    Collection scans every tenant's blob store under an exclusive lock, so it
+    runs on its own schedule instead of after each ingestion build. Runs
+    until the event loop is stopped (app shutdown).
+
+    Args:
+        work_dir: JobPackage work directory holding the blob stores
+        interval: Seconds between runs
+    """
+    while True:
+        try:
+            await asyncio.sleep(interval)
+        except asyncio.CancelledError:
+            break
+
+        try:
+            await asyncio.to_thread(collect_garbage_in, work_dir)
+        except asyncio.CancelledError:
+            break
+        except Exception:
+            # Unreferenced blobs stay until the next run
+            pass
+
+
 # Configure structlog before any loggers are created
 configure_logging()
 
@@ -552,7 +662,9 @@ async def kartograph_lifespan(app: FastAPI):
     - Database engine lifecycle (created on startup, disposed on shutdown)
     - MCP server lifespan
     - AGE connection pool lifecycle
-    - Outbox worker lifecycle
+    - Outbox worker and retention lifecycle
+    - API key usage flush task
+    - Content blob store garbage collection task
 
     Engines are created here (within the running event loop) to ensure
     proper async context for database connections.
@@ -582,6 +694,8 @@ async def kartograph_lifespan(app: FastAPI):
         preshared_key=spicedb_settings.preshared_key.get_secret_value(),
         use_tls=spicedb_settings.use_tls,
         cert_path=spicedb_settings.cert_path,
+        consistency=spicedb_settings.consistency,
+        token_store=get_zed_token_store(),
     )
 
     # Startup: ensure default tenant and root workspace exist (single-tenant mode)
@@ -636,18 +750,44 @@ async def kartograph_lifespan(app: FastAPI):
 
         # Build composite handler with registered bounded context handlers
         handler = CompositeEventHandler(probe=probe)
-        # Register SpiceDB handler wrapping the IAM translator
+        broadcast_handlers: dict[str, Callable[[str], Awaitable[None]]] = {}
+        # Register SpiceDB handler wrapping the IAM translator. Both SpiceDB
+        # handlers drop the decisions they may have changed here, broadcast
+        # them to the other replicas' caches, and record each tenant's
+        # newest ZedToken for at_least_as_fresh reads on every replica.
+        decision_cache = get_permission_decision_cache()
         spicedb_handler = SpiceDBEventHandler(
             translator=IAMEventTranslator(),
             authz=authz,
+            decision_cache=decision_cache,
+            session_factory=app.state.write_sessionmaker,
+            token_store=get_zed_token_store(),
         )
         handler.register(spicedb_handler, handler_name="iam")
+        if decision_cache is not None:
+            broadcast_handlers[DECISION_INVALIDATION_CHANNEL] = (
+                spicedb_handler.on_notification
+            )
         # Register SpiceDB handler wrapping the Management translator
         management_spicedb_handler = SpiceDBEventHandler(
             translator=ManagementEventTranslator(),
             authz=authz,
+            decision_cache=decision_cache,
+            session_factory=app.state.write_sessionmaker,
+            token_store=get_zed_token_store(),
         )
         handler.register(management_spicedb_handler, handler_name="management")
+        # Register API key cache handler: purges revoked/deleted keys here
+        # and broadcasts them to the other replicas' caches
+        api_key_cache = get_verified_api_key_cache()
+        if api_key_cache is not None:
+            api_key_cache_handler = APIKeyCacheInvalidationHandler(
+                api_key_cache, session_factory=app.state.write_sessionmaker
+            )
+            handler.register(api_key_cache_handler, handler_name="api_key_cache")
+            broadcast_handlers[API_KEY_INVALIDATION_CHANNEL] = (
+                api_key_cache_handler.on_notification
+            )
         # Register AGE graph provisioning handler for tenant lifecycle events
         age_pool = get_age_connection_pool()
         from infrastructure.database.connection import ConnectionFactory
@@ -690,11 +830,26 @@ async def kartograph_lifespan(app: FastAPI):
         )
         handler.register(graph_mutation_handler, handler_name="graph_mutation")
 
-        # Create event source for real-time NOTIFY processing
+        # Optionally split the outbox across replicas by aggregate hash
+        shard_coordinator = None
+        if outbox_settings.shard_count > 0:
+            shard_coordinator = OutboxShardCoordinator(
+                session_factory=app.state.write_sessionmaker,
+                shard_count=outbox_settings.shard_count,
+                lease_ttl_seconds=outbox_settings.shard_lease_ttl_seconds,
+                heartbeat_interval_seconds=outbox_settings.shard_heartbeat_interval_seconds,
+            )
+
+        # Create event source for real-time NOTIFY processing; sharded
+        # workers only wake for notifications on their own shards
         event_source = PostgresNotifyEventSource(
             db_url=db_url,
             channel="outbox_events",
             probe=DefaultEventSourceProbe(),
+            routing_filter=shard_coordinator.owns_routing_key
+            if shard_coordinator is not None
+            else None,
+            broadcast_handlers=broadcast_handlers,
         )
 
         worker = OutboxWorker(
@@ -706,6 +861,8 @@ async def kartograph_lifespan(app: FastAPI):
             batch_size=outbox_settings.batch_size,
             max_retries=outbox_settings.max_retries,
             sync_started_max_concurrency=outbox_settings.sync_started_max_concurrency,
+            partition_max_concurrency=outbox_settings.partition_max_concurrency,
+            shard_coordinator=shard_coordinator,
         )
         await worker.start()
         app.state.outbox_worker = worker
@@ -721,6 +878,43 @@ async def kartograph_lifespan(app: FastAPI):
         )
         app.state.scheduler_task = scheduler_task
 
+        # Start the outbox retention task: moves processed entries to the
+        # archive so the worker's head scans stay fast as history grows.
+        retention = OutboxRetention(
+            session_factory=app.state.write_sessionmaker,
+            probe=probe,
+            archive_after=timedelta(hours=outbox_settings.archive_after_hours),
+            purge_after=timedelta(days=outbox_settings.archive_retention_days)
+            if outbox_settings.archive_retention_days > 0
+            else None,
+            batch_size=outbox_settings.retention_batch_size,
+        )
+        app.state.outbox_retention_task = asyncio.create_task(
+            _run_outbox_retention_loop(
+                retention=retention,
+                interval=outbox_settings.retention_interval_seconds,
+            )
+        )
+
+    # Start the API key usage flush task: API key authentication records
+    # last_used_at in memory, and this task writes it in batches.
+    if hasattr(app.state, "write_sessionmaker"):
+        app.state.api_key_usage_flush_task = asyncio.create_task(
+            _run_api_key_usage_flush_loop(
+                session_factory=app.state.write_sessionmaker,
+                flush_interval=iam_settings.api_key_usage_flush_interval_seconds,
+            )
+        )
+
+    # Start the content blob GC task: deletes blobs once the archives of
+    # every package referencing them have been removed.
+    app.state.content_blob_gc_task = asyncio.create_task(
+        _run_content_blob_gc_loop(
+            work_dir=_JOB_PACKAGE_WORK_DIR,
+            interval=_CONTENT_BLOB_GC_INTERVAL_SECONDS,
+        )
+    )
+
     # MCP lifespan: refresh proxy so each startup gets a fresh
     # StreamableHTTPSessionManager (it cannot be restarted after exit).
     mcp_http_app_proxy.refresh()
@@ -735,6 +929,35 @@ async def kartograph_lifespan(app: FastAPI):
         except asyncio.CancelledError:
             pass
 
+    # Shutdown: stop outbox retention task
+    if hasattr(app.state, "outbox_retention_task"):
+        app.state.outbox_retention_task.cancel()
+        try:
+            await app.state.outbox_retention_task
+        except asyncio.CancelledError:
+            pass
+
+    # Shutdown: stop content blob GC task
+    if hasattr(app.state, "content_blob_gc_task"):
+        app.state.content_blob_gc_task.cancel()
+        try:
+            await app.state.content_blob_gc_task
+        except asyncio.CancelledError:
+            pass
+
+    # Shutdown: stop API key usage flush task, then flush what is left
+    if hasattr(app.state, "api_key_usage_flush_task"):
+        app.state.api_key_usage_flush_task.cancel()
+        try:
+            await app.state.api_key_usage_flush_task
+        except asyncio.CancelledError:
+            pass
+        try:
+            await flush_api_key_usage(app.state.write_sessionmaker)
+        except Exception:
+            # Losing last_used_at must not block shutdown
+            pass
+
     # Shutdown: stop outbox worker
     if hasattr(app.state, "outbox_worker"):
         await app.state.outbox_worker.stop()
@@ -746,6 +969,11 @@ async def kartograph_lifespan(app: FastAPI):
     # Shutdown: close database engines
     await close_database_engines(app)
 
+    # Shutdown: stop MCP query threads before their pool goes away
+    if get_query_executor.cache_info().currsize:
+        get_query_executor().shutdown()
+        get_query_executor.cache_clear()
+
     # Shutdown: close AGE connection pool and clear cache for next startup
     try:
         pool = get_age_connection_pool()
@@ -766,6 +994,9 @@ app = FastAPI(
 # Configure CORS middleware based on current settings
 configure_cors(app, get_cors_settings())
 
+# Memoize permission decisions for the duration of each request
+app.add_middleware(PermissionDecisionScopeMiddleware)
+
 app.mount(path="/query", app=query_mcp_app)
 
 # Include health check routes (liveness and readiness probes)
@@ -26,7 +26,10 @@ from management.ports.repositories import (
     IKnowledgeGraphRepository,
 )
 from management.ports.secret_store import ISecretStoreRepository
-from shared_kernel.authorization.protocols import AuthorizationProvider
+from shared_kernel.authorization.protocols import (
+    AuthorizationProvider,
+    CheckRequest,
+)
 from shared_kernel.authorization.types import (
     Permission,
     ResourceType,
@@ -300,6 +303,10 @@ class DataSourceService:
         the latest sync run per source. This enables the sidebar navigation badge
         to show a live count of active syncs with a single API call.
 
+        Permissions are checked with one bulk call, and data sources and their
+        latest runs are each loaded with one query, however many knowledge
+        graphs the tenant has.
+
         Args:
             user_id: Authenticated user requesting the list.
 
@@ -307,31 +314,39 @@ class DataSourceService:
             List of DataSourceWithLatestRun pairs (data source + optional latest run).
         """
         all_kgs = await self._kg_repo.find_by_tenant(self._scope_to_tenant)
+        if not all_kgs:
+            return []
 
-        result: list[DataSourceWithLatestRun] = []
-        for kg in all_kgs:
-            has_view = await self._check_permission(
-                user_id=user_id,
-                resource_type=ResourceType.KNOWLEDGE_GRAPH,
-                resource_id=kg.id.value,
-                permission=Permission.VIEW,
-            )
-            if not has_view:
-                continue
-
-            data_sources = await self._ds_repo.find_by_knowledge_graph(kg.id.value)
-            for ds in data_sources:
-                latest_run = await self._sync_run_repo.get_latest_for_data_source(
-                    ds.id.value
-                )
-                result.append(
-                    DataSourceWithLatestRun(
-                        data_source=ds,
-                        latest_sync_run=latest_run,
-                    )
+        subject = format_subject(ResourceType.USER, user_id)
+        permitted = await self._authz.bulk_check_permission(
+            [
+                CheckRequest(
+                    resource=format_resource(ResourceType.KNOWLEDGE_GRAPH, kg.id.value),
+                    permission=Permission.VIEW,
+                    subject=subject,
                 )
-
-        return result
+                for kg in all_kgs
+            ]
+        )
+        viewable_kg_ids = [
+            kg.id.value
+            for kg in all_kgs
+            if format_resource(ResourceType.KNOWLEDGE_GRAPH, kg.id.value) in permitted
+        ]
+        if not viewable_kg_ids:
+            return []
+
+        data_sources = await self._ds_repo.find_by_knowledge_graphs(viewable_kg_ids)
+        latest_runs = await self._sync_run_repo.get_latest_for_data_sources(
+            [ds.id.value for ds in data_sources]
+        )
+        return [
+            DataSourceWithLatestRun(
+                data_source=ds,
+                latest_sync_run=latest_runs.get(ds.id.value),
+            )
+            for ds in data_sources
+        ]
 
     async def update(
         self,
@@ -41,7 +41,10 @@ from management.ports.repositories import (
 from management.ports.canonical_schema import ICanonicalSchemaRepository
 from management.ports.maintenance_pipeline import MaintenancePipelinePort
 from management.ports.secret_store import ISecretStoreRepository
-from shared_kernel.authorization.protocols import AuthorizationProvider
+from shared_kernel.authorization.protocols import (
+    AuthorizationProvider,
+    CheckRequest,
+)
 from shared_kernel.authorization.types import (
     Permission,
     RelationType,
@@ -292,6 +295,70 @@ class KnowledgeGraphService:
             subject=subject,
         )
 
+    async def _permitted_kg_ids(
+        self,
+        user_id: str,
+        kg_ids: list[str],
+        permission: Permission,
+    ) -> set[str]:
+        """Return the subset of *kg_ids* the user has *permission* on.
+
+        Checks all knowledge graphs with one bulk permission call rather
+        than one call per knowledge graph.
+
+        Args:
+            user_id: The user to check
+            kg_ids: IDs of the knowledge graphs to check
+            permission: The permission to check
+
+        Returns:
+            IDs of the knowledge graphs that passed the check
+        """
+        if not kg_ids:
+            return set()
+        subject = format_subject(ResourceType.USER, user_id)
+        permitted = await self._authz.bulk_check_permission(
+            [
+                CheckRequest(
+                    resource=format_resource(ResourceType.KNOWLEDGE_GRAPH, kg_id),
+                    permission=permission,
+                    subject=subject,
+                )
+                for kg_id in kg_ids
+            ]
+        )
+        return {
+            kg_id
+            for kg_id in kg_ids
+            if format_resource(ResourceType.KNOWLEDGE_GRAPH, kg_id) in permitted
+        }
+
+    async def _workspace_kg_ids(self, workspace_id: str) -> list[str]:
+        """Return the IDs of the knowledge graphs linked to a workspace.
+
+        Reads the explicit ``knowledge_graph#workspace`` tuples in SpiceDB.
+
+        Args:
+            workspace_id: The workspace to list KG IDs for
+
+        Returns:
+            IDs of the linked knowledge graphs
+        """
+        tuples = await self._authz.read_relationships(
+            resource_type=ResourceType.KNOWLEDGE_GRAPH,
+            relation=RelationType.WORKSPACE,
+            subject_type=ResourceType.WORKSPACE,
+            subject_id=workspace_id,
+        )
+
+        # Format is "knowledge_graph:ID"
+        kg_ids: list[str] = []
+        for rel_tuple in tuples:
+            parts = rel_tuple.resource.split(":")
+            if len(parts) == 2:
+                kg_ids.append(parts[1])
+        return kg_ids
+
     async def create(
         self,
         user_id: str,
@@ -400,15 +467,19 @@ class KnowledgeGraphService:
         self,
         user_id: str,
         workspace_id: str,
+        limit: int | None = None,
+        offset: int = 0,
     ) -> list[KnowledgeGraph]:
         """List knowledge graphs in a workspace.
 
         Uses read_relationships to discover KG IDs linked to the workspace,
-        then fetches each from the repository and filters by tenant.
+        then loads those in the scoped tenant with one repository query.
 
         Args:
             user_id: The user requesting the list
             workspace_id: The workspace to list KGs for
+            limit: Maximum number of KGs to return (None for all)
+            offset: Number of KGs to skip, in name order
 
         Returns:
             List of KnowledgeGraph aggregates
@@ -433,29 +504,11 @@ class KnowledgeGraphService:
                 f"User {user_id} lacks view permission on workspace {workspace_id}"
             )
 
-        # Read explicit tuples to discover KG IDs linked to this workspace
-        tuples = await self._authz.read_relationships(
-            resource_type=ResourceType.KNOWLEDGE_GRAPH,
-            relation=RelationType.WORKSPACE,
-            subject_type=ResourceType.WORKSPACE,
-            subject_id=workspace_id,
+        kg_ids = await self._workspace_kg_ids(workspace_id)
+        kgs = await self._kg_repo.find_by_ids_and_tenant(
+            kg_ids, self._scope_to_tenant, limit=limit, offset=offset
         )
 
-        # Extract KG IDs from relationship tuples
-        # Format is "knowledge_graph:ID"
-        kg_ids: list[str] = []
-        for rel_tuple in tuples:
-            parts = rel_tuple.resource.split(":")
-            if len(parts) == 2:
-                kg_ids.append(parts[1])
-
-        # Fetch each KG from repo and filter by tenant
-        kgs: list[KnowledgeGraph] = []
-        for kg_id in kg_ids:
-            kg = await self._kg_repo.get_by_id(KnowledgeGraphId(value=kg_id))
-            if kg is not None and kg.tenant_id == self._scope_to_tenant:
-                kgs.append(kg)
-
         self._probe.knowledge_graphs_listed(
             workspace_id=workspace_id,
             count=len(kgs),
@@ -468,6 +521,8 @@ class KnowledgeGraphService:
         user_id: str,
         workspace_id: str,
         permission: Permission = Permission.VIEW,
+        limit: int | None = None,
+        offset: int = 0,
     ) -> list[KnowledgeGraph]:
         """List knowledge graphs in a workspace filtered by per-KG permission.
 
@@ -483,40 +538,24 @@ class KnowledgeGraphService:
             user_id: The user requesting the list
             workspace_id: The workspace to filter by
             permission: Minimum permission to check on each KG (VIEW or EDIT)
+            limit: Maximum number of KGs to return (None for all)
+            offset: Number of KGs to skip, in name order
 
         Returns:
             KGs in the workspace that the user has the requested permission on.
             Returns an empty list when the workspace has no KGs or when the user
             lacks the requested permission on all workspace KGs.
         """
-        # Discover KG IDs linked to the workspace via SpiceDB relationships
-        tuples = await self._authz.read_relationships(
-            resource_type=ResourceType.KNOWLEDGE_GRAPH,
-            relation=RelationType.WORKSPACE,
-            subject_type=ResourceType.WORKSPACE,
-            subject_id=workspace_id,
-        )
-
-        # Extract KG IDs from relationship tuples (format: "knowledge_graph:<id>")
-        kg_ids: list[str] = []
-        for rel_tuple in tuples:
-            parts = rel_tuple.resource.split(":")
-            if len(parts) == 2:
-                kg_ids.append(parts[1])
+        kg_ids = await self._workspace_kg_ids(workspace_id)
 
         # Filter by per-KG permission (no workspace-level check required)
-        kgs: list[KnowledgeGraph] = []
-        for kg_id in kg_ids:
-            has_perm = await self._check_permission(
-                user_id=user_id,
-                resource_type=ResourceType.KNOWLEDGE_GRAPH,
-                resource_id=kg_id,
-                permission=permission,
-            )
-            if has_perm:
-                kg = await self._kg_repo.get_by_id(KnowledgeGraphId(value=kg_id))
-                if kg is not None and kg.tenant_id == self._scope_to_tenant:
-                    kgs.append(kg)
+        permitted = await self._permitted_kg_ids(user_id, kg_ids, permission)
+        kgs = await self._kg_repo.find_by_ids_and_tenant(
+            [kg_id for kg_id in kg_ids if kg_id in permitted],
+            self._scope_to_tenant,
+            limit=limit,
+            offset=offset,
+        )
 
         self._probe.knowledge_graphs_listed(
             workspace_id=workspace_id,
@@ -528,34 +567,35 @@ class KnowledgeGraphService:
         self,
         user_id: str,
         permission: Permission = Permission.VIEW,
+        limit: int | None = None,
+        offset: int = 0,
     ) -> list[KnowledgeGraph]:
         """List all knowledge graphs in the current tenant accessible to the user.
 
-        Fetches all KGs in the tenant then filters to those the user has the
-        requested permission on via SpiceDB.
+        Uses SpiceDB lookup_resources to find the KGs the user has the
+        requested permission on, then loads those in the scoped tenant with
+        one repository query.
 
         Args:
             user_id: The user requesting the list
             permission: The permission to check (VIEW by default; pass EDIT to
                 return only KGs the user can edit — e.g. for the Mutations
                 Console KG selector which must show only submission targets).
+            limit: Maximum number of KGs to return (None for all)
+            offset: Number of KGs to skip, in name order
 
         Returns:
             List of KnowledgeGraph aggregates the user has the requested
             permission on.
         """
-        all_kgs = await self._kg_repo.find_by_tenant(self._scope_to_tenant)
-
-        accessible_kgs: list[KnowledgeGraph] = []
-        for kg in all_kgs:
-            has_permission = await self._check_permission(
-                user_id=user_id,
-                resource_type=ResourceType.KNOWLEDGE_GRAPH,
-                resource_id=kg.id.value,
-                permission=permission,
-            )
-            if has_permission:
-                accessible_kgs.append(kg)
+        accessible_ids = await self._authz.lookup_resources(
+            resource_type=ResourceType.KNOWLEDGE_GRAPH,
+            permission=permission,
+            subject=format_subject(ResourceType.USER, user_id),
+        )
+        accessible_kgs = await self._kg_repo.find_by_ids_and_tenant(
+            accessible_ids, self._scope_to_tenant, limit=limit, offset=offset
+        )
 
         self._probe.knowledge_graphs_listed(
             workspace_id=self._scope_to_tenant,
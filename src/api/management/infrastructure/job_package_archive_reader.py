@@ -12,7 +12,11 @@ from shared_kernel.job_package.value_objects import JobPackageId
 
 
 class SqlJobPackageArchiveReader:
-    """Resolve the latest non-empty JobPackage id emitted for one data source."""
+    """Resolve the latest non-empty JobPackage id emitted for one data source.
+
+    Processed events are moved to ``outbox_archive`` by outbox retention, so
+    both tables are read.
+    """
 
     def __init__(self, *, session: AsyncSession, job_package_work_dir: Path) -> None:
         self._session = session
@@ -25,7 +29,11 @@ class SqlJobPackageArchiveReader:
             text(
                 """
                 SELECT payload->>'job_package_id' AS job_package_id
-                FROM outbox
+                FROM (
+                  SELECT event_type, payload, occurred_at FROM outbox
+                  UNION ALL
+                  SELECT event_type, payload, occurred_at FROM outbox_archive
+                ) o
                 WHERE event_type IN ('IngestionPrepared', 'JobPackageProduced')
                   AND payload->>'data_source_id' = :data_source_id
                   AND payload->>'job_package_id' IS NOT NULL
@@ -169,6 +169,19 @@ class DataSourceRepository(IDataSourceRepository):
         self._probe.data_sources_listed(knowledge_graph_id, len(data_sources))
         return data_sources
 
+    async def find_by_knowledge_graphs(
+        self, knowledge_graph_ids: list[str]
+    ) -> list[DataSource]:
+        if not knowledge_graph_ids:
+            return []
+
+        stmt = select(DataSourceModel).where(
+            DataSourceModel.knowledge_graph_id.in_(knowledge_graph_ids)
+        )
+        result = await self._session.execute(stmt)
+        models = result.scalars().all()
+        return [self._to_domain(model) for model in models]
+
     async def find_all(self) -> list[DataSource]:
         """List all data sources across all knowledge graphs and tenants."""
         stmt = select(DataSourceModel)
@@ -123,6 +123,26 @@ class DataSourceSyncRunRepository(IDataSourceSyncRunRepository):
 
         return self._to_domain(model)
 
+    async def get_latest_for_data_sources(
+        self, data_source_ids: list[str]
+    ) -> dict[str, DataSourceSyncRun]:
+        """Return the most recent sync run per data source (DISTINCT ON)."""
+        if not data_source_ids:
+            return {}
+
+        stmt = (
+            select(DataSourceSyncRunModel)
+            .where(DataSourceSyncRunModel.data_source_id.in_(data_source_ids))
+            .order_by(
+                DataSourceSyncRunModel.data_source_id,
+                desc(DataSourceSyncRunModel.created_at),
+            )
+            .distinct(DataSourceSyncRunModel.data_source_id)
+        )
+        result = await self._session.execute(stmt)
+        models = result.scalars().all()
+        return {model.data_source_id: self._to_domain(model) for model in models}
+
     def _to_domain(self, model: DataSourceSyncRunModel) -> DataSourceSyncRun:
         """Reconstitute entity from database state."""
         return DataSourceSyncRun(
@@ -178,6 +178,33 @@ class KnowledgeGraphRepository(IKnowledgeGraphRepository):
         self._probe.knowledge_graphs_listed(tenant_id, len(kgs))
         return kgs
 
+    async def find_by_ids_and_tenant(
+        self,
+        knowledge_graph_ids: list[str],
+        tenant_id: str,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> list[KnowledgeGraph]:
+        if not knowledge_graph_ids:
+            return []
+
+        stmt = (
+            select(KnowledgeGraphModel)
+            .where(
+                KnowledgeGraphModel.id.in_(knowledge_graph_ids),
+                KnowledgeGraphModel.tenant_id == tenant_id,
+            )
+            .order_by(KnowledgeGraphModel.name, KnowledgeGraphModel.id)
+            .offset(offset)
+            .limit(limit)
+        )
+        result = await self._session.execute(stmt)
+        models = result.scalars().all()
+
+        kgs = [self._to_domain(model) for model in models]
+        self._probe.knowledge_graphs_listed(tenant_id, len(kgs))
+        return kgs
+
     async def find_all(self) -> list[KnowledgeGraph]:
         stmt = select(KnowledgeGraphModel)
         result = await self._session.execute(stmt)
@@ -66,6 +66,29 @@ class IKnowledgeGraphRepository(Protocol):
         """
         ...
 
+    async def find_by_ids_and_tenant(
+        self,
+        knowledge_graph_ids: list[str],
+        tenant_id: str,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> list[KnowledgeGraph]:
+        """Load the given knowledge graphs that belong to a tenant in one query.
+
+        IDs that do not exist or belong to another tenant are skipped.
+        Results are ordered by name, then ID, so pages are stable.
+
+        Args:
+            knowledge_graph_ids: IDs of the knowledge graphs to load
+            tenant_id: The tenant the knowledge graphs must belong to
+            limit: Maximum number of knowledge graphs to return (None for all)
+            offset: Number of knowledge graphs to skip
+
+        Returns:
+            List of matching KnowledgeGraph aggregates
+        """
+        ...
+
     async def find_all(self) -> list[KnowledgeGraph]:
         """List all knowledge graphs across tenants."""
         ...
@@ -155,6 +178,19 @@ class IDataSourceRepository(Protocol):
         """
         ...
 
+    async def find_by_knowledge_graphs(
+        self, knowledge_graph_ids: list[str]
+    ) -> list[DataSource]:
+        """List the data sources of several knowledge graphs in one query.
+
+        Args:
+            knowledge_graph_ids: The knowledge graphs to list data sources for
+
+        Returns:
+            List of DataSource aggregates for the knowledge graphs
+        """
+        ...
+
     async def delete(self, data_source: DataSource) -> bool:
         """Delete a data source and emit domain events.
 
@@ -240,3 +276,17 @@ class IDataSourceSyncRunRepository(Protocol):
             The most recent DataSourceSyncRun entity, or None if not found
         """
         ...
+
+    async def get_latest_for_data_sources(
+        self, data_source_ids: list[str]
+    ) -> dict[str, DataSourceSyncRun]:
+        """Return the most recent sync run of each data source in one query.
+
+        Args:
+            data_source_ids: The data sources to fetch the latest runs for
+
+        Returns:
+            Mapping of data source ID to its most recent DataSourceSyncRun.
+            Data sources that have never synced are absent.
+        """
+        ...
@@ -334,6 +334,17 @@ async def list_knowledge_graphs(
             )
         ),
     ] = None,
+    limit: Annotated[
+        int | None,
+        Query(
+            ge=1,
+            le=500,
+            description="Maximum number of knowledge graphs to return (all if omitted)",
+        ),
+    ] = None,
+    offset: Annotated[
+        int, Query(ge=0, description="Number of knowledge graphs to skip")
+    ] = 0,
 ) -> KnowledgeGraphListResponse:
     """List knowledge graphs accessible to the current user in their tenant.
 
@@ -347,15 +358,18 @@ async def list_knowledge_graphs(
       are sufficient. Used by the Mutations Console KG selector.
     - Without ``?workspace_id=``: returns all accessible KGs in the tenant
       (existing behaviour, no regression).
+    - ``?limit=&offset=``: pages through the results, ordered by name.
 
     Args:
         current_user: Current authenticated user with tenant context
         service: Knowledge graph service for orchestration
         permission: Minimum permission level to filter by (view or edit)
         workspace_id: Optional workspace to scope results to
+        limit: Maximum number of KGs to return
+        offset: Number of KGs to skip
 
     Returns:
-        KnowledgeGraphListResponse with all accessible KGs
+        KnowledgeGraphListResponse with the requested page of accessible KGs
 
     Raises:
         HTTPException: 500 for unexpected errors
@@ -367,11 +381,15 @@ async def list_knowledge_graphs(
                 user_id=current_user.user_id.value,
                 workspace_id=workspace_id,
                 permission=perm,
+                limit=limit,
+                offset=offset,
             )
         else:
             kgs = await service.list_all(
                 user_id=current_user.user_id.value,
                 permission=perm,
+                limit=limit,
+                offset=offset,
             )
         kg_responses = [KnowledgeGraphResponse.from_domain(kg) for kg in kgs]
         return KnowledgeGraphListResponse(
@@ -605,6 +623,7 @@ List all knowledge graphs within a workspace that the caller can view.
 
 Requires `view` permission on the workspace. Results are filtered by
 authorization — only knowledge graphs the caller can access are returned.
+Results are ordered by name; use `limit` and `offset` to page through them.
 """,
     response_description="List of knowledge graphs with total count",
     responses={
@@ -618,12 +637,16 @@ async def list_workspace_knowledge_graphs(
     workspace_id: str,
     current_user: Annotated[CurrentUser, Depends(get_current_user)],
     service: Annotated[KnowledgeGraphService, Depends(get_knowledge_graph_service)],
+    limit: Annotated[int | None, Query(ge=1, le=500)] = None,
+    offset: Annotated[int, Query(ge=0)] = 0,
 ) -> KnowledgeGraphListResponse:
     """List knowledge graphs in a workspace."""
     try:
         kgs = await service.list_for_workspace(
             user_id=current_user.user_id.value,
             workspace_id=workspace_id,
+            limit=limit,
+            offset=offset,
         )
 
         kg_responses = [KnowledgeGraphResponse.from_domain(kg) for kg in kgs]
@@ -20,9 +20,11 @@ Redaction rules:
     - Map results:       each nested node/edge value is recursively evaluated
 
 Performance:
-    Permission results are cached per ``knowledge_graph_id`` within a single
-    ``apply_redaction`` call to avoid redundant SpiceDB round-trips when
-    multiple entities share the same parent KnowledgeGraph.
+    Before redacting, ``apply_redaction`` collects the distinct
+    ``knowledge_graph_id`` values in the result set and checks them with a
+    single bulk permission check. Results are cached per
+    ``knowledge_graph_id`` so entities sharing a parent KnowledgeGraph never
+    trigger another SpiceDB round-trip.
 
 Fail-safe:
     Any SpiceDB error during permission checking causes the entity to be
@@ -33,7 +35,10 @@ from __future__ import annotations
 
 from typing import Any
 
-from shared_kernel.authorization.protocols import AuthorizationProvider
+from shared_kernel.authorization.protocols import (
+    AuthorizationProvider,
+    CheckRequest,
+)
 from shared_kernel.authorization.types import (
     Permission,
     ResourceType,
@@ -94,8 +99,10 @@ class MCPQuerySecureEnclave:
     async def apply_redaction(self, rows: list[QueryResultRow]) -> list[QueryResultRow]:
         """Apply secure enclave authorization to a list of result rows.
 
-        Each row is processed independently. Within a row, all node and edge
-        values are authorized against SpiceDB (with per-kg_id caching).
+        Each row is processed independently. The permissions for all
+        knowledge graphs referenced by the rows are checked up front in one
+        bulk call, then every node and edge value is authorized from that
+        per-kg_id cache.
 
         Args:
             rows: Raw query result rows from the graph repository.
@@ -104,6 +111,11 @@ class MCPQuerySecureEnclave:
             The same rows with unauthorized entities redacted according
             to the spec redaction rules.
         """
+        kg_ids: set[str] = set()
+        for row in rows:
+            for value in row.values():
+                self._collect_kg_ids(value, kg_ids)
+        await self._prefetch_kg_view(kg_ids)
         return [await self._process_row(row) for row in rows]
 
     # ------------------------------------------------------------------
@@ -182,6 +194,50 @@ class MCPQuerySecureEnclave:
     # Private — SpiceDB permission check (cached)
     # ------------------------------------------------------------------
 
+    def _collect_kg_ids(self, value: Any, kg_ids: set[str]) -> None:
+        """Add the knowledge_graph_id of every entity within *value* to *kg_ids*."""
+        if not isinstance(value, dict):
+            return
+        if _is_edge_dict(value) or _is_node_dict(value):
+            kg_id = self._extract_kg_id(value.get("properties", {}))
+            if kg_id is not None:
+                kg_ids.add(kg_id)
+            return
+        for nested in value.values():
+            self._collect_kg_ids(nested, kg_ids)
+
+    async def _prefetch_kg_view(self, kg_ids: set[str]) -> None:
+        """Check VIEW on all uncached *kg_ids* with one bulk call.
+
+        Any SpiceDB error denies every knowledge graph in the batch (fail-safe).
+        """
+        pending = sorted(kg_ids - self._permission_cache.keys())
+        if not pending:
+            return
+
+        subject = format_subject(ResourceType.USER, self._user_id)
+        resources = {
+            kg_id: format_resource(ResourceType.KNOWLEDGE_GRAPH, kg_id)
+            for kg_id in pending
+        }
+        try:
+            permitted = await self._authz.bulk_check_permission(
+                [
+                    CheckRequest(
+                        resource=resource,
+                        permission=Permission.VIEW,
+                        subject=subject,
+                    )
+                    for resource in resources.values()
+                ]
+            )
+        except Exception:
+            # Fail-safe: any error → deny (do not expose data on errors)
+            permitted = set()
+
+        for kg_id, resource in resources.items():
+            self._permission_cache[kg_id] = resource in permitted
+
     async def _check_kg_view(self, kg_id: str) -> bool:
         """Return True if the user has VIEW permission on *kg_id* (cached).
 
@@ -14,6 +14,7 @@ from query.infrastructure.observability.remote_file_repository_probe import (
     DefaultRemoteFileRepositoryProbe,
 )
 from query.infrastructure.prompt_repository import PromptRepository
+from query.infrastructure.query_executor import BlockingQueryExecutor
 from query.infrastructure.tenant_routing import (
     AGEGraphExistenceChecker,
     TenantAwareQueryGraphRepository,
@@ -30,7 +31,7 @@ from query.application.observability import (
     SchemaResourceProbe,
 )
 from query.application.services import MCPQueryService
-from query.infrastructure.query_repository import QueryGraphRepository
+from query.infrastructure.query_repository import ConnectOnUseQueryGraphRepository
 from shared_kernel.middleware.mcp_auth import get_mcp_auth_context
 
 if TYPE_CHECKING:
@@ -89,6 +90,11 @@ def get_mcp_query_service() -> Iterator[MCPQueryService]:
     if the graph has not been provisioned the query is rejected with a
     QueryExecutionError before any AGE round-trip (spec: Tenant graph not found).
 
+    No connection is opened here: the graph client is checked out when a
+    query runs and returned when it finishes, so entering this context never
+    blocks the event loop. Run the service's queries through
+    :func:`get_query_executor`.
+
     Context manager that manually resolves all dependencies to work with
     FastMCP's DI system, which doesn't support nested Depends() chains.
     Handles graph client lifecycle (connect/disconnect) automatically.
@@ -115,15 +121,33 @@ def get_mcp_query_service() -> Iterator[MCPQueryService]:
     # This lets us verify the graph before opening an AGE-registered connection.
     existence_checker = AGEGraphExistenceChecker(connection_factory=factory)
 
-    with mcp_graph_client_context(graph_name=tenant_graph_name) as client:
-        probe = get_query_service_probe()
-        inner_repository = QueryGraphRepository(client=client)
-        repository = TenantAwareQueryGraphRepository(
-            tenant_id=tenant_id,
-            inner_repository=inner_repository,
-            existence_check_fn=existence_checker,
-        )
-        yield MCPQueryService(repository=repository, probe=probe)
+    probe = get_query_service_probe()
+    inner_repository = ConnectOnUseQueryGraphRepository(
+        lambda: mcp_graph_client_context(graph_name=tenant_graph_name)
+    )
+    repository = TenantAwareQueryGraphRepository(
+        tenant_id=tenant_id,
+        inner_repository=inner_repository,
+        existence_check_fn=existence_checker,
+    )
+    yield MCPQueryService(repository=repository, probe=probe)
+
+
+@lru_cache(maxsize=1)
+def get_query_executor() -> BlockingQueryExecutor:
+    """Get the executor that runs MCP graph queries off the event loop.
+
+    Sized to the connections interactive queries may hold: the interactive
+    pool quota when one is configured, otherwise the whole pool.
+
+    Returns:
+        BlockingQueryExecutor instance (singleton)
+    """
+    settings = get_database_settings()
+    return BlockingQueryExecutor(
+        max_workers=settings.pool_interactive_max_connections
+        or settings.pool_max_connections
+    )
 
 
 def get_schema_resource_probe() -> SchemaResourceProbe:
@@ -0,0 +1,49 @@
+"""Bounded executor for blocking graph queries.
+
+The AGE client is built on psycopg2, which blocks the calling thread for the
+whole round trip. MCP tools are ``async def`` and share one event loop per
+API worker, so a query run inline stalls every other request on that worker.
+``BlockingQueryExecutor`` moves the call onto a dedicated, bounded thread pool
+so concurrent agents get parallel query throughput.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import ParamSpec, TypeVar
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+
+class BlockingQueryExecutor:
+    """Runs blocking query callables off the event loop.
+
+    The pool is sized to the number of connections queries may hold, so
+    extra callers queue here rather than tying up a thread while they wait
+    for a pooled connection. Context variables (e.g. observation context)
+    are propagated to the worker thread, as with ``asyncio.to_thread``.
+
+    Args:
+        max_workers: Maximum number of queries running at once.
+    """
+
+    def __init__(self, max_workers: int) -> None:
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="graph-query"
+        )
+
+    async def run(self, fn: Callable[P, T], /, *args: P.args, **kwargs: P.kwargs) -> T:
+        """Run ``fn(*args, **kwargs)`` on the executor and await its result."""
+        loop = asyncio.get_running_loop()
+        ctx = contextvars.copy_context()
+        call = functools.partial(ctx.run, fn, *args, **kwargs)
+        return await loop.run_in_executor(self._executor, call)
+
+    def shutdown(self) -> None:
+        """Stop accepting work and drop queued calls."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
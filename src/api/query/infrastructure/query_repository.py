@@ -8,7 +8,8 @@ from __future__ import annotations
 
 import re
 import uuid
-
+from collections.abc import Callable
+from contextlib import AbstractContextManager
 
 from age.models import Edge as AgeEdge  # type: ignore
 from age.models import Vertex as AgeVertex
@@ -266,3 +267,37 @@ class QueryGraphRepository(IQueryGraphRepository):
             end_id=str(edge.end_id),
             properties=dict(edge.properties) if edge.properties else {},
         )
+
+
+class ConnectOnUseQueryGraphRepository(IQueryGraphRepository):
+    """Opens a graph client per query instead of holding one.
+
+    The client is connected, used, and released inside ``execute_cypher``,
+    so all blocking work for a query happens on whichever thread runs the
+    query (see ``BlockingQueryExecutor``) and no pooled connection is held
+    between queries.
+
+    Args:
+        client_context: Returns a context manager yielding a connected
+            graph client and releasing it on exit.
+    """
+
+    def __init__(
+        self,
+        client_context: Callable[[], AbstractContextManager[GraphClientProtocol]],
+    ) -> None:
+        self._client_context = client_context
+
+    def execute_cypher(
+        self,
+        query: str,
+        timeout_seconds: int = 30,
+        max_rows: int = 1000,
+    ) -> list[QueryResultRow]:
+        """Execute a Cypher query on a freshly checked-out client."""
+        with self._client_context() as client:
+            return QueryGraphRepository(client=client).execute_cypher(
+                query=query,
+                timeout_seconds=timeout_seconds,
+                max_rows=max_rows,
+            )
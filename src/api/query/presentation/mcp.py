@@ -23,6 +23,7 @@ from query.dependencies import (
     get_git_repository,
     get_mcp_query_service,
     get_prompt_repository,
+    get_query_executor,
 )
 from query.ports.exceptions import InvalidRemoteFileURL, RemoteFileFetchFailed
 from query.ports.file_repository_models import RemoteFileRepositoryResponse
@@ -229,7 +230,10 @@ async def query_graph(
     # Enforce maximum limits (spec: max 60 s timeout, max 10 000 rows)
     timeout_seconds, max_rows = _clamp_query_params(timeout_seconds, max_rows)
 
-    result = service.execute_cypher_query(
+    # psycopg2 blocks for the whole round trip; keep the event loop free
+    # for other agents' requests while this query runs.
+    result = await get_query_executor().run(
+        service.execute_cypher_query,
         query=cypher,
         timeout_seconds=timeout_seconds,
         max_rows=max_rows,
@@ -6,6 +6,10 @@ Validates JWT tokens using OIDC provider's JWKS with caching.
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import TYPE_CHECKING, Any
@@ -38,7 +42,14 @@ class JWTValidator:
     """Validates JWT tokens using OIDC provider's JWKS.
 
     Fetches JWKS from the OIDC provider and caches them for the configured TTL.
+    Once the cached JWKS is within ``jwks_refresh_ahead`` of expiring, it is
+    refreshed in the background while the cached keys keep being served.
     Validates token signature, expiry, issuer, and audience.
+
+    Clients resend the same bearer token on every request, so the claims of
+    validated tokens can be cached (keyed by a SHA-256 digest of the token)
+    until the token's ``exp`` or ``claims_cache_ttl``, whichever is sooner.
+    Signature verification on a cache miss runs in a worker thread.
     """
 
     def __init__(
@@ -49,6 +60,10 @@ class JWTValidator:
         user_id_claim: str = "sub",
         username_claim: str = "preferred_username",
         jwks_cache_ttl: timedelta = timedelta(hours=24),
+        jwks_refresh_ahead: timedelta = timedelta(minutes=5),
+        claims_cache_max_entries: int = 0,
+        claims_cache_ttl: timedelta = timedelta(minutes=5),
+        clock: Callable[[], float] = time.time,
     ):
         """Initialize the JWT validator.
 
@@ -59,6 +74,13 @@ class JWTValidator:
             user_id_claim: JWT claim to use for user ID (default: sub).
             username_claim: JWT claim to use for username (default: preferred_username).
             jwks_cache_ttl: How long to cache JWKS keys (default: 24 hours).
+            jwks_refresh_ahead: How long before the JWKS cache expires to
+                start refreshing it in the background (default: 5 minutes).
+            claims_cache_max_entries: Validated tokens whose claims are
+                cached; 0 disables the claims cache (default).
+            claims_cache_ttl: Longest a token's claims are served from the
+                cache, even if the token expires later (default: 5 minutes).
+            clock: Wall clock in epoch seconds, injectable for tests.
         """
         self._issuer_url = issuer_url.rstrip("/")
         self._audience = audience
@@ -72,6 +94,16 @@ class JWTValidator:
         self._jwks_fetched_at: datetime | None = None
         self._jwks_uri: str | None = None
         self._jwks_lock = asyncio.Lock()
+        self._jwks_refresh_ahead = jwks_refresh_ahead
+        self._jwks_refresh_task: asyncio.Task[None] | None = None
+
+        # Validated claims cache: token digest -> (claims, expires at)
+        self._claims_cache_max_entries = claims_cache_max_entries
+        self._claims_cache_ttl = claims_cache_ttl.total_seconds()
+        self._clock = clock
+        self._claims_cache: OrderedDict[bytes, tuple[TokenClaims, float]] = (
+            OrderedDict()
+        )
 
     async def validate_token(self, token: str) -> TokenClaims:
         """Validate JWT and return claims.
@@ -85,6 +117,15 @@ class JWTValidator:
         Raises:
             InvalidTokenError: If token is invalid, expired, or verification fails.
         """
+        digest = None
+        if self._claims_cache_max_entries > 0:
+            digest = hashlib.sha256(token.encode()).digest()
+            cached = self._get_cached_claims(digest)
+            if cached is not None:
+                self._probe.claims_cache_hit(user_id=cached.sub)
+                return cached
+            self._probe.claims_cache_miss()
+
         # First, do a quick check for malformed tokens
         try:
             unverified_header = jwt.get_unverified_header(token)
@@ -99,9 +140,10 @@ class JWTValidator:
         # Get JWKS (from cache or fetch)
         jwks = await self._get_jwks()
 
-        # Validate the token
+        # Validate the token (RSA verification is CPU-bound: keep it off the loop)
         try:
-            claims = jwt.decode(
+            claims = await asyncio.to_thread(
+                jwt.decode,
                 token=token,
                 key=jwks,
                 algorithms=["RS256"],
@@ -153,12 +195,37 @@ class JWTValidator:
 
         self._probe.token_validated(user_id=str(user_id))
 
-        return TokenClaims(
+        token_claims = TokenClaims(
             sub=str(user_id),
             preferred_username=str(username) if username is not None else None,
             name=str(name) if name is not None else None,
             email=str(email) if email is not None else None,
         )
+        if digest is not None:
+            self._cache_claims(digest, token_claims, claims.get("exp"))
+        return token_claims
+
+    def _get_cached_claims(self, digest: bytes) -> TokenClaims | None:
+        """Return cached claims for a token digest if not yet expired."""
+        entry = self._claims_cache.get(digest)
+        if entry is None:
+            return None
+        token_claims, expires_at = entry
+        if expires_at <= self._clock():
+            del self._claims_cache[digest]
+            return None
+        self._claims_cache.move_to_end(digest)
+        return token_claims
+
+    def _cache_claims(self, digest: bytes, token_claims: TokenClaims, exp: Any) -> None:
+        """Cache validated claims until the token expires or the TTL elapses."""
+        expires_at = self._clock() + self._claims_cache_ttl
+        if isinstance(exp, (int, float)):
+            expires_at = min(expires_at, float(exp))
+        self._claims_cache[digest] = (token_claims, expires_at)
+        self._claims_cache.move_to_end(digest)
+        while len(self._claims_cache) > self._claims_cache_max_entries:
+            self._claims_cache.popitem(last=False)
 
     async def _get_jwks(self) -> dict[str, Any]:
         """Get JWKS, fetching from issuer if cache expired.
@@ -172,6 +239,8 @@ class JWTValidator:
         # Check if cache is still valid (without lock for quick check)
         if self._is_cache_valid():
             self._probe.jwks_cache_hit()
+            if self._is_cache_due_for_refresh():
+                self._schedule_jwks_refresh()
             return self._jwks  # type: ignore[return-value]
 
         # Acquire lock for fetching
@@ -192,6 +261,32 @@ class JWTValidator:
         now = datetime.now(tz=timezone.utc)
         return (now - self._jwks_fetched_at) < self._jwks_cache_ttl
 
+    def _is_cache_due_for_refresh(self) -> bool:
+        """Check if the JWKS cache is close enough to expiry to refresh it."""
+        if self._jwks_fetched_at is None:
+            return False
+
+        now = datetime.now(tz=timezone.utc)
+        age = now - self._jwks_fetched_at
+        return age >= self._jwks_cache_ttl - self._jwks_refresh_ahead
+
+    def _schedule_jwks_refresh(self) -> None:
+        """Start a background JWKS refresh unless one is already running."""
+        if self._jwks_refresh_task is not None and not self._jwks_refresh_task.done():
+            return
+        self._jwks_refresh_task = asyncio.create_task(self._refresh_jwks())
+
+    async def _refresh_jwks(self) -> None:
+        """Refresh the JWKS cache, keeping the cached keys on failure."""
+        async with self._jwks_lock:
+            if self._is_cache_valid() and not self._is_cache_due_for_refresh():
+                return
+            try:
+                await self._fetch_jwks()
+            except InvalidTokenError:
+                # Already reported via the probe; the next request retries
+                pass
+
     async def _fetch_jwks(self) -> dict[str, Any]:
         """Fetch JWKS from the OIDC provider.
 
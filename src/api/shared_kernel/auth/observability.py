@@ -39,6 +39,14 @@ class JWTValidatorProbe(Protocol):
         """Record that JWKS fetch failed."""
         ...
 
+    def claims_cache_hit(self, user_id: str) -> None:
+        """Record that a token's claims were served from cache."""
+        ...
+
+    def claims_cache_miss(self) -> None:
+        """Record that a token had to be fully validated."""
+        ...
+
     def with_context(self, context: ObservationContext) -> JWTValidatorProbe:
         """Create a new probe with observation context bound."""
         ...
@@ -103,3 +111,18 @@ class DefaultJWTValidatorProbe:
             error=error,
             **self._get_context_kwargs(),
         )
+
+    def claims_cache_hit(self, user_id: str) -> None:
+        """Record that a token's claims were served from cache."""
+        self._logger.debug(
+            "jwt_claims_cache_hit",
+            user_id=user_id,
+            **self._get_context_kwargs(),
+        )
+
+    def claims_cache_miss(self) -> None:
+        """Record that a token had to be fully validated."""
+        self._logger.debug(
+            "jwt_claims_cache_miss",
+            **self._get_context_kwargs(),
+        )
@@ -0,0 +1,396 @@
+"""Permission decision caching for authorization providers.
+
+``CachingAuthorizationProvider`` decorates any AuthorizationProvider and
+answers repeated permission checks from two layers:
+
+1. A request-scoped memo, active inside ``permission_decision_scope()``.
+   Every decision made while handling one request is remembered for the
+   rest of that request, so e.g. the tenant VIEW check made by the tenant
+   context dependency is not repeated by the services behind it.
+2. An optional ``PermissionDecisionCache`` shared across requests: a
+   bounded LRU whose entries expire after a short TTL.
+
+Writes and deletes made through the decorator, and relationship changes
+reported via ``PermissionDecisionCache.invalidate``, drop the decisions
+they may have changed. A relationship whose subject is a user can only
+change that user's permissions, so only that user's decisions are dropped;
+any other write (e.g. a group granted a role on a workspace) may change
+permissions transitively and clears the caches.
+
+Errors are never cached.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TypeVar
+
+from shared_kernel.authorization.observability import (
+    AuthorizationProbe,
+    DefaultAuthorizationProbe,
+)
+from shared_kernel.authorization.protocols import AuthorizationProvider, CheckRequest
+from shared_kernel.authorization.types import (
+    RelationshipSpec,
+    RelationshipTuple,
+    ResourceType,
+    SubjectRelation,
+)
+
+#: (resource, permission, subject)
+DecisionKey = tuple[str, str, str]
+
+_V = TypeVar("_V")
+
+_request_decisions: ContextVar[dict[DecisionKey, bool] | None] = ContextVar(
+    "request_permission_decisions", default=None
+)
+
+
+@contextmanager
+def permission_decision_scope() -> Iterator[None]:
+    """Memoize permission decisions until the block exits.
+
+    Intended to wrap the handling of a single request.
+    """
+    token = _request_decisions.set({})
+    try:
+        yield
+    finally:
+        _request_decisions.reset(token)
+
+
+def _is_user_subject(subject: str) -> bool:
+    """Whether ``subject`` names a user directly (not e.g. ``group:g#member``)."""
+    return "#" not in subject and subject.startswith(f"{ResourceType.USER}:")
+
+
+def _invalidate_decisions(
+    decisions: dict[DecisionKey, _V],
+    resource: str | None,
+    subject: str | None,
+) -> int:
+    """Drop the decisions a relationship change may affect; return how many."""
+    if subject is None or not _is_user_subject(subject):
+        count = len(decisions)
+        decisions.clear()
+        return count
+    stale = [key for key in decisions if key[2] == subject or key[0] == resource]
+    for key in stale:
+        del decisions[key]
+    return len(stale)
+
+
+class PermissionDecisionCache:
+    """Bounded LRU of permission decisions with a time-to-live.
+
+    Shared by all CachingAuthorizationProvider instances in a process.
+    Thread-safe.
+
+    Args:
+        max_entries: Entries kept before the least recently used is evicted.
+        ttl_seconds: Seconds a decision may be served after it was made.
+        probe: Optional domain probe for observability.
+        clock: Monotonic clock, injectable for tests.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float,
+        probe: AuthorizationProbe | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._probe = probe or DefaultAuthorizationProbe()
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[DecisionKey, tuple[bool, float]] = OrderedDict()
+
+    def get(self, key: DecisionKey) -> bool | None:
+        """Return the cached decision for ``key``, or None if absent or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            granted, expires_at = entry
+            if expires_at > self._clock():
+                self._entries.move_to_end(key)
+                return granted
+            del self._entries[key]
+        self._probe.decision_cache_evicted(reason="expired", count=1)
+        return None
+
+    def put(self, key: DecisionKey, granted: bool) -> None:
+        """Cache a decision, evicting the least recently used if full."""
+        with self._lock:
+            self._entries[key] = (granted, self._clock() + self._ttl_seconds)
+            self._entries.move_to_end(key)
+            evicted = 0
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                evicted += 1
+        if evicted:
+            self._probe.decision_cache_evicted(reason="capacity", count=evicted)
+
+    def invalidate(self, resource: str | None, subject: str | None) -> None:
+        """Drop decisions a change to a relationship may have affected.
+
+        Args:
+            resource: The relationship's resource, if known.
+            subject: The relationship's subject; None when unknown (e.g. a
+                delete by filter), which clears the cache.
+        """
+        with self._lock:
+            count = _invalidate_decisions(self._entries, resource, subject)
+        if count:
+            self._probe.decision_cache_evicted(reason="invalidated", count=count)
+
+    def clear(self) -> None:
+        """Drop every cached decision."""
+        self.invalidate(resource=None, subject=None)
+
+
+class CachingAuthorizationProvider(AuthorizationProvider):
+    """AuthorizationProvider decorator that caches permission decisions.
+
+    Only ``check_permission`` and ``bulk_check_permission`` are cached; all
+    other calls are delegated unchanged, with writes and deletes also
+    invalidating affected decisions.
+
+    Args:
+        inner: The provider that makes the actual decisions.
+        shared_cache: Optional cross-request cache.
+        probe: Optional domain probe for observability.
+    """
+
+    def __init__(
+        self,
+        inner: AuthorizationProvider,
+        shared_cache: PermissionDecisionCache | None = None,
+        probe: AuthorizationProbe | None = None,
+    ) -> None:
+        self._inner = inner
+        self._shared_cache = shared_cache
+        self._probe = probe or DefaultAuthorizationProbe()
+
+    # ------------------------------------------------------------------
+    # Cached checks
+    # ------------------------------------------------------------------
+
+    async def check_permission(
+        self,
+        resource: str,
+        permission: str,
+        subject: str,
+    ) -> bool:
+        """Check a permission, answering from the caches when possible."""
+        key = (resource, permission, subject)
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+
+        self._probe.decision_cache_miss(
+            resource=resource, permission=permission, subject=subject
+        )
+        granted = await self._inner.check_permission(resource, permission, subject)
+        self._store(key, granted)
+        return granted
+
+    async def bulk_check_permission(
+        self,
+        requests: list[CheckRequest],
+    ) -> set[str]:
+        """Bulk check permissions, sending only uncached checks to the provider."""
+        permitted: set[str] = set()
+        misses: list[CheckRequest] = []
+        for req in requests:
+            cached = self._lookup((req.resource, req.permission, req.subject))
+            if cached is None:
+                self._probe.decision_cache_miss(
+                    resource=req.resource,
+                    permission=req.permission,
+                    subject=req.subject,
+                )
+                misses.append(req)
+            elif cached:
+                permitted.add(req.resource)
+
+        if misses:
+            granted = await self._inner.bulk_check_permission(misses)
+            for req in misses:
+                self._store(
+                    (req.resource, req.permission, req.subject),
+                    req.resource in granted,
+                )
+            permitted |= granted
+        return permitted
+
+    def _lookup(self, key: DecisionKey) -> bool | None:
+        decisions = _request_decisions.get()
+        if decisions is not None and key in decisions:
+            self._probe.decision_cache_hit(
+                resource=key[0], permission=key[1], subject=key[2], scope="request"
+            )
+            return decisions[key]
+        if self._shared_cache is not None:
+            granted = self._shared_cache.get(key)
+            if granted is not None:
+                self._probe.decision_cache_hit(
+                    resource=key[0], permission=key[1], subject=key[2], scope="shared"
+                )
+                if decisions is not None:
+                    decisions[key] = granted
+                return granted
+        return None
+
+    def _store(self, key: DecisionKey, granted: bool) -> None:
+        decisions = _request_decisions.get()
+        if decisions is not None:
+            decisions[key] = granted
+        if self._shared_cache is not None:
+            self._shared_cache.put(key, granted)
+
+    def _invalidate(self, resource: str | None, subject: str | None) -> None:
+        decisions = _request_decisions.get()
+        if decisions is not None:
+            _invalidate_decisions(decisions, resource, subject)
+        if self._shared_cache is not None:
+            self._shared_cache.invalidate(resource, subject)
+
+    # ------------------------------------------------------------------
+    # Writes (invalidate)
+    # ------------------------------------------------------------------
+
+    async def write_relationship(
+        self,
+        resource: str,
+        relation: str,
+        subject: str,
+    ) -> None:
+        """Write a relationship and invalidate the decisions it affects."""
+        try:
+            await self._inner.write_relationship(resource, relation, subject)
+        finally:
+            self._invalidate(resource, subject)
+
+    async def write_relationships(
+        self,
+        relationships: list[RelationshipSpec],
+    ) -> None:
+        """Write relationships and invalidate the decisions they affect."""
+        try:
+            await self._inner.write_relationships(relationships)
+        finally:
+            for rel in relationships:
+                self._invalidate(rel.resource, rel.subject)
+
+    async def delete_relationship(
+        self,
+        resource: str,
+        relation: str,
+        subject: str,
+    ) -> None:
+        """Delete a relationship and invalidate the decisions it affects."""
+        try:
+            await self._inner.delete_relationship(resource, relation, subject)
+        finally:
+            self._invalidate(resource, subject)
+
+    async def delete_relationships(
+        self,
+        relationships: list[RelationshipSpec],
+    ) -> None:
+        """Delete relationships and invalidate the decisions they affect."""
+        try:
+            await self._inner.delete_relationships(relationships)
+        finally:
+            for rel in relationships:
+                self._invalidate(rel.resource, rel.subject)
+
+    async def update_relationships(
+        self,
+        writes: list[RelationshipSpec],
+        deletes: list[RelationshipSpec],
+    ) -> None:
+        """Write and delete relationships, invalidating the decisions they affect."""
+        try:
+            await self._inner.update_relationships(writes, deletes)
+        finally:
+            for rel in [*writes, *deletes]:
+                self._invalidate(rel.resource, rel.subject)
+
+    async def delete_relationships_by_filter(
+        self,
+        resource_type: str,
+        resource_id: str | None = None,
+        relation: str | None = None,
+        subject_type: str | None = None,
+        subject_id: str | None = None,
+    ) -> None:
+        """Delete matching relationships and clear the cached decisions."""
+        try:
+            await self._inner.delete_relationships_by_filter(
+                resource_type=resource_type,
+                resource_id=resource_id,
+                relation=relation,
+                subject_type=subject_type,
+                subject_id=subject_id,
+            )
+        finally:
+            self._invalidate(None, None)
+
+    # ------------------------------------------------------------------
+    # Pass-through reads
+    # ------------------------------------------------------------------
+
+    async def lookup_subjects(
+        self,
+        resource: str,
+        relation: str,
+        subject_type: str,
+        optional_subject_relation: str | None = None,
+    ) -> list[SubjectRelation]:
+        """Delegate to the wrapped provider (not cached)."""
+        return await self._inner.lookup_subjects(
+            resource=resource,
+            relation=relation,
+            subject_type=subject_type,
+            optional_subject_relation=optional_subject_relation,
+        )
+
+    async def lookup_resources(
+        self,
+        resource_type: str,
+        permission: str,
+        subject: str,
+    ) -> list[str]:
+        """Delegate to the wrapped provider (not cached)."""
+        return await self._inner.lookup_resources(
+            resource_type=resource_type,
+            permission=permission,
+            subject=subject,
+        )
+
+    async def read_relationships(
+        self,
+        resource_type: str,
+        resource_id: str | None = None,
+        relation: str | None = None,
+        subject_type: str | None = None,
+        subject_id: str | None = None,
+    ) -> list[RelationshipTuple]:
+        """Delegate to the wrapped provider (not cached)."""
+        return await self._inner.read_relationships(
+            resource_type=resource_type,
+            resource_id=resource_id,
+            relation=relation,
+            subject_type=subject_type,
+            subject_id=subject_id,
+        )
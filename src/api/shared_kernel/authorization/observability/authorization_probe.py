@@ -64,6 +64,39 @@ class AuthorizationProbe(Protocol):
         """Record that a bulk permission check completed."""
         ...
 
+    def decision_cache_hit(
+        self,
+        resource: str,
+        permission: str,
+        subject: str,
+        scope: str,
+    ) -> None:
+        """Record that a permission decision was served from a cache.
+
+        ``scope`` is ``"request"`` or ``"shared"``.
+        """
+        ...
+
+    def decision_cache_miss(
+        self,
+        resource: str,
+        permission: str,
+        subject: str,
+    ) -> None:
+        """Record that a permission decision was not cached."""
+        ...
+
+    def decision_cache_evicted(
+        self,
+        reason: str,
+        count: int,
+    ) -> None:
+        """Record that cached permission decisions were dropped.
+
+        ``reason`` is ``"capacity"``, ``"expired"`` or ``"invalidated"``.
+        """
+        ...
+
     def relationship_deleted(
         self,
         resource: str,
@@ -288,6 +321,51 @@ class DefaultAuthorizationProbe:
             **self._get_context_kwargs(),
         )
 
+    def decision_cache_hit(
+        self,
+        resource: str,
+        permission: str,
+        subject: str,
+        scope: str,
+    ) -> None:
+        """Record that a permission decision was served from a cache."""
+        self._logger.debug(
+            "authorization_decision_cache_hit",
+            resource=resource,
+            permission=permission,
+            subject=subject,
+            scope=scope,
+            **self._get_context_kwargs(),
+        )
+
+    def decision_cache_miss(
+        self,
+        resource: str,
+        permission: str,
+        subject: str,
+    ) -> None:
+        """Record that a permission decision was not cached."""
+        self._logger.debug(
+            "authorization_decision_cache_miss",
+            resource=resource,
+            permission=permission,
+            subject=subject,
+            **self._get_context_kwargs(),
+        )
+
+    def decision_cache_evicted(
+        self,
+        reason: str,
+        count: int,
+    ) -> None:
+        """Record that cached permission decisions were dropped."""
+        self._logger.debug(
+            "authorization_decision_cache_evicted",
+            reason=reason,
+            count=count,
+            **self._get_context_kwargs(),
+        )
+
     def relationship_deleted(
         self,
         resource: str,
@@ -146,6 +146,25 @@ class AuthorizationProvider(Protocol):
         """
         ...
 
+    async def update_relationships(
+        self,
+        writes: list[RelationshipSpec],
+        deletes: list[RelationshipSpec],
+    ) -> None:
+        """Write and delete relationships together in as few requests as possible.
+
+        The same relationship must not appear more than once across
+        ``writes`` and ``deletes``.
+
+        Args:
+            writes: RelationshipSpec objects to write
+            deletes: RelationshipSpec objects to delete
+
+        Raises:
+            AuthorizationError: If the update fails
+        """
+        ...
+
     async def delete_relationships_by_filter(
         self,
         resource_type: str,
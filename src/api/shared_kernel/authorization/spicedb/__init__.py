@@ -5,6 +5,10 @@ protocol for fine-grained access control.
 """
 
 from shared_kernel.authorization.spicedb.client import SpiceDBClient
+from shared_kernel.authorization.spicedb.consistency import (
+    ConsistencyMode,
+    ZedTokenStore,
+)
 from shared_kernel.authorization.spicedb.exceptions import (
     AuthorizationError,
     SpiceDBConnectionError,
@@ -13,6 +17,8 @@ from shared_kernel.authorization.spicedb.exceptions import (
 
 __all__ = [
     "SpiceDBClient",
+    "ConsistencyMode",
+    "ZedTokenStore",
     "AuthorizationError",
     "SpiceDBConnectionError",
     "SpiceDBPermissionError",
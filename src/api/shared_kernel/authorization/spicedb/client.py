@@ -12,8 +12,10 @@ from pathlib import Path
 
 import grpc
 from authzed.api.v1 import (
+    CheckBulkPermissionsPair,
+    CheckBulkPermissionsRequest,
+    CheckBulkPermissionsRequestItem,
     CheckPermissionRequest,
-    Consistency,
     DeleteRelationshipsRequest,
     LookupResourcesRequest,
     LookupSubjectsRequest,
@@ -34,6 +36,10 @@ from shared_kernel.authorization.observability import (
     DefaultAuthorizationProbe,
 )
 from shared_kernel.authorization.protocols import AuthorizationProvider, CheckRequest
+from shared_kernel.authorization.spicedb.consistency import (
+    ConsistencyMode,
+    ZedTokenStore,
+)
 from shared_kernel.authorization.spicedb.exceptions import (
     SpiceDBConnectionError,
     SpiceDBPermissionError,
@@ -44,6 +50,13 @@ from shared_kernel.authorization.types import (
     SubjectRelation,
 )
 
+#: Maximum number of items sent in a single CheckBulkPermissions RPC.
+BULK_CHECK_CHUNK_SIZE = 100
+
+#: Maximum number of updates sent in a single WriteRelationships RPC
+#: (SpiceDB's default ``--write-relationships-max-updates-per-call``).
+WRITE_RELATIONSHIPS_CHUNK_SIZE = 1000
+
 
 def _inject_bearer_metadata(client_call_details, token_metadata):
     """Inject bearer token metadata into gRPC call details."""
@@ -261,6 +274,13 @@ class SpiceDBClient(AuthorizationProvider):
 
     This client provides async methods for writing relationships, checking
     permissions, and bulk permission checks against a SpiceDB instance.
+
+    The ZedToken returned by every write and delete is reported to the
+    client's ZedTokenStore. Reads are then issued according to the client's
+    ConsistencyMode. ``FULLY_CONSISTENT`` always reads the latest revision;
+    ``AT_LEAST_AS_FRESH`` reads at or after the token the store holds for
+    the current context (the request tenant's newest write), without
+    forcing every read to the datastore.
     """
 
     def __init__(
@@ -270,6 +290,8 @@ class SpiceDBClient(AuthorizationProvider):
         use_tls: bool = True,
         cert_path: str | None = None,
         probe: AuthorizationProbe | None = None,
+        consistency: ConsistencyMode = ConsistencyMode.FULLY_CONSISTENT,
+        token_store: ZedTokenStore | None = None,
     ):
         """Initialize SpiceDB client.
 
@@ -279,6 +301,10 @@ class SpiceDBClient(AuthorizationProvider):
             use_tls: Use TLS for connection (default: True, False for local dev only)
             cert_path: Path to custom root certificate for TLS (e.g., self-signed cert)
             probe: Optional domain probe for observability
+            consistency: Freshness required of reads (default: the latest
+                datastore revision)
+            token_store: Tracker of written and required ZedTokens; share
+                one per process
         """
         self._endpoint = endpoint
         self._preshared_key = preshared_key
@@ -286,6 +312,8 @@ class SpiceDBClient(AuthorizationProvider):
         self._cert_path = cert_path
         self._client = None
         self._probe = probe or DefaultAuthorizationProbe()
+        self._consistency = consistency
+        self._token_store = token_store or ZedTokenStore()
         self._init_lock = asyncio.Lock()
 
     async def _ensure_client(self):
@@ -369,7 +397,9 @@ class SpiceDBClient(AuthorizationProvider):
 
             request = WriteRelationshipsRequest(updates=[update])
 
-            await self._client.WriteRelationships(request)
+            with self._token_store.write() as observe_write:
+                response = await self._client.WriteRelationships(request)
+                observe_write(response.written_at)
 
             self._probe.relationship_written(
                 resource=resource,
@@ -390,37 +420,53 @@ class SpiceDBClient(AuthorizationProvider):
 
     async def _execute_relationship_updates(
         self,
-        relationships: list[RelationshipSpec],
-        operation: RelationshipOperation,
+        updates: list[tuple[RelationshipSpec, RelationshipOperation]],
     ) -> None:
-        """Execute relationship updates (write or delete) with error handling.
+        """Execute relationship updates (writes and/or deletes) with error handling.
+
+        Updates are sent as WriteRelationships RPCs of at most
+        ``WRITE_RELATIONSHIPS_CHUNK_SIZE`` updates; each RPC is applied
+        atomically by SpiceDB.
 
         Args:
-            relationships: List of RelationshipSpec objects
-            operation: RelationshipOperation.WRITE or DELETE
+            updates: Pairs of RelationshipSpec and the operation to apply
 
         Raises:
-            SpiceDBPermissionError: If the operation fails
+            SpiceDBPermissionError: If any chunk fails
         """
-        if not relationships:
+        if not updates:
             return
 
         await self._ensure_client()
         assert self._client is not None
 
-        try:
-            updates = [
-                _build_relationship_update(
-                    rel.resource, rel.relation, rel.subject, operation
-                )
-                for rel in relationships
-            ]
+        for start in range(0, len(updates), WRITE_RELATIONSHIPS_CHUNK_SIZE):
+            await self._write_update_chunk(
+                updates[start : start + WRITE_RELATIONSHIPS_CHUNK_SIZE]
+            )
 
-            request = WriteRelationshipsRequest(updates=updates)
-            await self._client.WriteRelationships(request)
+    async def _write_update_chunk(
+        self,
+        chunk: list[tuple[RelationshipSpec, RelationshipOperation]],
+    ) -> None:
+        """Apply one chunk of updates with a single WriteRelationships RPC."""
+        assert self._client is not None
+
+        try:
+            request = WriteRelationshipsRequest(
+                updates=[
+                    _build_relationship_update(
+                        rel.resource, rel.relation, rel.subject, operation
+                    )
+                    for rel, operation in chunk
+                ]
+            )
+            with self._token_store.write() as observe_write:
+                response = await self._client.WriteRelationships(request)
+                observe_write(response.written_at)
 
             # Log successful operations
-            for rel in relationships:
+            for rel, operation in chunk:
                 if operation == RelationshipOperation.WRITE:
                     self._probe.relationship_written(
                         rel.resource, rel.relation, rel.subject
@@ -431,16 +477,21 @@ class SpiceDBClient(AuthorizationProvider):
                     )
 
         except Exception as e:
-            if operation == RelationshipOperation.WRITE:
+            operations = {operation for _, operation in chunk}
+            if RelationshipOperation.WRITE in operations:
                 self._probe.relationship_write_failed(
                     "<bulk>", "<multiple>", "<multiple>", e
                 )
-            else:
+            if RelationshipOperation.DELETE in operations:
                 self._probe.relationship_delete_failed(
                     "<bulk>", "<multiple>", "<multiple>", e
                 )
+            if len(operations) == 1:
+                action = repr(operations.pop())
+            else:
+                action = "update"
             raise SpiceDBPermissionError(
-                f"Failed to {repr(operation)} {len(relationships)} relationships"
+                f"Failed to {action} {len(chunk)} relationships"
             ) from e
 
     async def write_relationships(
@@ -456,7 +507,7 @@ class SpiceDBClient(AuthorizationProvider):
             SpiceDBPermissionError: If the write fails
         """
         await self._execute_relationship_updates(
-            relationships, RelationshipOperation.WRITE
+            [(rel, RelationshipOperation.WRITE) for rel in relationships]
         )
 
     async def check_permission(
@@ -489,7 +540,7 @@ class SpiceDBClient(AuthorizationProvider):
 
         try:
             request = CheckPermissionRequest(
-                consistency=Consistency(fully_consistent=True),
+                consistency=self._token_store.consistency(self._consistency),
                 resource=ObjectReference(
                     object_type=resource_type,
                     object_id=resource_id,
@@ -536,8 +587,10 @@ class SpiceDBClient(AuthorizationProvider):
     ) -> set[str]:
         """Bulk check permissions for multiple resources.
 
-        For now, this is implemented as sequential checks. Future optimization
-        could use SpiceDB's BulkCheckPermission API when available.
+        Uses SpiceDB's CheckBulkPermissions API, sending the requests in
+        chunks of ``BULK_CHECK_CHUNK_SIZE`` items. Chunks are sent
+        concurrently, so N requests cost ``ceil(N / BULK_CHECK_CHUNK_SIZE)``
+        round trips instead of N.
 
         Args:
             requests: List of permission check requests
@@ -548,17 +601,21 @@ class SpiceDBClient(AuthorizationProvider):
         Raises:
             SpiceDBPermissionError: If any check fails
         """
-        permitted_resources = set()
+        permitted_resources: set[str] = set()
 
-        for req in requests:
-            has_permission = await self.check_permission(
-                resource=req.resource,
-                permission=req.permission,
-                subject=req.subject,
-            )
+        if requests:
+            await self._ensure_client()
+            assert self._client is not None  # For mypy
 
-            if has_permission:
-                permitted_resources.add(req.resource)
+            chunks = [
+                requests[i : i + BULK_CHECK_CHUNK_SIZE]
+                for i in range(0, len(requests), BULK_CHECK_CHUNK_SIZE)
+            ]
+            results = await asyncio.gather(
+                *(self._bulk_check_chunk(chunk) for chunk in chunks)
+            )
+            for granted in results:
+                permitted_resources.update(granted)
 
         self._probe.bulk_check_completed(
             total_requests=len(requests),
@@ -567,6 +624,101 @@ class SpiceDBClient(AuthorizationProvider):
 
         return permitted_resources
 
+    async def _bulk_check_chunk(self, chunk: list[CheckRequest]) -> set[str]:
+        """Check one chunk of requests with a single CheckBulkPermissions RPC.
+
+        Args:
+            chunk: At most ``BULK_CHECK_CHUNK_SIZE`` permission check requests
+
+        Returns:
+            Set of resource identifiers in the chunk that passed
+
+        Raises:
+            SpiceDBPermissionError: If the RPC or any item in it fails
+        """
+        assert self._client is not None  # For mypy
+
+        try:
+            items = []
+            for req in chunk:
+                resource_type, resource_id = _parse_reference(req.resource, "resource")
+                subject_type, subject_id = _parse_reference(req.subject, "subject")
+                items.append(
+                    CheckBulkPermissionsRequestItem(
+                        resource=ObjectReference(
+                            object_type=resource_type,
+                            object_id=resource_id,
+                        ),
+                        permission=req.permission,
+                        subject=SubjectReference(
+                            object=ObjectReference(
+                                object_type=subject_type,
+                                object_id=subject_id,
+                            ),
+                        ),
+                    )
+                )
+
+            response = await self._client.CheckBulkPermissions(
+                CheckBulkPermissionsRequest(
+                    consistency=self._token_store.consistency(self._consistency),
+                    items=items,
+                )
+            )
+            if len(response.pairs) != len(chunk):
+                raise ValueError(
+                    f"Expected {len(chunk)} results, got {len(response.pairs)}"
+                )
+        except Exception as e:
+            for req in chunk:
+                self._probe.permission_check_failed(
+                    resource=req.resource,
+                    permission=req.permission,
+                    subject=req.subject,
+                    error=e,
+                )
+            raise SpiceDBPermissionError(
+                f"Failed to bulk check {len(chunk)} permissions"
+            ) from e
+
+        # Pairs are returned in request order
+        permitted: set[str] = set()
+        for req, pair in zip(chunk, response.pairs):
+            self._raise_on_pair_error(req, pair)
+            has_permission = (
+                pair.item.permissionship
+                == CheckPermissionResponse.PERMISSIONSHIP_HAS_PERMISSION
+            )
+            self._probe.permission_checked(
+                resource=req.resource,
+                permission=req.permission,
+                subject=req.subject,
+                granted=has_permission,
+            )
+            if has_permission:
+                permitted.add(req.resource)
+
+        return permitted
+
+    def _raise_on_pair_error(
+        self,
+        req: CheckRequest,
+        pair: CheckBulkPermissionsPair,
+    ) -> None:
+        """Raise if SpiceDB reported an error for a single bulk check item."""
+        if pair.WhichOneof("response") != "error":
+            return
+        error = Exception(pair.error.message)
+        self._probe.permission_check_failed(
+            resource=req.resource,
+            permission=req.permission,
+            subject=req.subject,
+            error=error,
+        )
+        raise SpiceDBPermissionError(
+            f"Failed to check permission: {req.resource} {req.permission} {req.subject}"
+        ) from error
+
     async def delete_relationship(
         self,
         resource: str,
@@ -611,7 +763,9 @@ class SpiceDBClient(AuthorizationProvider):
 
             request = WriteRelationshipsRequest(updates=[update])
 
-            await self._client.WriteRelationships(request)
+            with self._token_store.write() as observe_write:
+                response = await self._client.WriteRelationships(request)
+                observe_write(response.written_at)
 
             self._probe.relationship_deleted(
                 resource=resource,
@@ -643,7 +797,29 @@ class SpiceDBClient(AuthorizationProvider):
             SpiceDBPermissionError: If the delete fails
         """
         await self._execute_relationship_updates(
-            relationships, RelationshipOperation.DELETE
+            [(rel, RelationshipOperation.DELETE) for rel in relationships]
+        )
+
+    async def update_relationships(
+        self,
+        writes: list[RelationshipSpec],
+        deletes: list[RelationshipSpec],
+    ) -> None:
+        """Write and delete relationships together.
+
+        Sent as WriteRelationships RPCs mixing touch and delete updates, so
+        up to ``WRITE_RELATIONSHIPS_CHUNK_SIZE`` updates apply atomically.
+
+        Args:
+            writes: Relationships to write (touch)
+            deletes: Relationships to delete
+
+        Raises:
+            SpiceDBPermissionError: If any chunk fails
+        """
+        await self._execute_relationship_updates(
+            [(rel, RelationshipOperation.WRITE) for rel in writes]
+            + [(rel, RelationshipOperation.DELETE) for rel in deletes]
         )
 
     async def delete_relationships_by_filter(
@@ -720,7 +896,9 @@ class SpiceDBClient(AuthorizationProvider):
                 relationship_filter=relationship_filter,
             )
 
-            await self._client.DeleteRelationships(request)
+            with self._token_store.write() as observe_write:
+                response = await self._client.DeleteRelationships(request)
+                observe_write(response.deleted_at)
 
             self._probe.relationships_deleted_by_filter(
                 resource_type=resource_type,
@@ -780,7 +958,7 @@ class SpiceDBClient(AuthorizationProvider):
 
         try:
             request_kwargs: dict = {
-                "consistency": Consistency(fully_consistent=True),
+                "consistency": self._token_store.consistency(self._consistency),
                 "resource": ObjectReference(
                     object_type=resource_type,
                     object_id=resource_id,
@@ -859,7 +1037,7 @@ class SpiceDBClient(AuthorizationProvider):
 
         try:
             request = LookupResourcesRequest(
-                consistency=Consistency(fully_consistent=True),
+                consistency=self._token_store.consistency(self._consistency),
                 resource_object_type=resource_type,
                 permission=permission,
                 subject=SubjectReference(
@@ -966,7 +1144,7 @@ class SpiceDBClient(AuthorizationProvider):
 
             relationship_filter = RelationshipFilter(**filter_kwargs)
             request = ReadRelationshipsRequest(
-                consistency=Consistency(fully_consistent=True),
+                consistency=self._token_store.consistency(self._consistency),
                 relationship_filter=relationship_filter,
             )
 
@@ -0,0 +1,110 @@
+"""Read consistency for SpiceDB requests.
+
+SpiceDB answers each write with a ZedToken naming the revision it was
+committed at. Reads issued ``at_least_as_fresh`` that token are guaranteed to
+see the write, while still letting SpiceDB serve them from its caches at any
+newer revision. ``fully_consistent`` reads, by contrast, always go to the
+datastore.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import StrEnum
+
+from authzed.api.v1 import Consistency, ZedToken
+
+_read_token: ContextVar[str | None] = ContextVar("spicedb_read_token", default=None)
+
+_captured_write_tokens: ContextVar[list[str] | None] = ContextVar(
+    "spicedb_captured_write_tokens", default=None
+)
+
+
+class ConsistencyMode(StrEnum):
+    """How fresh the data behind a SpiceDB read must be.
+
+    Attributes:
+        FULLY_CONSISTENT: Always read the latest datastore revision.
+        AT_LEAST_AS_FRESH: Read at or after the newest write to the request's
+            tenant, whose ZedToken the outbox records in Postgres so that
+            every replica sees it. Reads without a known token are fully
+            consistent.
+        MINIMIZE_LATENCY: Read whatever revision SpiceDB has cached; writes
+            may take up to SpiceDB's quantization window to become visible.
+    """
+
+    FULLY_CONSISTENT = "fully_consistent"
+    AT_LEAST_AS_FRESH = "at_least_as_fresh"
+    MINIMIZE_LATENCY = "minimize_latency"
+
+
+class ZedTokenStore:
+    """ZedTokens returned by writes and required by reads.
+
+    Both are tracked per execution context (``ContextVar``), not per
+    process, so one store is shared by every SpiceDBClient in the process:
+
+    - Writes made inside :meth:`capture_writes` report their tokens to that
+      block. The outbox SpiceDB handler uses this to learn the revision of
+      the writes it made for an event and records it per tenant in
+      Postgres.
+    - :meth:`read_at_least_as_fresh` sets the token reads in the current
+      context must be at least as fresh as; the request's tenant token is
+      loaded from Postgres and set here once the tenant is resolved.
+
+    Thread-safe.
+    """
+
+    @contextmanager
+    def capture_writes(self) -> Iterator[list[str]]:
+        """Collect the tokens of writes completed inside the block, in order.
+
+        Writes within one context are sequential, so the last token covers
+        every write made in the block.
+        """
+        tokens: list[str] = []
+        reset = _captured_write_tokens.set(tokens)
+        try:
+            yield tokens
+        finally:
+            _captured_write_tokens.reset(reset)
+
+    @contextmanager
+    def write(self) -> Iterator[Callable[[ZedToken], None]]:
+        """Track one write or delete request.
+
+        Yields a callback for the token returned by the request, which is
+        reported to the enclosing :meth:`capture_writes` block, if any.
+        """
+        captured = _captured_write_tokens.get()
+
+        def observe(token: ZedToken) -> None:
+            if captured is not None and token.token:
+                captured.append(token.token)
+
+        yield observe
+
+    def read_at_least_as_fresh(self, token: str | None) -> None:
+        """Make reads in the current context at least as fresh as ``token``.
+
+        Args:
+            token: ZedToken covering the writes the reads must see, or None
+                if unknown, in which case reads are fully consistent
+        """
+        _read_token.set(token)
+
+    def consistency(self, mode: ConsistencyMode) -> Consistency:
+        """Build the Consistency for a read under ``mode``.
+
+        ``AT_LEAST_AS_FRESH`` falls back to a fully consistent read while no
+        token is known in the current context.
+        """
+        if mode is ConsistencyMode.MINIMIZE_LATENCY:
+            return Consistency(minimize_latency=True)
+        token = _read_token.get()
+        if mode is ConsistencyMode.FULLY_CONSISTENT or token is None:
+            return Consistency(fully_consistent=True)
+        return Consistency(at_least_as_fresh=ZedToken(token=token))
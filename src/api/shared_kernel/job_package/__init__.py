@@ -3,17 +3,20 @@
 Provides the shared contract between the Ingestion context (producer)
 and the Extraction context (consumer). A JobPackage is a ZIP archive
 containing a manifest, a changeset, raw content files (content-addressable),
-and an adapter checkpoint snapshot.
+and an adapter checkpoint snapshot. Content may instead live in a
+tenant-scoped content blob store shared across packages.
 
 Public API:
     - JobPackageBuilder: assembles a ZIP archive
     - JobPackageReader: reads and validates a ZIP archive
+    - ContentBlobStore: tenant-scoped content store shared across packages
     - Value objects: JobPackageId, ContentRef, SyncMode, ChangeOperation,
                      ChangesetEntry, Manifest, AdapterCheckpoint
     - compute_content_checksum: content directory checksum computation
     - validate_zip_entry_name / PathSafetyError: path safety helpers
 """
 
+from shared_kernel.job_package.blob_store import ContentBlobStore
 from shared_kernel.job_package.builder import JobPackageBuilder
 from shared_kernel.job_package.checksum import compute_content_checksum
 from shared_kernel.job_package.path_safety import (
@@ -35,6 +38,7 @@ __all__ = [
     # Builder / Reader
     "JobPackageBuilder",
     "JobPackageReader",
+    "ContentBlobStore",
     # Value objects
     "AdapterCheckpoint",
     "ChangeOperation",
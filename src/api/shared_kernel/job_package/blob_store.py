@@ -0,0 +1,313 @@
+"""ContentBlobStore: tenant-scoped, content-addressed storage for JobPackage content.
+
+Consecutive syncs of a data source share almost all of their file content.
+Instead of embedding every file in each JobPackage ZIP, a builder given a
+blob store writes only the content the store does not already hold, and the
+package refers to the rest by digest. Readers resolve that content from the
+store.
+
+Layout under ``{work_dir}/blobs/{tenant_id}/``::
+
+    objects/{aa}/{hex_digest}   raw content, named by its SHA-256
+    refs/{job_package_id}       digests one package references, one per line
+    .lock                       orders garbage collection against writers
+
+A package holds its references for as long as its archive exists in
+``work_dir``. Once the archive is removed, :meth:`ContentBlobStore.collect_garbage`
+releases the package's references and deletes the blobs no remaining package
+refers to. Collection scans the whole store, so it runs periodically for
+every tenant (:func:`collect_garbage_in`) rather than after each build.
+"""
+
+from __future__ import annotations
+
+import fcntl
+import hashlib
+import os
+import re
+import tempfile
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO
+
+from shared_kernel.job_package.value_objects import ContentRef, JobPackageId
+
+# Tenant and package IDs become path components, so only plain identifiers
+# are accepted.
+_IDENTIFIER_PATTERN = re.compile(r"^[A-Za-z0-9_-]+$")
+
+# Bytes copied per chunk when writing content into the store.
+_COPY_CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class BlobCollection:
+    """Outcome of one :meth:`ContentBlobStore.collect_garbage` run."""
+
+    released_packages: int
+    removed_blobs: int
+    removed_bytes: int
+
+
+class ContentBlobStore:
+    """Content-addressed blob store for one tenant's JobPackages.
+
+    Blobs are written atomically: content goes to a temporary file in the
+    blob's directory and is renamed into place once its SHA-256 has been
+    verified, so a blob path either does not exist or holds exactly the
+    content its name promises.
+
+    Writers (:meth:`writing`) take a shared lock and garbage collection takes
+    an exclusive one, so a blob is never deleted between a builder finding it
+    present and recording its reference. Readers take no lock; a package's
+    blobs stay in place for as long as its archive exists.
+
+    Args:
+        work_dir: Directory holding the JobPackage archives.  The store lives
+            under ``{work_dir}/blobs/{tenant_id}``.
+        tenant_id: Tenant owning the content.  Stores never share blobs
+            across tenants.
+
+    Raises:
+        ValueError: If ``tenant_id`` is not a plain identifier.
+    """
+
+    def __init__(self, *, work_dir: Path, tenant_id: str) -> None:
+        if not _IDENTIFIER_PATTERN.match(tenant_id):
+            raise ValueError(f"Invalid tenant_id for content blob store: {tenant_id!r}")
+        self._work_dir = work_dir
+        self._tenant_id = tenant_id
+        self._root = work_dir / "blobs" / tenant_id
+        self._objects_dir = self._root / "objects"
+        self._refs_dir = self._root / "refs"
+
+    @property
+    def tenant_id(self) -> str:
+        """Tenant owning this store."""
+        return self._tenant_id
+
+    # ------------------------------------------------------------------
+    # Blobs
+    # ------------------------------------------------------------------
+
+    def blob_path(self, content_ref: ContentRef) -> Path:
+        """Return where the blob for ``content_ref`` is stored."""
+        return self._objects_dir / content_ref.hex_digest[:2] / content_ref.filename
+
+    def contains(self, content_ref: ContentRef) -> bool:
+        """Return whether the store holds the blob for ``content_ref``."""
+        return self.blob_path(content_ref).is_file()
+
+    def open(self, content_ref: ContentRef) -> BinaryIO:
+        """Open the blob for ``content_ref`` for binary reading.
+
+        Raises:
+            KeyError: If the store does not hold the blob.
+        """
+        try:
+            return self.blob_path(content_ref).open("rb")
+        except FileNotFoundError:
+            raise KeyError(
+                f"Content {content_ref.ref_string!r} is not in the blob store "
+                f"for tenant {self._tenant_id!r}"
+            ) from None
+
+    def put_bytes(self, raw_bytes: bytes, content_ref: ContentRef) -> bool:
+        """Store ``raw_bytes`` as the blob for ``content_ref``.
+
+        Returns:
+            True if the blob was written, False if the store already held it.
+
+        Raises:
+            ValueError: If the bytes do not hash to ``content_ref``.
+        """
+        if self.contains(content_ref):
+            return False
+        _verify_digest(content_ref, hashlib.sha256(raw_bytes).hexdigest())
+        with self._partial(content_ref) as partial:
+            partial.write(raw_bytes)
+        return True
+
+    def put_file(
+        self, path: Path, content_ref: ContentRef, *, move: bool = False
+    ) -> bool:
+        """Store the file at ``path`` as the blob for ``content_ref``.
+
+        The file is copied in chunks and hashed during the copy.  With
+        ``move`` set, the file is instead renamed into the store without
+        being read; the caller vouches for its digest and gives up the file.
+        A file that cannot be renamed (e.g. across filesystems) is copied.
+
+        Returns:
+            True if the blob was written, False if the store already held it.
+
+        Raises:
+            ValueError: If a copied file does not hash to ``content_ref``.
+        """
+        if self.contains(content_ref):
+            return False
+        blob_path = self.blob_path(content_ref)
+        if move:
+            blob_path.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                os.replace(path, blob_path)
+                return True
+            except OSError:
+                pass
+        hasher = hashlib.sha256()
+        with path.open("rb") as source, self._partial(content_ref) as partial:
+            while chunk := source.read(_COPY_CHUNK_SIZE):
+                hasher.update(chunk)
+                partial.write(chunk)
+            _verify_digest(content_ref, hasher.hexdigest())
+        return True
+
+    # ------------------------------------------------------------------
+    # References
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def writing(self) -> Iterator[None]:
+        """Hold off garbage collection while blobs and references are written."""
+        with self._lock(fcntl.LOCK_SH):
+            yield
+
+    def add_references(self, job_package_id: str, hex_digests: Iterable[str]) -> None:
+        """Record that a package references the given blobs.
+
+        Call inside :meth:`writing`.  The references keep their blobs alive
+        for as long as the package's archive exists.
+        """
+        refs_path = self._refs_path(job_package_id)
+        refs_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, partial_name = tempfile.mkstemp(dir=refs_path.parent, prefix=".")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as partial:
+                for hex_digest in hex_digests:
+                    partial.write(f"{hex_digest}\n")
+            os.replace(partial_name, refs_path)
+        except BaseException:
+            Path(partial_name).unlink(missing_ok=True)
+            raise
+
+    def release(self, job_package_id: str) -> None:
+        """Drop a package's references.  Its blobs go at the next collection."""
+        self._refs_path(job_package_id).unlink(missing_ok=True)
+
+    def collect_garbage(self) -> BlobCollection:
+        """Release packages whose archives are gone and delete unreferenced blobs.
+
+        Leftover temporary files from interrupted writes are removed too.
+
+        Returns:
+            Counts of released packages and removed blobs.
+        """
+        released = 0
+        removed_blobs = 0
+        removed_bytes = 0
+        with self._lock(fcntl.LOCK_EX):
+            live: set[str] = set()
+            for refs_path in _list_dir(self._refs_dir):
+                if refs_path.name.startswith("."):
+                    refs_path.unlink(missing_ok=True)
+                elif self._archive_exists(refs_path.name):
+                    live.update(refs_path.read_text(encoding="utf-8").split())
+                else:
+                    refs_path.unlink(missing_ok=True)
+                    released += 1
+
+            for prefix_dir in _list_dir(self._objects_dir):
+                for blob_path in _list_dir(prefix_dir):
+                    if blob_path.name in live:
+                        continue
+                    try:
+                        size = blob_path.stat().st_size
+                        blob_path.unlink()
+                    except FileNotFoundError:
+                        continue
+                    removed_blobs += 1
+                    removed_bytes += size
+        return BlobCollection(
+            released_packages=released,
+            removed_blobs=removed_blobs,
+            removed_bytes=removed_bytes,
+        )
+
+    # ------------------------------------------------------------------
+    # Private helpers
+    # ------------------------------------------------------------------
+
+    def _refs_path(self, job_package_id: str) -> Path:
+        if not _IDENTIFIER_PATTERN.match(job_package_id):
+            raise ValueError(f"Invalid job_package_id: {job_package_id!r}")
+        return self._refs_dir / job_package_id
+
+    def _archive_exists(self, job_package_id: str) -> bool:
+        return (
+            self._work_dir / JobPackageId(value=job_package_id).archive_name()
+        ).is_file()
+
+    @contextmanager
+    def _lock(self, operation: int) -> Iterator[None]:
+        self._root.mkdir(parents=True, exist_ok=True)
+        with (self._root / ".lock").open("a") as lock_file:
+            fcntl.flock(lock_file, operation)
+            yield
+
+    @contextmanager
+    def _partial(self, content_ref: ContentRef) -> Iterator[BinaryIO]:
+        """Yield a temporary file that becomes the blob if the block succeeds."""
+        blob_path = self.blob_path(content_ref)
+        blob_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, partial_name = tempfile.mkstemp(
+            dir=blob_path.parent, prefix=".", suffix=".part"
+        )
+        try:
+            with os.fdopen(fd, "wb") as partial:
+                yield partial
+            os.replace(partial_name, blob_path)
+        except BaseException:
+            Path(partial_name).unlink(missing_ok=True)
+            raise
+
+
+def collect_garbage_in(work_dir: Path) -> BlobCollection:
+    """Collect garbage in the blob store of every tenant under ``work_dir``.
+
+    Returns:
+        Counts summed over all tenants.
+    """
+    released = 0
+    removed_blobs = 0
+    removed_bytes = 0
+    for tenant_dir in _list_dir(work_dir / "blobs"):
+        if not tenant_dir.is_dir() or not _IDENTIFIER_PATTERN.match(tenant_dir.name):
+            continue
+        collection = ContentBlobStore(
+            work_dir=work_dir, tenant_id=tenant_dir.name
+        ).collect_garbage()
+        released += collection.released_packages
+        removed_blobs += collection.removed_blobs
+        removed_bytes += collection.removed_bytes
+    return BlobCollection(
+        released_packages=released,
+        removed_blobs=removed_blobs,
+        removed_bytes=removed_bytes,
+    )
+
+
+def _list_dir(path: Path) -> list[Path]:
+    try:
+        return list(path.iterdir())
+    except FileNotFoundError:
+        return []
+
+
+def _verify_digest(content_ref: ContentRef, actual_digest: str) -> None:
+    if actual_digest != content_ref.hex_digest:
+        raise ValueError(
+            f"Content does not match {content_ref.ref_string!r}: "
+            f"got sha256:{actual_digest}"
+        )
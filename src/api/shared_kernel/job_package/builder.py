@@ -14,15 +14,28 @@ Usage::
 
 The builder validates all ZIP entry names before writing to prevent path
 traversal vulnerabilities.
+
+Given a :class:`ContentBlobStore`, the builder writes content into the store
+instead of the archive, skipping content the store already holds, and the
+manifest records which tenant's store to resolve it from.
 """
 
 from __future__ import annotations
 
 import hashlib
+import io
 import json
+import math
+import os
+import shutil
+import tempfile
+import time
 import zipfile
+from collections import Counter
 from pathlib import Path
+from typing import BinaryIO
 
+from shared_kernel.job_package.blob_store import ContentBlobStore
 from shared_kernel.job_package.path_safety import validate_zip_entry_name
 from shared_kernel.job_package.value_objects import (
     AdapterCheckpoint,
@@ -37,23 +50,97 @@ from shared_kernel.job_package.value_objects import (
 # major when backwards-incompatible changes are made.
 _FORMAT_VERSION = "1.0.0"
 
+# Format version of packages whose content lives in a content blob store.
+_BLOB_STORE_FORMAT_VERSION = "1.1.0"
+
+# Chunk size used when streaming content into the archive.
+_READ_CHUNK_SIZE = 1024 * 1024
+
+# Content types that are already compressed; deflating them wastes CPU.
+_INCOMPRESSIBLE_CONTENT_TYPES = frozenset(
+    {
+        "application/gzip",
+        "application/java-archive",
+        "application/pdf",
+        "application/vnd.rar",
+        "application/x-7z-compressed",
+        "application/x-bzip2",
+        "application/x-gzip",
+        "application/x-rar-compressed",
+        "application/x-tar+gzip",
+        "application/x-xz",
+        "application/zip",
+        "application/zstd",
+    }
+)
+_INCOMPRESSIBLE_CONTENT_TYPE_PREFIXES = ("audio/", "video/")
+# Images are compressed formats, except for these plain-text/raw ones.
+_COMPRESSIBLE_IMAGE_TYPES = frozenset(
+    {"image/bmp", "image/svg+xml", "image/x-ms-bmp", "image/x-portable-pixmap"}
+)
+
+# Bytes sampled to estimate whether content of an unknown type compresses.
+_ENTROPY_SAMPLE_SIZE = 4096
+# Shannon entropy (bits per byte) above which content is stored uncompressed.
+_INCOMPRESSIBLE_ENTROPY = 7.5
+
+
+def _is_incompressible(content_type: str | None, sample: bytes) -> bool:
+    """Whether content is unlikely to shrink under DEFLATE.
+
+    Decides by content type where it is conclusive, otherwise by the byte
+    entropy of a sample from the start of the content.
+    """
+    if content_type is not None:
+        if content_type in _INCOMPRESSIBLE_CONTENT_TYPES or content_type.startswith(
+            _INCOMPRESSIBLE_CONTENT_TYPE_PREFIXES
+        ):
+            return True
+        if content_type.startswith("image/"):
+            return content_type not in _COMPRESSIBLE_IMAGE_TYPES
+    if len(sample) < _ENTROPY_SAMPLE_SIZE:
+        return False
+    entropy = -sum(
+        count / len(sample) * math.log2(count / len(sample))
+        for count in Counter(sample).values()
+    )
+    return entropy > _INCOMPRESSIBLE_ENTROPY
+
 
 class JobPackageBuilder:
     """Assembles a JobPackage ZIP archive from ingestion artefacts.
 
     The builder accumulates content, changeset entries, and the adapter
-    checkpoint in memory, then writes everything to a single ZIP file when
-    ``build()`` is called.
+    checkpoint, then writes everything to a single ZIP file when
+    ``build()`` is called.  Content may be added as bytes, as a file on
+    disk via ``add_content_file()``, or as a stream via
+    ``add_content_stream()``.  With ``spool_dir`` set, bytes and streams
+    are written to disk as they arrive, so memory use does not grow with
+    the package.
+
+    ``build()`` makes a single pass over the content in digest order,
+    streaming each file into the archive while computing the content
+    checksum.  Content that will not compress (by content type or byte
+    entropy) is stored rather than deflated.
 
     Content is automatically deduplicated: adding the same raw bytes twice
     stores only one file in the ``content/`` directory.
 
+    With ``blob_store`` set, content is written to the store rather than
+    under ``content/``, and only content the store does not already hold is
+    written at all.  The package records a reference to every blob it uses.
+
     Args:
         data_source_id: ID of the DataSource that produced this package.
         knowledge_graph_id: ID of the KnowledgeGraph this package feeds.
         sync_mode: Whether this run is incremental or a full refresh.
         package_id: Optional pre-existing ULID for the package.  If omitted,
             a new ULID is generated.
+        spool_dir: Optional directory under which added bytes and streams
+            are spooled to disk instead of held in memory.  The spool is
+            removed when ``build()`` finishes.
+        blob_store: Optional tenant content blob store to write content to
+            instead of embedding it in the archive.
     """
 
     def __init__(
@@ -62,15 +149,23 @@ class JobPackageBuilder:
         knowledge_graph_id: str,
         sync_mode: SyncMode,
         package_id: JobPackageId | None = None,
+        spool_dir: Path | None = None,
+        blob_store: ContentBlobStore | None = None,
     ) -> None:
         self._data_source_id = data_source_id
         self._knowledge_graph_id = knowledge_graph_id
         self._sync_mode = sync_mode
         self._package_id: JobPackageId = package_id or JobPackageId.generate()
+        self._spool_root = spool_dir
+        self._spool: Path | None = None
+        self._blob_store = blob_store
 
         # Content store: hex_digest -> raw bytes (deduplicated)
         self._content: dict[str, bytes] = {}
 
+        # Content on disk: hex_digest -> file path (deduplicated)
+        self._content_files: dict[str, Path] = {}
+
         # Changeset entries in insertion order
         self._changeset_entries: list[ChangesetEntry] = []
 
@@ -85,7 +180,8 @@ class JobPackageBuilder:
         """Store raw content and return its ContentRef.
 
         If the same bytes have already been added, the existing ContentRef
-        is returned without duplicating the storage.
+        is returned without duplicating the storage.  With ``spool_dir``
+        set, the bytes are written to disk rather than kept.
 
         Args:
             raw_bytes: Raw content bytes to store.
@@ -93,10 +189,55 @@ class JobPackageBuilder:
         Returns:
             ContentRef pointing to this content in the ``content/`` directory.
         """
+        if self._spool_root is not None:
+            return self.add_content_stream(io.BytesIO(raw_bytes))
         ref = ContentRef.from_bytes(raw_bytes)
         self._content[ref.hex_digest] = raw_bytes
         return ref
 
+    def add_content_stream(self, stream: BinaryIO) -> ContentRef:
+        """Spool content from a binary stream to disk and return its ContentRef.
+
+        The stream is read in chunks and hashed while it is written, so it
+        is never held in memory.  Spools under ``spool_dir``, or the system
+        temporary directory when none was given.
+
+        Args:
+            stream: Binary stream positioned at the start of the content.
+
+        Returns:
+            ContentRef pointing to this content in the ``content/`` directory.
+        """
+        spool = self._spool_path()
+        hasher = hashlib.sha256()
+        fd, partial_name = tempfile.mkstemp(dir=spool, suffix=".part")
+        with os.fdopen(fd, "wb") as partial:
+            while chunk := stream.read(_READ_CHUNK_SIZE):
+                hasher.update(chunk)
+                partial.write(chunk)
+        ref = ContentRef(hex_digest=hasher.hexdigest())
+        if ref.hex_digest in self._content or ref.hex_digest in self._content_files:
+            os.unlink(partial_name)
+        else:
+            content_path = spool / ref.hex_digest
+            os.replace(partial_name, content_path)
+            self._content_files[ref.hex_digest] = content_path
+        return ref
+
+    def add_content_file(self, path: Path, content_ref: ContentRef) -> None:
+        """Register content already written to a file.
+
+        The file is read only when the archive is built, so it must exist
+        until ``build()`` returns.  The caller is responsible for
+        ``content_ref`` being the SHA-256 of the file's bytes.
+
+        Args:
+            path: File holding the raw content bytes.
+            content_ref: ContentRef of the file's content.
+        """
+        if content_ref.hex_digest not in self._content:
+            self._content_files[content_ref.hex_digest] = path
+
     def add_changeset_entry(self, entry: ChangesetEntry) -> None:
         """Append a changeset entry.
 
@@ -137,12 +278,13 @@ class JobPackageBuilder:
         archive_path = output_dir / self._package_id.archive_name()
 
         # Consistency check: every changeset entry's content_ref must exist in
-        # the in-memory content store.  Fail-fast here so consumers never
-        # receive a ZIP that would raise KeyError inside read_content().
+        # the content store.  Fail-fast here so consumers never receive a ZIP
+        # that would raise KeyError inside read_content().
         missing_refs = [
             entry.content_ref.ref_string
             for entry in self._changeset_entries
             if entry.content_ref.hex_digest not in self._content
+            and entry.content_ref.hex_digest not in self._content_files
         ]
         if missing_refs:
             raise ValueError(
@@ -151,54 +293,78 @@ class JobPackageBuilder:
                 "Call add_content() for each content_ref before build()."
             )
 
-        # Compute content checksum from in-memory store
-        content_checksum = self._compute_content_checksum()
+        try:
+            if self._blob_store is None:
+                self._write_archive(archive_path, self._checkpoint)
+            else:
+                package_id = self._package_id.value
+                with self._blob_store.writing():
+                    self._blob_store.add_references(
+                        package_id,
+                        sorted(self._content.keys() | self._content_files.keys()),
+                    )
+                    try:
+                        self._write_archive(archive_path, self._checkpoint)
+                    except BaseException:
+                        self._blob_store.release(package_id)
+                        archive_path.unlink(missing_ok=True)
+                        raise
+        finally:
+            if self._spool is not None:
+                shutil.rmtree(self._spool, ignore_errors=True)
+                self._spool = None
 
-        manifest = Manifest(
-            format_version=_FORMAT_VERSION,
-            data_source_id=self._data_source_id,
-            knowledge_graph_id=self._knowledge_graph_id,
-            sync_mode=self._sync_mode,
-            entry_count=len(self._changeset_entries),
-            content_checksum=content_checksum,
-        )
+        return archive_path
+
+    # ------------------------------------------------------------------
+    # Private helpers
+    # ------------------------------------------------------------------
 
+    def _spool_path(self) -> Path:
+        """Create the spool directory on first use."""
+        if self._spool is None:
+            if self._spool_root is not None:
+                self._spool_root.mkdir(parents=True, exist_ok=True)
+            self._spool = Path(
+                tempfile.mkdtemp(prefix="job-package-", dir=self._spool_root)
+            )
+        return self._spool
+
+    def _write_archive(self, archive_path: Path, checkpoint: AdapterCheckpoint) -> None:
+        """Write the ZIP archive, and content to the blob store if one is set."""
         with zipfile.ZipFile(
             archive_path, mode="w", compression=zipfile.ZIP_DEFLATED
         ) as zf:
-            # 1. manifest.json
-            self._write_json(zf, "manifest.json", manifest.to_dict())
-
-            # 2. changeset.jsonl
+            # 1. changeset.jsonl
             self._write_changeset(zf)
 
-            # 3. content/ files
-            self._write_content(zf)
+            # 2. content, computing the checksum in the same pass
+            if self._blob_store is None:
+                content_checksum = self._write_content(zf)
+            else:
+                content_checksum = self._store_content(self._blob_store)
+
+            # 3. manifest.json (needs the checksum; ZIP order is irrelevant
+            #    to readers, which use the central directory)
+            manifest = Manifest(
+                format_version=(
+                    _FORMAT_VERSION
+                    if self._blob_store is None
+                    else _BLOB_STORE_FORMAT_VERSION
+                ),
+                data_source_id=self._data_source_id,
+                knowledge_graph_id=self._knowledge_graph_id,
+                sync_mode=self._sync_mode,
+                entry_count=len(self._changeset_entries),
+                content_checksum=content_checksum,
+                content_store=(
+                    None if self._blob_store is None else self._blob_store.tenant_id
+                ),
+            )
+            self._write_json(zf, "manifest.json", manifest.to_dict())
 
             # 4. state.json
-            self._write_json(zf, "state.json", self._checkpoint.to_dict())
-
-        return archive_path
-
-    # ------------------------------------------------------------------
-    # Private helpers
-    # ------------------------------------------------------------------
-
-    def _compute_content_checksum(self) -> str:
-        """Compute the canonical content checksum from the in-memory store.
-
-        The algorithm mirrors what :func:`compute_content_checksum` does on
-        a filesystem directory:
-        - Sort hex digests lexicographically (they are the filenames).
-        - For each hex digest, append ``{digest}\\n{raw_bytes}`` to the stream.
-        - Return the hex-encoded SHA-256.
-        """
-        hasher = hashlib.sha256()
-        for hex_digest in sorted(self._content.keys()):
-            hasher.update(hex_digest.encode("utf-8"))
-            hasher.update(b"\n")
-            hasher.update(self._content[hex_digest])
-        return hasher.hexdigest()
+            self._write_json(zf, "state.json", checkpoint.to_dict())
 
     def _write_json(self, zf: zipfile.ZipFile, entry_name: str, data: dict) -> None:
         """Write a JSON object as a ZIP entry."""
@@ -209,22 +375,92 @@ class JobPackageBuilder:
         zf.writestr(entry_name, payload)
 
     def _write_changeset(self, zf: zipfile.ZipFile) -> None:
-        """Write all changeset entries as JSONL to ``changeset.jsonl``."""
+        """Stream all changeset entries as JSONL to ``changeset.jsonl``."""
         validate_zip_entry_name("changeset.jsonl")
-        lines = []
-        for entry in self._changeset_entries:
-            line = json.dumps(
-                entry.to_dict(), ensure_ascii=False, separators=(",", ":")
-            )
-            lines.append(line)
-        payload = "\n".join(lines)
-        if payload:
-            payload += "\n"
-        zf.writestr("changeset.jsonl", payload.encode("utf-8"))
-
-    def _write_content(self, zf: zipfile.ZipFile) -> None:
-        """Write all content files under ``content/`` in the ZIP."""
-        for hex_digest, raw_bytes in sorted(self._content.items()):
+        with zf.open("changeset.jsonl", mode="w") as fh:
+            for entry in self._changeset_entries:
+                line = json.dumps(
+                    entry.to_dict(), ensure_ascii=False, separators=(",", ":")
+                )
+                fh.write(line.encode("utf-8") + b"\n")
+
+    def _write_content(self, zf: zipfile.ZipFile) -> str:
+        """Write all content files under ``content/`` and return the checksum.
+
+        Files are written in sorted digest order, which is also the order of
+        the canonical content checksum (mirroring
+        :func:`compute_content_checksum` on a filesystem directory), so each
+        file is read exactly once, in chunks:
+        - For each hex digest, append ``{digest}\\n{raw_bytes}`` to the stream.
+        - Return the hex-encoded SHA-256.
+        """
+        content_types = {
+            entry.content_ref.hex_digest: entry.content_type
+            for entry in self._changeset_entries
+        }
+        date_time = time.localtime(time.time())[:6]
+        hasher = hashlib.sha256()
+
+        for hex_digest in sorted(self._content.keys() | self._content_files.keys()):
             entry_name = f"content/{hex_digest}"
             validate_zip_entry_name(entry_name)
-            zf.writestr(entry_name, raw_bytes)
+            hasher.update(hex_digest.encode("utf-8"))
+            hasher.update(b"\n")
+
+            if hex_digest in self._content:
+                source: BinaryIO = io.BytesIO(self._content[hex_digest])
+                size = len(self._content[hex_digest])
+            else:
+                source = self._content_files[hex_digest].open("rb")
+                size = os.fstat(source.fileno()).st_size
+
+            with source:
+                chunk = source.read(_READ_CHUNK_SIZE)
+                info = zipfile.ZipInfo(entry_name, date_time=date_time)
+                info.external_attr = 0o600 << 16
+                info.file_size = size
+                info.compress_type = (
+                    zipfile.ZIP_STORED
+                    if _is_incompressible(
+                        content_types.get(hex_digest),
+                        chunk[:_ENTROPY_SAMPLE_SIZE],
+                    )
+                    else zipfile.ZIP_DEFLATED
+                )
+                with zf.open(info, mode="w") as dest:
+                    while chunk:
+                        hasher.update(chunk)
+                        dest.write(chunk)
+                        chunk = source.read(_READ_CHUNK_SIZE)
+
+        return hasher.hexdigest()
+
+    def _store_content(self, blob_store: ContentBlobStore) -> str:
+        """Write content the blob store lacks and return the checksum.
+
+        The checksum is the same canonical content checksum
+        :meth:`_write_content` computes, so it matches
+        :func:`compute_content_checksum` on the ``content/`` directory that
+        :meth:`JobPackageReader.extract_archive` writes.  Content already in
+        the store is hashed but not rewritten; files spooled by the builder
+        itself are hashed and then moved into the store rather than copied.
+        """
+        hasher = hashlib.sha256()
+        for hex_digest in sorted(self._content.keys() | self._content_files.keys()):
+            hasher.update(hex_digest.encode("utf-8"))
+            hasher.update(b"\n")
+            content_ref = ContentRef(hex_digest=hex_digest)
+            if hex_digest in self._content:
+                hasher.update(self._content[hex_digest])
+                blob_store.put_bytes(self._content[hex_digest], content_ref)
+            else:
+                path = self._content_files[hex_digest]
+                with path.open("rb") as source:
+                    while chunk := source.read(_READ_CHUNK_SIZE):
+                        hasher.update(chunk)
+                blob_store.put_file(
+                    path,
+                    content_ref,
+                    move=self._spool is not None and path.parent == self._spool,
+                )
+        return hasher.hexdigest()
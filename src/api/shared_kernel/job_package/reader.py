@@ -8,8 +8,21 @@ Usage::
         data = reader.read_content(entry.content_ref)  # raises on corruption
     checkpoint = reader.read_checkpoint()
 
+Used as a context manager, the reader keeps one archive handle open, so the
+central directory is parsed once instead of on every call. Bulk consumers
+stream content straight to disk with :meth:`JobPackageReader.extract_many`::
+
+    with JobPackageReader(archive_path) as reader:
+        targets = [(e.path, e.content_ref) for e in reader.iter_changeset()]
+        reader.extract_many(targets, dest)
+
+Packages whose manifest names a ``content_store`` keep their content in
+that tenant's :class:`ContentBlobStore` beside the archive rather than under
+``content/``; every content method resolves it from there transparently.
+
 All ZIP entry names are validated for path safety on construction.
-Content integrity is verified on every :meth:`read_content` call.
+Content integrity is verified on every :meth:`read_content` call and during
+the copy in :meth:`extract_many`.
 """
 
 from __future__ import annotations
@@ -17,10 +30,19 @@ from __future__ import annotations
 import hashlib
 import io
 import json
+import os
+import secrets
+import shutil
 import zipfile
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
+from types import TracebackType
+from typing import IO, Self
 
+from shared_kernel.job_package.blob_store import ContentBlobStore
 from shared_kernel.job_package.path_safety import validate_zip_entry_name
 from shared_kernel.job_package.value_objects import (
     AdapterCheckpoint,
@@ -29,6 +51,9 @@ from shared_kernel.job_package.value_objects import (
     Manifest,
 )
 
+#: Bytes read from a content entry per chunk when extracting to disk.
+_COPY_CHUNK_SIZE = 1024 * 1024
+
 
 class JobPackageReader:
     """Reads a JobPackage ZIP archive with safety and integrity guarantees.
@@ -38,6 +63,9 @@ class JobPackageReader:
     paths, etc.) raises immediately, preventing malicious archives from causing
     harm later.
 
+    Outside a ``with`` block each call opens the archive itself. Inside one,
+    all calls share a single handle that is closed on exit.
+
     Args:
         archive_path: Path to the JobPackage ZIP file.
 
@@ -49,8 +77,34 @@ class JobPackageReader:
 
     def __init__(self, archive_path: Path) -> None:
         self._archive_path = archive_path
+        self._zf: zipfile.ZipFile | None = None
+        self._blob_store: ContentBlobStore | None = None
+        self._blob_store_resolved = False
         self._validate_entry_names()
 
+    # ------------------------------------------------------------------
+    # Handle lifecycle
+    # ------------------------------------------------------------------
+
+    def __enter__(self) -> Self:
+        if self._zf is None:
+            self._zf = zipfile.ZipFile(self._archive_path)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the shared archive handle, if one is open."""
+        if self._zf is not None:
+            self._zf.close()
+            self._zf = None
+
     # ------------------------------------------------------------------
     # Manifest
     # ------------------------------------------------------------------
@@ -63,7 +117,7 @@ class JobPackageReader:
         Returns:
             Manifest value object.
         """
-        with zipfile.ZipFile(self._archive_path) as zf:
+        with self._archive() as zf:
             data = json.loads(zf.read("manifest.json").decode("utf-8"))
         return Manifest.from_dict(data)
 
@@ -81,7 +135,7 @@ class JobPackageReader:
         Yields:
             ChangesetEntry objects in the order they appear in the file.
         """
-        with zipfile.ZipFile(self._archive_path) as zf:
+        with self._archive() as zf:
             with zf.open("changeset.jsonl") as entry_file:
                 text_stream = io.TextIOWrapper(entry_file, encoding="utf-8")
                 for line in text_stream:
@@ -99,9 +153,9 @@ class JobPackageReader:
         """Read and integrity-verify the raw content for a given ContentRef.
 
         The consumer strips the ``sha256:`` prefix from ``content_ref`` to
-        derive the filename, reads ``content/{hex_digest}`` from the archive,
-        then verifies that the SHA-256 of the returned bytes matches the
-        filename.
+        derive the filename, reads ``content/{hex_digest}`` from the archive
+        (or the blob from the package's content store), then verifies that
+        the SHA-256 of the returned bytes matches the filename.
 
         Args:
             content_ref: The reference to the content file.
@@ -114,21 +168,86 @@ class JobPackageReader:
                 (indicating archive corruption).
             KeyError: If the content file is not present in the archive.
         """
-        entry_name = f"content/{content_ref.filename}"
-        with zipfile.ZipFile(self._archive_path) as zf:
-            raw_bytes = zf.read(entry_name)
+        with self._archive() as zf:
+            entry_name, source = self._open_content(zf, content_ref)
+            with source:
+                raw_bytes = source.read()
 
         # Integrity verification: recompute SHA-256 and compare to filename
-        actual_digest = hashlib.sha256(raw_bytes).hexdigest()
-        if actual_digest != content_ref.hex_digest:
-            raise ValueError(
-                f"Content integrity mismatch for {entry_name!r}: "
-                f"expected {content_ref.hex_digest!r}, got {actual_digest!r}. "
-                "The archive may be corrupted."
-            )
-
+        _verify_digest(entry_name, content_ref, hashlib.sha256(raw_bytes).hexdigest())
         return raw_bytes
 
+    def extract_many(
+        self, targets: Iterable[tuple[str, ContentRef]], dest: Path
+    ) -> int:
+        """Stream content for many paths straight to files under ``dest``.
+
+        Each ``(relative_path, content_ref)`` target is copied in chunks from
+        ``content/{hex_digest}`` and hashed during the copy, so no file is
+        held in memory. Data goes to a temporary file beside the destination,
+        which is renamed into place only once its hash has been verified.
+        Content shared by several paths is decompressed once and then copied
+        from the first file written.
+
+        Args:
+            targets: Pairs of a path relative to ``dest`` and the content to
+                write there.
+            dest: Directory the relative paths are resolved against.
+
+        Returns:
+            The number of files written.
+
+        Raises:
+            PathSafetyError: If a relative path violates path safety rules.
+            ValueError: If stored content does not match the expected hash
+                (indicating archive corruption).
+            KeyError: If a content file is not present in the archive.
+        """
+        extracted: dict[str, Path] = {}
+        files_written = 0
+        with self._archive() as zf:
+            for relative_path, content_ref in targets:
+                validate_zip_entry_name(relative_path)
+                output_path = dest / relative_path
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                first_copy = extracted.get(content_ref.hex_digest)
+                if first_copy is not None and first_copy != output_path:
+                    shutil.copyfile(first_copy, output_path)
+                else:
+                    entry_name, source = self._open_content(zf, content_ref)
+                    _extract_verified(entry_name, source, content_ref, output_path)
+                    extracted[content_ref.hex_digest] = output_path
+                files_written += 1
+        return files_written
+
+    def extract_archive(self, dest: Path) -> None:
+        """Extract every package entry under ``dest`` in the archive layout.
+
+        Content held in a content store is written under ``content/`` as if
+        it were embedded, so the result is the same for either kind of
+        package.
+
+        Args:
+            dest: Directory to extract into.
+
+        Raises:
+            ValueError: If store-backed content does not match its hash.
+            KeyError: If store-backed content is missing from the store.
+        """
+        with self._archive() as zf:
+            for entry_name in zf.namelist():
+                zf.extract(entry_name, path=dest)
+            if self._content_store(zf) is None:
+                return
+        content_refs = {
+            change.content_ref.hex_digest: change.content_ref
+            for change in self.iter_changeset()
+        }
+        self.extract_many(
+            ((f"content/{ref.filename}", ref) for ref in content_refs.values()),
+            dest,
+        )
+
     # ------------------------------------------------------------------
     # Checkpoint
     # ------------------------------------------------------------------
@@ -139,7 +258,7 @@ class JobPackageReader:
         Returns:
             AdapterCheckpoint value object.
         """
-        with zipfile.ZipFile(self._archive_path) as zf:
+        with self._archive() as zf:
             data = json.loads(zf.read("state.json").decode("utf-8"))
         return AdapterCheckpoint.from_dict(data)
 
@@ -147,6 +266,39 @@ class JobPackageReader:
     # Private helpers
     # ------------------------------------------------------------------
 
+    @contextmanager
+    def _archive(self) -> Iterator[zipfile.ZipFile]:
+        """Yield the shared handle, or a handle opened for this call only."""
+        if self._zf is not None:
+            yield self._zf
+            return
+        with zipfile.ZipFile(self._archive_path) as zf:
+            yield zf
+
+    def _content_store(self, zf: zipfile.ZipFile) -> ContentBlobStore | None:
+        """Return the store holding this package's content, if it uses one."""
+        if not self._blob_store_resolved:
+            manifest = Manifest.from_dict(
+                json.loads(zf.read("manifest.json").decode("utf-8"))
+            )
+            if manifest.content_store is not None:
+                self._blob_store = ContentBlobStore(
+                    work_dir=self._archive_path.parent,
+                    tenant_id=manifest.content_store,
+                )
+            self._blob_store_resolved = True
+        return self._blob_store
+
+    def _open_content(
+        self, zf: zipfile.ZipFile, content_ref: ContentRef
+    ) -> tuple[str, IO[bytes]]:
+        """Open a content file, returning its name for error messages too."""
+        blob_store = self._content_store(zf)
+        if blob_store is None:
+            entry_name = f"content/{content_ref.filename}"
+            return entry_name, zf.open(entry_name)
+        return str(blob_store.blob_path(content_ref)), blob_store.open(content_ref)
+
     def _validate_entry_names(self) -> None:
         """Validate every ZIP entry name for path safety on construction.
 
@@ -156,3 +308,84 @@ class JobPackageReader:
         with zipfile.ZipFile(self._archive_path) as zf:
             for name in zf.namelist():
                 validate_zip_entry_name(name)
+
+
+@dataclass(frozen=True)
+class PackageExtraction:
+    """Content to extract from one JobPackage archive.
+
+    Attributes:
+        archive_path: Path to the JobPackage ZIP file.
+        targets: Pairs of a path relative to ``dest`` and the content to
+            write there, as accepted by :meth:`JobPackageReader.extract_many`.
+        dest: Directory the relative paths are resolved against.
+    """
+
+    archive_path: Path
+    targets: tuple[tuple[str, ContentRef], ...]
+    dest: Path
+
+
+def extract_packages(
+    extractions: Sequence[PackageExtraction], *, max_workers: int = 4
+) -> list[int]:
+    """Run :meth:`JobPackageReader.extract_many` for several packages.
+
+    Each package is read through its own handle on a worker thread; zlib
+    decompression and SHA-256 hashing release the GIL, so packages extract
+    in parallel.
+
+    Args:
+        extractions: The packages and targets to extract.
+        max_workers: Upper bound on packages extracted concurrently.
+
+    Returns:
+        The number of files written per extraction, in input order.
+
+    Raises:
+        PathSafetyError, ValueError, KeyError: As for
+            :meth:`JobPackageReader.extract_many`, from the first failing
+            extraction in input order.
+    """
+    if len(extractions) <= 1 or max_workers <= 1:
+        return [_extract_package(extraction) for extraction in extractions]
+    with ThreadPoolExecutor(
+        max_workers=min(max_workers, len(extractions)),
+        thread_name_prefix="job-package-extract",
+    ) as pool:
+        return list(pool.map(_extract_package, extractions))
+
+
+def _extract_package(extraction: PackageExtraction) -> int:
+    with JobPackageReader(extraction.archive_path) as reader:
+        return reader.extract_many(extraction.targets, extraction.dest)
+
+
+def _extract_verified(
+    entry_name: str, source: IO[bytes], content_ref: ContentRef, output_path: Path
+) -> None:
+    """Copy one open content file to ``output_path``, verifying its hash on the way."""
+    hasher = hashlib.sha256()
+    # Opened like write_bytes() would, so the file mode follows the umask
+    tmp_path = output_path.with_name(f".{output_path.name}.{secrets.token_hex(4)}.part")
+    try:
+        with source, tmp_path.open("xb") as target:
+            while chunk := source.read(_COPY_CHUNK_SIZE):
+                hasher.update(chunk)
+                target.write(chunk)
+        _verify_digest(entry_name, content_ref, hasher.hexdigest())
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _verify_digest(
+    entry_name: str, content_ref: ContentRef, actual_digest: str
+) -> None:
+    if actual_digest != content_ref.hex_digest:
+        raise ValueError(
+            f"Content integrity mismatch for {entry_name!r}: "
+            f"expected {content_ref.hex_digest!r}, got {actual_digest!r}. "
+            "The archive may be corrupted."
+        )
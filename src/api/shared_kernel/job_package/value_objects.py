@@ -251,9 +251,18 @@ class Manifest:
     content_checksum: str
     """Hex-encoded SHA-256 of the canonical content-directory byte stream."""
 
+    content_store: str | None = None
+    """Tenant whose content blob store holds the package's content.
+
+    ``None`` when content is embedded under ``content/``.  Either way
+    ``content_checksum`` is computed over the same canonical stream, so it
+    matches the ``content/`` directory :meth:`JobPackageReader.extract_archive`
+    writes.
+    """
+
     def to_dict(self) -> dict[str, Any]:
         """Serialise to a JSON-compatible dictionary."""
-        return {
+        result: dict[str, Any] = {
             "format_version": self.format_version,
             "data_source_id": self.data_source_id,
             "knowledge_graph_id": self.knowledge_graph_id,
@@ -261,6 +270,9 @@ class Manifest:
             "entry_count": self.entry_count,
             "content_checksum": self.content_checksum,
         }
+        if self.content_store is not None:
+            result["content_store"] = self.content_store
+        return result
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "Manifest":
@@ -279,6 +291,7 @@ class Manifest:
             sync_mode=SyncMode(data["sync_mode"]),
             entry_count=data["entry_count"],
             content_checksum=data["content_checksum"],
+            content_store=data.get("content_store"),
         )
 
 
@@ -0,0 +1,35 @@
+"""ASGI middleware scoping permission decision memos to a request.
+
+Each HTTP request is handled inside ``permission_decision_scope()`` so that
+CachingAuthorizationProvider remembers permission decisions for the rest of
+that request, and forgets them when the request ends.
+"""
+
+from __future__ import annotations
+
+from collections.abc import MutableMapping
+from typing import Any
+
+from shared_kernel.authorization.caching import permission_decision_scope
+from shared_kernel.middleware.mcp_api_key_auth import ASGIApp, ASGIReceive, ASGISend
+
+
+class PermissionDecisionScopeMiddleware:
+    """Pure ASGI middleware opening a permission decision scope per request."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self._app = app
+
+    async def __call__(
+        self,
+        scope: MutableMapping[str, Any],
+        receive: ASGIReceive,
+        send: ASGISend,
+    ) -> None:
+        """ASGI interface: scope HTTP requests, pass through others."""
+        if scope["type"] != "http":
+            await self._app(scope, receive, send)
+            return
+
+        with permission_decision_scope():
+            await self._app(scope, receive, send)
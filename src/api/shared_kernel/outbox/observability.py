@@ -51,8 +51,19 @@ class OutboxWorkerProbe(Protocol):
         """Called when an event exceeds max retries and is moved to DLQ."""
         ...
 
-    def batch_processed(self, count: int) -> None:
-        """Called when a batch of events is processed."""
+    def batch_processed(
+        self,
+        count: int,
+        duration_seconds: float | None = None,
+        lag_seconds: float | None = None,
+    ) -> None:
+        """Called when a batch of events is processed.
+
+        Args:
+            count: Number of entries in the batch
+            duration_seconds: Time taken to process and commit the batch
+            lag_seconds: Age of the oldest entry in the batch when fetched
+        """
         ...
 
     def listen_loop_started(self) -> None:
@@ -67,6 +78,35 @@ class OutboxWorkerProbe(Protocol):
         """Called when an error occurs in the poll loop."""
         ...
 
+    def shards_assigned(self, shards: list[int], shard_count: int) -> None:
+        """Called when the set of outbox shards this worker owns changes.
+
+        Args:
+            shards: The shards now owned, in ascending order
+            shard_count: Total number of shards
+        """
+        ...
+
+    def shard_heartbeat_failed(self, error: str) -> None:
+        """Called when renewing or releasing shard leases fails."""
+        ...
+
+    def retention_completed(
+        self, archived: int, purged: int, duration_seconds: float
+    ) -> None:
+        """Called after a retention run archived and purged processed entries.
+
+        Args:
+            archived: Entries moved from the outbox to the archive
+            purged: Archived entries deleted for exceeding retention
+            duration_seconds: Wall-clock time the run took
+        """
+        ...
+
+    def retention_failed(self, error: str) -> None:
+        """Called when a retention run fails."""
+        ...
+
     def handler_registered(
         self, handler_name: str, event_types: frozenset[str]
     ) -> None:
@@ -136,10 +176,23 @@ class DefaultOutboxWorkerProbe:
             error=error,
         )
 
-    def batch_processed(self, count: int) -> None:
-        """Log batch processing."""
-        if count > 0:
-            self._log.info("outbox_batch_processed", count=count)
+    def batch_processed(
+        self,
+        count: int,
+        duration_seconds: float | None = None,
+        lag_seconds: float | None = None,
+    ) -> None:
+        """Log batch processing with throughput and lag when known."""
+        if count <= 0:
+            return
+        metrics: dict[str, float] = {}
+        if duration_seconds is not None:
+            metrics["duration_seconds"] = round(duration_seconds, 3)
+            if duration_seconds > 0:
+                metrics["events_per_second"] = round(count / duration_seconds, 1)
+        if lag_seconds is not None:
+            metrics["lag_seconds"] = round(lag_seconds, 3)
+        self._log.info("outbox_batch_processed", count=count, **metrics)
 
     def listen_loop_started(self) -> None:
         """Log LISTEN loop start."""
@@ -153,6 +206,34 @@ class DefaultOutboxWorkerProbe:
         """Log poll loop error."""
         self._log.warning("outbox_poll_loop_error", error=error)
 
+    def shards_assigned(self, shards: list[int], shard_count: int) -> None:
+        """Log a change in shard ownership."""
+        self._log.info(
+            "outbox_shards_assigned",
+            shards=shards,
+            owned_count=len(shards),
+            shard_count=shard_count,
+        )
+
+    def shard_heartbeat_failed(self, error: str) -> None:
+        """Log a failed shard lease heartbeat."""
+        self._log.warning("outbox_shard_heartbeat_failed", error=error)
+
+    def retention_completed(
+        self, archived: int, purged: int, duration_seconds: float
+    ) -> None:
+        """Log a completed retention run."""
+        self._log.info(
+            "outbox_retention_completed",
+            archived=archived,
+            purged=purged,
+            duration_seconds=round(duration_seconds, 3),
+        )
+
+    def retention_failed(self, error: str) -> None:
+        """Log a failed retention run."""
+        self._log.warning("outbox_retention_failed", error=error)
+
     def handler_registered(
         self, handler_name: str, event_types: frozenset[str]
     ) -> None:
@@ -0,0 +1,28 @@
+"""Benchmark fixtures.
+
+Benchmarks are slow and environment-sensitive, so they are skipped unless
+``KARTOGRAPH_RUN_BENCHMARKS=1`` is set (see ``make test-benchmarks``).
+"""
+
+import os
+
+import pytest
+
+RUN_BENCHMARKS_ENV = "KARTOGRAPH_RUN_BENCHMARKS"
+
+
+def pytest_configure(config):
+    """Register custom markers."""
+    config.addinivalue_line(
+        "markers",
+        "benchmark: mark test as a performance benchmark (opt-in)",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if os.environ.get(RUN_BENCHMARKS_ENV) == "1":
+        return
+    skip = pytest.mark.skip(reason=f"set {RUN_BENCHMARKS_ENV}=1 to run benchmarks")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
@@ -0,0 +1,115 @@
+"""Benchmark: repeated full-refresh packaging, embedded content vs. blob store.
+
+Models a second full refresh of a repository in which 2% of files changed.
+"embedded" is the previous behaviour: every file is streamed into the new
+ZIP again. "blob store" writes only the changed files to the tenant's
+content store and references the rest, so the second package is built from
+a handful of writes. Both then materialize the package to a workdir.
+
+Run with::
+
+    KARTOGRAPH_RUN_BENCHMARKS=1 uv run pytest tests/benchmarks -s
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from shared_kernel.job_package.blob_store import ContentBlobStore
+from shared_kernel.job_package.builder import JobPackageBuilder
+from shared_kernel.job_package.reader import JobPackageReader
+from shared_kernel.job_package.value_objects import (
+    AdapterCheckpoint,
+    ChangeOperation,
+    ChangesetEntry,
+    SyncMode,
+)
+
+pytestmark = pytest.mark.benchmark
+
+_FILE_SIZE = 16 * 1024
+
+
+def _content(i: int, revision: int) -> bytes:
+    # Random bytes per file so DEFLATE cannot hide the I/O being measured
+    return f"# file {i} revision {revision}\n".encode() + os.urandom(_FILE_SIZE)
+
+
+def _build(
+    work_dir: Path, files: dict[str, bytes], blob_store: ContentBlobStore | None
+) -> Path:
+    builder = JobPackageBuilder(
+        data_source_id="ds",
+        knowledge_graph_id="kg",
+        sync_mode=SyncMode.FULL_REFRESH,
+        blob_store=blob_store,
+    )
+    for path, content in files.items():
+        ref = builder.add_content(content)
+        builder.add_changeset_entry(
+            ChangesetEntry(
+                operation=ChangeOperation.ADD,
+                id=path,
+                type="io.kartograph.change.file",
+                path=path,
+                content_ref=ref,
+                content_type="application/octet-stream",
+                metadata={},
+            )
+        )
+    builder.set_checkpoint(AdapterCheckpoint(schema_version="1.0.0", data={}))
+    return builder.build(work_dir)
+
+
+def _materialize(archive_path: Path, dest: Path) -> None:
+    with JobPackageReader(archive_path) as reader:
+        reader.extract_many(
+            ((change.path, change.content_ref) for change in reader.iter_changeset()),
+            dest,
+        )
+
+
+def _second_sync(
+    work_dir: Path, first: dict[str, bytes], second: dict[str, bytes], use_store: bool
+) -> tuple[float, int]:
+    work_dir.mkdir()
+    blob_store = (
+        ContentBlobStore(work_dir=work_dir, tenant_id="tenant") if use_store else None
+    )
+    _build(work_dir, first, blob_store)
+
+    start = time.perf_counter()
+    archive_path = _build(work_dir, second, blob_store)
+    _materialize(archive_path, work_dir / "workdir")
+    return time.perf_counter() - start, archive_path.stat().st_size
+
+
+@pytest.mark.parametrize("count", [2_000, 10_000])
+def test_blob_store_vs_embedded_repeated_sync(
+    count: int, tmp_path: Path, capsys: pytest.CaptureFixture
+) -> None:
+    first = {f"src/pkg_{i % 100}/module_{i}.py": _content(i, 0) for i in range(count)}
+    second = {
+        path: _content(i, 1) if i % 50 == 0 else content
+        for i, (path, content) in enumerate(first.items())
+    }
+
+    embedded_s, embedded_size = _second_sync(
+        tmp_path / "embedded", first, second, use_store=False
+    )
+    store_s, store_size = _second_sync(
+        tmp_path / "store", first, second, use_store=True
+    )
+
+    with capsys.disabled():
+        print(
+            f"\n{count:>7} files | embedded {embedded_s:6.2f}s "
+            f"({embedded_size / 2**20:6.1f} MiB) | blob store {store_s:6.2f}s "
+            f"({store_size / 2**20:6.1f} MiB) ({embedded_s / store_s:5.1f}x)"
+        )
+
+    assert store_size < embedded_size
@@ -0,0 +1,144 @@
+"""Benchmark: JobPackage build time and peak memory, buffered vs. streaming.
+
+Both start from content spooled to disk, as the GitHub adapter leaves it.
+"buffered" is the previous builder: every blob loaded into memory, hashed in
+a separate checksum pass, then deflated one by one regardless of type.
+"streaming" is the current builder fed the content files: one pass in digest
+order that hashes and writes each file in chunks, storing incompressible
+content uncompressed.
+
+A third of the files are random bytes typed ``image/png`` to stand in for
+already-compressed assets.
+
+Run with::
+
+    KARTOGRAPH_RUN_BENCHMARKS=1 uv run pytest tests/benchmarks -s
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import random
+import time
+import tracemalloc
+import zipfile
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from shared_kernel.job_package.builder import JobPackageBuilder
+from shared_kernel.job_package.value_objects import (
+    AdapterCheckpoint,
+    ChangeOperation,
+    ChangesetEntry,
+    ContentRef,
+    SyncMode,
+)
+
+pytestmark = pytest.mark.benchmark
+
+_CHECKPOINT = AdapterCheckpoint(schema_version="1.0.0", data={})
+
+
+def _files(count: int) -> list[tuple[str, str, bytes]]:
+    rng = random.Random(count)
+    files = []
+    for i in range(count):
+        if i % 3 == 0:
+            files.append((f"assets/{i}.png", "image/png", rng.randbytes(2048)))
+        else:
+            source = f"def function_{i}():\n    return {i}\n" * 40
+            files.append((f"src/module_{i}.py", "text/x-python", source.encode()))
+    return files
+
+
+def _entry(path: str, content_type: str, ref: ContentRef) -> ChangesetEntry:
+    return ChangesetEntry(
+        operation=ChangeOperation.ADD,
+        id=ref.hex_digest,
+        type="io.kartograph.change.file",
+        path=path,
+        content_ref=ref,
+        content_type=content_type,
+        metadata={},
+    )
+
+
+def _buffered_build(
+    spooled: list[tuple[str, str, ContentRef, Path]], out_dir: Path
+) -> None:
+    """The previous builder: in-memory store, checksum pass, deflate everything."""
+    content: dict[str, bytes] = {}
+    entries = []
+    for path, content_type, ref, content_path in spooled:
+        content[ref.hex_digest] = content_path.read_bytes()
+        entries.append(_entry(path, content_type, ref))
+    hasher = hashlib.sha256()
+    for hex_digest in sorted(content):
+        hasher.update(hex_digest.encode() + b"\n")
+        hasher.update(content[hex_digest])
+    with zipfile.ZipFile(
+        out_dir / "buffered.zip", mode="w", compression=zipfile.ZIP_DEFLATED
+    ) as zf:
+        zf.writestr("manifest.json", json.dumps({"checksum": hasher.hexdigest()}))
+        zf.writestr(
+            "changeset.jsonl",
+            "\n".join(json.dumps(entry.to_dict()) for entry in entries),
+        )
+        for hex_digest, raw in sorted(content.items()):
+            zf.writestr(f"content/{hex_digest}", raw)
+        zf.writestr("state.json", json.dumps(_CHECKPOINT.to_dict()))
+
+
+def _streaming_build(
+    spooled: list[tuple[str, str, ContentRef, Path]], out_dir: Path
+) -> None:
+    builder = JobPackageBuilder(
+        data_source_id="ds", knowledge_graph_id="kg", sync_mode=SyncMode.FULL_REFRESH
+    )
+    for path, content_type, ref, content_path in spooled:
+        builder.add_content_file(content_path, ref)
+        builder.add_changeset_entry(_entry(path, content_type, ref))
+    builder.set_checkpoint(_CHECKPOINT)
+    builder.build(out_dir)
+
+
+def _measure(fn: Any) -> tuple[float, int]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+@pytest.mark.parametrize("count", [10_000, 100_000])
+def test_streaming_vs_buffered_build(
+    count: int, tmp_path: Path, capsys: pytest.CaptureFixture
+) -> None:
+    files = _files(count)
+
+    spool = tmp_path / "spool"
+    spool.mkdir()
+    spooled = []
+    for path, content_type, raw in files:
+        ref = ContentRef.from_bytes(raw)
+        (spool / ref.hex_digest).write_bytes(raw)
+        spooled.append((path, content_type, ref, spool / ref.hex_digest))
+    total_bytes = sum(len(raw) for _, _, raw in files)
+
+    del files
+    buffered_s, buffered_peak = _measure(lambda: _buffered_build(spooled, tmp_path))
+    streaming_s, streaming_peak = _measure(lambda: _streaming_build(spooled, tmp_path))
+
+    with capsys.disabled():
+        print(
+            f"\n{count:>7} files ({total_bytes / 2**20:6.1f} MiB) | buffered "
+            f"{buffered_s:6.2f}s peak {buffered_peak / 2**20:7.1f} MiB | streaming "
+            f"{streaming_s:6.2f}s peak {streaming_peak / 2**20:7.1f} MiB"
+        )
+
+    assert streaming_peak < buffered_peak
@@ -0,0 +1,93 @@
+"""Benchmark: materializing a JobPackage, per-file reads vs. bulk extraction.
+
+"per-file" is the previous materializer loop: ``read_content`` for every
+changeset entry, each call opening the archive and parsing its central
+directory again, then writing the returned bytes. "bulk" opens the reader
+once and streams every entry to disk with ``extract_many``.
+
+Per-file cost grows quadratically with the entry count (every read parses
+the whole central directory), so the sizes are kept small enough for the
+baseline to finish; 3,000 files already take over a minute.
+
+Run with::
+
+    KARTOGRAPH_RUN_BENCHMARKS=1 uv run pytest tests/benchmarks -s
+"""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+import pytest
+
+from shared_kernel.job_package.builder import JobPackageBuilder
+from shared_kernel.job_package.reader import JobPackageReader
+from shared_kernel.job_package.value_objects import (
+    AdapterCheckpoint,
+    ChangeOperation,
+    ChangesetEntry,
+    SyncMode,
+)
+
+pytestmark = pytest.mark.benchmark
+
+
+def _build_package(out_dir: Path, count: int) -> Path:
+    builder = JobPackageBuilder(
+        data_source_id="ds", knowledge_graph_id="kg", sync_mode=SyncMode.FULL_REFRESH
+    )
+    for i in range(count):
+        ref = builder.add_content(f"def function_{i}():\n    return {i}\n".encode())
+        builder.add_changeset_entry(
+            ChangesetEntry(
+                operation=ChangeOperation.ADD,
+                id=ref.hex_digest,
+                type="io.kartograph.change.file",
+                path=f"src/pkg_{i % 100}/module_{i}.py",
+                content_ref=ref,
+                content_type="text/x-python",
+                metadata={},
+            )
+        )
+    builder.set_checkpoint(AdapterCheckpoint(schema_version="1.0.0", data={}))
+    return builder.build(out_dir)
+
+
+def _per_file(archive_path: Path, dest: Path) -> None:
+    reader = JobPackageReader(archive_path)
+    for change in reader.iter_changeset():
+        output_path = dest / change.path
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_bytes(reader.read_content(change.content_ref))
+
+
+def _bulk(archive_path: Path, dest: Path) -> None:
+    with JobPackageReader(archive_path) as reader:
+        reader.extract_many(
+            ((change.path, change.content_ref) for change in reader.iter_changeset()),
+            dest,
+        )
+
+
+@pytest.mark.parametrize("count", [1_000, 3_000])
+def test_bulk_vs_per_file_extraction(
+    count: int, tmp_path: Path, capsys: pytest.CaptureFixture
+) -> None:
+    archive_path = _build_package(tmp_path, count)
+
+    start = time.perf_counter()
+    _per_file(archive_path, tmp_path / "per-file")
+    per_file_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    _bulk(archive_path, tmp_path / "bulk")
+    bulk_s = time.perf_counter() - start
+
+    with capsys.disabled():
+        print(
+            f"\n{count:>7} files | per-file {per_file_s:6.2f}s | "
+            f"bulk {bulk_s:6.2f}s ({per_file_s / bulk_s:5.1f}x)"
+        )
+
+    assert bulk_s < per_file_s
@@ -0,0 +1,105 @@
+"""Benchmark: concurrent ``query_graph`` calls, inline vs. query executor.
+
+Fires N simultaneous ``query_graph`` calls at one event loop. The service is
+a stand-in whose ``execute_cypher_query`` blocks for a fixed time the way a
+psycopg2 round trip does, so the numbers isolate event-loop scheduling from
+the database. "inline" is the previous behaviour (the blocking call made
+directly from the tool coroutine); "executor" is the current tool.
+
+Run with::
+
+    KARTOGRAPH_RUN_BENCHMARKS=1 uv run pytest tests/benchmarks -s
+"""
+
+from __future__ import annotations
+
+import asyncio
+import statistics
+import time
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+import query.presentation.mcp as mcp_module
+from query.domain.value_objects import CypherQueryResult, QueryResultRow
+from query.infrastructure.query_executor import BlockingQueryExecutor
+from query.presentation.mcp import query_graph
+
+pytestmark = pytest.mark.benchmark
+
+QUERY_SECONDS = 0.02
+EXECUTOR_WORKERS = 10
+
+
+class _BlockingService:
+    """Answers every query after blocking the calling thread."""
+
+    def execute_cypher_query(self, query: str, **_: Any) -> CypherQueryResult:
+        time.sleep(QUERY_SECONDS)
+        return CypherQueryResult(
+            rows=[{"value": 1}], row_count=1, truncated=False, execution_time_ms=0.0
+        )
+
+
+class _PassthroughEnclave:
+    async def apply_redaction(self, rows: list[QueryResultRow]) -> list[QueryResultRow]:
+        return rows
+
+
+async def _inline_query_graph(cypher: str, service: _BlockingService) -> None:
+    """The previous tool body: the blocking call runs on the event loop."""
+    service.execute_cypher_query(query=cypher)
+
+
+async def _timed(call: Any, arrived: float) -> float:
+    """Latency from the moment every call arrived until this one returned."""
+    await call
+    return time.perf_counter() - arrived
+
+
+async def _run(concurrency: int, inline: bool) -> list[float]:
+    service = _BlockingService()
+    calls = [
+        _inline_query_graph("MATCH (n) RETURN n", service)
+        if inline
+        else query_graph.fn(cypher="MATCH (n) RETURN n", service=service)
+        for _ in range(concurrency)
+    ]
+    arrived = time.perf_counter()
+    return list(await asyncio.gather(*(_timed(call, arrived) for call in calls)))
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    return statistics.quantiles(samples, n=100, method="inclusive")[int(pct) - 1]
+
+
+@pytest.mark.parametrize("concurrency", [10, 50, 200])
+def test_query_graph_concurrency(
+    concurrency: int, capsys: pytest.CaptureFixture
+) -> None:
+    executor = BlockingQueryExecutor(max_workers=EXECUTOR_WORKERS)
+    try:
+        with (
+            patch.object(
+                mcp_module,
+                "get_mcp_secure_enclave",
+                return_value=_PassthroughEnclave(),
+            ),
+            patch.object(mcp_module, "get_query_executor", return_value=executor),
+        ):
+            inline = asyncio.run(_run(concurrency, inline=True))
+            offloaded = asyncio.run(_run(concurrency, inline=False))
+    finally:
+        executor.shutdown()
+
+    with capsys.disabled():
+        print(
+            f"\n{concurrency:>4} calls | inline p50 "
+            f"{_percentile(inline, 50) * 1000:8.1f} ms p99 "
+            f"{_percentile(inline, 99) * 1000:8.1f} ms | executor p50 "
+            f"{_percentile(offloaded, 50) * 1000:8.1f} ms p99 "
+            f"{_percentile(offloaded, 99) * 1000:8.1f} ms"
+        )
+
+    assert _percentile(offloaded, 99) < _percentile(inline, 99)
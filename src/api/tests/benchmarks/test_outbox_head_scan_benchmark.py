@@ -0,0 +1,124 @@
+"""Benchmark: outbox head-scan latency as processed history grows.
+
+Copies the ``outbox`` table definition (columns and indexes, including the
+``idx_outbox_pending`` partial index) into a temporary table, then times the
+worker's head query with only pending rows present and again after loading
+a large number of processed rows, as happens when retention falls behind.
+Because the partial index only contains pending rows, head-scan latency
+should stay flat regardless of history.
+
+Needs a migrated database (``DatabaseSettings`` from the environment). The
+history size defaults to 10M rows; override it with
+``KARTOGRAPH_BENCH_OUTBOX_HISTORY_ROWS``.
+
+Run with::
+
+    KARTOGRAPH_RUN_BENCHMARKS=1 uv run pytest tests/benchmarks -s
+"""
+
+from __future__ import annotations
+
+import os
+import statistics
+import time
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from infrastructure.database.engines import create_write_engine
+from infrastructure.settings import get_database_settings
+
+pytestmark = pytest.mark.benchmark
+
+HISTORY_ROWS = int(os.environ.get("KARTOGRAPH_BENCH_OUTBOX_HISTORY_ROWS", "10000000"))
+PENDING_ROWS = 1_000
+BATCH_SIZE = 100
+SAMPLES = 200
+
+# The worker's head query (OutboxWorker._process_batch), against the copy.
+HEAD_QUERY = text(
+    "SELECT id FROM outbox_bench "
+    "WHERE processed_at IS NULL AND failed_at IS NULL "
+    "ORDER BY created_at LIMIT :limit FOR UPDATE SKIP LOCKED"
+)
+
+_INSERT_ROWS = """
+INSERT INTO outbox_bench (
+    id, aggregate_type, aggregate_id, event_type, payload,
+    occurred_at, created_at, processed_at
+)
+SELECT
+    gen_random_uuid(), 'group', 'group-' || (n % 1000), 'GroupCreated',
+    '{{}}'::json, NOW() - make_interval(secs => n), NOW() - make_interval(secs => n),
+    {processed_at}
+FROM generate_series(1, :count) AS n
+"""
+
+
+async def _head_scan_latencies(conn: AsyncConnection) -> list[float]:
+    latencies = []
+    for _ in range(SAMPLES):
+        start = time.perf_counter()
+        await conn.execute(HEAD_QUERY, {"limit": BATCH_SIZE})
+        latencies.append(time.perf_counter() - start)
+        # Release the row locks, as the worker's commit would
+        await conn.rollback()
+    return latencies
+
+
+@pytest.mark.asyncio
+async def test_head_scan_latency_flat_with_history(
+    capsys: pytest.CaptureFixture,
+) -> None:
+    engine = create_write_engine(get_database_settings())
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(
+                text(
+                    "CREATE TEMP TABLE outbox_bench "
+                    "(LIKE outbox INCLUDING ALL) ON COMMIT PRESERVE ROWS"
+                )
+            )
+            await conn.execute(
+                text(_INSERT_ROWS.format(processed_at="NULL")),
+                {"count": PENDING_ROWS},
+            )
+            await conn.execute(text("ANALYZE outbox_bench"))
+            await conn.commit()
+            baseline = await _head_scan_latencies(conn)
+
+            await conn.execute(
+                text(_INSERT_ROWS.format(processed_at="NOW()")),
+                {"count": HISTORY_ROWS},
+            )
+            await conn.execute(text("ANALYZE outbox_bench"))
+            await conn.commit()
+            with_history = await _head_scan_latencies(conn)
+
+            plan = "\n".join(
+                (
+                    await conn.execute(
+                        text(f"EXPLAIN {HEAD_QUERY.text}"), {"limit": BATCH_SIZE}
+                    )
+                ).scalars()
+            )
+            await conn.rollback()
+    finally:
+        await engine.dispose()
+
+    baseline_p50 = statistics.median(baseline)
+    history_p50 = statistics.median(with_history)
+
+    with capsys.disabled():
+        print(
+            f"\nhead scan p50 | {PENDING_ROWS} pending: {baseline_p50 * 1000:.3f} ms"
+            f" | + {HISTORY_ROWS:,} processed: {history_p50 * 1000:.3f} ms"
+            f"\n{plan}"
+        )
+
+    # The copy of idx_outbox_pending serves the scan; history is never read
+    assert "Index Scan" in plan
+    assert "Seq Scan" not in plan
+    # Flat: within 2x of the baseline, with 1ms slack for timer noise
+    assert history_p50 <= baseline_p50 * 2 + 0.001
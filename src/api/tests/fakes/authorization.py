@@ -79,6 +79,8 @@ class InMemoryAuthorizationProvider:
 
     def __init__(self) -> None:
         self._relationships: list[_StoredRelationship] = []
+        # Requests of each bulk_check_permission call, for round-trip assertions
+        self.bulk_check_calls: list[list[CheckRequest]] = []
 
     # ------------------------------------------------------------------
     # Helpers
@@ -220,6 +222,7 @@ class InMemoryAuthorizationProvider:
         requests: list[CheckRequest],
     ) -> set[str]:
         """Return the set of resource identifiers that passed permission checks."""
+        self.bulk_check_calls.append(list(requests))
         permitted: set[str] = set()
         for req in requests:
             if await self.check_permission(req.resource, req.permission, req.subject):
@@ -249,6 +252,15 @@ class InMemoryAuthorizationProvider:
         }
         self._relationships = [r for r in self._relationships if r not in to_remove]
 
+    async def update_relationships(
+        self,
+        writes: list[RelationshipSpec],
+        deletes: list[RelationshipSpec],
+    ) -> None:
+        """Apply relationship deletes and writes together."""
+        await self.delete_relationships(deletes)
+        await self.write_relationships(writes)
+
     async def delete_relationships_by_filter(
         self,
         resource_type: str,
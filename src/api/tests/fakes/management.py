@@ -40,6 +40,8 @@ class InMemoryKnowledgeGraphRepository:
         self._ontology_store: dict[str, OntologyConfig] = {}
         self.saved: list[KnowledgeGraph] = []
         self.deleted: list[KnowledgeGraph] = []
+        # IDs requested by each find_by_ids_and_tenant call
+        self.find_by_ids_calls: list[list[str]] = []
 
     def seed(self, *kgs: KnowledgeGraph) -> None:
         """Pre-populate the store (used in test setup)."""
@@ -58,6 +60,26 @@ class InMemoryKnowledgeGraphRepository:
     async def find_by_tenant(self, tenant_id: str) -> list[KnowledgeGraph]:
         return [kg for kg in self._store.values() if kg.tenant_id == tenant_id]
 
+    async def find_by_ids_and_tenant(
+        self,
+        knowledge_graph_ids: list[str],
+        tenant_id: str,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> list[KnowledgeGraph]:
+        self.find_by_ids_calls.append(list(knowledge_graph_ids))
+        wanted = set(knowledge_graph_ids)
+        kgs = sorted(
+            (
+                kg
+                for kg in self._store.values()
+                if kg.id.value in wanted and kg.tenant_id == tenant_id
+            ),
+            key=lambda kg: (kg.name, kg.id.value),
+        )
+        end = None if limit is None else offset + limit
+        return kgs[offset:end]
+
     async def find_all(self) -> list[KnowledgeGraph]:
         return list(self._store.values())
 
@@ -113,6 +135,12 @@ class InMemoryDataSourceRepository:
             if ds.knowledge_graph_id == knowledge_graph_id
         ]
 
+    async def find_by_knowledge_graphs(
+        self, knowledge_graph_ids: list[str]
+    ) -> list[DataSource]:
+        wanted = set(knowledge_graph_ids)
+        return [ds for ds in self._store.values() if ds.knowledge_graph_id in wanted]
+
     async def delete(self, data_source: DataSource) -> bool:
         self.deleted.append(data_source)
         if self._call_log is not None:
@@ -19,6 +19,7 @@ from pydantic import SecretStr
 from sqlalchemy import CursorResult, text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from iam.dependencies.user import get_provisioned_user_memo
 from iam.domain.aggregates import Tenant
 from iam.domain.value_objects import TenantId
 from iam.infrastructure.group_repository import GroupRepository
@@ -181,6 +182,8 @@ async def clean_iam_data(
             probe.table_cleaned("tenants", tenants_result.rowcount)
 
             await async_session.commit()
+            # Deleted users must be JIT provisioned again on their next request
+            get_provisioned_user_memo.cache_clear()
             probe.cleanup_completed(tables_cleaned=7)
 
         except Exception as e:
@@ -0,0 +1,87 @@
+"""Integration tests for per-tenant SpiceDB ZedTokens in Postgres.
+
+Requirements:
+    - PostgreSQL with migrations applied
+"""
+
+from collections.abc import AsyncGenerator
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+from ulid import ULID
+
+from infrastructure.outbox.zed_tokens import TenantZedTokenRepository
+
+pytestmark = pytest.mark.integration
+
+
+@pytest_asyncio.fixture
+async def tenant_id(async_session: AsyncSession) -> AsyncGenerator[str, None]:
+    """Provide a fresh tenant ID and delete its token row afterwards."""
+    tenant_id = str(ULID())
+    yield tenant_id
+    await async_session.rollback()
+    await async_session.execute(
+        text("DELETE FROM spicedb_zed_tokens WHERE tenant_id = :tenant_id"),
+        {"tenant_id": tenant_id},
+    )
+    await async_session.commit()
+
+
+class TestTenantZedTokenRepository:
+    """Tests for recording and reading tenant ZedTokens."""
+
+    @pytest.mark.asyncio
+    async def test_unknown_tenant_has_no_token(
+        self, async_session: AsyncSession, tenant_id: str
+    ) -> None:
+        tokens = TenantZedTokenRepository(async_session)
+
+        assert await tokens.get(tenant_id) is None
+        assert await tokens.writes(tenant_id) == 0
+
+    @pytest.mark.asyncio
+    async def test_sequential_writes_keep_the_newest_token(
+        self, async_session: AsyncSession, tenant_id: str
+    ) -> None:
+        tokens = TenantZedTokenRepository(async_session)
+
+        await tokens.record(tenant_id, writes_seen=0, token="rev-1")
+        await tokens.record(tenant_id, writes_seen=1, token="rev-2")
+        await async_session.commit()
+
+        assert await tokens.get(tenant_id) == "rev-2"
+        assert await tokens.writes(tenant_id) == 2
+
+    @pytest.mark.asyncio
+    async def test_overlapping_write_clears_the_token(
+        self, async_session: AsyncSession, tenant_id: str
+    ) -> None:
+        """Both writes saw no earlier write, so neither token covers the other."""
+        tokens = TenantZedTokenRepository(async_session)
+
+        await tokens.record(tenant_id, writes_seen=0, token="rev-1")
+        await tokens.record(tenant_id, writes_seen=0, token="rev-2")
+        await async_session.commit()
+
+        assert await tokens.get(tenant_id) is None
+
+        await tokens.record(tenant_id, writes_seen=2, token="rev-3")
+        await async_session.commit()
+
+        assert await tokens.get(tenant_id) == "rev-3"
+
+    @pytest.mark.asyncio
+    async def test_forget_all_clears_the_token(
+        self, async_session: AsyncSession, tenant_id: str
+    ) -> None:
+        tokens = TenantZedTokenRepository(async_session)
+        await tokens.record(tenant_id, writes_seen=0, token="rev-1")
+
+        await tokens.forget_all()
+        await async_session.commit()
+
+        assert await tokens.get(tenant_id) is None
+        assert await tokens.writes(tenant_id) == 2
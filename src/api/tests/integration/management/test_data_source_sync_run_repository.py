@@ -456,6 +456,14 @@ class TestFindByDataSource:
 
         assert [run.id for run in results] == [newest_id, middle_id, oldest_id]
 
+        latest = await data_source_sync_run_repository.get_latest_for_data_sources(
+            [ds.id.value, "never-synced"]
+        )
+
+        assert {ds_id: run.id for ds_id, run in latest.items()} == {
+            ds.id.value: newest_id
+        }
+
     @pytest.mark.asyncio
     async def test_returns_empty_for_data_source_with_no_runs(
         self,
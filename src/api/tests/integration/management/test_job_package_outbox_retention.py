@@ -0,0 +1,131 @@
+"""Integration tests for JobPackage lookups across outbox retention.
+
+Outbox retention moves processed JobPackage events into ``outbox_archive``;
+extraction and management must keep finding the packages they name.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from ulid import ULID
+
+from extraction.infrastructure.prepared_job_package_reader import (
+    SqlPreparedJobPackageReader,
+)
+from infrastructure.outbox.models import OutboxModel
+from infrastructure.outbox.retention import OutboxRetention
+from management.infrastructure.job_package_archive_reader import (
+    SqlJobPackageArchiveReader,
+)
+from shared_kernel.job_package.builder import JobPackageBuilder
+from shared_kernel.job_package.value_objects import (
+    AdapterCheckpoint,
+    ChangeOperation,
+    ChangesetEntry,
+    JobPackageId,
+    SyncMode,
+)
+
+pytestmark = pytest.mark.integration
+
+
+def _build_package(
+    work_dir: Path, package_id: str, data_source_id: str, knowledge_graph_id: str
+) -> None:
+    builder = JobPackageBuilder(
+        data_source_id=data_source_id,
+        knowledge_graph_id=knowledge_graph_id,
+        sync_mode=SyncMode.FULL_REFRESH,
+        package_id=JobPackageId(value=package_id),
+    )
+    builder.add_changeset_entry(
+        ChangesetEntry(
+            operation=ChangeOperation.ADD,
+            id="file-1",
+            type="io.kartograph.change.file",
+            path="pkg/api/example.go",
+            content_ref=builder.add_content(b"package api\n"),
+            content_type="text/plain",
+            metadata={},
+        )
+    )
+    builder.set_checkpoint(
+        AdapterCheckpoint(schema_version="1.0.0", data={"commit_sha": "abc"})
+    )
+    builder.build(work_dir)
+
+
+@pytest.mark.asyncio
+async def test_archived_job_package_events_are_still_found(
+    async_session: AsyncSession,
+    session_factory: async_sessionmaker[AsyncSession],
+    tmp_path: Path,
+) -> None:
+    """Readers find a JobPackage whose event was archived and is past purge age."""
+    data_source_id = str(ULID())
+    knowledge_graph_id = str(ULID())
+    package_id = str(ULID())
+    event_id = uuid4()
+    _build_package(tmp_path, package_id, data_source_id, knowledge_graph_id)
+    processed_at = datetime.now(UTC) - timedelta(days=60)
+    async_session.add(
+        OutboxModel(
+            id=event_id,
+            aggregate_type="data_source",
+            aggregate_id=data_source_id,
+            event_type="JobPackageProduced",
+            payload={
+                "data_source_id": data_source_id,
+                "knowledge_graph_id": knowledge_graph_id,
+                "job_package_id": package_id,
+            },
+            occurred_at=processed_at,
+            processed_at=processed_at,
+        )
+    )
+    await async_session.commit()
+
+    try:
+        retention = OutboxRetention(
+            session_factory=session_factory,
+            probe=MagicMock(),
+            archive_after=timedelta(hours=24),
+            purge_after=timedelta(days=30),
+        )
+        await retention.run()
+
+        in_outbox = await async_session.execute(
+            text("SELECT count(*) FROM outbox WHERE id = :id"), {"id": event_id}
+        )
+        assert in_outbox.scalar_one() == 0
+        in_archive = await async_session.execute(
+            text("SELECT count(*) FROM outbox_archive WHERE id = :id"),
+            {"id": event_id},
+        )
+        assert in_archive.scalar_one() == 1
+
+        prepared = await SqlPreparedJobPackageReader(
+            session=async_session, job_package_work_dir=tmp_path
+        ).list_latest_for_knowledge_graph(knowledge_graph_id=knowledge_graph_id)
+        assert [source.package_id for source in prepared] == [package_id]
+
+        latest = await SqlJobPackageArchiveReader(
+            session=async_session, job_package_work_dir=tmp_path
+        ).latest_job_package_id_for_data_source(data_source_id=data_source_id)
+        assert latest == package_id
+    finally:
+        await async_session.rollback()
+        await async_session.execute(
+            text("DELETE FROM outbox_archive WHERE id = :id"), {"id": event_id}
+        )
+        await async_session.execute(
+            text("DELETE FROM outbox WHERE id = :id"), {"id": event_id}
+        )
+        await async_session.commit()
@@ -432,6 +432,70 @@ class TestFindByTenant:
         assert results == []
 
 
+class TestFindByIdsAndTenant:
+    """Tests for batched knowledge graph loading."""
+
+    @pytest.mark.asyncio
+    async def test_loads_requested_kgs_in_name_order_with_paging(
+        self,
+        knowledge_graph_repository: KnowledgeGraphRepository,
+        async_session,
+        test_tenant: str,
+        test_workspace: str,
+        clean_management_data,
+    ):
+        """Should return only the requested KGs, ordered by name and paged."""
+        kgs = [
+            KnowledgeGraph.create(
+                tenant_id=test_tenant,
+                workspace_id=test_workspace,
+                name=name,
+                description="",
+            )
+            for name in ("Charlie", "Alpha", "Bravo", "Unrequested")
+        ]
+        async with async_session.begin():
+            for kg in kgs:
+                await knowledge_graph_repository.save(kg)
+
+        requested = [kg.id.value for kg in kgs[:3]] + ["nonexistent"]
+
+        all_results = await knowledge_graph_repository.find_by_ids_and_tenant(
+            requested, test_tenant
+        )
+        page = await knowledge_graph_repository.find_by_ids_and_tenant(
+            requested, test_tenant, limit=1, offset=1
+        )
+
+        assert [kg.name for kg in all_results] == ["Alpha", "Bravo", "Charlie"]
+        assert [kg.name for kg in page] == ["Bravo"]
+
+    @pytest.mark.asyncio
+    async def test_excludes_kgs_of_other_tenants(
+        self,
+        knowledge_graph_repository: KnowledgeGraphRepository,
+        async_session,
+        test_tenant: str,
+        test_workspace: str,
+        clean_management_data,
+    ):
+        """Should not return a requested KG that belongs to another tenant."""
+        kg = KnowledgeGraph.create(
+            tenant_id=test_tenant,
+            workspace_id=test_workspace,
+            name="Tenant KG",
+            description="",
+        )
+        async with async_session.begin():
+            await knowledge_graph_repository.save(kg)
+
+        results = await knowledge_graph_repository.find_by_ids_and_tenant(
+            [kg.id.value], "other-tenant"
+        )
+
+        assert results == []
+
+
 class TestOutboxConsistency:
     """Tests verifying outbox events are recorded with aggregate operations."""
 
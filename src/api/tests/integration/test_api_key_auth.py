@@ -21,6 +21,7 @@ from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from iam.application.security import extract_prefix, generate_api_key_secret
+from iam.dependencies.api_key import flush_api_key_usage
 from iam.domain.value_objects import APIKeyId
 from iam.infrastructure.outbox import IAMEventTranslator
 from infrastructure.authorization_dependencies import get_spicedb_client
@@ -259,6 +260,9 @@ class TestAPIKeyAuthentication:
         )
         assert auth_response.status_code == 200
 
+        # Usage is recorded in memory; persist it as the background task would
+        await flush_api_key_usage(app.state.write_sessionmaker)
+
         # Check that last_used_at was updated
         list_response_after = await async_client.get(
             "/iam/api-keys",
@@ -9,6 +9,7 @@ These tests verify that the bulk loading strategy correctly handles:
 6. Label validation - invalid label names are rejected
 7. UPDATE/DELETE operations work correctly
 8. Advisory locks are stable across Python versions
+9. A failed chunked apply resumes from its persisted checkpoint
 """
 
 import hashlib
@@ -19,6 +20,7 @@ from graph.domain.value_objects import (
     EntityType,
     MutationOperation,
     MutationOperationType,
+    MutationResult,
 )
 from graph.infrastructure.age_bulk_loading import (
     AgeBulkLoadingStrategy,
@@ -26,6 +28,11 @@ from graph.infrastructure.age_bulk_loading import (
     validate_label_name,
 )
 from graph.infrastructure.age_client import AgeGraphClient
+from graph.infrastructure.mutation_applier import MutationApplier
+from graph.infrastructure.mutation_checkpoint import (
+    PostgresMutationCheckpoint,
+    mutation_log_digest,
+)
 from graph.infrastructure.observability import DefaultMutationProbe
 
 
@@ -1473,6 +1480,189 @@ class TestCartesianJoinFix:
         assert query_result.rows[0][0] == 19
 
 
+# =============================================================================
+# MIXED-CASE LABEL RESOLUTION TESTS
+# =============================================================================
+
+
+def _mixed_case_nodes(prefix: str) -> list[MutationOperation]:
+    return [
+        MutationOperation(
+            op=MutationOperationType.CREATE,
+            type=EntityType.NODE,
+            id=f"workitem:{prefix}{i:04x}",
+            label="WorkItem",
+            set_properties={
+                "slug": f"work-item-{prefix}{i:04x}",
+                "name": f"Work item {i}",
+                "data_source_id": "ds-123",
+                "source_path": "test.md",
+            },
+        )
+        for i in range(2)
+    ]
+
+
+@pytest.mark.integration
+class TestMixedCaseLabels:
+    """IDs resolve against labels whose names are not lowercase."""
+
+    def test_edges_between_pascal_case_nodes_resolve(self, clean_graph: AgeGraphClient):
+        """Edge endpoints resolve through the WorkItem label table."""
+        strategy = AgeBulkLoadingStrategy()
+        probe = DefaultMutationProbe()
+        strategy.apply_batch(
+            client=clean_graph,
+            operations=_mixed_case_nodes("ac1ed0000000"),
+            probe=probe,
+            graph_name=clean_graph.graph_name,
+        )
+
+        result = strategy.apply_batch(
+            client=clean_graph,
+            operations=[
+                MutationOperation(
+                    op=MutationOperationType.CREATE,
+                    type=EntityType.EDGE,
+                    id="blocks:ac1ed00000000001",
+                    label="BLOCKS",
+                    start_id="workitem:ac1ed00000000000",
+                    end_id="workitem:ac1ed00000000001",
+                    set_properties={
+                        "data_source_id": "ds-123",
+                        "source_path": "test.md",
+                    },
+                ),
+            ],
+            probe=probe,
+            graph_name=clean_graph.graph_name,
+        )
+
+        assert result.success is True
+        query_result = clean_graph.execute_cypher(
+            "MATCH (:WorkItem)-[r:BLOCKS]->(:WorkItem) RETURN count(r)"
+        )
+        assert query_result.rows[0][0] == 1
+
+    def test_update_and_delete_pascal_case_nodes(self, clean_graph: AgeGraphClient):
+        """Set-based UPDATE and DELETE find nodes of the WorkItem label."""
+        strategy = AgeBulkLoadingStrategy()
+        probe = DefaultMutationProbe()
+        strategy.apply_batch(
+            client=clean_graph,
+            operations=_mixed_case_nodes("ac1ed1111111"),
+            probe=probe,
+            graph_name=clean_graph.graph_name,
+        )
+
+        result = strategy.apply_batch(
+            client=clean_graph,
+            operations=[
+                MutationOperation(
+                    op=MutationOperationType.UPDATE,
+                    type=EntityType.NODE,
+                    id="workitem:ac1ed11111110000",
+                    label="WorkItem",
+                    set_properties={"status": "done"},
+                ),
+                MutationOperation(
+                    op=MutationOperationType.DELETE,
+                    type=EntityType.NODE,
+                    id="workitem:ac1ed11111110001",
+                    label="WorkItem",
+                ),
+            ],
+            probe=probe,
+            graph_name=clean_graph.graph_name,
+        )
+
+        assert result.success is True
+        query_result = clean_graph.execute_cypher(
+            "MATCH (w:WorkItem) WHERE w.id STARTS WITH 'workitem:ac1ed1111111' "
+            "RETURN w.status"
+        )
+        assert [row[0] for row in query_result.rows] == ["done"]
+
+
+class _FailSecondChunkStrategy(AgeBulkLoadingStrategy):
+    """AGE strategy whose second call fails without touching the graph."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = 0
+
+    def apply_batch(self, client, operations, probe, graph_name) -> MutationResult:
+        self.calls += 1
+        if self.calls == 2:
+            return MutationResult(
+                success=False, operations_applied=0, errors=["worker crashed"]
+            )
+        return super().apply_batch(client, operations, probe, graph_name)
+
+
+@pytest.mark.integration
+class TestResumableChunkedApply:
+    """A failed chunked apply resumes after its last committed chunk."""
+
+    def test_failed_apply_resumes_from_persisted_checkpoint(
+        self, clean_graph: AgeGraphClient
+    ):
+        """The retry skips committed chunks and clears the checkpoint."""
+        operations = [
+            MutationOperation(
+                op=MutationOperationType.CREATE,
+                type=EntityType.NODE,
+                id=f"resumable:7e5e0000000{i:05x}",
+                label="resumable",
+                set_properties={
+                    "slug": f"resumable-{i}",
+                    "name": f"Resumable {i}",
+                    "data_source_id": "ds-123",
+                    "source_path": "test.md",
+                },
+            )
+            for i in range(5)
+        ]
+        checkpoint = PostgresMutationCheckpoint(
+            clean_graph.raw_connection,
+            knowledge_graph_id="01JRESUMABLECHECKPOINT0000",
+            log_digest=mutation_log_digest(operations),
+        )
+        try:
+            failing = _FailSecondChunkStrategy()
+            failed = MutationApplier(
+                client=clean_graph,
+                bulk_loading_strategy=failing,
+                chunk_size=2,
+                checkpoint=checkpoint,
+            ).apply_batch(operations, resume_from=checkpoint.load())
+
+            assert failed.success is False
+            assert checkpoint.load() == 2
+            committed = clean_graph.execute_cypher(
+                "MATCH (n:resumable) RETURN count(n)"
+            )
+            assert committed.rows[0][0] == 2
+
+            resuming = _FailSecondChunkStrategy()
+            resuming.calls = 2
+            resumed = MutationApplier(
+                client=clean_graph,
+                bulk_loading_strategy=resuming,
+                chunk_size=2,
+                checkpoint=checkpoint,
+            ).apply_batch(operations, resume_from=checkpoint.load())
+
+            assert resumed.success is True
+            assert resumed.operations_applied == 5
+            assert resuming.calls == 4
+            assert checkpoint.load() == 0
+            applied = clean_graph.execute_cypher("MATCH (n:resumable) RETURN count(n)")
+            assert applied.rows[0][0] == 5
+        finally:
+            checkpoint.clear()
+
+
 # =============================================================================
 # P2: OPERATION COUNT OFF-BY-ONE TESTS
 # =============================================================================
@@ -4,12 +4,16 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from extraction.domain.extraction_job import ExtractionTargetInstance
+from extraction.domain.extraction_job import (
+    ExtractionTargetFile,
+    ExtractionTargetInstance,
+)
 from extraction.domain.prepared_job_package_source import PreparedJobPackageSource
 from extraction.infrastructure.extraction_job_repository_files import (
     collect_instance_repository_paths,
     materialize_all_repository_files,
     materialize_instance_repository_paths,
+    materialize_target_files,
 )
 from shared_kernel.job_package.builder import JobPackageBuilder
 from shared_kernel.job_package.value_objects import (
@@ -181,3 +185,34 @@ def test_materialize_instance_repository_paths_matches_directory_config_path_pre
     assert result.files_written == 1
     assert result.paths_not_found == ()
     assert output.read_text(encoding="utf-8") == "transport: maestro\n"
+
+
+def test_materialize_target_files_writes_requested_paths(tmp_path: Path) -> None:
+    package_id = "01JTESTPACK0000000000000004"
+    _build_package(tmp_path, package_id, "pkg/adapter/adapter.go", b"package adapter\n")
+    repo_dir = tmp_path / "repository-files"
+
+    result = materialize_target_files(
+        repository_files_dir=repo_dir,
+        job_package_work_dir=tmp_path,
+        target_files=(
+            ExtractionTargetFile(
+                path="pkg/adapter/adapter.go",
+                repository_folder="hyperfleet-e2e",
+                package_id=package_id,
+            ),
+            ExtractionTargetFile(
+                path="pkg/adapter/missing.go",
+                repository_folder="hyperfleet-e2e",
+                package_id=package_id,
+            ),
+        ),
+        packages_by_id={package_id: _source(package_id=package_id)},
+    )
+
+    assert result.files_written == 1
+    assert result.packages_found == 1
+    assert result.sample_paths == ("hyperfleet-e2e/pkg/adapter/adapter.go",)
+    assert (repo_dir / "hyperfleet-e2e" / "pkg/adapter/adapter.go").read_text(
+        encoding="utf-8"
+    ) == "package adapter\n"
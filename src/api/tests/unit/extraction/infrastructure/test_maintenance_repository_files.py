@@ -16,6 +16,7 @@ from extraction.infrastructure.extraction_job_repository_files import (
     RepositoryFilesMaterializationResult,
 )
 from shared_kernel.job_package.builder import JobPackageBuilder
+from shared_kernel.job_package.reader import JobPackageReader
 from shared_kernel.job_package.value_objects import (
     AdapterCheckpoint,
     ChangeOperation,
@@ -36,25 +37,33 @@ def _source(
     )
 
 
-def _build_package(work_dir: Path, package_id: str, path: str, content: bytes) -> None:
+def _build_package(
+    work_dir: Path,
+    package_id: str,
+    path: str,
+    content: bytes,
+    extra_files: dict[str, bytes] | None = None,
+) -> None:
     builder = JobPackageBuilder(
         data_source_id="ds-1",
         knowledge_graph_id="kg-1",
         sync_mode=SyncMode.FULL_REFRESH,
         package_id=JobPackageId(value=package_id),
     )
-    ref = builder.add_content(content)
-    builder.add_changeset_entry(
-        ChangesetEntry(
-            operation=ChangeOperation.ADD,
-            id="file-1",
-            type="io.kartograph.change.file",
-            path=path,
-            content_ref=ref,
-            content_type="text/plain",
-            metadata={},
+    for index, (file_path, file_content) in enumerate(
+        {path: content, **(extra_files or {})}.items(), start=1
+    ):
+        builder.add_changeset_entry(
+            ChangesetEntry(
+                operation=ChangeOperation.ADD,
+                id=f"file-{index}",
+                type="io.kartograph.change.file",
+                path=file_path,
+                content_ref=builder.add_content(file_content),
+                content_type="text/plain",
+                metadata={},
+            )
         )
-    )
     builder.set_checkpoint(
         AdapterCheckpoint(schema_version="1.0.0", data={"commit_sha": "0b64088c"})
     )
@@ -116,6 +125,53 @@ async def test_materialize_maintenance_target_files_writes_commit_scoped_paths(
     assert "@@ -1 +1 @@" in diff_path.read_text(encoding="utf-8")
 
 
+@pytest.mark.asyncio
+async def test_materialize_maintenance_target_files_streams_each_package_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    package_id = "01JTESTPACK0000000000000000"
+    _build_package(
+        tmp_path,
+        package_id,
+        "src/foo.go",
+        b"package foo\n",
+        extra_files={"src/bar.go": b"package bar\n"},
+    )
+    repo_dir = tmp_path / "repository-files"
+    opened: list[Path] = []
+    original_init = JobPackageReader.__init__
+
+    def tracking_init(self: JobPackageReader, archive_path: Path) -> None:
+        opened.append(archive_path)
+        original_init(self, archive_path)
+
+    def no_per_file_reads(*_args: object) -> bytes:
+        raise AssertionError("content must be streamed with extract_many")
+
+    monkeypatch.setattr(JobPackageReader, "__init__", tracking_init)
+    monkeypatch.setattr(JobPackageReader, "read_content", no_per_file_reads)
+
+    result = await materialize_maintenance_target_files(
+        repository_files_dir=repo_dir,
+        job_package_work_dir=tmp_path,
+        target_files=(
+            _target_file(path="src/foo.go", patch=None),
+            _target_file(path="src/bar.go", patch=None),
+            _target_file(path="src/missing.go", patch=None),
+        ),
+        packages_by_id={package_id: _source(package_id=package_id)},
+    )
+
+    head_dir = repo_dir / "0b64088c" / "hyperfleet-api"
+    assert len(opened) == 1
+    assert result.files_written == 2
+    assert (head_dir / "src/foo.go").read_bytes() == b"package foo\n"
+    assert (head_dir / "src/bar.go").read_bytes() == b"package bar\n"
+    assert result.warnings == (
+        "HEAD content missing in JobPackage for hyperfleet-api/src/missing.go",
+    )
+
+
 @pytest.mark.asyncio
 async def test_materialize_maintenance_target_files_added_skips_baseline_fetch(
     tmp_path: Path,
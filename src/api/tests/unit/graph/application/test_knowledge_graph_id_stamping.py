@@ -28,7 +28,9 @@ class FakeMutationApplier:
         self.received_operations: list[MutationOperation] = []
         self.should_succeed = True
 
-    def apply_batch(self, operations: list[MutationOperation]) -> MutationResult:
+    def apply_batch(
+        self, operations: list[MutationOperation], resume_from: int = 0
+    ) -> MutationResult:
         self.received_operations = list(operations)
         if self.should_succeed:
             return MutationResult(success=True, operations_applied=len(operations))
@@ -541,7 +541,7 @@ class TestGraphMutationServiceApplyFromJSONL:
         result = service.apply_mutations_from_jsonl("")
 
         # Should call apply with empty list
-        mock_applier.apply_batch.assert_called_once_with([])
+        mock_applier.apply_batch.assert_called_once_with([], resume_from=0)
         assert result.success is True
         assert result.operations_applied == 0
 
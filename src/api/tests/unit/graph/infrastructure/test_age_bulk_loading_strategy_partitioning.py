@@ -257,7 +257,7 @@ class TestDeleteOrderingEdgesBeforeNodes:
         delete_order: list[str] = []
 
         def tracking_execute_deletes(
-            cursor, operations, entity_type, probe, graph_name
+            cursor, operations, entity_type, probe, graph_name, session_id
         ):
             delete_order.append(entity_type.value)
             return 0
@@ -26,7 +26,7 @@ def mock_cursor():
     """Create a mock database cursor."""
     cursor = MagicMock()
     # Default: no indexes exist
-    cursor.fetchone.return_value = None
+    cursor.fetchall.return_value = []
     return cursor
 
 
@@ -152,7 +152,11 @@ class TestSkipsExistingIndexes:
     def test_skips_existing_indexes(self, indexing_strategy, mock_cursor):
         """Should not recreate indexes that already exist."""
         # Mock: all indexes already exist
-        mock_cursor.fetchone.return_value = (1,)
+        mock_cursor.fetchall.return_value = [
+            ("idx_test_graph_person_id_btree",),
+            ("idx_test_graph_person_props_gin",),
+            ("idx_test_graph_person_prop_id_text_btree",),
+        ]
 
         created = indexing_strategy.create_label_indexes(
             mock_cursor, "test_graph", "person", EntityType.NODE
@@ -163,10 +167,9 @@ class TestSkipsExistingIndexes:
     def test_creates_only_missing_indexes(self, indexing_strategy, mock_cursor):
         """Should only create indexes that don't exist."""
         # Mock: first two indexes exist, third doesn't
-        mock_cursor.fetchone.side_effect = [
-            (1,),  # First index exists
-            (1,),  # Second index exists
-            None,  # Third index doesn't exist
+        mock_cursor.fetchall.return_value = [
+            ("idx_test_graph_person_id_btree",),
+            ("idx_test_graph_person_props_gin",),
         ]
 
         created = indexing_strategy.create_label_indexes(
@@ -175,6 +178,19 @@ class TestSkipsExistingIndexes:
 
         assert created == 1
 
+    def test_probes_existing_indexes_once(self, indexing_strategy, mock_cursor):
+        """Should check all of a label's indexes with a single catalog query."""
+        indexing_strategy.create_label_indexes(
+            mock_cursor, "test_graph", "knows", EntityType.EDGE
+        )
+
+        probes = [
+            c
+            for c in mock_cursor.execute.call_args_list
+            if "pg_indexes" in str(c.args[0])
+        ]
+        assert len(probes) == 1
+
 
 class TestInputValidation:
     """Tests for input validation."""
@@ -225,13 +241,11 @@ class TestIndexNameConsistency:
             if "pg_indexes" in str(call)
         ]
 
-        assert len(check_calls) == 3  # 3 indexes for nodes
+        assert len(check_calls) == 1  # One probe covers all 3 node indexes
 
-        # Extract index names from the calls
-        index_names = []
-        for call in check_calls:
-            args = call[0][1]  # Get the tuple of parameters
-            index_names.append(args[1])  # Second param is index name
+        # Second param is the tuple of index names
+        index_names = check_calls[0][0][1][1]
+        assert len(index_names) == 3
 
         assert "idx_test_graph_person_id_btree" in index_names
         assert "idx_test_graph_person_props_gin" in index_names
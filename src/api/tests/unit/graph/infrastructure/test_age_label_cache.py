@@ -0,0 +1,175 @@
+"""Unit tests for the process-wide AGE label catalog cache.
+
+Tests for bulk-loading.spec.md:
+
+Requirement: Label and Index Pre-Creation
+  - Scenario: Cached label catalog
+"""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from graph.domain.value_objects import EntityType
+from graph.infrastructure.age_bulk_loading import (
+    AgeBulkLoadingStrategy,
+    LabelCatalogCache,
+    LabelMetadata,
+)
+
+PERSON = LabelMetadata(name="person", label_id=3, seq_name="person_id_seq", kind="v")
+COMPANY = LabelMetadata(name="company", label_id=4, seq_name="company_id_seq", kind="v")
+GRAPH_ID = 17
+
+
+class TestLabelCatalogCache:
+    def test_unknown_graph_is_a_miss(self) -> None:
+        assert LabelCatalogCache().get_graph("g", GRAPH_ID) is None
+
+    def test_stored_graph_is_returned(self) -> None:
+        cache = LabelCatalogCache()
+        cache.store_graph("g", GRAPH_ID, [PERSON, COMPANY])
+
+        assert cache.get_graph("g", GRAPH_ID) == {"person": PERSON, "company": COMPANY}
+
+    def test_invalidate_drops_only_that_graph(self) -> None:
+        cache = LabelCatalogCache()
+        cache.store_graph("g1", GRAPH_ID, [PERSON])
+        cache.store_graph("g2", GRAPH_ID, [COMPANY])
+
+        cache.invalidate("g1")
+
+        assert cache.get_graph("g1", GRAPH_ID) is None
+        assert cache.get_graph("g2", GRAPH_ID) == {"company": COMPANY}
+
+    def test_invalidate_without_graph_clears_everything(self) -> None:
+        cache = LabelCatalogCache()
+        cache.store_graph("g1", GRAPH_ID, [PERSON])
+        cache.store_graph("g2", GRAPH_ID, [COMPANY])
+
+        cache.invalidate()
+
+        assert cache.get_graph("g1", GRAPH_ID) is None
+        assert cache.get_graph("g2", GRAPH_ID) is None
+
+    def test_recreated_graph_is_a_miss(self) -> None:
+        cache = LabelCatalogCache()
+        cache.store_graph("g", GRAPH_ID, [PERSON])
+
+        assert cache.get_graph("g", GRAPH_ID + 1) is None
+
+
+@pytest.fixture
+def queries() -> MagicMock:
+    queries = MagicMock()
+    queries.get_graph_id.return_value = GRAPH_ID
+    queries.get_label_catalog.return_value = [PERSON, COMPANY]
+    queries.get_label_info.return_value = (9, "employee_id_seq")
+    return queries
+
+
+def _strategy(
+    cache: LabelCatalogCache, queries: MagicMock, probe: MagicMock | None = None
+) -> AgeBulkLoadingStrategy:
+    strategy = AgeBulkLoadingStrategy(
+        indexing_strategy=MagicMock(),
+        bulk_loading_probe=probe or MagicMock(),
+        label_cache=cache,
+    )
+    strategy._queries = queries
+    return strategy
+
+
+class TestStrategyUsesLabelCache:
+    def test_catalog_is_read_once_across_strategies(self, queries) -> None:
+        cache = LabelCatalogCache()
+
+        for _ in range(3):
+            metadata, new_labels = _strategy(
+                cache, queries
+            )._pre_create_labels_and_indexes(
+                MagicMock(), "g", ["person", "company"], EntityType.NODE
+            )
+
+        assert queries.get_label_catalog.call_count == 1
+        queries.get_label_info.assert_not_called()
+        assert metadata == {"person": PERSON, "company": COMPANY}
+        assert new_labels == set()
+
+    def test_hits_and_misses_are_reported(self, queries) -> None:
+        cache = LabelCatalogCache()
+        probe = MagicMock()
+        strategy = _strategy(cache, queries, probe)
+
+        strategy._pre_create_labels_and_indexes(
+            MagicMock(), "g", ["person", "company"], EntityType.NODE
+        )
+        strategy._pre_create_labels_and_indexes(
+            MagicMock(), "g", ["person"], EntityType.NODE
+        )
+
+        calls = [c.kwargs for c in probe.label_cache_checked.call_args_list]
+        assert calls == [{"hits": 0, "misses": 2}, {"hits": 1, "misses": 0}]
+
+    def test_label_missing_from_cache_reloads_catalog(self, queries) -> None:
+        cache = LabelCatalogCache()
+        cache.store_graph("g", GRAPH_ID, [PERSON])
+
+        metadata, new_labels = _strategy(cache, queries)._pre_create_labels_and_indexes(
+            MagicMock(), "g", ["company"], EntityType.NODE
+        )
+
+        queries.get_label_catalog.assert_called_once()
+        queries.create_label.assert_not_called()
+        assert metadata == {"company": COMPANY}
+        assert new_labels == set()
+
+    def test_graph_recreated_elsewhere_reloads_catalog(self, queries) -> None:
+        """A graph dropped and recreated by another replica gets a new id."""
+        cache = LabelCatalogCache()
+        cache.store_graph(
+            "g",
+            GRAPH_ID,
+            [LabelMetadata(name="person", label_id=8, seq_name="old_seq", kind="v")],
+        )
+        queries.get_graph_id.return_value = GRAPH_ID + 1
+
+        metadata, _ = _strategy(cache, queries)._pre_create_labels_and_indexes(
+            MagicMock(), "g", ["person"], EntityType.NODE
+        )
+
+        queries.get_label_catalog.assert_called_once()
+        assert metadata == {"person": PERSON}
+        assert cache.get_graph("g", GRAPH_ID + 1) == {
+            "person": PERSON,
+            "company": COMPANY,
+        }
+
+    def test_new_label_is_created_and_invalidates_graph(self, queries) -> None:
+        cache = LabelCatalogCache()
+
+        metadata, new_labels = _strategy(cache, queries)._pre_create_labels_and_indexes(
+            MagicMock(), "g", ["person", "employee"], EntityType.NODE
+        )
+
+        queries.create_label.assert_called_once()
+        assert new_labels == {"employee"}
+        assert metadata["employee"] == LabelMetadata(
+            name="employee", label_id=9, seq_name="employee_id_seq", kind="v"
+        )
+        assert cache.get_graph("g", GRAPH_ID) is None
+
+    def test_failed_batch_invalidates_graph(self) -> None:
+        cache = LabelCatalogCache()
+        cache.store_graph("g", GRAPH_ID, [PERSON])
+        strategy = _strategy(cache, MagicMock())
+        strategy._max_retries = 0
+        client = MagicMock()
+        client.raw_connection.cursor.side_effect = RuntimeError("boom")
+
+        result = strategy.apply_batch(client, [], MagicMock(), "g")
+
+        assert not result.success
+        assert cache.get_graph("g", GRAPH_ID) is None
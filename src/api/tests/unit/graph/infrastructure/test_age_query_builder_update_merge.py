@@ -129,10 +129,10 @@ class TestUpdateExistingQueryMergeSemantics:
         assert "service" in sql_text
         assert "staging_xyz" in sql_text
 
-    def test_merge_consistent_with_update_properties_method(self) -> None:
-        """Merge pattern should match the update_properties() method's SQL pattern.
+    def test_merge_consistent_with_property_patch_method(self) -> None:
+        """Merge pattern should match apply_property_patches_in_label()'s SQL pattern.
 
-        update_properties() already correctly uses:
+        apply_property_patches_in_label() already correctly uses:
             (t.properties::text)::jsonb || %s::jsonb
         _build_update_existing_query should follow the same pattern.
         """
@@ -147,5 +147,5 @@ class TestUpdateExistingQueryMergeSemantics:
         # Both should use ::jsonb casting for merge
         assert "jsonb" in sql_text, (
             "Merge query should cast to jsonb for || operator, consistent with "
-            "update_properties(). SQL: " + sql_text
+            "apply_property_patches_in_label(). SQL: " + sql_text
         )
@@ -0,0 +1,118 @@
+"""Unit tests for AgeBulkLoadingStrategy graphid lookup mode selection.
+
+Tests for bulk-loading.spec.md:
+
+Requirement: Staging-Based Ingestion
+  - Scenario: Incremental endpoint resolution
+    Only the endpoints referenced by the batch are resolved, and the lookup
+    mode is reported through the AgeBulkLoadingProbe.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from graph.domain.value_objects import (
+    EntityType,
+    MutationOperation,
+    MutationOperationType,
+)
+from graph.infrastructure.age_bulk_loading import (
+    AgeBulkLoadingStrategy,
+    GraphidLookupMode,
+)
+
+
+def _make_create_edge() -> MutationOperation:
+    return MutationOperation.model_construct(
+        op=MutationOperationType.CREATE,
+        type=EntityType.EDGE,
+        id="knows:abc123def4560002",
+        label="knows",
+        start_id="person:abc123def4560001",
+        end_id="person:abc123def4560003",
+        set_properties={"data_source_id": "ds1", "source_path": "/a"},
+        remove_properties=None,
+    )
+
+
+@pytest.fixture
+def mock_cursor() -> MagicMock:
+    cursor = MagicMock()
+    cursor.fetchone.return_value = (1,)
+    cursor.fetchall.return_value = []
+    return cursor
+
+
+def _run_edge_creates(
+    strategy: AgeBulkLoadingStrategy, mock_cursor: MagicMock
+) -> tuple[MagicMock, MagicMock]:
+    with (
+        patch.object(
+            strategy._staging,
+            "create_incremental_graphid_lookup_table",
+            return_value=("_graphid_lookup_s", 2),
+        ) as incremental,
+        patch.object(
+            strategy._staging,
+            "create_graphid_lookup_table",
+            return_value=("_graphid_lookup_s", 50_000),
+        ) as full_scan,
+    ):
+        strategy._execute_creates(
+            mock_cursor,
+            [_make_create_edge()],
+            EntityType.EDGE,
+            "test_graph",
+            "s",
+            MagicMock(),
+        )
+    return incremental, full_scan
+
+
+class TestGraphidLookupModeSelection:
+    """The configured lookup mode decides how edge endpoints are resolved."""
+
+    def test_incremental_is_the_default(self, mock_cursor: MagicMock) -> None:
+        strategy = AgeBulkLoadingStrategy(bulk_loading_probe=MagicMock())
+
+        incremental, full_scan = _run_edge_creates(strategy, mock_cursor)
+
+        incremental.assert_called_once()
+        full_scan.assert_not_called()
+        # The edge staging table drives the lookup
+        assert incremental.call_args[0][2].startswith("_staging_edges_")
+
+    def test_full_scan_mode_materializes_all_vertices(
+        self, mock_cursor: MagicMock
+    ) -> None:
+        strategy = AgeBulkLoadingStrategy(
+            bulk_loading_probe=MagicMock(),
+            graphid_lookup_mode=GraphidLookupMode.FULL_SCAN,
+        )
+
+        incremental, full_scan = _run_edge_creates(strategy, mock_cursor)
+
+        full_scan.assert_called_once()
+        incremental.assert_not_called()
+
+    @pytest.mark.parametrize(
+        ("mode", "row_count"),
+        [(GraphidLookupMode.INCREMENTAL, 2), (GraphidLookupMode.FULL_SCAN, 50_000)],
+    )
+    def test_probe_reports_lookup_mode(
+        self, mock_cursor: MagicMock, mode: GraphidLookupMode, row_count: int
+    ) -> None:
+        bulk_probe = MagicMock()
+        strategy = AgeBulkLoadingStrategy(
+            bulk_loading_probe=bulk_probe, graphid_lookup_mode=mode
+        )
+
+        _run_edge_creates(strategy, mock_cursor)
+
+        bulk_probe.graphid_lookup_table_created.assert_called_once()
+        call = bulk_probe.graphid_lookup_table_created.call_args
+        assert call.args[0] == row_count
+        assert call.kwargs["lookup_mode"] == mode.value
@@ -0,0 +1,352 @@
+"""Unit tests for AgeBulkLoadingStrategy set-based DELETE and UPDATE paths.
+
+Tests for bulk-loading.spec.md:
+
+Requirement: Set-Based Deletes and Updates
+  - Scenario: Bulk delete
+    IDs are staged via COPY, resolved once, and deleted per label
+  - Scenario: Bulk update
+    Property patches are staged via COPY, resolved once, and applied per label
+"""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from graph.domain.value_objects import (
+    EntityType,
+    MutationOperation,
+    MutationOperationType,
+)
+from graph.infrastructure.age_bulk_loading.strategy import (
+    AgeBulkLoadingStrategy,
+    _fold_property_patch,
+)
+
+
+@pytest.fixture
+def strategy() -> AgeBulkLoadingStrategy:
+    return AgeBulkLoadingStrategy(bulk_loading_probe=MagicMock())
+
+
+@pytest.fixture
+def mock_cursor() -> MagicMock:
+    return MagicMock()
+
+
+@pytest.fixture
+def mock_probe() -> MagicMock:
+    return MagicMock()
+
+
+def _make_delete_op(entity_type: EntityType, entity_id: str) -> MutationOperation:
+    return MutationOperation(
+        op=MutationOperationType.DELETE,
+        type=entity_type,
+        id=entity_id,
+    )
+
+
+def _make_update_op(
+    entity_type: EntityType,
+    entity_id: str,
+    set_properties: dict | None = None,
+    remove_properties: list[str] | None = None,
+) -> MutationOperation:
+    return MutationOperation(
+        op=MutationOperationType.UPDATE,
+        type=entity_type,
+        id=entity_id,
+        set_properties=set_properties,
+        remove_properties=remove_properties,
+    )
+
+
+def _patch_staging(strategy: AgeBulkLoadingStrategy, labels: list[str]):
+    """Patch staging/queries so that every staged ID resolves into ``labels``."""
+    staging = strategy._staging
+    return (
+        patch.object(
+            staging, "create_resolved_id_table", return_value=("_resolved", 3)
+        ),
+        patch.object(staging, "fetch_resolved_labels", return_value=labels),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Scenario: Bulk delete
+# ---------------------------------------------------------------------------
+
+
+class TestSetBasedDeletes:
+    """DELETEs are staged, resolved once and applied per label."""
+
+    def test_ids_are_copied_into_staging_once(
+        self, strategy, mock_cursor, mock_probe
+    ) -> None:
+        ops = [_make_delete_op(EntityType.NODE, f"person:{i:016x}") for i in range(5)]
+        resolved, labels = _patch_staging(strategy, ["person"])
+
+        with (
+            resolved,
+            labels,
+            patch.object(
+                strategy._staging, "copy_ids_to_staging", return_value=5
+            ) as copy_ids,
+            patch.object(strategy._queries, "detach_resolved_nodes", return_value=0),
+            patch.object(strategy._queries, "delete_resolved_in_label", return_value=5),
+        ):
+            strategy._execute_deletes(
+                mock_cursor, ops, EntityType.NODE, mock_probe, "test_graph", "s"
+            )
+
+        copy_ids.assert_called_once()
+        assert copy_ids.call_args[0][2] == [op.id for op in ops]
+
+    def test_one_delete_statement_per_label(
+        self, strategy, mock_cursor, mock_probe
+    ) -> None:
+        ops = [
+            _make_delete_op(EntityType.NODE, "person:abc123def456789a"),
+            _make_delete_op(EntityType.NODE, "repository:def456789abc1230"),
+            _make_delete_op(EntityType.NODE, "person:789abc123def4560"),
+        ]
+        resolved, labels = _patch_staging(strategy, ["person", "repository"])
+
+        with (
+            resolved,
+            labels,
+            patch.object(strategy._queries, "detach_resolved_nodes", return_value=4),
+            patch.object(
+                strategy._queries, "delete_resolved_in_label", side_effect=[2, 1]
+            ) as delete_in_label,
+        ):
+            batches = strategy._execute_deletes(
+                mock_cursor, ops, EntityType.NODE, mock_probe, "test_graph", "s"
+            )
+
+        assert batches == 2
+        assert [c[0][2] for c in delete_in_label.call_args_list] == [
+            "person",
+            "repository",
+        ]
+
+    def test_reports_per_label_batch_timings(
+        self, strategy, mock_cursor, mock_probe
+    ) -> None:
+        ops = [_make_delete_op(EntityType.EDGE, "knows:abc123def456789a")]
+        resolved, labels = _patch_staging(strategy, ["knows"])
+
+        with (
+            resolved,
+            labels,
+            patch.object(strategy._queries, "delete_resolved_in_label", return_value=1),
+        ):
+            strategy._execute_deletes(
+                mock_cursor, ops, EntityType.EDGE, mock_probe, "test_graph", "s"
+            )
+
+        mock_probe.batch_applied.assert_called_once()
+        kwargs = mock_probe.batch_applied.call_args.kwargs
+        assert kwargs["operation"] == MutationOperationType.DELETE
+        assert kwargs["entity_type"] == "edge"
+        assert kwargs["label"] == "knows"
+        assert kwargs["count"] == 1
+        assert kwargs["duration_ms"] >= 0
+
+    def test_node_deletes_detach_edges_before_deleting_nodes(
+        self, strategy, mock_cursor, mock_probe
+    ) -> None:
+        ops = [_make_delete_op(EntityType.NODE, "person:abc123def456789a")]
+        resolved, labels = _patch_staging(strategy, ["person"])
+        calls: list[str] = []
+
+        def _recorder(name: str, result: int):
+            def _record(*args) -> int:
+                calls.append(name)
+                return result
+
+            return _record
+
+        with (
+            resolved,
+            labels,
+            patch.object(
+                strategy._queries,
+                "detach_resolved_nodes",
+                side_effect=_recorder("detach", 0),
+            ),
+            patch.object(
+                strategy._queries,
+                "delete_resolved_in_label",
+                side_effect=_recorder("delete", 1),
+            ),
+        ):
+            strategy._execute_deletes(
+                mock_cursor, ops, EntityType.NODE, mock_probe, "test_graph", "s"
+            )
+
+        assert calls == ["detach", "delete"]
+
+    def test_edge_deletes_do_not_detach(
+        self, strategy, mock_cursor, mock_probe
+    ) -> None:
+        ops = [_make_delete_op(EntityType.EDGE, "knows:abc123def456789a")]
+        resolved, labels = _patch_staging(strategy, ["knows"])
+
+        with (
+            resolved,
+            labels,
+            patch.object(strategy._queries, "detach_resolved_nodes") as detach,
+            patch.object(strategy._queries, "delete_resolved_in_label", return_value=1),
+        ):
+            strategy._execute_deletes(
+                mock_cursor, ops, EntityType.EDGE, mock_probe, "test_graph", "s"
+            )
+
+        detach.assert_not_called()
+
+    def test_no_any_array_predicates(self, strategy, mock_cursor, mock_probe) -> None:
+        """Set-based deletes must not fall back to ``= ANY(%s)`` plans."""
+        mock_cursor.fetchone.return_value = (0,)
+        mock_cursor.fetchall.return_value = [("person",)]
+        ops = [_make_delete_op(EntityType.NODE, f"person:{i:016x}") for i in range(3)]
+
+        strategy._execute_deletes(
+            mock_cursor, ops, EntityType.NODE, mock_probe, "test_graph", "s"
+        )
+
+        for c in mock_cursor.execute.call_args_list:
+            assert "ANY" not in str(c[0][0])
+
+    def test_handles_empty_operations(self, strategy, mock_cursor, mock_probe) -> None:
+        batches = strategy._execute_deletes(
+            mock_cursor, [], EntityType.NODE, mock_probe, "test_graph", "s"
+        )
+        assert batches == 0
+        mock_cursor.execute.assert_not_called()
+
+    def test_raises_on_missing_id(self, strategy, mock_cursor, mock_probe) -> None:
+        op = MutationOperation(
+            op=MutationOperationType.DELETE,
+            type=EntityType.NODE,
+            id=None,
+        )
+
+        with pytest.raises(ValueError, match="missing an ID"):
+            strategy._execute_deletes(
+                mock_cursor, [op], EntityType.NODE, mock_probe, "test_graph", "s"
+            )
+
+
+# ---------------------------------------------------------------------------
+# Scenario: Bulk update
+# ---------------------------------------------------------------------------
+
+
+class TestSetBasedUpdates:
+    """UPDATEs are staged per entity type, resolved once and applied per label."""
+
+    def test_patches_staged_per_entity_type(
+        self, strategy, mock_cursor, mock_probe
+    ) -> None:
+        ops = [
+            _make_update_op(EntityType.NODE, "person:abc123def456789a", {"a": 1}),
+            _make_update_op(EntityType.EDGE, "knows:abc123def456789a", {"b": 2}),
+            _make_update_op(EntityType.NODE, "person:def456789abc1230", None, ["c"]),
+        ]
+        resolved, labels = _patch_staging(strategy, ["person"])
+
+        with (
+            resolved,
+            labels,
+            patch.object(
+                strategy._staging, "copy_updates_to_staging", return_value=1
+            ) as copy_updates,
+            patch.object(
+                strategy._queries, "apply_property_patches_in_label", return_value=1
+            ),
+        ):
+            strategy._execute_updates(mock_cursor, ops, "test_graph", mock_probe, "s")
+
+        assert copy_updates.call_count == 2
+        node_patches = copy_updates.call_args_list[0][0][2]
+        edge_patches = copy_updates.call_args_list[1][0][2]
+        assert node_patches == {
+            "person:abc123def456789a": ({"a": 1}, []),
+            "person:def456789abc1230": ({}, ["c"]),
+        }
+        assert edge_patches == {"knows:abc123def456789a": ({"b": 2}, [])}
+
+    def test_one_update_statement_per_label(
+        self, strategy, mock_cursor, mock_probe
+    ) -> None:
+        ops = [
+            _make_update_op(EntityType.NODE, f"person:{i:016x}", {"a": i})
+            for i in range(10)
+        ]
+        resolved, labels = _patch_staging(strategy, ["person"])
+
+        with (
+            resolved,
+            labels,
+            patch.object(
+                strategy._queries, "apply_property_patches_in_label", return_value=10
+            ) as apply_patches,
+        ):
+            batches = strategy._execute_updates(
+                mock_cursor, ops, "test_graph", mock_probe, "s"
+            )
+
+        assert batches == 1
+        apply_patches.assert_called_once()
+        kwargs = mock_probe.batch_applied.call_args.kwargs
+        assert kwargs["operation"] == MutationOperationType.UPDATE
+        assert kwargs["label"] == "person"
+        assert kwargs["count"] == 10
+
+    def test_raises_on_missing_id(self, strategy, mock_cursor, mock_probe) -> None:
+        op = MutationOperation.model_construct(
+            op=MutationOperationType.UPDATE,
+            type=EntityType.NODE,
+            id=None,
+            set_properties={"a": 1},
+            remove_properties=None,
+        )
+
+        with pytest.raises(RuntimeError, match="missing ID"):
+            strategy._execute_updates(mock_cursor, [op], "test_graph", mock_probe, "s")
+
+
+class TestFoldPropertyPatch:
+    """Folding several UPDATEs must equal applying them in order."""
+
+    @staticmethod
+    def _apply(properties: dict, set_props: dict, remove: list[str]) -> dict:
+        merged = {**properties, **set_props}
+        return {k: v for k, v in merged.items() if k not in remove}
+
+    @pytest.mark.parametrize(
+        "updates",
+        [
+            [({"a": 1}, []), ({"b": 2}, [])],
+            [({"a": 1}, []), ({}, ["a"])],
+            [({}, ["a"]), ({"a": 3}, [])],
+            [({"a": 1}, ["a"]), ({"b": 2}, ["c"])],
+            [({}, ["x"]), ({"x": 1}, []), ({}, ["x"]), ({"y": 2}, [])],
+        ],
+    )
+    def test_fold_matches_sequential_application(self, updates) -> None:
+        original = {"a": 0, "c": 0, "x": 0, "keep": True}
+
+        expected = original
+        for set_props, remove in updates:
+            expected = self._apply(expected, set_props, remove)
+
+        patch_ = None
+        for set_props, remove in updates:
+            patch_ = _fold_property_patch(patch_, set_props, remove)
+
+        assert self._apply(original, *patch_) == expected
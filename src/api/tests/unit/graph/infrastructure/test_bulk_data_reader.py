@@ -0,0 +1,160 @@
+"""Unit tests for the streaming bulk graph data reader."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import MagicMock
+
+from graph.infrastructure.bulk_data_reader import (
+    fetch_bulk_graph_data,
+    iter_bulk_graph_batches,
+)
+
+
+def _make_pool(labels, named_rows):
+    """Build a pool whose connection serves label rows and named-cursor rows.
+
+    ``named_rows`` maps the named cursor ("bulk_graph_nodes"/"bulk_graph_edges")
+    to the list of fetchmany() results it returns, in order.
+    """
+    conn = MagicMock()
+    plain = MagicMock()
+    plain.fetchall.return_value = labels
+    named: dict[str, MagicMock] = {}
+
+    def cursor(name=None):
+        cm = MagicMock()
+        if name is None:
+            cm.__enter__.return_value = plain
+        else:
+            cur = MagicMock()
+            cur.fetchmany.side_effect = [*named_rows.get(name, []), []]
+            named[name] = cur
+            cm.__enter__.return_value = cur
+        return cm
+
+    conn.cursor.side_effect = cursor
+    pool = MagicMock()
+    pool.get_connection.return_value = conn
+    return pool, conn, named
+
+
+def _props(**props):
+    return json.dumps(props)
+
+
+class TestIterBulkGraphBatches:
+    """Tests for iter_bulk_graph_batches."""
+
+    def test_yields_node_batches_then_edge_batches(self):
+        pool, _, _ = _make_pool(
+            [("person", "v"), ("knows", "e")],
+            {
+                "bulk_graph_nodes": [
+                    [("1", "person", _props(id="p1", name="Ada"))],
+                    [("2", "person", _props(id="p2"))],
+                ],
+                "bulk_graph_edges": [
+                    [("3", "1", "2", "knows", _props(id="k1"))],
+                ],
+            },
+        )
+
+        batches = list(iter_bulk_graph_batches(pool, "tenant_t", batch_size=1))
+
+        assert [kind for kind, _ in batches] == ["nodes", "nodes", "edges"]
+        assert batches[0][1] == [
+            {
+                "id": "1",
+                "domainId": "p1",
+                "label": "Ada",
+                "type": "person",
+                "name": "Ada",
+            }
+        ]
+        assert batches[2][1][0]["source"] == "1"
+        assert batches[2][1][0]["target"] == "2"
+
+    def test_reads_through_server_side_cursor_in_batches(self):
+        pool, _, named = _make_pool(
+            [("person", "v")],
+            {"bulk_graph_nodes": [[("1", "person", _props(id="p1"))]]},
+        )
+
+        list(iter_bulk_graph_batches(pool, "tenant_t", batch_size=250))
+
+        cur = named["bulk_graph_nodes"]
+        assert cur.itersize == 250
+        cur.fetchmany.assert_called_with(250)
+        cur.fetchall.assert_not_called()
+
+    def test_pushes_knowledge_graph_filter_into_sql(self):
+        pool, _, named = _make_pool(
+            [("person", "v"), ("company", "v")],
+            {"bulk_graph_nodes": []},
+        )
+
+        list(iter_bulk_graph_batches(pool, "tenant_t", knowledge_graph_id="kg-1"))
+
+        query, params = named["bulk_graph_nodes"].execute.call_args.args
+        assert "knowledge_graph_id" in repr(query)
+        assert params == ["kg-1", "kg-1"]
+
+    def test_empty_knowledge_graph_id_applies_no_filter(self):
+        pool, _, named = _make_pool([("person", "v")], {"bulk_graph_nodes": []})
+
+        list(iter_bulk_graph_batches(pool, "tenant_t", knowledge_graph_id=""))
+
+        query, params = named["bulk_graph_nodes"].execute.call_args.args
+        assert "knowledge_graph_id" not in repr(query)
+        assert params == []
+
+    def test_skips_rows_with_invalid_properties(self):
+        pool, _, _ = _make_pool(
+            [("person", "v")],
+            {"bulk_graph_nodes": [[("1", "person", "{not json"), ("2", "person", "")]]},
+        )
+
+        batches = list(iter_bulk_graph_batches(pool, "tenant_t"))
+
+        assert [node["id"] for _, batch in batches for node in batch] == ["2"]
+
+    def test_returns_connection_when_closed_early(self):
+        pool, conn, _ = _make_pool(
+            [("person", "v")],
+            {
+                "bulk_graph_nodes": [
+                    [("1", "person", _props(id="p1"))],
+                    [("2", "person", _props(id="p2"))],
+                ]
+            },
+        )
+
+        batches = iter_bulk_graph_batches(pool, "tenant_t", batch_size=1)
+        next(batches)
+        batches.close()
+
+        conn.rollback.assert_called_once()
+        pool.return_connection.assert_called_once_with(conn)
+
+
+class TestFetchBulkGraphData:
+    """fetch_bulk_graph_data collects the streamed batches."""
+
+    def test_collects_all_batches(self):
+        pool, conn, _ = _make_pool(
+            [("person", "v"), ("knows", "e")],
+            {
+                "bulk_graph_nodes": [
+                    [("1", "person", _props(id="p1"))],
+                    [("2", "person", _props(id="p2"))],
+                ],
+                "bulk_graph_edges": [[("3", "1", "2", "knows", _props(id="k1"))]],
+            },
+        )
+
+        data = fetch_bulk_graph_data(pool, "tenant_t")
+
+        assert [n["id"] for n in data["nodes"]] == ["1", "2"]
+        assert [e["id"] for e in data["edges"]] == ["3"]
+        pool.return_connection.assert_called_once_with(conn)
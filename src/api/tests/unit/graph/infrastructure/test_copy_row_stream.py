@@ -0,0 +1,84 @@
+"""Unit tests for CopyRowStream, the streaming COPY FROM source."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+from graph.domain.value_objects import (
+    EntityType,
+    MutationOperation,
+    MutationOperationType,
+)
+from graph.infrastructure.age_bulk_loading.copy_stream import CopyRowStream
+from graph.infrastructure.age_bulk_loading.staging import StagingTableManager
+
+
+def _drain(stream: CopyRowStream, size: int) -> list[str]:
+    chunks = []
+    while chunk := stream.read(size):
+        chunks.append(chunk)
+    return chunks
+
+
+class TestCopyRowStream:
+    def test_concatenated_chunks_equal_all_rows(self) -> None:
+        rows = [f"row-{i}\t{'x' * (i % 7)}\n" for i in range(100)]
+
+        chunks = _drain(CopyRowStream(rows), size=16)
+
+        assert "".join(chunks) == "".join(rows)
+
+    def test_chunks_never_exceed_requested_size(self) -> None:
+        rows = ["a" * 50 + "\n" for _ in range(10)]
+
+        chunks = _drain(CopyRowStream(rows), size=32)
+
+        assert all(len(c) <= 32 for c in chunks)
+        assert all(len(c) == 32 for c in chunks[:-1])
+
+    def test_rows_are_pulled_lazily(self) -> None:
+        pulled: list[int] = []
+
+        def rows():
+            for i in range(1000):
+                pulled.append(i)
+                yield "0123456789\n"
+
+        stream = CopyRowStream(rows())
+        stream.read(30)
+
+        assert len(pulled) == 3
+
+    def test_read_without_size_returns_everything(self) -> None:
+        stream = CopyRowStream(["a\n", "b\n"])
+
+        assert stream.read() == "a\nb\n"
+        assert stream.read() == ""
+
+    def test_empty_iterator_signals_eof(self) -> None:
+        assert CopyRowStream([]).read(8192) == ""
+
+
+class TestStagingUsesStream:
+    """copy_*_to_staging hands COPY a stream instead of a pre-built buffer."""
+
+    def test_node_copy_streams_escaped_rows(self) -> None:
+        cursor = MagicMock()
+        copied: list[str] = []
+        cursor.copy_from.side_effect = lambda f, *a, **k: copied.append(
+            "".join(_drain(f, k["size"]))
+        )
+        op = MutationOperation.model_construct(
+            op=MutationOperationType.CREATE,
+            type=EntityType.NODE,
+            id="person:abc123def4560001",
+            label="person",
+            set_properties={"bio": "line1\nline2"},
+        )
+
+        StagingTableManager().copy_nodes_to_staging(cursor, "_s", [op], "g")
+
+        assert isinstance(cursor.copy_from.call_args[0][0], CopyRowStream)
+        (row,) = copied[0].splitlines()
+        assert row.split("\t")[:2] == ["person:abc123def4560001", "person"]
+        assert "\\\\n" in row
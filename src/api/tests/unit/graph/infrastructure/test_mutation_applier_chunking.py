@@ -0,0 +1,219 @@
+"""Unit tests for chunked MutationApplier.apply_batch.
+
+Tests for bulk-loading.spec.md:
+
+Requirement: Chunked Apply
+  - Scenario: Chunked commit
+  - Scenario: Chunk failure
+  - Scenario: Resume after failure
+"""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from graph.domain.value_objects import (
+    EntityType,
+    MutationOperation,
+    MutationOperationType,
+    MutationResult,
+)
+from graph.infrastructure.mutation_applier import MutationApplier
+
+
+class _RecordingStrategy:
+    """Fake BulkLoadingStrategy that records each transaction's operations."""
+
+    def __init__(self, fail_on_calls: set[int] | None = None) -> None:
+        self.calls: list[list[MutationOperation]] = []
+        self._fail_on_calls = fail_on_calls or set()
+
+    def apply_batch(self, client, operations, probe, graph_name) -> MutationResult:
+        self.calls.append(list(operations))
+        if len(self.calls) - 1 in self._fail_on_calls:
+            return MutationResult(
+                success=False, operations_applied=0, errors=["lock timeout"]
+            )
+        return MutationResult(success=True, operations_applied=len(operations))
+
+
+class _MemoryCheckpoint:
+    """In-memory IMutationCheckpoint that records every save."""
+
+    def __init__(self) -> None:
+        self.committed = 0
+        self.saves: list[int] = []
+        self.cleared = False
+
+    def load(self) -> int:
+        return self.committed
+
+    def save(self, operations_committed: int) -> None:
+        self.committed = operations_committed
+        self.saves.append(operations_committed)
+
+    def clear(self) -> None:
+        self.committed = 0
+        self.cleared = True
+
+
+def _node(i: int) -> MutationOperation:
+    return MutationOperation(
+        op=MutationOperationType.CREATE,
+        type=EntityType.NODE,
+        id=f"person:{i:016x}",
+        label="person",
+        set_properties={
+            "data_source_id": "ds-1",
+            "source_path": "x.md",
+            "slug": f"p{i}",
+            "knowledge_graph_id": "kg-1",
+        },
+    )
+
+
+def _edge(i: int) -> MutationOperation:
+    return MutationOperation(
+        op=MutationOperationType.CREATE,
+        type=EntityType.EDGE,
+        id=f"knows:{i:016x}",
+        label="knows",
+        start_id=f"person:{0:016x}",
+        end_id=f"person:{1:016x}",
+        set_properties={
+            "data_source_id": "ds-1",
+            "source_path": "x.md",
+            "knowledge_graph_id": "kg-1",
+        },
+    )
+
+
+def _delete(i: int) -> MutationOperation:
+    return MutationOperation(
+        op=MutationOperationType.DELETE, type=EntityType.NODE, id=f"old:{i:016x}"
+    )
+
+
+def _applier(strategy, chunk_size, probe=None, checkpoint=None) -> MutationApplier:
+    client = MagicMock()
+    client.graph_name = "tenant_t1"
+    return MutationApplier(
+        client=client,
+        bulk_loading_strategy=strategy,
+        probe=probe or MagicMock(),
+        chunk_size=chunk_size,
+        checkpoint=checkpoint,
+    )
+
+
+class TestChunkedApply:
+    def test_without_chunk_size_applies_one_transaction(self) -> None:
+        strategy = _RecordingStrategy()
+
+        result = _applier(strategy, None).apply_batch([_node(i) for i in range(5)])
+
+        assert result.success
+        assert len(strategy.calls) == 1
+
+    def test_operations_are_split_into_chunks(self) -> None:
+        strategy = _RecordingStrategy()
+
+        result = _applier(strategy, 2).apply_batch([_node(i) for i in range(5)])
+
+        assert result.success
+        assert result.operations_applied == 5
+        assert [len(c) for c in strategy.calls] == [2, 2, 1]
+
+    def test_chunks_preserve_execution_order(self) -> None:
+        strategy = _RecordingStrategy()
+        operations = [_edge(0), _node(0), _delete(0), _node(1), _edge(1)]
+
+        _applier(strategy, 2).apply_batch(operations)
+
+        flattened = [(op.op, op.type) for chunk in strategy.calls for op in chunk]
+        assert flattened == [
+            (MutationOperationType.DELETE, EntityType.NODE),
+            (MutationOperationType.CREATE, EntityType.NODE),
+            (MutationOperationType.CREATE, EntityType.NODE),
+            (MutationOperationType.CREATE, EntityType.EDGE),
+            (MutationOperationType.CREATE, EntityType.EDGE),
+        ]
+
+    def test_progress_reported_after_each_commit(self) -> None:
+        probe = MagicMock()
+
+        _applier(_RecordingStrategy(), 2, probe).apply_batch(
+            [_node(i) for i in range(5)]
+        )
+
+        committed = [
+            c.kwargs["operations_committed"]
+            for c in probe.chunk_committed.call_args_list
+        ]
+        assert committed == [2, 4, 5]
+        assert all(
+            c.kwargs["chunk_count"] == 3 for c in probe.chunk_committed.call_args_list
+        )
+
+    def test_failed_chunk_stops_and_reports_committed_count(self) -> None:
+        strategy = _RecordingStrategy(fail_on_calls={1})
+
+        result = _applier(strategy, 2).apply_batch([_node(i) for i in range(5)])
+
+        assert not result.success
+        assert result.operations_applied == 2
+        assert len(strategy.calls) == 2
+        assert "lock timeout" in result.errors
+        assert any("2 of 5 operations are committed" in e for e in result.errors)
+
+    def test_negative_chunk_size_is_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            _applier(_RecordingStrategy(), -1)
+
+
+class TestChunkedResume:
+    def test_checkpoint_saved_after_each_chunk_and_cleared_on_success(
+        self,
+    ) -> None:
+        checkpoint = _MemoryCheckpoint()
+
+        _applier(_RecordingStrategy(), 2, checkpoint=checkpoint).apply_batch(
+            [_node(i) for i in range(5)]
+        )
+
+        assert checkpoint.saves == [2, 4, 5]
+        assert checkpoint.cleared
+
+    def test_failed_apply_resumes_after_last_committed_chunk(self) -> None:
+        operations = [_edge(0), _node(0), _delete(0), _node(1), _edge(1)]
+        checkpoint = _MemoryCheckpoint()
+        failing = _RecordingStrategy(fail_on_calls={1})
+
+        failed = _applier(failing, 2, checkpoint=checkpoint).apply_batch(operations)
+
+        assert not failed.success
+        assert checkpoint.load() == 2
+        assert not checkpoint.cleared
+
+        resumed_strategy = _RecordingStrategy()
+        resumed = _applier(resumed_strategy, 2, checkpoint=checkpoint).apply_batch(
+            operations, resume_from=checkpoint.load()
+        )
+
+        assert resumed.success
+        assert resumed.operations_applied == 5
+        assert [[(op.op, op.type) for op in c] for c in resumed_strategy.calls] == [
+            [
+                (MutationOperationType.CREATE, EntityType.NODE),
+                (MutationOperationType.CREATE, EntityType.EDGE),
+            ],
+            [(MutationOperationType.CREATE, EntityType.EDGE)],
+        ]
+        assert checkpoint.saves == [2, 4, 5]
+        assert checkpoint.cleared
+
+    def test_resume_from_outside_batch_is_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            _applier(_RecordingStrategy(), 2).apply_batch([_node(0)], resume_from=2)
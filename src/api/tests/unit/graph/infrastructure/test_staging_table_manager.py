@@ -25,6 +25,7 @@ from unittest.mock import MagicMock
 
 import pytest
 
+from graph.domain.value_objects import EntityType
 from graph.infrastructure.age_bulk_loading.staging import StagingTableManager
 
 
@@ -198,6 +199,219 @@ class TestGraphidLookupTableCreation:
         assert row_count == 42
 
 
+# ---------------------------------------------------------------------------
+# Requirement: Staging-Based Ingestion
+# Scenario: Incremental endpoint resolution
+# ---------------------------------------------------------------------------
+
+
+class TestIncrementalGraphidLookupTable:
+    """Incremental lookup MUST resolve only the endpoints referenced by the batch."""
+
+    def _executed_sqls(self, mock_cursor: MagicMock) -> list[str]:
+        return [str(c[0][0]) for c in mock_cursor.execute.call_args_list]
+
+    def test_endpoints_are_collected_from_staging_table(
+        self, manager: StagingTableManager, mock_cursor: MagicMock
+    ) -> None:
+        """The distinct start_id/end_id values come from the edge staging table."""
+        mock_cursor.fetchall.return_value = []
+        mock_cursor.fetchone.return_value = (0,)
+
+        manager.create_incremental_graphid_lookup_table(
+            mock_cursor, "my_graph", "_staging_edges_sess42", "sess42"
+        )
+
+        endpoints_sql = self._executed_sqls(mock_cursor)[0]
+        assert "_staging_edges_sess42" in endpoints_sql
+        assert "start_id" in endpoints_sql and "end_id" in endpoints_sql
+        assert "ON COMMIT DROP" in endpoints_sql
+
+    def test_does_not_materialize_every_vertex(
+        self, manager: StagingTableManager, mock_cursor: MagicMock
+    ) -> None:
+        """When all endpoints resolve by label, _ag_label_vertex is never scanned."""
+        mock_cursor.fetchall.return_value = [("person",)]
+        mock_cursor.fetchone.side_effect = [(0,), (2,)]
+
+        manager.create_incremental_graphid_lookup_table(
+            mock_cursor, "my_graph", "_staging_edges_sess42", "sess42"
+        )
+
+        assert not any(
+            "_ag_label_vertex" in s for s in self._executed_sqls(mock_cursor)
+        )
+
+    def test_resolves_each_hinted_label_from_staging(
+        self, manager: StagingTableManager, mock_cursor: MagicMock
+    ) -> None:
+        """One staging-driven join is issued per label named by an endpoint prefix."""
+        mock_cursor.fetchall.return_value = [("repository",), ("person",)]
+        mock_cursor.fetchone.side_effect = [(0,), (4,)]
+
+        manager.create_incremental_graphid_lookup_table(
+            mock_cursor, "my_graph", "_staging_edges_sess42", "sess42"
+        )
+
+        label_inserts = [
+            c
+            for c in mock_cursor.execute.call_args_list
+            if "INSERT INTO" in str(c[0][0]) and "label_hint" in str(c[0][0])
+        ]
+        assert [c[0][1] for c in label_inserts] == [("person",), ("repository",)]
+
+    def test_matches_mixed_case_labels_by_lowercased_prefix(
+        self, manager: StagingTableManager, mock_cursor: MagicMock
+    ) -> None:
+        """A PascalCase label is found from its lowercase ID prefix.
+
+        Label names are case-sensitive, so the lookup compares lowercased
+        names and reads the label's own table rather than the parent table.
+        """
+        mock_cursor.fetchall.return_value = [("WorkItem",)]
+        mock_cursor.fetchone.side_effect = [(0,), (2,)]
+
+        manager.create_incremental_graphid_lookup_table(
+            mock_cursor, "my_graph", "_staging_edges_sess42", "sess42"
+        )
+
+        executed = self._executed_sqls(mock_cursor)
+        assert "lower(split_part" in executed[0]
+        label_query = next(s for s in executed if "ag_label l" in s)
+        assert "lower(l.name) = i.label_hint" in label_query
+        (label_insert,) = [
+            c
+            for c in mock_cursor.execute.call_args_list
+            if "INSERT INTO" in str(c[0][0]) and "label_hint" in str(c[0][0])
+        ]
+        assert "Identifier('WorkItem')" in str(label_insert[0][0])
+        assert "Literal('WorkItem')" in str(label_insert[0][0])
+        assert label_insert[0][1] == ("workitem",)
+        assert not any("_ag_label_vertex" in s for s in executed)
+
+    def test_falls_back_to_all_vertices_for_unresolved_endpoints(
+        self, manager: StagingTableManager, mock_cursor: MagicMock
+    ) -> None:
+        """Endpoints whose prefix names no label are looked up across all vertices."""
+        mock_cursor.fetchall.return_value = []
+        mock_cursor.fetchone.side_effect = [(3,), (3,)]
+
+        manager.create_incremental_graphid_lookup_table(
+            mock_cursor, "my_graph", "_staging_edges_sess42", "sess42"
+        )
+
+        fallback = [
+            s
+            for s in self._executed_sqls(mock_cursor)
+            if "INSERT INTO" in s and "_ag_label_vertex" in s
+        ]
+        assert len(fallback) == 1
+        assert "NOT EXISTS" in fallback[0]
+
+    def test_returns_lookup_table_and_resolved_count(
+        self, manager: StagingTableManager, mock_cursor: MagicMock
+    ) -> None:
+        """The returned row count is the number of resolved endpoints."""
+        mock_cursor.fetchall.return_value = [("person",)]
+        mock_cursor.fetchone.side_effect = [(0,), (7,)]
+
+        table_name, row_count = manager.create_incremental_graphid_lookup_table(
+            mock_cursor, "my_graph", "_staging_edges_sess42", "sess42"
+        )
+
+        assert "sess42" in table_name
+        assert row_count == 7
+        assert any(
+            "CREATE INDEX" in s and "logical_id" in s
+            for s in self._executed_sqls(mock_cursor)
+        )
+
+
+# ---------------------------------------------------------------------------
+# Requirement: Set-Based Deletes and Updates
+# ---------------------------------------------------------------------------
+
+
+class TestDeleteAndUpdateStaging:
+    """DELETE/UPDATE staging tables are temp tables loaded via COPY."""
+
+    def test_delete_and_update_tables_use_on_commit_drop(
+        self, manager: StagingTableManager, mock_cursor: MagicMock
+    ) -> None:
+        delete_table = manager.create_delete_staging_table(
+            mock_cursor, "s1", EntityType.NODE
+        )
+        update_table = manager.create_update_staging_table(
+            mock_cursor, "s1", EntityType.NODE
+        )
+
+        assert delete_table != update_table
+        for c in mock_cursor.execute.call_args_list:
+            assert "ON COMMIT DROP" in str(c[0][0])
+
+    def test_update_patches_are_copy_escaped(
+        self, manager: StagingTableManager, mock_cursor: MagicMock
+    ) -> None:
+        copied: list[str] = []
+        mock_cursor.copy_from.side_effect = lambda buf, *a, **k: copied.append(
+            buf.read()
+        )
+
+        manager.copy_updates_to_staging(
+            mock_cursor,
+            "_staging_update_nodes_s1",
+            {"person:abc123def4560001": ({"note": "a\tb"}, ["old"])},
+        )
+
+        (row,) = copied[0].splitlines()
+        entity_id, set_json, remove_json = row.split("\t")
+        assert entity_id == "person:abc123def4560001"
+        assert set_json == '{"note": "a\\\\tb"}'
+        assert remove_json == '["old"]'
+
+    def test_resolved_id_table_reads_staged_ids(
+        self, manager: StagingTableManager, mock_cursor: MagicMock
+    ) -> None:
+        mock_cursor.fetchall.return_value = []
+        mock_cursor.fetchone.return_value = (0,)
+
+        resolved_table, _ = manager.create_resolved_id_table(
+            mock_cursor, "my_graph", "_staging_delete_edges_s1", EntityType.EDGE
+        )
+
+        assert resolved_table.startswith("_staging_delete_edges_s1")
+        executed = [str(c[0][0]) for c in mock_cursor.execute.call_args_list]
+        assert "_staging_delete_edges_s1" in executed[0]
+        label_query = next(
+            c
+            for c in mock_cursor.execute.call_args_list
+            if "ag_label l" in str(c[0][0])
+        )
+        assert label_query[0][1] == ("my_graph", "e")
+
+    def test_resolved_id_table_uses_index_of_mixed_case_labels(
+        self, manager: StagingTableManager, mock_cursor: MagicMock
+    ) -> None:
+        """Deletes and updates of a PascalCase label read its own label table."""
+        mock_cursor.fetchall.return_value = [("WorkItem",)]
+        mock_cursor.fetchone.side_effect = [(0,), (1,)]
+
+        manager.create_resolved_id_table(
+            mock_cursor, "my_graph", "_staging_update_nodes_s1", EntityType.NODE
+        )
+
+        executed = [str(c[0][0]) for c in mock_cursor.execute.call_args_list]
+        assert "lower(split_part" in executed[0]
+        (label_insert,) = [
+            c
+            for c in mock_cursor.execute.call_args_list
+            if "INSERT INTO" in str(c[0][0]) and "label_hint" in str(c[0][0])
+        ]
+        assert "Identifier('WorkItem')" in str(label_insert[0][0])
+        assert label_insert[0][1] == ("workitem",)
+        assert not any("_ag_label_vertex" in s for s in executed)
+
+
 # ---------------------------------------------------------------------------
 # Requirement: Duplicate and Orphan Detection
 # Scenario: Duplicate IDs in batch
@@ -15,9 +15,16 @@ from unittest.mock import MagicMock
 
 import pytest
 
+from graph.infrastructure.age_bulk_loading import (
+    LabelMetadata,
+    get_shared_label_cache,
+)
 from graph.infrastructure.tenant_graph_handler import (
     AGEGraphProvisioner,
+    OperationalGraphCache,
     TenantAGEGraphHandler,
+    ensure_tenant_graph_operational,
+    get_operational_graph_cache,
 )
 
 
@@ -46,11 +53,15 @@ class TestTenantAGEGraphHandlerSupportedEventTypes:
         handler = TenantAGEGraphHandler(FakeGraphProvisioner())
         assert "TenantCreated" in handler.supported_event_types()
 
+    def test_supports_tenant_deleted_event(self) -> None:
+        """Handler must support TenantDeleted to invalidate cached graph state."""
+        handler = TenantAGEGraphHandler(FakeGraphProvisioner())
+        assert "TenantDeleted" in handler.supported_event_types()
+
     def test_does_not_support_other_events(self) -> None:
-        """Handler should only support TenantCreated, not other IAM events."""
+        """Handler should only support tenant lifecycle events."""
         handler = TenantAGEGraphHandler(FakeGraphProvisioner())
         supported = handler.supported_event_types()
-        assert "TenantDeleted" not in supported
         assert "TenantMemberAdded" not in supported
         assert "WorkspaceCreated" not in supported
         assert "GroupCreated" not in supported
@@ -385,3 +396,67 @@ class TestAGEGraphProvisionerIdempotency:
             provisioner.ensure_graph_exists("tenant_abc")
 
         mock_conn.rollback.assert_called()
+
+
+class TestTenantGraphCacheInvalidation:
+    """Tests for the process-wide caches of tenant graph state."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_caches(self):
+        get_operational_graph_cache().invalidate()
+        get_shared_label_cache().invalidate()
+        yield
+        get_operational_graph_cache().invalidate()
+        get_shared_label_cache().invalidate()
+
+    @pytest.mark.asyncio
+    async def test_tenant_deleted_invalidates_without_provisioning(self) -> None:
+        """TenantDeleted must drop cached state and never provision a graph."""
+        provisioner = FakeGraphProvisioner()
+        handler = TenantAGEGraphHandler(provisioner)
+        get_operational_graph_cache().mark_operational("tenant_t1")
+        get_shared_label_cache().store_graph(
+            "tenant_t1",
+            17,
+            [LabelMetadata(name="person", label_id=3, seq_name="s", kind="v")],
+        )
+
+        await handler.handle("TenantDeleted", {"tenant_id": "t1"})
+
+        assert provisioner.provisioned_graphs == []
+        assert not get_operational_graph_cache().is_operational("tenant_t1", 300)
+        assert get_shared_label_cache().get_graph("tenant_t1", 17) is None
+
+    def test_operational_cache_entries_expire(self) -> None:
+        """Entries are only fresh within the TTL."""
+        now = [100.0]
+        cache = OperationalGraphCache(clock=lambda: now[0])
+        cache.mark_operational("tenant_t1")
+
+        assert cache.is_operational("tenant_t1", ttl_seconds=10)
+        now[0] = 111.0
+        assert not cache.is_operational("tenant_t1", ttl_seconds=10)
+
+    def test_ensure_operational_skips_check_while_cached(self) -> None:
+        """A fresh entry avoids the provisioning round trips."""
+        factory = MagicMock()
+        factory.get_connection.return_value.cursor.return_value.__enter__.return_value.fetchone.return_value = (
+            1,
+        )
+
+        ensure_tenant_graph_operational(factory, "t1", cache_ttl_seconds=300)
+        ensure_tenant_graph_operational(factory, "t1", cache_ttl_seconds=300)
+
+        assert factory.get_connection.call_count == 1
+
+    def test_ensure_operational_without_ttl_always_checks(self) -> None:
+        """The default keeps checking the graph on every call."""
+        factory = MagicMock()
+        factory.get_connection.return_value.cursor.return_value.__enter__.return_value.fetchone.return_value = (
+            1,
+        )
+
+        ensure_tenant_graph_operational(factory, "t1")
+        ensure_tenant_graph_operational(factory, "t1")
+
+        assert factory.get_connection.call_count == 2
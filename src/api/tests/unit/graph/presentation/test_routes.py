@@ -22,18 +22,25 @@ class FakeAuthorizationProvider:
 
     Avoids AsyncMock for this infrastructure boundary, consistent with
     the project's fake-over-mock policy. Stores all check_permission
-    calls so tests can assert on the exact arguments received.
+    and bulk_check_permission calls so tests can assert on the exact
+    arguments received.
     """
 
     def __init__(self, *, allow_all: bool = True) -> None:
         self._allow_all = allow_all
         self._check_calls: list[tuple[str, str, str]] = []
+        self._bulk_check_calls: list[list[tuple[str, str, str]]] = []
 
     @property
     def check_permission_calls(self) -> list[tuple[str, str, str]]:
         """Return recorded (resource, permission, subject) tuples."""
         return list(self._check_calls)
 
+    @property
+    def bulk_check_permission_calls(self) -> list[list[tuple[str, str, str]]]:
+        """Return the (resource, permission, subject) tuples of each bulk call."""
+        return list(self._bulk_check_calls)
+
     async def check_permission(
         self, resource: str, permission: str, subject: str
     ) -> bool:
@@ -67,7 +74,10 @@ class FakeAuthorizationProvider:
         pass
 
     async def bulk_check_permission(self, requests: list) -> set[str]:
-        return set()
+        self._bulk_check_calls.append(
+            [(req.resource, req.permission, req.subject) for req in requests]
+        )
+        return {req.resource for req in requests} if self._allow_all else set()
 
     async def lookup_subjects(
         self,
@@ -195,14 +205,14 @@ def test_client(
     app = FastAPI()
 
     # Override query/secure-enclave endpoints with async mock
-    app.dependency_overrides[dependencies.get_graph_secure_enclave_service] = (
-        lambda: mock_enclave_service
+    app.dependency_overrides[dependencies.get_graph_secure_enclave_service] = lambda: (
+        mock_enclave_service
     )
-    app.dependency_overrides[dependencies.get_graph_mutation_service] = (
-        lambda: mock_mutation_service
+    app.dependency_overrides[dependencies.get_graph_mutation_service] = lambda: (
+        mock_mutation_service
     )
-    app.dependency_overrides[dependencies.get_schema_service] = (
-        lambda: mock_schema_service
+    app.dependency_overrides[dependencies.get_schema_service] = lambda: (
+        mock_schema_service
     )
     app.dependency_overrides[get_current_user] = lambda: mock_current_user
     app.dependency_overrides[get_spicedb_client] = lambda: mock_authz_allowed
@@ -228,11 +238,11 @@ def _make_kg_test_client(
     from infrastructure.authorization_dependencies import get_spicedb_client
 
     app = FastAPI()
-    app.dependency_overrides[dependencies.get_graph_query_service] = (
-        lambda: mock_query_service
+    app.dependency_overrides[dependencies.get_graph_query_service] = lambda: (
+        mock_query_service
     )
-    app.dependency_overrides[dependencies.get_graph_mutation_service] = (
-        lambda: mock_mutation_service
+    app.dependency_overrides[dependencies.get_graph_mutation_service] = lambda: (
+        mock_mutation_service
     )
     app.dependency_overrides[get_current_user] = lambda: mock_current_user
     app.dependency_overrides[get_spicedb_client] = lambda: mock_authz
@@ -1036,3 +1046,212 @@ class TestGetEdgeSchemaRoute:
 
         mock_schema_service.get_edge_schema.assert_called_once_with("link")
         mock_schema_service.get_node_schema.assert_not_called()
+
+
+class TestVisualizerDataRoute:
+    """Tests for GET /graph/visualizer/data streaming."""
+
+    NODES = [
+        {"id": "1", "domainId": "a", "type": "person", "knowledge_graph_id": "kg-1"},
+        {"id": "2", "domainId": "b", "type": "person", "knowledge_graph_id": "kg-1"},
+    ]
+    EDGES = [
+        {
+            "id": "3",
+            "domainId": "e",
+            "source": "1",
+            "target": "2",
+            "type": "knows",
+            "knowledge_graph_id": "kg-1",
+        }
+    ]
+
+    def _client(self, monkeypatch, mock_current_user, authz, batches):
+        from fastapi import FastAPI
+
+        from graph.presentation import routes
+        from iam.dependencies.user import get_current_user
+        from infrastructure.authorization_dependencies import get_spicedb_client
+        from infrastructure.dependencies import get_age_connection_pool
+
+        self.calls: list[dict] = []
+        self.closed = False
+
+        def fake_batches(pool, graph_name, knowledge_graph_id=None):
+            self.calls.append(
+                {"graph_name": graph_name, "knowledge_graph_id": knowledge_graph_id}
+            )
+            try:
+                yield from batches
+            finally:
+                self.closed = True
+
+        app = FastAPI()
+        app.dependency_overrides[get_current_user] = lambda: mock_current_user
+        app.dependency_overrides[get_spicedb_client] = lambda: authz
+        app.dependency_overrides[get_age_connection_pool] = lambda: Mock()
+        app.include_router(routes.router)
+        monkeypatch.setattr(routes, "iter_bulk_graph_batches", fake_batches)
+        return TestClient(app)
+
+    def test_streams_json_document(
+        self, monkeypatch, mock_current_user, mock_authz_allowed
+    ):
+        """Batches should be joined into one nodes/edges JSON document."""
+        client = self._client(
+            monkeypatch,
+            mock_current_user,
+            mock_authz_allowed,
+            [
+                ("nodes", self.NODES[:1]),
+                ("nodes", self.NODES[1:]),
+                ("edges", self.EDGES),
+            ],
+        )
+
+        response = client.get("/graph/visualizer/data")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {"nodes": self.NODES, "edges": self.EDGES}
+        assert self.closed
+
+    def test_reads_and_closes_batches_on_one_thread(
+        self, monkeypatch, mock_current_user, mock_authz_allowed
+    ):
+        """A close must never race a next() still running on another thread."""
+        import threading
+
+        threads: set[int] = set()
+
+        def batches():
+            try:
+                for batch in [("nodes", self.NODES), ("edges", self.EDGES)]:
+                    threads.add(threading.get_ident())
+                    yield batch
+            finally:
+                threads.add(threading.get_ident())
+
+        client = self._client(
+            monkeypatch, mock_current_user, mock_authz_allowed, batches()
+        )
+
+        client.get("/graph/visualizer/data")
+
+        assert self.closed
+        assert len(threads) == 1
+
+    def test_empty_graph_is_valid_json(
+        self, monkeypatch, mock_current_user, mock_authz_allowed
+    ):
+        client = self._client(monkeypatch, mock_current_user, mock_authz_allowed, [])
+
+        response = client.get("/graph/visualizer/data")
+
+        assert response.json() == {"nodes": [], "edges": []}
+
+    def test_gzip_stream_decompresses(
+        self, monkeypatch, mock_current_user, mock_authz_allowed
+    ):
+        """Gzip-encoded streams should decode to the same document."""
+        client = self._client(
+            monkeypatch, mock_current_user, mock_authz_allowed, [("edges", self.EDGES)]
+        )
+
+        response = client.get(
+            "/graph/visualizer/data", headers={"Accept-Encoding": "gzip"}
+        )
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.json() == {"nodes": [], "edges": self.EDGES}
+
+    def test_redacts_entities_without_view(
+        self, monkeypatch, mock_current_user, mock_authz_denied
+    ):
+        client = self._client(
+            monkeypatch,
+            mock_current_user,
+            mock_authz_denied,
+            [("nodes", self.NODES[:1]), ("edges", self.EDGES)],
+        )
+
+        body = client.get("/graph/visualizer/data").json()
+
+        assert body["nodes"] == [
+            {
+                "id": "1",
+                "domainId": "a",
+                "type": "person",
+                "label": "",
+                "_redacted": True,
+            }
+        ]
+        assert body["edges"][0]["_redacted"] is True
+        assert "knowledge_graph_id" not in body["edges"][0]
+
+    def test_checks_each_knowledge_graph_once(
+        self, monkeypatch, mock_current_user, mock_authz_allowed
+    ):
+        client = self._client(
+            monkeypatch,
+            mock_current_user,
+            mock_authz_allowed,
+            [("nodes", self.NODES), ("edges", self.EDGES)],
+        )
+
+        client.get("/graph/visualizer/data")
+
+        assert mock_authz_allowed.check_permission_calls == []
+        assert len(mock_authz_allowed.bulk_check_permission_calls) == 1
+        assert len(mock_authz_allowed.bulk_check_permission_calls[0]) == 1
+
+    def test_checks_a_batch_with_one_bulk_call(
+        self, monkeypatch, mock_current_user, mock_authz_allowed
+    ):
+        """Distinct knowledge graphs in a batch share a single bulk check."""
+        nodes = [
+            {"id": str(i), "type": "person", "knowledge_graph_id": f"kg-{i % 3}"}
+            for i in range(9)
+        ]
+        client = self._client(
+            monkeypatch, mock_current_user, mock_authz_allowed, [("nodes", nodes)]
+        )
+
+        client.get("/graph/visualizer/data")
+
+        (call,) = mock_authz_allowed.bulk_check_permission_calls
+        assert sorted(resource for resource, _, _ in call) == [
+            "knowledge_graph:kg-0",
+            "knowledge_graph:kg-1",
+            "knowledge_graph:kg-2",
+        ]
+
+    def test_ndjson_emits_one_entity_per_line(
+        self, monkeypatch, mock_current_user, mock_authz_allowed
+    ):
+        import json
+
+        client = self._client(
+            monkeypatch,
+            mock_current_user,
+            mock_authz_allowed,
+            [("nodes", self.NODES), ("edges", self.EDGES)],
+        )
+
+        response = client.get(
+            "/graph/visualizer/data", headers={"Accept": "application/x-ndjson"}
+        )
+
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert lines == [{"node": n} for n in self.NODES] + [
+            {"edge": e} for e in self.EDGES
+        ]
+
+    def test_passes_knowledge_graph_filter_to_reader(
+        self, monkeypatch, mock_current_user, mock_authz_allowed
+    ):
+        client = self._client(monkeypatch, mock_current_user, mock_authz_allowed, [])
+
+        client.get("/graph/visualizer/data", params={"knowledge_graph_id": "kg-9"})
+
+        assert self.calls[0]["knowledge_graph_id"] == "kg-9"
@@ -0,0 +1,137 @@
+"""Unit tests for the verified API key cache and usage recorder."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from iam.application.api_key_cache import APIKeyUsageRecorder, VerifiedAPIKeyCache
+from iam.domain.aggregates import APIKey
+from iam.domain.value_objects import APIKeyId, TenantId, UserId
+
+
+class _FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _make_key() -> APIKey:
+    return APIKey(
+        id=APIKeyId.generate(),
+        created_by_user_id=UserId.generate(),
+        tenant_id=TenantId.generate(),
+        name="My Key",
+        key_hash="hash",
+        prefix="karto_abc12",
+        created_at=datetime.now(UTC),
+        expires_at=datetime.now(UTC) + timedelta(days=1),
+    )
+
+
+@pytest.fixture
+def clock() -> _FakeClock:
+    return _FakeClock()
+
+
+@pytest.fixture
+def cache(clock: _FakeClock) -> VerifiedAPIKeyCache:
+    return VerifiedAPIKeyCache(max_entries=2, ttl_seconds=5, clock=clock)
+
+
+class TestVerifiedAPIKeyCache:
+    """Tests for VerifiedAPIKeyCache."""
+
+    def test_returns_key_for_cached_secret(self, cache: VerifiedAPIKeyCache) -> None:
+        key = _make_key()
+        cache.put("secret-a", key)
+
+        cached = cache.get("secret-a")
+
+        assert cached is not None
+        assert cached.id == key.id
+        assert cache.get("secret-b") is None
+
+    def test_returns_independent_copies(self, cache: VerifiedAPIKeyCache) -> None:
+        cache.put("secret-a", _make_key())
+
+        first = cache.get("secret-a")
+        assert first is not None
+        first.record_usage()
+
+        second = cache.get("secret-a")
+        assert second is not None
+        assert second.last_used_at is None
+        assert second.collect_events() == []
+
+    def test_entries_expire_after_ttl(
+        self, cache: VerifiedAPIKeyCache, clock: _FakeClock
+    ) -> None:
+        cache.put("secret-a", _make_key())
+
+        clock.now = 4.9
+        assert cache.get("secret-a") is not None
+        clock.now = 5.0
+        assert cache.get("secret-a") is None
+
+    def test_least_recently_used_entry_is_evicted(
+        self, cache: VerifiedAPIKeyCache
+    ) -> None:
+        cache.put("secret-a", _make_key())
+        cache.put("secret-b", _make_key())
+        cache.get("secret-a")
+        cache.put("secret-c", _make_key())
+
+        assert cache.get("secret-a") is not None
+        assert cache.get("secret-b") is None
+        assert cache.get("secret-c") is not None
+
+    def test_invalidate_drops_only_that_key(self, cache: VerifiedAPIKeyCache) -> None:
+        key = _make_key()
+        cache.put("secret-a", key)
+        cache.put("secret-b", _make_key())
+
+        cache.invalidate(key.id.value)
+
+        assert cache.get("secret-a") is None
+        assert cache.get("secret-b") is not None
+
+
+class TestAPIKeyUsageRecorder:
+    """Tests for APIKeyUsageRecorder."""
+
+    def test_keeps_latest_usage_per_key(self) -> None:
+        recorder = APIKeyUsageRecorder()
+        earlier = datetime(2026, 1, 1, tzinfo=UTC)
+        later = earlier + timedelta(minutes=5)
+
+        recorder.record("key-1", later)
+        recorder.record("key-1", earlier)
+        recorder.record("key-2", earlier)
+
+        assert recorder.drain() == {"key-1": later, "key-2": earlier}
+
+    def test_drain_empties_recorder(self) -> None:
+        recorder = APIKeyUsageRecorder()
+        recorder.record("key-1", datetime.now(UTC))
+
+        recorder.drain()
+
+        assert recorder.drain() == {}
+
+    def test_restore_keeps_newer_usage(self) -> None:
+        recorder = APIKeyUsageRecorder()
+        earlier = datetime(2026, 1, 1, tzinfo=UTC)
+        later = earlier + timedelta(minutes=5)
+        recorder.record("key-1", earlier)
+        pending = recorder.drain()
+        recorder.record("key-1", later)
+
+        recorder.restore(pending)
+
+        assert recorder.drain() == {"key-1": later}
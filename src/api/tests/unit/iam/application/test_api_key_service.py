@@ -8,6 +8,7 @@ from unittest.mock import AsyncMock, MagicMock, create_autospec
 
 import pytest
 
+from iam.application.api_key_cache import APIKeyUsageRecorder, VerifiedAPIKeyCache
 from iam.application.services.api_key_service import APIKeyService
 from iam.application.value_objects import CurrentUser
 from iam.domain.aggregates import APIKey
@@ -863,6 +864,125 @@ class TestAPIKeyServiceValidate:
         assert result is None
 
 
+class TestAPIKeyServiceValidateCaching:
+    """Tests for validate_and_get_key with a verified key cache and recorder."""
+
+    SECRET = "karto_test_secret_12345"  # gitleaks:allow
+
+    @pytest.fixture
+    def cache(self) -> VerifiedAPIKeyCache:
+        return VerifiedAPIKeyCache(max_entries=10, ttl_seconds=60)
+
+    @pytest.fixture
+    def recorder(self) -> APIKeyUsageRecorder:
+        return APIKeyUsageRecorder()
+
+    @pytest.fixture
+    def caching_service(
+        self,
+        mock_session,
+        mock_api_key_repository,
+        mock_authz,
+        mock_probe,
+        cache,
+        recorder,
+    ) -> APIKeyService:
+        return APIKeyService(
+            session=mock_session,
+            api_key_repository=mock_api_key_repository,
+            authz=mock_authz,
+            probe=mock_probe,
+            verified_key_cache=cache,
+            usage_recorder=recorder,
+        )
+
+    @staticmethod
+    def _make_key(**overrides) -> APIKey:
+        fields = dict(
+            id=APIKeyId.generate(),
+            created_by_user_id=UserId.generate(),
+            expires_at=(datetime.now(UTC) + timedelta(days=1)),
+            tenant_id=TenantId.generate(),
+            name="My Key",
+            key_hash="hash",
+            prefix="karto_test_s",
+            created_at=datetime.now(UTC),
+        )
+        fields.update(overrides)
+        return APIKey(**fields)
+
+    @pytest.mark.asyncio
+    async def test_second_validation_skips_repository(
+        self, caching_service: APIKeyService, mock_api_key_repository
+    ):
+        """Repeat secrets should be answered from the cache."""
+        key = self._make_key()
+        mock_api_key_repository.get_verified_key = AsyncMock(return_value=key)
+
+        first = await caching_service.validate_and_get_key(self.SECRET)
+        second = await caching_service.validate_and_get_key(self.SECRET)
+
+        assert first is not None and second is not None
+        assert second.id == key.id
+        mock_api_key_repository.get_verified_key.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_invalid_keys_are_not_cached(
+        self, caching_service: APIKeyService, mock_api_key_repository
+    ):
+        """Revoked keys should be re-verified on every request."""
+        key = self._make_key(is_revoked=True)
+        mock_api_key_repository.get_verified_key = AsyncMock(return_value=key)
+
+        assert await caching_service.validate_and_get_key(self.SECRET) is None
+        assert await caching_service.validate_and_get_key(self.SECRET) is None
+
+        assert mock_api_key_repository.get_verified_key.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_records_usage_instead_of_committing(
+        self,
+        caching_service: APIKeyService,
+        mock_api_key_repository,
+        mock_session,
+        recorder: APIKeyUsageRecorder,
+    ):
+        """last_used_at should be left for the background flush."""
+        key = self._make_key()
+        mock_api_key_repository.get_verified_key = AsyncMock(return_value=key)
+
+        result = await caching_service.validate_and_get_key(self.SECRET)
+
+        assert result is not None
+        mock_api_key_repository.save.assert_not_called()
+        mock_session.commit.assert_not_called()
+        assert recorder.drain() == {key.id.value: result.last_used_at}
+
+    @pytest.mark.asyncio
+    async def test_revoke_invalidates_cached_key(
+        self,
+        caching_service: APIKeyService,
+        mock_api_key_repository,
+        mock_authz,
+        cache: VerifiedAPIKeyCache,
+    ):
+        """Revoking a key should stop it authenticating from the cache."""
+        key = self._make_key()
+        mock_api_key_repository.get_verified_key = AsyncMock(return_value=key)
+        await caching_service.validate_and_get_key(self.SECRET)
+        assert cache.get(self.SECRET) is not None
+
+        mock_api_key_repository.get_by_id = AsyncMock(return_value=key)
+        mock_authz.check_permission = AsyncMock(return_value=True)
+        await caching_service.revoke_api_key(
+            api_key_id=key.id,
+            user_id=key.created_by_user_id,
+            tenant_id=key.tenant_id,
+        )
+
+        assert cache.get(self.SECRET) is None
+
+
 class TestAPIKeyServiceList:
     """Tests for list_api_keys method."""
 
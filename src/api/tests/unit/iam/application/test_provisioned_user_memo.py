@@ -0,0 +1,73 @@
+"""Unit tests for ProvisionedUserMemo."""
+
+from __future__ import annotations
+
+import pytest
+
+from iam.application.provisioned_user_memo import ProvisionedUserMemo
+
+
+class _FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+PROFILE = ("alice", "Alice", "alice@example.com")
+
+
+@pytest.fixture
+def clock() -> _FakeClock:
+    return _FakeClock()
+
+
+@pytest.fixture
+def memo(clock: _FakeClock) -> ProvisionedUserMemo:
+    return ProvisionedUserMemo(max_entries=2, ttl_seconds=5, clock=clock)
+
+
+class TestProvisionedUserMemo:
+    """Tests for ProvisionedUserMemo."""
+
+    def test_unknown_user_is_not_current(self, memo: ProvisionedUserMemo) -> None:
+        assert not memo.is_current("user-1", PROFILE)
+        assert memo.skipped == 0
+
+    def test_remembered_profile_is_current(self, memo: ProvisionedUserMemo) -> None:
+        memo.remember("user-1", PROFILE)
+
+        assert memo.is_current("user-1", PROFILE)
+        assert memo.is_current("user-1", PROFILE)
+        assert memo.skipped == 2
+
+    def test_changed_profile_is_not_current(self, memo: ProvisionedUserMemo) -> None:
+        memo.remember("user-1", PROFILE)
+
+        assert not memo.is_current("user-1", ("alice", "Alice", "new@example.com"))
+        assert memo.skipped == 0
+
+    def test_entries_expire_after_ttl(
+        self, memo: ProvisionedUserMemo, clock: _FakeClock
+    ) -> None:
+        memo.remember("user-1", PROFILE)
+
+        clock.now = 4.9
+        assert memo.is_current("user-1", PROFILE)
+        clock.now = 5.0
+        assert not memo.is_current("user-1", PROFILE)
+
+    def test_least_recently_used_entry_is_evicted(
+        self, memo: ProvisionedUserMemo
+    ) -> None:
+        memo.remember("user-1", PROFILE)
+        memo.remember("user-2", PROFILE)
+        memo.is_current("user-1", PROFILE)
+        memo.remember("user-3", PROFILE)
+
+        assert memo.is_current("user-1", PROFILE)
+        assert not memo.is_current("user-2", PROFILE)
+        assert memo.is_current("user-3", PROFILE)
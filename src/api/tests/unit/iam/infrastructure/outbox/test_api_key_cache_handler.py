@@ -0,0 +1,140 @@
+"""Unit tests for APIKeyCacheInvalidationHandler."""
+
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+
+from iam.application.api_key_cache import VerifiedAPIKeyCache
+from iam.domain.aggregates import APIKey
+from iam.domain.value_objects import APIKeyId, TenantId, UserId
+from iam.infrastructure.outbox import (
+    API_KEY_INVALIDATION_CHANNEL,
+    APIKeyCacheInvalidationHandler,
+)
+
+
+@pytest.fixture
+def api_key() -> APIKey:
+    return APIKey(
+        id=APIKeyId.generate(),
+        created_by_user_id=UserId.generate(),
+        tenant_id=TenantId.generate(),
+        name="My Key",
+        key_hash="hash",
+        prefix="karto_abc12",
+        created_at=datetime.now(UTC),
+        expires_at=datetime.now(UTC) + timedelta(days=1),
+    )
+
+
+class _FakeNotifyBus:
+    """Stands in for Postgres NOTIFY/LISTEN shared by several replicas.
+
+    ``session_factory`` yields sessions whose ``pg_notify`` calls are
+    delivered to every listener when the session commits.
+    """
+
+    def __init__(self) -> None:
+        self.listeners: dict[str, list[Callable[[str], Awaitable[None]]]] = {}
+
+    def listen(self, channel: str, on_payload: Callable[[str], Awaitable[None]]):
+        self.listeners.setdefault(channel, []).append(on_payload)
+
+    def session_factory(self) -> MagicMock:
+        bus = self
+        pending: list[tuple[str, str]] = []
+
+        class _Session:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc_info):
+                return None
+
+            async def execute(self, statement, params):
+                assert "pg_notify" in str(statement)
+                pending.append((params["channel"], params["api_key_id"]))
+
+            async def commit(self):
+                for channel, payload in pending:
+                    for on_payload in bus.listeners.get(channel, []):
+                        await on_payload(payload)
+                pending.clear()
+
+        return MagicMock(side_effect=lambda: _Session())
+
+
+@pytest.fixture
+def cache(api_key: APIKey) -> VerifiedAPIKeyCache:
+    cache = VerifiedAPIKeyCache(max_entries=10, ttl_seconds=60)
+    cache.put("secret", api_key)
+    return cache
+
+
+class TestAPIKeyCacheInvalidationHandler:
+    """Tests for purging cached API keys from outbox events."""
+
+    def test_supports_revoked_and_deleted(self, cache: VerifiedAPIKeyCache):
+        handler = APIKeyCacheInvalidationHandler(cache)
+
+        assert handler.supported_event_types() == frozenset(
+            {"APIKeyRevoked", "APIKeyDeleted"}
+        )
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("event_type", ["APIKeyRevoked", "APIKeyDeleted"])
+    async def test_purges_cached_key(
+        self, cache: VerifiedAPIKeyCache, api_key: APIKey, event_type: str
+    ):
+        handler = APIKeyCacheInvalidationHandler(cache)
+
+        await handler.handle(event_type, {"api_key_id": api_key.id.value})
+
+        assert cache.get("secret") is None
+
+    @pytest.mark.asyncio
+    async def test_unknown_key_is_a_noop(self, cache: VerifiedAPIKeyCache):
+        handler = APIKeyCacheInvalidationHandler(cache)
+
+        await handler.handle("APIKeyRevoked", {"api_key_id": APIKeyId.generate().value})
+
+        assert cache.get("secret") is not None
+
+    @pytest.mark.asyncio
+    async def test_revocation_reaches_other_replicas(self, api_key: APIKey):
+        """A key revoked through one replica is purged from every replica."""
+        bus = _FakeNotifyBus()
+        replicas = []
+        for _ in range(3):
+            replica_cache = VerifiedAPIKeyCache(max_entries=10, ttl_seconds=60)
+            replica_cache.put("secret", api_key)
+            handler = APIKeyCacheInvalidationHandler(
+                replica_cache, session_factory=bus.session_factory()
+            )
+            bus.listen(API_KEY_INVALIDATION_CHANNEL, handler.on_notification)
+            replicas.append((replica_cache, handler))
+
+        # Only the replica whose outbox worker owns the event handles it
+        _, worker_handler = replicas[0]
+        await worker_handler.handle("APIKeyRevoked", {"api_key_id": api_key.id.value})
+
+        assert [replica_cache.get("secret") for replica_cache, _ in replicas] == [
+            None,
+            None,
+            None,
+        ]
+
+    @pytest.mark.asyncio
+    async def test_without_session_factory_only_local_cache_is_purged(
+        self, cache: VerifiedAPIKeyCache, api_key: APIKey
+    ):
+        other = VerifiedAPIKeyCache(max_entries=10, ttl_seconds=60)
+        other.put("secret", api_key)
+        handler = APIKeyCacheInvalidationHandler(cache)
+
+        await handler.handle("APIKeyDeleted", {"api_key_id": api_key.id.value})
+
+        assert cache.get("secret") is None
+        assert other.get("secret") is not None
@@ -0,0 +1,63 @@
+"""Unit tests for flushing coalesced API key usage."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from iam.dependencies.api_key import flush_api_key_usage, get_api_key_usage_recorder
+
+
+@pytest.fixture(autouse=True)
+def clean_recorder() -> Iterator[None]:
+    get_api_key_usage_recorder.cache_clear()
+    yield
+    get_api_key_usage_recorder.cache_clear()
+
+
+def _session_factory(session: AsyncMock) -> MagicMock:
+    context = MagicMock()
+    context.__aenter__ = AsyncMock(return_value=session)
+    context.__aexit__ = AsyncMock(return_value=None)
+    return MagicMock(return_value=context)
+
+
+class TestFlushAPIKeyUsage:
+    """Tests for flush_api_key_usage."""
+
+    @pytest.mark.asyncio
+    async def test_nothing_pending_opens_no_session(self):
+        factory = _session_factory(AsyncMock())
+
+        assert await flush_api_key_usage(factory) == 0
+
+        factory.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_writes_pending_usage_and_commits(self):
+        session = AsyncMock()
+        recorder = get_api_key_usage_recorder()
+        recorder.record("key-1", datetime.now(UTC))
+        recorder.record("key-2", datetime.now(UTC))
+
+        assert await flush_api_key_usage(_session_factory(session)) == 2
+
+        assert session.execute.await_count == 2
+        session.commit.assert_awaited_once()
+        assert recorder.drain() == {}
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_restores_pending_usage(self):
+        session = AsyncMock()
+        session.commit.side_effect = RuntimeError("database unavailable")
+        recorder = get_api_key_usage_recorder()
+        used_at = datetime.now(UTC)
+        recorder.record("key-1", used_at)
+
+        with pytest.raises(RuntimeError):
+            await flush_api_key_usage(_session_factory(session))
+
+        assert recorder.drain() == {"key-1": used_at}
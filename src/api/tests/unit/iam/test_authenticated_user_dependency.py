@@ -13,6 +13,7 @@ from fastapi import HTTPException
 from pytest_archon import archrule
 
 from iam.application.observability import UserServiceProbe
+from iam.application.provisioned_user_memo import ProvisionedUserMemo
 from iam.application.value_objects import AuthenticatedUser
 from iam.dependencies.user import _AuthResult, get_authenticated_user
 from iam.domain.aggregates import User
@@ -352,3 +353,99 @@ class TestGetAuthenticatedUser:
             was_created=True,
             was_updated=False,
         )
+
+
+class TestGetAuthenticatedUserProvisioningMemo:
+    """Tests for skipping JIT provisioning for recently provisioned users."""
+
+    @pytest.fixture
+    def memo(self) -> ProvisionedUserMemo:
+        return ProvisionedUserMemo(max_entries=10, ttl_seconds=60)
+
+    @pytest.mark.asyncio
+    async def test_second_request_skips_database(
+        self,
+        jwt_auth_result: _AuthResult,
+        mock_user_repo: AsyncMock,
+        mock_session: AsyncMock,
+        mock_probe: MagicMock,
+        memo: ProvisionedUserMemo,
+    ) -> None:
+        """An unchanged profile is provisioned once, then served from the memo."""
+        for _ in range(2):
+            await get_authenticated_user(
+                auth_result=jwt_auth_result,
+                user_repo=mock_user_repo,
+                session=mock_session,
+                probe=mock_probe,
+                memo=memo,
+            )
+
+        mock_user_repo.get_by_id.assert_awaited_once()
+        mock_session.begin.assert_called_once()
+        mock_probe.user_provisioning_skipped.assert_called_once_with(
+            user_id="external-user-123", skipped_total=1
+        )
+
+    @pytest.mark.asyncio
+    async def test_changed_profile_is_synced(
+        self,
+        jwt_auth_result: _AuthResult,
+        mock_user_repo: AsyncMock,
+        mock_session: AsyncMock,
+        mock_probe: MagicMock,
+        memo: ProvisionedUserMemo,
+    ) -> None:
+        """A profile change in SSO still reaches the database."""
+        await get_authenticated_user(
+            auth_result=jwt_auth_result,
+            user_repo=mock_user_repo,
+            session=mock_session,
+            probe=mock_probe,
+            memo=memo,
+        )
+        mock_user_repo.get_by_id.return_value = User(
+            id=jwt_auth_result.user_id, username=jwt_auth_result.username
+        )
+        renamed = _AuthResult(
+            user_id=jwt_auth_result.user_id,
+            username=jwt_auth_result.username,
+            api_key_tenant_id=None,
+            is_api_key=False,
+            email="new@example.com",
+        )
+
+        await get_authenticated_user(
+            auth_result=renamed,
+            user_repo=mock_user_repo,
+            session=mock_session,
+            probe=mock_probe,
+            memo=memo,
+        )
+
+        assert mock_user_repo.save.await_count == 2
+        mock_probe.user_provisioning_skipped.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_failed_provisioning_is_not_remembered(
+        self,
+        jwt_auth_result: _AuthResult,
+        mock_user_repo: AsyncMock,
+        mock_session: AsyncMock,
+        mock_probe: MagicMock,
+        memo: ProvisionedUserMemo,
+    ) -> None:
+        """A failed attempt is retried on the next request."""
+        mock_user_repo.save.side_effect = ProvisioningConflictError("testuser")
+
+        for _ in range(2):
+            with pytest.raises(HTTPException):
+                await get_authenticated_user(
+                    auth_result=jwt_auth_result,
+                    user_repo=mock_user_repo,
+                    session=mock_session,
+                    probe=mock_probe,
+                    memo=memo,
+                )
+
+        assert mock_user_repo.save.await_count == 2
@@ -18,6 +18,8 @@ from iam.dependencies.user import (
     get_current_user_no_jit,
 )
 from iam.domain.value_objects import TenantId, UserId
+from infrastructure.authorization_dependencies import get_zed_token_store
+from shared_kernel.authorization.spicedb.consistency import ConsistencyMode
 from shared_kernel.middleware.tenant_context import TenantContext
 
 
@@ -163,6 +165,38 @@ class TestGetCurrentUserNoJit:
         assert result.user_id == UserId(value="auth0|12345678901234567890")
         assert result.user_id.value == "auth0|12345678901234567890"
 
+    @pytest.mark.asyncio
+    async def test_reads_at_least_as_fresh_as_the_tenant_token(
+        self,
+        jwt_auth_result: _AuthResult,
+        tenant_context: TenantContext,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Should make the request's SpiceDB reads see the tenant's newest write."""
+        repository = MagicMock()
+        repository.return_value.get = AsyncMock(return_value="tenant-rev")
+        monkeypatch.setattr(
+            "iam.dependencies.user.TenantZedTokenRepository", repository
+        )
+        monkeypatch.setattr(
+            "iam.dependencies.user.get_spicedb_settings",
+            lambda: MagicMock(consistency=ConsistencyMode.AT_LEAST_AS_FRESH),
+        )
+        store = get_zed_token_store()
+
+        try:
+            await get_current_user_no_jit(
+                auth_result=jwt_auth_result,
+                tenant_context=tenant_context,
+                zed_token_session=AsyncMock(),
+            )
+            consistency = store.consistency(ConsistencyMode.AT_LEAST_AS_FRESH)
+        finally:
+            store.read_at_least_as_fresh(None)
+
+        repository.return_value.get.assert_awaited_once_with(tenant_context.tenant_id)
+        assert consistency.at_least_as_fresh.token == "tenant-rev"
+
 
 class TestGetCurrentUser:
     """Tests for get_current_user dependency (with JIT user provisioning)."""
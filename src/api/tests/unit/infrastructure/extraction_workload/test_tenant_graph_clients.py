@@ -0,0 +1,32 @@
+"""Unit tests for TenantGraphClientProvider."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+from infrastructure.extraction_workload.tenant_graph_clients import (
+    TenantGraphClientProvider,
+)
+from infrastructure.settings import DatabaseSettings
+
+
+def test_connect_uses_cached_graph_check_and_skips_setup_age() -> None:
+    settings = DatabaseSettings(tenant_graph_cache_ttl_seconds=120)
+    provider = TenantGraphClientProvider(pool=MagicMock(), settings=settings)
+
+    with (
+        patch(
+            "infrastructure.extraction_workload.tenant_graph_clients."
+            "ensure_tenant_graph_operational",
+            return_value="tenant_t1",
+        ) as ensure,
+        patch(
+            "infrastructure.extraction_workload.tenant_graph_clients.AgeGraphClient"
+        ) as client_cls,
+    ):
+        client = provider.connect("t1")
+
+    assert ensure.call_args.kwargs == {"cache_ttl_seconds": 120}
+    assert client_cls.call_args.kwargs["graph_name"] == "tenant_t1"
+    assert client_cls.call_args.kwargs["check_graph"] is False
+    client.connect.assert_called_once()
@@ -0,0 +1,167 @@
+"""Unit tests for outbox retention."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from infrastructure.outbox.retention import OutboxRetention
+
+
+def _rowcount(count: int) -> MagicMock:
+    result = MagicMock()
+    result.rowcount = count
+    return result
+
+
+def _session_factory(session: AsyncMock) -> MagicMock:
+    factory = MagicMock()
+    factory.return_value.__aenter__.return_value = session
+    return factory
+
+
+def _sql(session: AsyncMock, call_index: int) -> str:
+    stmt = session.execute.await_args_list[call_index].args[0]
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+class TestOutboxRetentionValidation:
+    """Tests for constructor validation."""
+
+    def test_rejects_non_positive_archive_age(self):
+        with pytest.raises(ValueError, match="archive_after"):
+            OutboxRetention(
+                session_factory=MagicMock(),
+                probe=MagicMock(),
+                archive_after=timedelta(0),
+            )
+
+    def test_rejects_zero_batch_size(self):
+        with pytest.raises(ValueError, match="batch_size"):
+            OutboxRetention(
+                session_factory=MagicMock(),
+                probe=MagicMock(),
+                archive_after=timedelta(hours=1),
+                batch_size=0,
+            )
+
+
+class TestOutboxRetentionRun:
+    """Tests for archiving and purging."""
+
+    @pytest.mark.asyncio
+    async def test_moves_processed_entries_into_archive(self):
+        session = AsyncMock()
+        session.execute.return_value = _rowcount(3)
+        probe = MagicMock()
+        retention = OutboxRetention(
+            session_factory=_session_factory(session),
+            probe=probe,
+            archive_after=timedelta(hours=24),
+            batch_size=10,
+        )
+
+        archived, purged = await retention.run()
+
+        assert (archived, purged) == (3, 0)
+        sql = _sql(session, 0)
+        assert "WITH moved AS" in sql
+        assert "DELETE FROM outbox WHERE" in sql
+        assert "outbox.processed_at IS NOT NULL" in sql
+        assert "FOR UPDATE SKIP LOCKED" in sql
+        assert "INSERT INTO outbox_archive" in sql
+        session.commit.assert_awaited_once()
+        probe.retention_completed.assert_called_once()
+        assert probe.retention_completed.call_args.args[:2] == (3, 0)
+
+    @pytest.mark.asyncio
+    async def test_repeats_full_batches_in_separate_transactions(self):
+        session = AsyncMock()
+        session.execute.side_effect = [_rowcount(10), _rowcount(10), _rowcount(4)]
+        retention = OutboxRetention(
+            session_factory=_session_factory(session),
+            probe=MagicMock(),
+            archive_after=timedelta(hours=24),
+            batch_size=10,
+        )
+
+        archived, _ = await retention.run()
+
+        assert archived == 24
+        assert session.commit.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_stops_after_max_batches(self):
+        session = AsyncMock()
+        session.execute.return_value = _rowcount(10)
+        retention = OutboxRetention(
+            session_factory=_session_factory(session),
+            probe=MagicMock(),
+            archive_after=timedelta(hours=24),
+            batch_size=10,
+            max_batches=2,
+        )
+
+        archived, _ = await retention.run()
+
+        assert archived == 20
+
+    @pytest.mark.asyncio
+    async def test_purges_archive_when_retention_configured(self):
+        session = AsyncMock()
+        session.execute.side_effect = [_rowcount(0), _rowcount(7)]
+        retention = OutboxRetention(
+            session_factory=_session_factory(session),
+            probe=MagicMock(),
+            archive_after=timedelta(hours=24),
+            purge_after=timedelta(days=30),
+            batch_size=10,
+        )
+
+        archived, purged = await retention.run()
+
+        assert (archived, purged) == (0, 7)
+        assert "DELETE FROM outbox_archive" in _sql(session, 1)
+
+    @pytest.mark.asyncio
+    async def test_purge_keeps_job_package_events(self):
+        """JobPackage lookups read these events from the archive."""
+        session = AsyncMock()
+        session.execute.side_effect = [_rowcount(0), _rowcount(0)]
+        retention = OutboxRetention(
+            session_factory=_session_factory(session),
+            probe=MagicMock(),
+            archive_after=timedelta(hours=24),
+            purge_after=timedelta(days=30),
+        )
+
+        await retention.run()
+
+        stmt = session.execute.await_args_list[1].args[0]
+        compiled = stmt.compile(dialect=postgresql.dialect())
+        assert "event_type NOT IN" in str(compiled)
+        assert {"IngestionPrepared", "JobPackageProduced"} <= {
+            value
+            for param in compiled.params.values()
+            for value in (param if isinstance(param, list | tuple) else [param])
+        }
+
+    @pytest.mark.asyncio
+    async def test_reports_failure_to_probe(self):
+        session = AsyncMock()
+        session.execute.side_effect = RuntimeError("connection lost")
+        probe = MagicMock()
+        retention = OutboxRetention(
+            session_factory=_session_factory(session),
+            probe=probe,
+            archive_after=timedelta(hours=24),
+        )
+
+        with pytest.raises(RuntimeError):
+            await retention.run()
+
+        probe.retention_failed.assert_called_once_with("connection lost")
+        probe.retention_completed.assert_not_called()
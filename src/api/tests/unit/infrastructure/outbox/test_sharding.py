@@ -0,0 +1,209 @@
+"""Unit tests for outbox sharding and shard lease coordination.
+
+The coordinator's SQL runs against Postgres; here a scripted session stands
+in for it, returning the rows each statement would produce.
+"""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from infrastructure.outbox.models import OutboxModel
+from infrastructure.outbox.sharding import (
+    OutboxShardCoordinator,
+    shard_expression,
+    shard_for_routing_key,
+)
+
+
+class _FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _rows(values: list[int]) -> MagicMock:
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = values
+    return result
+
+
+def _claim(shard: int | None) -> MagicMock:
+    result = MagicMock()
+    result.scalar_one_or_none.return_value = shard
+    return result
+
+
+def _session_factory(session: AsyncMock) -> MagicMock:
+    factory = MagicMock()
+    factory.return_value.__aenter__.return_value = session
+    return factory
+
+
+class TestShardRouting:
+    """Tests for mapping aggregates to shards."""
+
+    def test_negative_hash_maps_like_postgres(self):
+        """hashtext is a signed int4; masking the sign bit matches Postgres' &."""
+        assert shard_for_routing_key(-5, 8) == (2**31 - 5) % 8
+        assert shard_for_routing_key(13, 8) == 5
+
+    def test_shard_expression_uses_hashtext(self):
+        sql = str(
+            select(OutboxModel.id)
+            .where(shard_expression(8).in_([1]))
+            .compile(dialect=postgresql.dialect())
+        )
+
+        assert "hashtext(outbox.aggregate_id) &" in sql
+
+
+class TestOutboxShardCoordinatorValidation:
+    """Tests for constructor validation."""
+
+    def test_rejects_zero_shard_count(self):
+        with pytest.raises(ValueError, match="shard_count"):
+            OutboxShardCoordinator(session_factory=MagicMock(), shard_count=0)
+
+    def test_rejects_heartbeat_not_shorter_than_ttl(self):
+        with pytest.raises(ValueError, match="heartbeat_interval_seconds"):
+            OutboxShardCoordinator(
+                session_factory=MagicMock(),
+                shard_count=4,
+                lease_ttl_seconds=10,
+                heartbeat_interval_seconds=10,
+            )
+
+
+class TestOutboxShardCoordinatorHeartbeat:
+    """Tests for lease renewal and rebalancing."""
+
+    @pytest.fixture
+    def clock(self) -> _FakeClock:
+        return _FakeClock()
+
+    def _coordinator(
+        self, session: AsyncMock, clock: _FakeClock, shard_count: int = 4
+    ) -> OutboxShardCoordinator:
+        return OutboxShardCoordinator(
+            session_factory=_session_factory(session),
+            shard_count=shard_count,
+            lease_ttl_seconds=30,
+            heartbeat_interval_seconds=10,
+            worker_id="worker-a",
+            clock=clock,
+        )
+
+    @pytest.mark.asyncio
+    async def test_sole_worker_claims_every_free_shard(self, clock):
+        session = AsyncMock()
+        session.scalar.return_value = 1
+        session.execute.side_effect = [
+            MagicMock(),  # heartbeat upsert
+            MagicMock(),  # prune stale heartbeats
+            _rows([]),  # renew own leases
+            _rows([]),  # live leases held by anyone
+            _claim(0),
+            _claim(1),
+            _claim(2),
+            _claim(3),
+        ]
+        coordinator = self._coordinator(session, clock)
+
+        owned = await coordinator.heartbeat()
+
+        assert owned == frozenset({0, 1, 2, 3})
+        assert coordinator.owns_routing_key(5)
+        session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_releases_surplus_when_a_worker_joins(self, clock):
+        session = AsyncMock()
+        session.scalar.return_value = 2
+        session.execute.side_effect = [
+            MagicMock(),  # heartbeat upsert
+            MagicMock(),  # prune stale heartbeats
+            _rows([0, 1, 2, 3]),  # renew own leases
+            MagicMock(),  # release surplus
+        ]
+        coordinator = self._coordinator(session, clock)
+
+        owned = await coordinator.heartbeat()
+
+        assert owned == frozenset({0, 1})
+
+    @pytest.mark.asyncio
+    async def test_skips_shards_leased_by_others_and_lost_races(self, clock):
+        session = AsyncMock()
+        session.scalar.return_value = 2
+        session.execute.side_effect = [
+            MagicMock(),  # heartbeat upsert
+            MagicMock(),  # prune stale heartbeats
+            _rows([]),  # renew own leases
+            _rows([0]),  # shard 0 is held by another worker
+            _claim(None),  # shard 1 was taken concurrently
+            _claim(2),
+            _claim(3),
+        ]
+        coordinator = self._coordinator(session, clock)
+
+        owned = await coordinator.heartbeat()
+
+        assert owned == frozenset({2, 3})
+
+    @pytest.mark.asyncio
+    async def test_prunes_heartbeats_of_long_dead_workers(self, clock):
+        session = AsyncMock()
+        session.scalar.return_value = 1
+        session.execute.side_effect = [MagicMock(), MagicMock(), _rows([0, 1, 2, 3])]
+        coordinator = self._coordinator(session, clock)
+
+        await coordinator.heartbeat()
+
+        prune = session.execute.await_args_list[1].args[0]
+        compiled = prune.compile(dialect=postgresql.dialect())
+        assert str(compiled).startswith("DELETE FROM outbox_worker_heartbeats")
+        assert "outbox_worker_heartbeats.expires_at < now() -" in str(compiled)
+        assert list(compiled.params.values()) == [timedelta(seconds=300)]
+
+    @pytest.mark.asyncio
+    async def test_ownership_lapses_without_heartbeats(self, clock):
+        session = AsyncMock()
+        session.scalar.return_value = 1
+        session.execute.side_effect = [MagicMock(), MagicMock(), _rows([0, 1, 2, 3])]
+        coordinator = self._coordinator(session, clock)
+
+        await coordinator.heartbeat()
+        clock.now = 29.9
+        assert coordinator.owned_shards == frozenset({0, 1, 2, 3})
+        clock.now = 30.0
+        assert coordinator.owned_shards == frozenset()
+        assert not coordinator.owns_routing_key(5)
+
+    @pytest.mark.asyncio
+    async def test_release_forgets_ownership(self, clock):
+        session = AsyncMock()
+        session.scalar.return_value = 1
+        session.execute.side_effect = [
+            MagicMock(),
+            MagicMock(),
+            _rows([0, 1, 2, 3]),
+            MagicMock(),  # delete leases
+            MagicMock(),  # delete heartbeat
+        ]
+        coordinator = self._coordinator(session, clock)
+        await coordinator.heartbeat()
+
+        await coordinator.release()
+
+        assert coordinator.owned_shards == frozenset()
+        assert session.commit.await_count == 2
@@ -7,12 +7,23 @@ extracting the _apply_operation pattern match from OutboxWorker.
 
 from __future__ import annotations
 
+from collections.abc import Awaitable, Callable
 from unittest.mock import AsyncMock, MagicMock, call
 
 import pytest
+from authzed.api.v1 import ZedToken
 
-from infrastructure.outbox.spicedb_handler import SpiceDBEventHandler
-from shared_kernel.authorization.types import RelationType, ResourceType
+from infrastructure.outbox.spicedb_handler import (
+    DECISION_INVALIDATION_CHANNEL,
+    SpiceDBEventHandler,
+)
+from shared_kernel.authorization.caching import PermissionDecisionCache
+from shared_kernel.authorization.spicedb.consistency import ZedTokenStore
+from shared_kernel.authorization.types import (
+    RelationshipSpec,
+    RelationType,
+    ResourceType,
+)
 from shared_kernel.outbox.operations import (
     DeleteRelationship,
     DeleteRelationshipsByFilter,
@@ -121,8 +132,8 @@ class TestSpiceDBEventHandler:
         )
 
     @pytest.mark.asyncio
-    async def test_handle_applies_multiple_operations_in_order(self) -> None:
-        """handle should apply all operations in order from the translator."""
+    async def test_handle_batches_contiguous_relationship_operations(self) -> None:
+        """Contiguous writes and deletes are applied in one update call."""
         write_op = WriteRelationship(
             resource_type=ResourceType.GROUP,
             resource_id="group-1",
@@ -144,29 +155,76 @@ class TestSpiceDBEventHandler:
         handler = SpiceDBEventHandler(translator=translator, authz=authz)
         await handler.handle("GroupUpdated", {"id": "group-1"})
 
-        # Verify both operations applied
-        authz.write_relationship.assert_awaited_once_with(
-            resource="group:group-1",
-            relation="tenant",
-            subject="tenant:tenant-1",
-        )
-        authz.delete_relationship.assert_awaited_once_with(
-            resource="group:group-1",
-            relation="member",
-            subject="user:user-old",
+        assert authz.method_calls == [
+            call.update_relationships(
+                writes=[RelationshipSpec("group:group-1", "tenant", "tenant:tenant-1")],
+                deletes=[RelationshipSpec("group:group-1", "member", "user:user-old")],
+            ),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_handle_applies_filter_deletes_between_batches_in_order(
+        self,
+    ) -> None:
+        """A filter delete splits the batches around it, preserving order."""
+        writes = [
+            WriteRelationship(
+                resource_type=ResourceType.GROUP,
+                resource_id="group-1",
+                relation=RelationType.MEMBER,
+                subject_type=ResourceType.USER,
+                subject_id=f"user-{i}",
+            )
+            for i in range(3)
+        ]
+        filter_op = DeleteRelationshipsByFilter(
+            resource_type=ResourceType.GROUP,
+            resource_id="group-1",
         )
+        translator = MagicMock()
+        translator.translate.return_value = [
+            writes[0],
+            writes[1],
+            filter_op,
+            writes[2],
+        ]
+        authz = AsyncMock()
+
+        handler = SpiceDBEventHandler(translator=translator, authz=authz)
+        await handler.handle("GroupReset", {})
+
+        assert [c[0] for c in authz.method_calls] == [
+            "update_relationships",
+            "delete_relationships_by_filter",
+            "write_relationship",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_handle_splits_batch_on_repeated_relationship(self) -> None:
+        """The same relationship twice never lands in one request."""
+        kwargs = {
+            "resource_type": ResourceType.GROUP,
+            "resource_id": "group-1",
+            "relation": RelationType.MEMBER,
+            "subject_type": ResourceType.USER,
+            "subject_id": "user-1",
+        }
+        translator = MagicMock()
+        translator.translate.return_value = [
+            DeleteRelationship(**kwargs),
+            WriteRelationship(**kwargs),
+        ]
+        authz = AsyncMock()
+
+        handler = SpiceDBEventHandler(translator=translator, authz=authz)
+        await handler.handle("MemberRoleChanged", {})
 
-        # Verify order: write before delete
         assert authz.method_calls == [
-            call.write_relationship(
-                resource="group:group-1",
-                relation="tenant",
-                subject="tenant:tenant-1",
-            ),
             call.delete_relationship(
-                resource="group:group-1",
-                relation="member",
-                subject="user:user-old",
+                resource="group:group-1", relation="member", subject="user:user-1"
+            ),
+            call.write_relationship(
+                resource="group:group-1", relation="member", subject="user:user-1"
             ),
         ]
 
@@ -245,3 +303,360 @@ class TestSpiceDBEventHandler:
         authz.write_relationship.assert_not_awaited()
         authz.delete_relationship.assert_not_awaited()
         authz.delete_relationships_by_filter.assert_not_awaited()
+
+
+class TestSpiceDBEventHandlerDecisionCache:
+    """Tests for invalidating cached permission decisions."""
+
+    @staticmethod
+    def _cache() -> PermissionDecisionCache:
+        cache = PermissionDecisionCache(max_entries=100, ttl_seconds=60)
+        cache.put(("group:group-1", "view", "user:user-1"), True)
+        cache.put(("workspace:ws-1", "view", "user:user-2"), False)
+        return cache
+
+    @pytest.mark.asyncio
+    async def test_user_relationship_write_invalidates_that_users_decisions(
+        self,
+    ) -> None:
+        """Writing a user relationship drops only that user's decisions."""
+        write_op = WriteRelationship(
+            resource_type=ResourceType.GROUP,
+            resource_id="group-9",
+            relation=RelationType.MEMBER,
+            subject_type=ResourceType.USER,
+            subject_id="user-1",
+        )
+        translator = MagicMock()
+        translator.translate.return_value = [write_op]
+        cache = self._cache()
+
+        handler = SpiceDBEventHandler(
+            translator=translator, authz=AsyncMock(), decision_cache=cache
+        )
+        await handler.handle("MemberAdded", {})
+
+        assert cache.get(("group:group-1", "view", "user:user-1")) is None
+        assert cache.get(("workspace:ws-1", "view", "user:user-2")) is False
+
+    @pytest.mark.asyncio
+    async def test_delete_by_filter_clears_decisions(self) -> None:
+        """A delete by filter may touch anything, so the cache is cleared."""
+        filter_op = DeleteRelationshipsByFilter(
+            resource_type=ResourceType.WORKSPACE,
+            resource_id="ws-1",
+        )
+        translator = MagicMock()
+        translator.translate.return_value = [filter_op]
+        cache = self._cache()
+
+        handler = SpiceDBEventHandler(
+            translator=translator, authz=AsyncMock(), decision_cache=cache
+        )
+        await handler.handle("WorkspaceDeleted", {})
+
+        assert cache.get(("group:group-1", "view", "user:user-1")) is None
+        assert cache.get(("workspace:ws-1", "view", "user:user-2")) is None
+
+    @pytest.mark.asyncio
+    async def test_invalidates_even_when_authz_fails(self) -> None:
+        """A failed write may have partially applied, so still invalidate."""
+        write_op = WriteRelationship(
+            resource_type=ResourceType.WORKSPACE,
+            resource_id="ws-1",
+            relation=RelationType.MEMBER,
+            subject_type=ResourceType.USER,
+            subject_id="user-2",
+        )
+        translator = MagicMock()
+        translator.translate.return_value = [write_op]
+        authz = AsyncMock()
+        authz.write_relationship.side_effect = Exception("SpiceDB unavailable")
+        cache = self._cache()
+
+        handler = SpiceDBEventHandler(
+            translator=translator, authz=authz, decision_cache=cache
+        )
+        with pytest.raises(Exception, match="SpiceDB unavailable"):
+            await handler.handle("MemberAdded", {})
+
+        assert cache.get(("workspace:ws-1", "view", "user:user-2")) is None
+
+
+class _FakeNotifyBus:
+    """Stands in for Postgres NOTIFY/LISTEN shared by several replicas.
+
+    ``session_factory`` yields sessions whose ``pg_notify`` calls are
+    delivered to every listener when the session commits.
+    """
+
+    def __init__(self) -> None:
+        self.listeners: dict[str, list[Callable[[str], Awaitable[None]]]] = {}
+        self.sent: list[str] = []
+
+    def listen(self, channel: str, on_payload: Callable[[str], Awaitable[None]]):
+        self.listeners.setdefault(channel, []).append(on_payload)
+
+    def session_factory(self) -> MagicMock:
+        bus = self
+        pending: list[tuple[str, str]] = []
+
+        class _Session:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc_info):
+                return None
+
+            async def execute(self, statement, params):
+                assert "pg_notify" in str(statement)
+                pending.append((params["channel"], params["payload"]))
+
+            async def commit(self):
+                for channel, payload in pending:
+                    bus.sent.append(payload)
+                    for on_payload in bus.listeners.get(channel, []):
+                        await on_payload(payload)
+                pending.clear()
+
+        return MagicMock(side_effect=lambda: _Session())
+
+
+class TestSpiceDBEventHandlerBroadcast:
+    """Tests for broadcasting decision invalidations to other replicas."""
+
+    REVOKED = ("workspace:ws-1", "view", "user:user-2")
+    UNRELATED = ("group:group-1", "view", "user:user-1")
+
+    def _replicas(self, bus: _FakeNotifyBus, translator: MagicMock, count: int):
+        replicas = []
+        for _ in range(count):
+            cache = PermissionDecisionCache(max_entries=100, ttl_seconds=60)
+            cache.put(self.REVOKED, True)
+            cache.put(self.UNRELATED, True)
+            handler = SpiceDBEventHandler(
+                translator=translator,
+                authz=AsyncMock(),
+                decision_cache=cache,
+                session_factory=bus.session_factory(),
+            )
+            bus.listen(DECISION_INVALIDATION_CHANNEL, handler.on_notification)
+            replicas.append((cache, handler))
+        return replicas
+
+    @pytest.mark.asyncio
+    async def test_revocation_reaches_second_replica(self) -> None:
+        """A revoked grant is dropped from a replica that did not apply it."""
+        translator = MagicMock()
+        translator.translate.return_value = [
+            DeleteRelationship(
+                resource_type=ResourceType.WORKSPACE,
+                resource_id="ws-1",
+                relation=RelationType.MEMBER,
+                subject_type=ResourceType.USER,
+                subject_id="user-2",
+            )
+        ]
+        bus = _FakeNotifyBus()
+        (_, worker_handler), (other_cache, _) = self._replicas(bus, translator, 2)
+
+        await worker_handler.handle("MemberRemoved", {})
+
+        assert other_cache.get(self.REVOKED) is None
+        assert other_cache.get(self.UNRELATED) is True
+
+    @pytest.mark.asyncio
+    async def test_oversized_broadcast_clears_every_cache(self) -> None:
+        translator = MagicMock()
+        translator.translate.return_value = [
+            WriteRelationship(
+                resource_type=ResourceType.WORKSPACE,
+                resource_id=f"ws-{index}",
+                relation=RelationType.MEMBER,
+                subject_type=ResourceType.USER,
+                subject_id=f"user-{index}",
+            )
+            for index in range(500)
+        ]
+        bus = _FakeNotifyBus()
+        (_, worker_handler), (other_cache, _) = self._replicas(bus, translator, 2)
+
+        await worker_handler.handle("MembersAdded", {})
+
+        assert bus.sent == ["[[null, null]]"]
+        assert other_cache.get(self.UNRELATED) is None
+
+    @pytest.mark.asyncio
+    async def test_unreadable_notification_clears_cache(self) -> None:
+        bus = _FakeNotifyBus()
+        ((cache, handler),) = self._replicas(bus, MagicMock(), 1)
+
+        await handler.on_notification("not json")
+
+        assert cache.get(self.UNRELATED) is None
+
+    @pytest.mark.asyncio
+    async def test_without_session_factory_nothing_is_broadcast(self) -> None:
+        translator = MagicMock()
+        translator.translate.return_value = [
+            DeleteRelationshipsByFilter(
+                resource_type=ResourceType.WORKSPACE, resource_id="ws-1"
+            )
+        ]
+        cache = PermissionDecisionCache(max_entries=100, ttl_seconds=60)
+        cache.put(self.UNRELATED, True)
+        handler = SpiceDBEventHandler(
+            translator=translator, authz=AsyncMock(), decision_cache=cache
+        )
+
+        await handler.handle("WorkspaceDeleted", {})
+
+        assert cache.get(self.UNRELATED) is None
+
+
+class _FakeZedTokens:
+    """In-memory ``spicedb_zed_tokens`` behind TenantZedTokenRepository."""
+
+    def __init__(self) -> None:
+        self.rows: dict[str, tuple[str | None, int]] = {}
+        self.forgotten = 0
+
+    def repository(self, session: object) -> _FakeZedTokens:
+        return self
+
+    async def writes(self, tenant_id: str) -> int:
+        return self.rows.get(tenant_id, (None, 0))[1]
+
+    async def record(
+        self, tenant_id: str, *, writes_seen: int, token: str | None
+    ) -> None:
+        _, writes = self.rows.get(tenant_id, (None, 0))
+        self.rows[tenant_id] = (token if writes == writes_seen else None, writes + 1)
+
+    async def forget_all(self) -> None:
+        self.forgotten += 1
+        self.rows = {tenant: (None, n + 1) for tenant, (_, n) in self.rows.items()}
+
+
+class _Session:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return None
+
+    async def execute(self, statement, params=None):
+        return None
+
+    async def commit(self):
+        return None
+
+
+class TestSpiceDBEventHandlerZedTokens:
+    """Tests for recording each tenant's newest ZedToken for every replica."""
+
+    WRITE = WriteRelationship(
+        resource_type=ResourceType.WORKSPACE,
+        resource_id="ws-1",
+        relation=RelationType.MEMBER,
+        subject_type=ResourceType.USER,
+        subject_id="user-1",
+    )
+
+    @pytest.fixture
+    def tokens(self, monkeypatch: pytest.MonkeyPatch) -> _FakeZedTokens:
+        tokens = _FakeZedTokens()
+        monkeypatch.setattr(
+            "infrastructure.outbox.spicedb_handler.TenantZedTokenRepository",
+            tokens.repository,
+        )
+        return tokens
+
+    @staticmethod
+    def _authz(store: ZedTokenStore, *revisions: str) -> AsyncMock:
+        """Authz whose writes report ``revisions`` to the store in turn."""
+        pending = iter(revisions)
+
+        async def write(**kwargs: object) -> None:
+            with store.write() as observe:
+                observe(ZedToken(token=next(pending)))
+
+        authz = AsyncMock()
+        authz.write_relationship.side_effect = write
+        return authz
+
+    def _handler(
+        self, authz: AsyncMock, store: ZedTokenStore | None, operations=None
+    ) -> SpiceDBEventHandler:
+        translator = MagicMock()
+        translator.translate.return_value = operations or [self.WRITE]
+        return SpiceDBEventHandler(
+            translator=translator,
+            authz=authz,
+            session_factory=MagicMock(side_effect=_Session),
+            token_store=store,
+        )
+
+    @pytest.mark.asyncio
+    async def test_records_last_write_token_for_tenant(
+        self, tokens: _FakeZedTokens
+    ) -> None:
+        store = ZedTokenStore()
+        handler = self._handler(self._authz(store, "rev-1", "rev-2"), store)
+
+        await handler.handle("MemberAdded", {"tenant_id": "tenant-1"})
+        await handler.handle("MemberAdded", {"tenant_id": "tenant-1"})
+
+        assert tokens.rows == {"tenant-1": ("rev-2", 2)}
+
+    @pytest.mark.asyncio
+    async def test_overlapping_write_clears_token(self, tokens: _FakeZedTokens) -> None:
+        """A token recorded after another handler's write may not cover it."""
+        store = ZedTokenStore()
+        authz = self._authz(store, "rev-1")
+        handler = self._handler(authz, store)
+
+        async def overlapping_write(**kwargs: object) -> None:
+            await tokens.record("tenant-1", writes_seen=0, token="rev-other")
+            await self._authz(store, "rev-1").write_relationship(**kwargs)
+
+        authz.write_relationship.side_effect = overlapping_write
+        await handler.handle("MemberAdded", {"tenant_id": "tenant-1"})
+
+        assert tokens.rows == {"tenant-1": (None, 2)}
+
+    @pytest.mark.asyncio
+    async def test_failed_write_clears_token(self, tokens: _FakeZedTokens) -> None:
+        store = ZedTokenStore()
+        tokens.rows["tenant-1"] = ("rev-0", 1)
+        authz = AsyncMock()
+        authz.write_relationship.side_effect = Exception("SpiceDB unavailable")
+        handler = self._handler(authz, store)
+
+        with pytest.raises(Exception, match="SpiceDB unavailable"):
+            await handler.handle("MemberAdded", {"tenant_id": "tenant-1"})
+
+        assert tokens.rows == {"tenant-1": (None, 2)}
+
+    @pytest.mark.asyncio
+    async def test_event_without_tenant_clears_every_token(
+        self, tokens: _FakeZedTokens
+    ) -> None:
+        store = ZedTokenStore()
+        tokens.rows["tenant-1"] = ("rev-0", 1)
+        handler = self._handler(self._authz(store, "rev-1"), store)
+
+        await handler.handle("GroupMemberAdded", {})
+
+        assert tokens.forgotten == 1
+        assert tokens.rows == {"tenant-1": (None, 2)}
+
+    @pytest.mark.asyncio
+    async def test_without_token_store_nothing_is_recorded(
+        self, tokens: _FakeZedTokens
+    ) -> None:
+        handler = self._handler(AsyncMock(), None)
+
+        await handler.handle("MemberAdded", {"tenant_id": "tenant-1"})
+
+        assert tokens.rows == {}
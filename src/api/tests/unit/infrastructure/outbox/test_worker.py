@@ -223,6 +223,247 @@ class TestOutboxWorkerProcessBatch:
         assert max_in_flight <= 3
 
 
+def _entry(aggregate_id: str, event_type: str = "MemberAdded") -> OutboxEntry:
+    return OutboxEntry(
+        id=uuid4(),
+        aggregate_type="group",
+        aggregate_id=aggregate_id,
+        event_type=event_type,
+        payload={"__type__": event_type, "group_id": aggregate_id},
+        occurred_at=datetime(2026, 1, 8, 12, 0, 0, tzinfo=UTC),
+        processed_at=None,
+        created_at=datetime(2026, 1, 8, 12, 0, 1, tzinfo=UTC),
+    )
+
+
+class TestOutboxWorkerPartitionedProcessing:
+    """Tests for per-aggregate partitioned processing and bulk marking."""
+
+    @pytest.mark.asyncio
+    async def test_processes_aggregates_in_parallel_preserving_their_order(self):
+        """Different aggregates run concurrently; one aggregate stays ordered."""
+        in_flight = 0
+        max_in_flight = 0
+        handled: list[tuple[str, str]] = []
+
+        async def handle(event_type: str, payload: dict) -> None:
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            handled.append((payload["group_id"], event_type))
+            in_flight -= 1
+
+        mock_handler = AsyncMock()
+        mock_handler.handle.side_effect = handle
+
+        entries = [
+            _entry("G1", "GroupCreated"),
+            _entry("G2", "GroupCreated"),
+            _entry("G3", "GroupCreated"),
+            _entry("G1", "MemberAdded"),
+            _entry("G2", "MemberAdded"),
+            _entry("G1", "GroupDeleted"),
+        ]
+
+        worker = OutboxWorker(
+            session_factory=AsyncMock(),
+            handler=mock_handler,
+            probe=MagicMock(),
+            event_source=None,
+            partition_max_concurrency=2,
+        )
+
+        await worker._process_entries(entries, AsyncMock())
+
+        assert max_in_flight == 2
+        assert [event for group, event in handled if group == "G1"] == [
+            "GroupCreated",
+            "MemberAdded",
+            "GroupDeleted",
+        ]
+        assert [event for group, event in handled if group == "G2"] == [
+            "GroupCreated",
+            "MemberAdded",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_marks_successes_with_single_update(self):
+        """All successful entries in a batch are marked by one statement."""
+        mock_session = AsyncMock()
+        entries = [_entry("G1"), _entry("G2"), _entry("G3")]
+
+        worker = OutboxWorker(
+            session_factory=AsyncMock(),
+            handler=AsyncMock(),
+            probe=MagicMock(),
+            event_source=None,
+            partition_max_concurrency=3,
+        )
+
+        await worker._process_entries(entries, mock_session)
+
+        mock_session.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failure_in_one_partition_does_not_block_others(self):
+        """A failing aggregate is retried while the others are marked."""
+        mock_session = AsyncMock()
+        mock_probe = MagicMock()
+        failing, passing = _entry("G1"), _entry("G2")
+
+        async def handle(event_type: str, payload: dict) -> None:
+            if payload["group_id"] == "G1":
+                raise RuntimeError("SpiceDB unavailable")
+
+        mock_handler = AsyncMock()
+        mock_handler.handle.side_effect = handle
+
+        worker = OutboxWorker(
+            session_factory=AsyncMock(),
+            handler=mock_handler,
+            probe=mock_probe,
+            event_source=None,
+            partition_max_concurrency=2,
+        )
+
+        await worker._process_entries([failing, passing], mock_session)
+
+        mock_probe.event_processed.assert_called_once_with(passing.id, "MemberAdded")
+        mock_probe.event_processing_failed.assert_called_once_with(
+            failing.id, "SpiceDB unavailable", 1
+        )
+        # One bulk mark for the success, one retry update for the failure
+        assert mock_session.execute.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failure_stops_the_rest_of_its_partition(self):
+        """Later entries of a failing aggregate wait for a later batch."""
+        mock_session = AsyncMock()
+        mock_probe = MagicMock()
+        first, second, other = _entry("G1"), _entry("G1", "GroupDeleted"), _entry("G2")
+        handled: list[str] = []
+
+        async def handle(event_type: str, payload: dict) -> None:
+            handled.append(f"{payload['group_id']}:{event_type}")
+            if payload["group_id"] == "G1":
+                raise RuntimeError("SpiceDB unavailable")
+
+        mock_handler = AsyncMock()
+        mock_handler.handle.side_effect = handle
+
+        worker = OutboxWorker(
+            session_factory=AsyncMock(),
+            handler=mock_handler,
+            probe=mock_probe,
+            event_source=None,
+            partition_max_concurrency=2,
+        )
+
+        await worker._process_entries([first, second, other], mock_session)
+
+        assert "G1:GroupDeleted" not in handled
+        mock_probe.event_processed.assert_called_once_with(other.id, "MemberAdded")
+        mock_probe.event_processing_failed.assert_called_once_with(
+            first.id, "SpiceDB unavailable", 1
+        )
+        # One bulk mark for G2, one retry update for the first G1 entry;
+        # the second G1 entry is neither marked nor retried
+        assert mock_session.execute.await_count == 2
+
+
+class TestOutboxWorkerSharding:
+    """Tests for processing only the shards this worker leases."""
+
+    @staticmethod
+    def _coordinator(owned: frozenset[int]) -> MagicMock:
+        coordinator = MagicMock()
+        coordinator.shard_count = 4
+        coordinator.heartbeat_interval = 60
+        coordinator.owned_shards = owned
+        coordinator.heartbeat = AsyncMock(return_value=owned)
+        coordinator.release = AsyncMock()
+        return coordinator
+
+    @pytest.mark.asyncio
+    async def test_batch_without_owned_shards_skips_query(self):
+        mock_session = AsyncMock()
+        session_factory = MagicMock()
+        session_factory.return_value.__aenter__.return_value = mock_session
+
+        worker = OutboxWorker(
+            session_factory=session_factory,
+            handler=AsyncMock(),
+            probe=MagicMock(),
+            shard_coordinator=self._coordinator(frozenset()),
+        )
+
+        await worker._process_batch()
+
+        mock_session.execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_batch_query_filters_to_owned_shards(self):
+        mock_session = AsyncMock()
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = []
+        mock_session.execute.return_value = result
+        session_factory = MagicMock()
+        session_factory.return_value.__aenter__.return_value = mock_session
+
+        worker = OutboxWorker(
+            session_factory=session_factory,
+            handler=AsyncMock(),
+            probe=MagicMock(),
+            shard_coordinator=self._coordinator(frozenset({1, 3})),
+        )
+
+        await worker._process_batch()
+
+        stmt = mock_session.execute.await_args.args[0]
+        assert "hashtext" in str(stmt)
+
+    @pytest.mark.asyncio
+    async def test_start_claims_shards_and_stop_releases_them(self):
+        coordinator = self._coordinator(frozenset({0, 1}))
+        coordinator.owned_shards = frozenset()
+        mock_probe = MagicMock()
+        worker = OutboxWorker(
+            session_factory=AsyncMock(),
+            handler=AsyncMock(),
+            probe=mock_probe,
+            poll_interval_seconds=60,
+            shard_coordinator=coordinator,
+        )
+        worker._process_batch = AsyncMock()  # type: ignore[method-assign]
+
+        await worker.start()
+        await worker.stop()
+
+        coordinator.heartbeat.assert_awaited_once()
+        mock_probe.shards_assigned.assert_called_once_with([0, 1], 4)
+        coordinator.release.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_heartbeat_failure_is_reported(self):
+        coordinator = self._coordinator(frozenset())
+        coordinator.heartbeat.side_effect = RuntimeError("database unavailable")
+        mock_probe = MagicMock()
+        worker = OutboxWorker(
+            session_factory=AsyncMock(),
+            handler=AsyncMock(),
+            probe=mock_probe,
+            shard_coordinator=coordinator,
+        )
+
+        await worker._heartbeat()
+
+        mock_probe.shard_heartbeat_failed.assert_called_once_with(
+            "database unavailable"
+        )
+        mock_probe.shards_assigned.assert_not_called()
+
+
 class TestOutboxWorkerLifecycle:
     """Tests for worker start/stop lifecycle."""
 
@@ -418,6 +659,15 @@ class TestOutboxWorkerValidation:
                 max_retries=-1,
             )
 
+    def test_rejects_zero_partition_max_concurrency(self):
+        with pytest.raises(ValueError, match="partition_max_concurrency"):
+            OutboxWorker(
+                session_factory=AsyncMock(),
+                handler=AsyncMock(),
+                probe=MagicMock(),
+                partition_max_concurrency=0,
+            )
+
     def test_rejects_none_session_factory(self):
         with pytest.raises(ValueError, match="session_factory"):
             OutboxWorker(session_factory=None, handler=AsyncMock(), probe=MagicMock())
@@ -1,11 +1,15 @@
 """Unit tests for ConnectionPool."""
 
+import threading
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
+from psycopg2 import extensions
 from pydantic import SecretStr
 
-from infrastructure.database.connection_pool import ConnectionPool
+from infrastructure.database.connection_pool import ConnectionPool, WorkloadClass
+from infrastructure.database.exceptions import DatabaseConnectionError
 from infrastructure.settings import DatabaseSettings
 
 
@@ -199,3 +203,203 @@ class TestSetupAge:
 
             # Verify commit called
             mock_conn.commit.assert_called_once()
+
+
+def _make_pool(settings, **overrides):
+    """Create a ConnectionPool over a mocked ThreadedConnectionPool."""
+    settings = settings.model_copy(update=overrides)
+    with patch(
+        "infrastructure.database.connection_pool.psycopg2_pool.ThreadedConnectionPool"
+    ) as mock_pool_class:
+        mock_pool_instance = MagicMock()
+        mock_pool_instance.getconn.side_effect = lambda: MagicMock()
+        mock_pool_class.return_value = mock_pool_instance
+        pool = ConnectionPool(settings)
+    pool._ensure_age_setup = MagicMock()
+    return pool, mock_pool_instance
+
+
+class TestBoundedWait:
+    """Tests for waiting on an exhausted pool."""
+
+    def test_times_out_when_pool_is_exhausted(self, mock_db_settings):
+        """Should raise DatabaseConnectionError after the wait expires."""
+        pool, _ = _make_pool(mock_db_settings, pool_max_connections=2)
+        pool.get_connection()
+        pool.get_connection()
+
+        with pytest.raises(DatabaseConnectionError, match="Pool exhausted"):
+            pool.get_connection(timeout=0.05)
+
+        assert pool.stats().waiting == 0
+
+    def test_waiter_gets_connection_when_one_is_returned(self, mock_db_settings):
+        """A blocked caller should be served as soon as a connection is returned."""
+        pool, _ = _make_pool(mock_db_settings, pool_max_connections=2)
+        held = pool.get_connection()
+        pool.get_connection()
+        acquired = []
+
+        waiter = threading.Thread(
+            target=lambda: acquired.append(pool.get_connection(timeout=5))
+        )
+        waiter.start()
+        _wait_for(lambda: pool.stats().waiting == 1)
+        pool.return_connection(held)
+        waiter.join(timeout=5)
+
+        assert len(acquired) == 1
+        assert pool.stats().in_use == 2
+
+    def test_waiters_are_served_in_arrival_order(self, mock_db_settings):
+        """Waiters should acquire connections first-in, first-out."""
+        pool, _ = _make_pool(mock_db_settings, pool_max_connections=2)
+        held = [pool.get_connection(), pool.get_connection()]
+        order = []
+
+        def acquire(name):
+            pool.get_connection(timeout=5)
+            order.append(name)
+
+        threads = []
+        for name in ("first", "second"):
+            thread = threading.Thread(target=acquire, args=(name,))
+            thread.start()
+            threads.append(thread)
+            _wait_for(lambda: pool.stats().waiting == len(threads))
+
+        pool.return_connection(held[0])
+        _wait_for(lambda: order == ["first"])
+        pool.return_connection(held[1])
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert order == ["first", "second"]
+
+
+class TestWorkloadQuotas:
+    """Tests for per-workload connection quotas."""
+
+    def test_quota_limits_workload(self, mock_db_settings):
+        """A workload at its quota should not take more connections."""
+        pool, _ = _make_pool(mock_db_settings, pool_mutation_max_connections=1)
+        pool.get_connection(workload=WorkloadClass.MUTATION)
+
+        with pytest.raises(DatabaseConnectionError):
+            pool.get_connection(workload=WorkloadClass.MUTATION, timeout=0)
+
+    def test_full_quota_does_not_block_other_workloads(self, mock_db_settings):
+        """A waiter blocked by its quota should not hold up other workloads."""
+        pool, _ = _make_pool(mock_db_settings, pool_mutation_max_connections=1)
+        pool.get_connection(workload=WorkloadClass.MUTATION)
+        errors = []
+
+        def wait_for_mutation_slot():
+            try:
+                pool.get_connection(workload=WorkloadClass.MUTATION, timeout=0.5)
+            except DatabaseConnectionError as e:
+                errors.append(e)
+
+        blocked = threading.Thread(target=wait_for_mutation_slot)
+        blocked.start()
+        _wait_for(lambda: pool.stats().waiting == 1)
+
+        conn = pool.get_connection(workload=WorkloadClass.INTERACTIVE, timeout=0)
+
+        assert conn is not None
+        assert pool.stats().in_use_by_workload == {
+            WorkloadClass.INTERACTIVE: 1,
+            WorkloadClass.MUTATION: 1,
+            WorkloadClass.BACKGROUND: 0,
+        }
+        blocked.join(timeout=5)
+        assert len(errors) == 1
+
+    def test_return_releases_workload_slot(self, mock_db_settings):
+        """Returning a connection should free its workload's slot."""
+        pool, _ = _make_pool(mock_db_settings, pool_mutation_max_connections=1)
+        conn = pool.get_connection(workload=WorkloadClass.MUTATION)
+        pool.return_connection(conn)
+
+        assert pool.get_connection(workload=WorkloadClass.MUTATION, timeout=0)
+
+    def test_settings_reject_quota_above_pool_size(self, mock_db_settings):
+        """A workload quota larger than the pool is a configuration error."""
+        with pytest.raises(ValueError, match="pool_background_max_connections"):
+            DatabaseSettings(pool_max_connections=5, pool_background_max_connections=6)
+
+
+class TestCheckoutHealthCheck:
+    """Tests for checking reused connections on checkout."""
+
+    def test_discards_closed_connection(self, mock_db_settings):
+        """A reused connection that was closed should be replaced."""
+        pool, mock_pool_instance = _make_pool(mock_db_settings)
+        stale = MagicMock(closed=0)
+        fresh = MagicMock()
+        mock_pool_instance.getconn.side_effect = [stale, stale, fresh]
+        pool.return_connection(pool.get_connection())
+        stale.closed = 1  # Dropped by the server while idle
+
+        assert pool.get_connection() is fresh
+        mock_pool_instance.putconn.assert_called_with(stale, close=True)
+
+    def test_pings_long_idle_connection(self, mock_db_settings):
+        """Connections idle past the threshold should be pinged."""
+        pool, mock_pool_instance = _make_pool(
+            mock_db_settings, pool_health_check_idle_seconds=0
+        )
+        conn = MagicMock(closed=0)
+        conn.get_transaction_status.return_value = extensions.TRANSACTION_STATUS_IDLE
+        mock_pool_instance.getconn.side_effect = [conn, conn]
+        pool.return_connection(pool.get_connection())
+
+        assert pool.get_connection() is conn
+        cursor = conn.cursor.return_value.__enter__.return_value
+        cursor.execute.assert_called_once_with("SELECT 1")
+
+    def test_forgets_connection_closed_by_psycopg2_on_return(self, mock_db_settings):
+        """Connections psycopg2 closes on return must not pass state to new ones."""
+        pool, mock_pool_instance = _make_pool(mock_db_settings)
+        conn = MagicMock(closed=0)
+        pool._age_setup_connections.add(id(conn))
+        mock_pool_instance.getconn.side_effect = [conn]
+        mock_pool_instance.putconn.side_effect = lambda c: setattr(c, "closed", 1)
+
+        pool.return_connection(pool.get_connection())
+
+        assert id(conn) not in pool._idle_since
+        assert id(conn) not in pool._age_setup_connections
+
+    def test_age_setup_failure_returns_connection_to_psycopg2(self, mock_db_settings):
+        """A failed setup must free the connection in psycopg2 and the slot."""
+        pool, mock_pool_instance = _make_pool(mock_db_settings)
+        conn = MagicMock()
+        mock_pool_instance.getconn.side_effect = [conn]
+        pool._ensure_age_setup.side_effect = RuntimeError("LOAD failed")
+
+        with pytest.raises(RuntimeError, match="LOAD failed"):
+            pool.get_connection()
+
+        mock_pool_instance.putconn.assert_called_once_with(conn, close=True)
+        assert pool.stats().in_use == 0
+
+    def test_skips_ping_for_recently_used_connection(self, mock_db_settings):
+        """Connections returned recently should not cost a round trip."""
+        pool, mock_pool_instance = _make_pool(mock_db_settings)
+        conn = MagicMock(closed=0)
+        conn.get_transaction_status.return_value = extensions.TRANSACTION_STATUS_IDLE
+        mock_pool_instance.getconn.side_effect = [conn, conn]
+        pool.return_connection(pool.get_connection())
+
+        assert pool.get_connection() is conn
+        conn.cursor.assert_not_called()
+
+
+def _wait_for(condition, timeout=5.0):
+    """Poll until ``condition`` holds or fail the test."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            pytest.fail("condition not reached")
+        time.sleep(0.005)
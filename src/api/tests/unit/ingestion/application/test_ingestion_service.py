@@ -7,6 +7,7 @@ Uses fakes for adapter, outbox, and work directory.
 from __future__ import annotations
 
 import tempfile
+import zipfile
 from pathlib import Path
 
 import pytest
@@ -14,6 +15,7 @@ import pytest
 from ingestion.application.services.ingestion_service import IngestionService
 from ingestion.application.value_objects import IngestionRunResult
 from ingestion.ports.adapters import ExtractionResult, IDatasourceAdapter
+from shared_kernel.job_package.reader import JobPackageReader
 from shared_kernel.job_package.value_objects import (
     AdapterCheckpoint,
     ChangeOperation,
@@ -239,3 +241,79 @@ class TestIngestionService:
 
         assert adapter.last_sync_mode == SyncMode.FULL_REFRESH
         assert adapter.last_checkpoint is None
+
+    async def test_packages_spooled_content_and_removes_spool_dir(self, tmp_path):
+        """Content spooled to disk by the adapter is packaged, then cleaned up."""
+        content = b"print('spooled')"
+        content_ref = ContentRef.from_bytes(content)
+        spool_dir = tmp_path / "spool"
+        spool_dir.mkdir()
+        (spool_dir / content_ref.hex_digest).write_bytes(content)
+        entry = ChangesetEntry(
+            operation=ChangeOperation.ADD,
+            id=content_ref.hex_digest,
+            type="io.kartograph.change.file",
+            path="src/main.py",
+            content_ref=content_ref,
+            content_type="text/x-python",
+            metadata={},
+        )
+        adapter = _FakeAdapter(
+            result=ExtractionResult(
+                changeset_entries=[entry],
+                content_blobs={},
+                new_checkpoint=AdapterCheckpoint(schema_version="1.0.0", data={}),
+                content_files={
+                    content_ref.hex_digest: spool_dir / content_ref.hex_digest
+                },
+                spool_dir=spool_dir,
+            )
+        )
+        work_dir = tmp_path / "work"
+        service = IngestionService(
+            adapter_registry={"github": adapter}, work_dir=work_dir
+        )
+
+        result = await service.run(
+            sync_run_id="run-001",
+            data_source_id="ds-001",
+            knowledge_graph_id="kg-001",
+            adapter_type="github",
+            connection_config={"repo": "org/repo"},
+            credentials_path=None,
+        )
+
+        archive_path = work_dir / result.job_package_id.archive_name()
+        with zipfile.ZipFile(archive_path) as zf:
+            assert zf.read(f"content/{content_ref.hex_digest}") == content
+        assert not spool_dir.exists()
+
+    async def test_content_blob_store_shares_content_across_runs(self, tmp_path):
+        """Runs for a tenant write content to its blob store, not each archive."""
+        adapter = _FakeAdapter(result=_make_extraction_result())
+        service = IngestionService(
+            adapter_registry={"github": adapter},
+            work_dir=tmp_path,
+            use_content_blob_store=True,
+        )
+        run_kwargs = {
+            "data_source_id": "ds-001",
+            "knowledge_graph_id": "kg-001",
+            "adapter_type": "github",
+            "connection_config": {"repo": "org/repo"},
+            "credentials_path": None,
+            "tenant_id": "tenant-001",
+        }
+
+        first = await service.run(sync_run_id="run-001", **run_kwargs)
+        (tmp_path / first.job_package_id.archive_name()).unlink()
+        second = await service.run(sync_run_id="run-002", **run_kwargs)
+
+        content_ref = ContentRef.from_bytes(b"print('hello')")
+        reader = JobPackageReader(tmp_path / second.job_package_id.archive_name())
+        assert reader.read_manifest().content_store == "tenant-001"
+        assert reader.read_content(content_ref) == b"print('hello')"
+        refs_dir = tmp_path / "blobs" / "tenant-001" / "refs"
+        assert sorted(path.name for path in refs_dir.iterdir()) == sorted(
+            [first.job_package_id.value, second.job_package_id.value]
+        ), "garbage collection runs periodically, not after each build"
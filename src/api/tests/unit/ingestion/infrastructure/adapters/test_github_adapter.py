@@ -26,11 +26,13 @@ import base64
 import io
 import json
 import tarfile
+from unittest.mock import MagicMock
 
 import httpx
 import pytest
 
 from ingestion.infrastructure.adapters.github import GitHubAdapter
+from ingestion.infrastructure.adapters.github_scheduler import GitHubRequestSchedulers
 from ingestion.ports.adapters import IDatasourceAdapter
 from shared_kernel.job_package.value_objects import (
     AdapterCheckpoint,
@@ -388,6 +390,138 @@ class TestFullRefresh:
         assert len(result.changeset_entries) == 2
 
 
+class _ChunkedStream(httpx.AsyncByteStream):
+    """Response body delivered in small chunks, like a real download."""
+
+    def __init__(self, payload: bytes, chunk_size: int = 4096) -> None:
+        self._payload = payload
+        self._chunk_size = chunk_size
+
+    async def __aiter__(self):
+        for start in range(0, len(self._payload), self._chunk_size):
+            yield self._payload[start : start + self._chunk_size]
+
+
+class _StreamingTarballTransport(httpx.AsyncBaseTransport):
+    """Serves the branch, the tree, and a chunked tarball."""
+
+    def __init__(self, tarball: bytes, *, forbid_token: bool = False) -> None:
+        self._tarball = tarball
+        self._forbid_token = forbid_token
+        self.tarball_requests = 0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        url_path = request.url.path
+        if "/tarball/" in url_path:
+            self.tarball_requests += 1
+            if self._forbid_token and request.headers.get("authorization"):
+                return httpx.Response(403, content=b'{"message":"Forbidden"}')
+            return httpx.Response(200, stream=_ChunkedStream(self._tarball))
+        if url_path.endswith("/branches/main"):
+            data: dict = _branch_response(HEAD_SHA)
+        elif f"/git/trees/{HEAD_SHA}" in url_path:
+            data = _tree_response()
+        else:
+            raise RuntimeError(f"Unexpected URL: {url_path}")
+        return httpx.Response(
+            200,
+            content=json.dumps(data).encode(),
+            headers={"content-type": "application/json"},
+        )
+
+
+class TestStreamingFullRefresh:
+    """Scenario: Streaming full refresh — content is spooled to disk.
+
+    - GIVEN a spool directory is configured
+    - WHEN the adapter runs a full refresh
+    - THEN each file's content is written to a content-addressed spool file
+    """
+
+    async def _extract(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        spool_root,
+        connection_config,
+        credentials,
+    ):
+        adapter = GitHubAdapter(
+            http_client=httpx.AsyncClient(transport=transport),
+            spool_dir=spool_root,
+        )
+        return await adapter.extract(
+            connection_config=connection_config,
+            credentials=credentials,
+            checkpoint=None,
+            sync_mode=SyncMode.FULL_REFRESH,
+        )
+
+    @pytest.mark.asyncio
+    async def test_spools_content_instead_of_holding_blobs(
+        self, tmp_path, connection_config, credentials
+    ):
+        large = bytes(range(256)) * 8192  # 2 MiB, spans many download chunks
+        transport = _StreamingTarballTransport(
+            _tarball_bytes(
+                {
+                    "README.md": README_CONTENT,
+                    "docs/copy.md": README_CONTENT,
+                    "data/large.bin": large,
+                }
+            )
+        )
+
+        result = await self._extract(
+            transport, tmp_path, connection_config, credentials
+        )
+
+        assert result.content_blobs == {}
+        assert result.spool_dir is not None
+        assert result.spool_dir.parent == tmp_path
+        assert [entry.path for entry in result.changeset_entries] == [
+            "README.md",
+            "docs/copy.md",
+            "data/large.bin",
+        ]
+        # Identical content is spooled once
+        assert len(result.content_files) == 2
+        for entry, expected in zip(
+            result.changeset_entries, [README_CONTENT, README_CONTENT, large]
+        ):
+            path = result.content_files[entry.content_ref.hex_digest]
+            assert path.parent == result.spool_dir
+            assert path.read_bytes() == expected
+        assert transport.tarball_requests == 1
+        assert result.branch_file_count == 2
+
+    @pytest.mark.asyncio
+    async def test_streaming_retries_without_auth_when_token_returns_403(
+        self, tmp_path, connection_config, credentials
+    ):
+        transport = _StreamingTarballTransport(
+            _tarball_bytes({"README.md": README_CONTENT}), forbid_token=True
+        )
+
+        result = await self._extract(
+            transport, tmp_path, connection_config, credentials
+        )
+
+        assert len(result.changeset_entries) == 1
+        assert transport.tarball_requests == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_extraction_removes_spool_dir(
+        self, tmp_path, connection_config, credentials
+    ):
+        truncated = _tarball_bytes({"README.md": README_CONTENT * 1000})[:200]
+        transport = _StreamingTarballTransport(truncated)
+
+        with pytest.raises((tarfile.TarError, EOFError)):
+            await self._extract(transport, tmp_path, connection_config, credentials)
+
+        assert list(tmp_path.iterdir()) == []
+
+
 # ---------------------------------------------------------------------------
 # Spec scenario: Incremental sync via checkpoint
 # ---------------------------------------------------------------------------
@@ -1047,3 +1181,197 @@ class TestContentFetching:
         assert len(result.changeset_entries) == 1
         assert auth_attempts >= 1
         assert unauth_attempts >= 1
+
+
+# ---------------------------------------------------------------------------
+# Request scheduling: Compare truncation, conditional requests
+# ---------------------------------------------------------------------------
+
+
+def _json_response(data: dict, headers: dict[str, str] | None = None):
+    return httpx.Response(
+        200,
+        content=json.dumps(data).encode(),
+        headers={"content-type": "application/json", **(headers or {})},
+    )
+
+
+class TestScheduledRequests:
+    """Incremental syncs go through the shared request scheduler.
+
+    Spec scenarios: Rate-limit-aware requests, Complete incremental changes
+    """
+
+    def _adapter(self, handler, **kwargs) -> GitHubAdapter:
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        kwargs.setdefault("schedulers", GitHubRequestSchedulers())
+        return GitHubAdapter(http_client=client, **kwargs)
+
+    async def _incremental(self, adapter, connection_config, credentials):
+        return await adapter.extract(
+            connection_config=connection_config,
+            credentials=credentials,
+            checkpoint=AdapterCheckpoint(
+                schema_version="1.0.0", data={"commit_sha": BASE_SHA}
+            ),
+            sync_mode=SyncMode.INCREMENTAL,
+        )
+
+    @pytest.mark.asyncio
+    async def test_compare_reads_only_the_first_page(
+        self, connection_config, credentials
+    ):
+        """Later Compare pages list commits, so their Link is not followed."""
+        compare_path = f"/compare/{BASE_SHA}...{HEAD_SHA}"
+        compare_requests: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            path = request.url.path
+            if path.endswith("/branches/main"):
+                return _json_response(_branch_response(HEAD_SHA))
+            if path.endswith(compare_path):
+                compare_requests.append(str(request.url))
+                next_url = request.url.copy_merge_params({"page": "2"})
+                return _json_response(
+                    _compare_response(),
+                    headers={"link": f'<{next_url}>; rel="next"'},
+                )
+            if HEAD_TREE_PATH in path:
+                return _json_response(_tree_response())
+            if f"/git/blobs/{BLOB_SHA_UTILS}" in path:
+                return _json_response(_blob_response(UTILS_PY_CONTENT))
+            raise RuntimeError(f"Unexpected URL: {request.url}")
+
+        result = await self._incremental(
+            self._adapter(handler), connection_config, credentials
+        )
+
+        assert len(compare_requests) == 1
+        assert "page=" not in compare_requests[0]
+        assert [entry.path for entry in result.changeset_entries] == ["src/utils.py"]
+
+    @pytest.mark.asyncio
+    async def test_truncated_compare_falls_back_to_tree_diff(
+        self, connection_config, credentials
+    ):
+        probe = MagicMock()
+        truncated_files = [
+            {"filename": f"gen/file_{i}.txt", "sha": f"sha{i}", "status": "added"}
+            for i in range(300)
+        ]
+        base_tree = [
+            {"path": "README.md", "type": "blob", "sha": BLOB_SHA_README},
+            {"path": "src/main.py", "type": "blob", "sha": "old-main-sha"},
+        ]
+        head_tree = [
+            {"path": "README.md", "type": "blob", "sha": BLOB_SHA_README},
+            {"path": "src/main.py", "type": "blob", "sha": BLOB_SHA_MAIN},
+            {"path": "src/utils.py", "type": "blob", "sha": BLOB_SHA_UTILS},
+            {"path": "src", "type": "tree", "sha": "tree-sha"},
+        ]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            path = request.url.path
+            if path.endswith("/branches/main"):
+                return _json_response(_branch_response(HEAD_SHA))
+            if "/compare/" in path:
+                return _json_response(_compare_response(truncated_files))
+            if f"/git/trees/{BASE_SHA}" in path:
+                return _json_response(_tree_response(base_tree))
+            if HEAD_TREE_PATH in path:
+                return _json_response(_tree_response(head_tree))
+            if f"/git/blobs/{BLOB_SHA_UTILS}" in path:
+                return _json_response(_blob_response(UTILS_PY_CONTENT))
+            if f"/git/blobs/{BLOB_SHA_MAIN}" in path:
+                return _json_response(_blob_response(MAIN_PY_CONTENT))
+            raise RuntimeError(f"Unexpected URL: {request.url}")
+
+        result = await self._incremental(
+            self._adapter(handler, probe=probe), connection_config, credentials
+        )
+
+        operations = {entry.path: entry.operation for entry in result.changeset_entries}
+        assert operations == {
+            "src/main.py": ChangeOperation.MODIFY,
+            "src/utils.py": ChangeOperation.ADD,
+        }
+        probe.compare_truncated.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_truncated_trees_fall_back_to_full_refresh(
+        self, connection_config, credentials
+    ):
+        probe = MagicMock()
+        tarball_requests = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal tarball_requests
+            path = request.url.path
+            if path.endswith("/branches/main"):
+                return _json_response(_branch_response(HEAD_SHA))
+            if "/compare/" in path:
+                return _json_response(
+                    _compare_response(
+                        [
+                            {"filename": f"f{i}", "sha": f"s{i}", "status": "added"}
+                            for i in range(300)
+                        ]
+                    )
+                )
+            if "/git/trees/" in path:
+                return _json_response({"tree": [], "truncated": True})
+            if "/tarball/" in path:
+                tarball_requests += 1
+                return httpx.Response(
+                    200, content=_tarball_bytes({"README.md": README_CONTENT})
+                )
+            raise RuntimeError(f"Unexpected URL: {request.url}")
+
+        result = await self._incremental(
+            self._adapter(handler, probe=probe), connection_config, credentials
+        )
+
+        assert tarball_requests == 1
+        assert [entry.path for entry in result.changeset_entries] == ["README.md"]
+        probe.incremental_fallback_to_full_refresh.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_etags_are_reused_across_syncs(self, connection_config, credentials):
+        probe = MagicMock()
+        revalidated: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            path = request.url.path
+            etag = f'"{path}"'
+            if (
+                "/git/blobs/" not in path
+                and request.headers.get("if-none-match") == etag
+            ):
+                revalidated.append(path)
+                return httpx.Response(304)
+            if path.endswith("/branches/main"):
+                return _json_response(_branch_response(HEAD_SHA), {"etag": etag})
+            if "/compare/" in path:
+                return _json_response(_compare_response(), {"etag": etag})
+            if HEAD_TREE_PATH in path:
+                return _json_response(_tree_response(), {"etag": etag})
+            if f"/git/blobs/{BLOB_SHA_UTILS}" in path:
+                return _json_response(_blob_response(UTILS_PY_CONTENT))
+            raise RuntimeError(f"Unexpected URL: {request.url}")
+
+        schedulers = GitHubRequestSchedulers()
+        for _ in range(2):
+            # A fresh adapter per sync, as the ingestion handler creates them
+            result = await self._incremental(
+                self._adapter(handler, schedulers=schedulers, probe=probe),
+                connection_config,
+                credentials,
+            )
+            assert [entry.path for entry in result.changeset_entries] == [
+                "src/utils.py"
+            ]
+
+        assert len(revalidated) == 3
+        first, second = probe.sync_requests_completed.call_args_list
+        assert first.kwargs["not_modified"] == 0
+        assert second.kwargs["not_modified"] == 3
@@ -0,0 +1,320 @@
+"""Unit tests for the GitHub request scheduler.
+
+Uses httpx.MockTransport to simulate GitHub API responses, and a fake clock
+and sleep so rate-limit pauses run instantly.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from ingestion.infrastructure.adapters.github_scheduler import (
+    GitHubETagCache,
+    GitHubRequestScheduler,
+    GitHubRequestSchedulers,
+    GitHubRequestStats,
+)
+
+URL = "https://api.github.com/repos/myorg/myrepo/branches/main"
+
+
+class FakeClock:
+    """Wall clock advanced only by the scheduler's sleeps."""
+
+    def __init__(self, now: float = 1_000_000.0) -> None:
+        self.now = now
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _json(status_code: int = 200, headers: dict[str, str] | None = None, **body):
+    return httpx.Response(
+        status_code,
+        content=json.dumps(body).encode(),
+        headers={"content-type": "application/json", **(headers or {})},
+    )
+
+
+def _client(handler) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def _scheduler(clock: FakeClock, **kwargs) -> GitHubRequestScheduler:
+    kwargs.setdefault("probe", MagicMock())
+    return GitHubRequestScheduler(clock=clock, sleep=clock.sleep, **kwargs)
+
+
+class TestConditionalRequests:
+    """ETag caching for conditional requests."""
+
+    @pytest.mark.asyncio
+    async def test_not_modified_response_is_served_from_cache(self):
+        seen_if_none_match: list[str | None] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen_if_none_match.append(request.headers.get("if-none-match"))
+            if request.headers.get("if-none-match") == '"v1"':
+                return httpx.Response(304)
+            return _json(headers={"etag": '"v1"'}, commit={"sha": "abc"})
+
+        scheduler = _scheduler(FakeClock())
+        stats = GitHubRequestStats()
+        async with _client(handler) as client:
+            first = await scheduler.get(
+                client, URL, headers={}, stats=stats, conditional=True
+            )
+            second = await scheduler.get(
+                client, URL, headers={}, stats=stats, conditional=True
+            )
+
+        assert seen_if_none_match == [None, '"v1"']
+        assert second.status_code == 200
+        assert second.json() == first.json() == {"commit": {"sha": "abc"}}
+        assert stats.requests == 2
+        assert stats.not_modified == 1
+
+    @pytest.mark.asyncio
+    async def test_unconditional_requests_are_not_cached(self):
+        seen_if_none_match: list[str | None] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen_if_none_match.append(request.headers.get("if-none-match"))
+            return _json(headers={"etag": '"v1"'})
+
+        scheduler = _scheduler(FakeClock())
+        async with _client(handler) as client:
+            for _ in range(2):
+                await scheduler.get(client, URL, headers={}, stats=GitHubRequestStats())
+
+        assert seen_if_none_match == [None, None]
+
+    @pytest.mark.asyncio
+    async def test_cache_evicts_least_recently_used_beyond_size_limit(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.headers.get("if-none-match"):
+                return httpx.Response(304)
+            return _json(headers={"etag": f'"{request.url.path}"'}, pad="x" * 100)
+
+        scheduler = _scheduler(FakeClock(), etag_cache=GitHubETagCache(max_bytes=250))
+        stats = GitHubRequestStats()
+        async with _client(handler) as client:
+            for name in ("a", "b", "c"):
+                await scheduler.get(
+                    client, f"{URL}/{name}", headers={}, stats=stats, conditional=True
+                )
+            for name in ("a", "c"):
+                await scheduler.get(
+                    client, f"{URL}/{name}", headers={}, stats=stats, conditional=True
+                )
+
+        # Only two ~110 byte bodies fit: "a" was evicted, "c" is still cached
+        assert stats.not_modified == 1
+
+
+class TestRateLimits:
+    """Waiting out, retrying, and adapting to rate limits."""
+
+    @pytest.mark.asyncio
+    async def test_retries_after_retry_after_delay(self):
+        responses = [
+            _json(429, headers={"retry-after": "2"}, message="slow down"),
+            _json(commit={"sha": "abc"}),
+        ]
+        clock = FakeClock()
+        probe = MagicMock()
+        scheduler = _scheduler(clock, max_concurrency=8, probe=probe)
+        stats = GitHubRequestStats()
+
+        async with _client(lambda request: responses.pop(0)) as client:
+            response = await scheduler.get(client, URL, headers={}, stats=stats)
+
+        assert response.status_code == 200
+        assert clock.sleeps == [2.0]
+        assert stats.requests == 2
+        assert stats.throttle_seconds == 2.0
+        assert scheduler.concurrency_limit == 4
+        probe.rate_limited.assert_called_once_with(URL, 429, 2.0, None)
+
+    @pytest.mark.asyncio
+    async def test_exhausted_primary_limit_waits_until_reset(self):
+        clock = FakeClock()
+        reset = str(int(clock.now) + 30)
+        responses = [
+            _json(
+                403,
+                headers={"x-ratelimit-remaining": "0", "x-ratelimit-reset": reset},
+                message="API rate limit exceeded",
+            ),
+            _json(headers={"x-ratelimit-remaining": "4999"}),
+        ]
+        scheduler = _scheduler(clock)
+        stats = GitHubRequestStats()
+
+        async with _client(lambda request: responses.pop(0)) as client:
+            response = await scheduler.get(client, URL, headers={}, stats=stats)
+
+        assert response.status_code == 200
+        assert clock.sleeps == [30.0]
+
+    @pytest.mark.asyncio
+    async def test_forbidden_without_rate_limit_headers_is_not_retried(self):
+        requests = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal requests
+            requests += 1
+            return _json(403, message="Resource not accessible by integration")
+
+        clock = FakeClock()
+        scheduler = _scheduler(clock)
+        async with _client(handler) as client:
+            response = await scheduler.get(
+                client, URL, headers={}, stats=GitHubRequestStats()
+            )
+
+        assert response.status_code == 403
+        assert requests == 1
+        assert clock.sleeps == []
+
+    @pytest.mark.asyncio
+    async def test_waits_longer_than_maximum_are_not_honoured(self):
+        clock = FakeClock()
+        scheduler = _scheduler(clock, max_wait_seconds=60)
+
+        async with _client(
+            lambda request: _json(429, headers={"retry-after": "3600"})
+        ) as client:
+            response = await scheduler.get(
+                client, URL, headers={}, stats=GitHubRequestStats()
+            )
+
+        assert response.status_code == 429
+        assert clock.sleeps == []
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_retries(self):
+        requests = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal requests
+            requests += 1
+            return _json(429, headers={"retry-after": "1"})
+
+        scheduler = _scheduler(FakeClock(), max_retries=2)
+        async with _client(handler) as client:
+            response = await scheduler.get(
+                client, URL, headers={}, stats=GitHubRequestStats()
+            )
+
+        assert response.status_code == 429
+        assert requests == 3
+
+    @pytest.mark.asyncio
+    async def test_low_remaining_budget_serializes_requests(self):
+        scheduler = _scheduler(FakeClock(), max_concurrency=8, low_watermark=100)
+
+        async with _client(
+            lambda request: _json(headers={"x-ratelimit-remaining": "42"})
+        ) as client:
+            await scheduler.get(client, URL, headers={}, stats=GitHubRequestStats())
+
+        assert scheduler.concurrency_limit == 1
+
+    @pytest.mark.asyncio
+    async def test_limit_grows_back_after_successful_window(self):
+        responses = [_json(429, headers={"retry-after": "1"})] + [
+            _json(headers={"x-ratelimit-remaining": "4000"}) for _ in range(5)
+        ]
+        scheduler = _scheduler(FakeClock(), max_concurrency=8)
+
+        async with _client(lambda request: responses.pop(0)) as client:
+            await scheduler.get(client, URL, headers={}, stats=GitHubRequestStats())
+            assert scheduler.concurrency_limit == 4
+            for _ in range(4):
+                await scheduler.get(client, URL, headers={}, stats=GitHubRequestStats())
+
+        assert scheduler.concurrency_limit == 5
+
+
+class TestConcurrency:
+    """The scheduler bounds concurrent requests."""
+
+    @pytest.mark.asyncio
+    async def test_in_flight_requests_never_exceed_limit(self):
+        in_flight = 0
+        peak = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return _json()
+
+        scheduler = _scheduler(FakeClock(), max_concurrency=3)
+        async with _client(handler) as client:
+            await asyncio.gather(
+                *(
+                    scheduler.get(client, URL, headers={}, stats=GitHubRequestStats())
+                    for _ in range(12)
+                )
+            )
+
+        assert peak == 3
+
+
+class TestGitHubRequestSchedulers:
+    """Per-token scheduler registry."""
+
+    def test_same_token_shares_scheduler(self):
+        schedulers = GitHubRequestSchedulers()
+
+        assert schedulers.for_authorization("Bearer a") is schedulers.for_authorization(
+            "Bearer a"
+        )
+        assert schedulers.for_authorization(
+            "Bearer a"
+        ) is not schedulers.for_authorization("Bearer b")
+
+    def test_least_recently_used_tokens_are_dropped(self):
+        schedulers = GitHubRequestSchedulers(max_tokens=2)
+        first = schedulers.for_authorization("Bearer a")
+        schedulers.for_authorization("Bearer b")
+        schedulers.for_authorization("Bearer c")
+
+        assert schedulers.for_authorization("Bearer a") is not first
+
+    @pytest.mark.asyncio
+    async def test_tokens_share_one_etag_budget_but_not_entries(self):
+        seen_if_none_match: list[str | None] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen_if_none_match.append(request.headers.get("if-none-match"))
+            if request.headers.get("if-none-match"):
+                return httpx.Response(304)
+            return _json(headers={"etag": '"v1"'}, pad="x" * 100)
+
+        schedulers = GitHubRequestSchedulers(etag_cache_max_bytes=250)
+        stats = GitHubRequestStats()
+        async with _client(handler) as client:
+            for token in ("Bearer a", "Bearer b", "Bearer c", "Bearer a"):
+                await schedulers.for_authorization(token).get(
+                    client, URL, headers={}, stats=stats, conditional=True
+                )
+
+        # Each token caches its own copy, and only two fit in the shared
+        # budget: token "a" was evicted before it asked again
+        assert seen_if_none_match == [None, None, None, None]
+        assert stats.not_modified == 0
@@ -38,6 +38,7 @@ class _FakeDataSourceRepository:
     def __init__(self) -> None:
         self._store: dict[str, DataSource] = {}
         self.saved: list[DataSource] = []
+        self.find_by_knowledge_graphs_calls = 0
 
     def seed(self, *sources: DataSource) -> None:
         for ds in sources:
@@ -58,6 +59,13 @@ class _FakeDataSourceRepository:
             if ds.knowledge_graph_id == knowledge_graph_id
         ]
 
+    async def find_by_knowledge_graphs(
+        self, knowledge_graph_ids: list[str]
+    ) -> list[DataSource]:
+        self.find_by_knowledge_graphs_calls += 1
+        wanted = set(knowledge_graph_ids)
+        return [ds for ds in self._store.values() if ds.knowledge_graph_id in wanted]
+
     async def save(self, data_source: DataSource) -> None:
         self._store[data_source.id.value] = data_source
         self.saved.append(data_source)
@@ -129,6 +137,7 @@ class _FakeSyncRunRepository:
     def __init__(self) -> None:
         self._runs: dict[str, DataSourceSyncRun] = {}
         self.saved: list[DataSourceSyncRun] = []
+        self.get_latest_for_data_sources_calls = 0
 
     def seed(self, *runs: DataSourceSyncRun) -> None:
         for run in runs:
@@ -152,6 +161,17 @@ class _FakeSyncRunRepository:
             return None
         return max(runs, key=lambda r: r.created_at)
 
+    async def get_latest_for_data_sources(
+        self, data_source_ids: list[str]
+    ) -> dict[str, DataSourceSyncRun]:
+        self.get_latest_for_data_sources_calls += 1
+        latest: dict[str, DataSourceSyncRun] = {}
+        for ds_id in data_source_ids:
+            run = await self.get_latest_for_data_source(ds_id)
+            if run is not None:
+                latest[ds_id] = run
+        return latest
+
 
 class _FakeAuthorizationProvider:
     """Configurable fake for AuthorizationProvider.
@@ -168,6 +188,7 @@ class _FakeAuthorizationProvider:
         self._resource_grants: dict[str, bool] = {}
         self._check_fn: Callable | None = None
         self.check_permission_calls: list[dict[str, Any]] = []
+        self.bulk_check_permission_calls: list[list] = []
 
     def grant_all(self) -> None:
         self._default_grant = True
@@ -217,7 +238,12 @@ class _FakeAuthorizationProvider:
         return self._default_grant
 
     async def bulk_check_permission(self, requests: list) -> set[str]:
-        return set()
+        self.bulk_check_permission_calls.append(list(requests))
+        permitted: set[str] = set()
+        for req in requests:
+            if await self.check_permission(req.resource, req.permission, req.subject):
+                permitted.add(req.resource)
+        return permitted
 
     async def write_relationship(
         self, resource: str, relation: str, subject: str
@@ -1363,6 +1389,33 @@ class TestDataSourceServiceListAllForUser:
         assert len(result) == 1
         assert result[0].latest_sync_run is None
 
+    @pytest.mark.asyncio
+    async def test_batches_permission_checks_and_loads(
+        self,
+        service: DataSourceService,
+        kg_repo: _FakeKnowledgeGraphRepository,
+        ds_repo: _FakeDataSourceRepository,
+        sync_run_repo: _FakeSyncRunRepository,
+        authz: _FakeAuthorizationProvider,
+        user_id: str,
+        tenant_id: str,
+    ) -> None:
+        """list_all_for_user() makes one bulk check and one load of each kind."""
+        for i in range(5):
+            kg_repo.seed(_make_kg(kg_id=f"kg-{i}", tenant_id=tenant_id))
+            ds_repo.seed(
+                _make_ds(ds_id=f"ds-{i}", kg_id=f"kg-{i}", tenant_id=tenant_id)
+            )
+        authz.grant_all()
+
+        result = await service.list_all_for_user(user_id=user_id)
+
+        assert len(result) == 5
+        assert len(authz.bulk_check_permission_calls) == 1
+        assert len(authz.bulk_check_permission_calls[0]) == 5
+        assert ds_repo.find_by_knowledge_graphs_calls == 1
+        assert sync_run_repo.get_latest_for_data_sources_calls == 1
+
 
 # ---- update_ontology ----
 
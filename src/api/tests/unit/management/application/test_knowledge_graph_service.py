@@ -783,6 +783,29 @@ class TestKnowledgeGraphServiceListForWorkspace:
         assert len(result) == 1
         assert result[0].id.value == "kg-001"
 
+    @pytest.mark.asyncio
+    async def test_list_loads_kgs_in_one_batch_and_pages_by_name(
+        self, service, authz, kg_repo, user_id, workspace_id, tenant_id
+    ):
+        """list_for_workspace() loads all KGs with one query, in name order."""
+        await _grant_workspace_view(authz, workspace_id, user_id)
+        for kg_id, name in [
+            ("kg-001", "Charlie"),
+            ("kg-002", "Alpha"),
+            ("kg-003", "Bravo"),
+        ]:
+            kg_repo.seed(_make_kg(kg_id=kg_id, tenant_id=tenant_id, name=name))
+            await authz.write_relationship(
+                f"knowledge_graph:{kg_id}", "workspace", f"workspace:{workspace_id}"
+            )
+
+        result = await service.list_for_workspace(
+            user_id=user_id, workspace_id=workspace_id, limit=2, offset=1
+        )
+
+        assert [kg.name for kg in result] == ["Bravo", "Charlie"]
+        assert len(kg_repo.find_by_ids_calls) == 1
+
 
 # ---- update ----
 
@@ -1313,6 +1336,36 @@ class TestKnowledgeGraphServiceListAll:
         assert len(result) == 1
         assert result[0].id.value == kg.id.value
 
+    @pytest.mark.asyncio
+    async def test_list_all_resolves_accessible_kgs_without_per_kg_checks(
+        self, service, authz, kg_repo, user_id, tenant_id
+    ):
+        """list_all() looks up accessible KGs once and loads them in one query."""
+        kgs = [_make_kg(kg_id=f"kg-{i:03d}", tenant_id=tenant_id) for i in range(5)]
+        kg_repo.seed(*kgs)
+        await _grant_kg_view(authz, kgs[2].id.value, user_id)
+
+        result = await service.list_all(user_id=user_id)
+
+        assert [kg.id.value for kg in result] == [kgs[2].id.value]
+        assert authz.bulk_check_calls == []
+        assert kg_repo.find_by_ids_calls == [[kgs[2].id.value]]
+
+    @pytest.mark.asyncio
+    async def test_list_all_excludes_accessible_kgs_of_other_tenants(
+        self, service, authz, kg_repo, user_id, tenant_id
+    ):
+        """list_all() only returns KGs in the scoped tenant."""
+        own = _make_kg(kg_id="kg-own", tenant_id=tenant_id)
+        other = _make_kg(kg_id="kg-other", tenant_id="other-tenant")
+        kg_repo.seed(own, other)
+        await _grant_kg_view(authz, own.id.value, user_id)
+        await _grant_kg_view(authz, other.id.value, user_id)
+
+        result = await service.list_all(user_id=user_id)
+
+        assert [kg.id.value for kg in result] == [own.id.value]
+
 
 # ---- list_for_workspace_with_permission ----
 
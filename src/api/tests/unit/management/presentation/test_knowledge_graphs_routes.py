@@ -128,6 +128,8 @@ class TestListKnowledgeGraphsRoute:
         mock_kg_service.list_all.assert_called_once_with(
             user_id=mock_current_user.user_id.value,
             permission=Permission.VIEW,
+            limit=None,
+            offset=0,
         )
 
     def test_list_knowledge_graphs_calls_list_all_with_edit_permission(
@@ -144,6 +146,8 @@ class TestListKnowledgeGraphsRoute:
         mock_kg_service.list_all.assert_called_once_with(
             user_id=mock_current_user.user_id.value,
             permission=Permission.EDIT,
+            limit=None,
+            offset=0,
         )
 
     def test_list_knowledge_graphs_returns_empty_list(
@@ -182,6 +186,8 @@ class TestListKnowledgeGraphsRoute:
             user_id=mock_current_user.user_id.value,
             workspace_id=workspace_id,
             permission=Permission.EDIT,
+            limit=None,
+            offset=0,
         )
         # list_all must NOT be called when workspace_id is provided
         mock_kg_service.list_all.assert_not_called()
@@ -221,6 +227,8 @@ class TestListKnowledgeGraphsRoute:
         mock_kg_service.list_all.assert_called_once_with(
             user_id=mock_current_user.user_id.value,
             permission=Permission.EDIT,
+            limit=None,
+            offset=0,
         )
         mock_kg_service.list_for_workspace_with_permission.assert_not_called()
 
@@ -240,8 +248,44 @@ class TestListKnowledgeGraphsRoute:
             user_id=mock_current_user.user_id.value,
             workspace_id=workspace_id,
             permission=Permission.VIEW,
+            limit=None,
+            offset=0,
         )
 
+    def test_list_knowledge_graphs_passes_pagination_to_service(
+        self,
+        test_client: TestClient,
+        mock_kg_service: AsyncMock,
+        mock_current_user: CurrentUser,
+    ) -> None:
+        """?limit= and ?offset= are forwarded to the service."""
+        mock_kg_service.list_all.return_value = []
+
+        test_client.get("/management/knowledge-graphs?limit=25&offset=50")
+
+        mock_kg_service.list_all.assert_called_once_with(
+            user_id=mock_current_user.user_id.value,
+            permission=Permission.VIEW,
+            limit=25,
+            offset=50,
+        )
+
+    def test_list_knowledge_graphs_rejects_invalid_pagination(
+        self,
+        test_client: TestClient,
+        mock_kg_service: AsyncMock,
+    ) -> None:
+        """A zero limit or negative offset is rejected with 422."""
+        assert (
+            test_client.get("/management/knowledge-graphs?limit=0").status_code
+            == status.HTTP_422_UNPROCESSABLE_ENTITY
+        )
+        assert (
+            test_client.get("/management/knowledge-graphs?offset=-1").status_code
+            == status.HTTP_422_UNPROCESSABLE_ENTITY
+        )
+        mock_kg_service.list_all.assert_not_called()
+
 
 class TestGetKnowledgeGraphRoute:
     """Tests for GET /management/knowledge-graphs/{kg_id} endpoint."""
@@ -773,6 +817,8 @@ class TestListWorkspaceKnowledgeGraphsRoute:
         mock_kg_service.list_for_workspace.assert_called_once_with(
             user_id=mock_current_user.user_id.value,
             workspace_id=workspace_id,
+            limit=None,
+            offset=0,
         )
 
     def test_list_workspace_kgs_returns_403_when_unauthorized(
@@ -0,0 +1,84 @@
+"""Unit tests for BlockingQueryExecutor."""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import threading
+import time
+
+import pytest
+
+from query.infrastructure.query_executor import BlockingQueryExecutor
+
+_request_id: contextvars.ContextVar[str] = contextvars.ContextVar("request_id")
+
+
+@pytest.fixture
+def executor():
+    executor = BlockingQueryExecutor(max_workers=4)
+    yield executor
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_runs_call_off_the_event_loop_thread(executor):
+    """Blocking work should not run on the event loop's thread."""
+    loop_thread = threading.get_ident()
+
+    worker_thread = await executor.run(threading.get_ident)
+
+    assert worker_thread != loop_thread
+
+
+@pytest.mark.asyncio
+async def test_passes_arguments_and_returns_result(executor):
+    """Positional and keyword arguments reach the callable."""
+
+    def add(a: int, *, b: int) -> int:
+        return a + b
+
+    assert await executor.run(add, 2, b=3) == 5
+
+
+@pytest.mark.asyncio
+async def test_propagates_context_variables(executor):
+    """Context variables set by the caller are visible to the worker."""
+    _request_id.set("req-1")
+
+    assert await executor.run(_request_id.get) == "req-1"
+
+
+@pytest.mark.asyncio
+async def test_blocking_calls_run_concurrently(executor):
+    """Concurrent blocking calls overlap instead of running one by one."""
+    started = time.perf_counter()
+
+    await asyncio.gather(*(executor.run(time.sleep, 0.2) for _ in range(4)))
+
+    assert time.perf_counter() - started < 0.6
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_bounded():
+    """No more than max_workers calls run at once."""
+    executor = BlockingQueryExecutor(max_workers=2)
+    running = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def work() -> None:
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.05)
+        with lock:
+            running -= 1
+
+    try:
+        await asyncio.gather(*(executor.run(work) for _ in range(6)))
+    finally:
+        executor.shutdown()
+
+    assert peak == 2
@@ -117,8 +117,8 @@ class TestGetMCPQueryService:
         auth_ctx = _make_auth_context(tenant_id=tenant_id)
         token = _mcp_auth_context_var.set(auth_ctx)
         try:
-            with get_mcp_query_service():
-                pass
+            with get_mcp_query_service() as service:
+                service.execute_cypher_query("MATCH (n) RETURN n")
         finally:
             _mcp_auth_context_var.reset(token)
 
@@ -153,10 +153,40 @@ class TestGetMCPQueryService:
         tenant_id = "completely-different-tenant-777"
         auth_ctx = _make_auth_context(tenant_id=tenant_id)
         token = _mcp_auth_context_var.set(auth_ctx)
+        try:
+            with get_mcp_query_service() as service:
+                service.execute_cypher_query("MATCH (n) RETURN n")
+        finally:
+            _mcp_auth_context_var.reset(token)
+
+        mock_client_context.assert_called_once_with(graph_name=f"tenant_{tenant_id}")
+
+    @patch("query.dependencies.AGEGraphExistenceChecker")
+    @patch("query.dependencies.mcp_graph_client_context")
+    @patch("query.dependencies.get_age_connection_pool")
+    @patch("query.dependencies.get_database_settings")
+    def test_does_not_connect_until_a_query_runs(
+        self,
+        mock_get_settings,
+        mock_get_pool,
+        mock_client_context,
+        mock_existence_checker_cls,
+    ):
+        """Entering the dependency must not block on a graph connection.
+
+        FastMCP enters sync dependencies on the event loop, so the client is
+        only checked out when a query executes (on the query executor).
+        """
+        mock_get_pool.return_value = MagicMock()
+        mock_get_settings.return_value = MagicMock()
+        mock_existence_checker_cls.return_value = MagicMock()
+
+        auth_ctx = _make_auth_context(tenant_id="lazy-tenant")
+        token = _mcp_auth_context_var.set(auth_ctx)
         try:
             with get_mcp_query_service():
                 pass
         finally:
             _mcp_auth_context_var.reset(token)
 
-        mock_client_context.assert_called_once_with(graph_name=f"tenant_{tenant_id}")
+        mock_client_context.assert_not_called()
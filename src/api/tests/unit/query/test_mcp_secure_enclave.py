@@ -15,6 +15,7 @@ from typing import Any
 import pytest
 
 from query.application.mcp_secure_enclave import MCPQuerySecureEnclave
+from shared_kernel.authorization.protocols import CheckRequest
 
 
 # ---------------------------------------------------------------------------
@@ -42,7 +43,9 @@ class FakeAuthorizationProvider:
     """Fake AuthorizationProvider for testing secure enclave.
 
     Authorizes knowledge_graph_ids in `authorized_kg_ids`.
-    If `raise_error` is True, raises on every check_permission call.
+    If `raise_error` is True, raises on every permission check.
+    Every checked resource is recorded in `check_calls`; each bulk call is
+    additionally recorded in `bulk_calls`.
     """
 
     def __init__(
@@ -53,6 +56,7 @@ class FakeAuthorizationProvider:
         self.authorized_kg_ids = authorized_kg_ids or set()
         self.raise_error = raise_error
         self.check_calls: list[tuple[str, str, str]] = []
+        self.bulk_calls: list[list[CheckRequest]] = []
 
     async def check_permission(
         self, resource: str, permission: str, subject: str
@@ -73,8 +77,13 @@ class FakeAuthorizationProvider:
     async def write_relationships(self, relationships: list) -> None:
         pass
 
-    async def bulk_check_permission(self, requests: list) -> set[str]:
-        return set()
+    async def bulk_check_permission(self, requests: list[CheckRequest]) -> set[str]:
+        self.bulk_calls.append(list(requests))
+        return {
+            req.resource
+            for req in requests
+            if await self.check_permission(req.resource, req.permission, req.subject)
+        }
 
     async def delete_relationship(
         self, resource: str, relation: str, subject: str
@@ -594,6 +603,7 @@ class TestPermissionCaching:
 
         # Only one SpiceDB call for kg-1 despite 3 entities
         assert len(authz.check_calls) == 1
+        assert len(authz.bulk_calls) == 1
 
     @pytest.mark.asyncio
     async def test_different_kg_ids_checked_separately(self) -> None:
@@ -619,8 +629,49 @@ class TestPermissionCaching:
         ]
         await _redact(enclave, rows)
 
-        # Two calls — one per unique kg_id
+        # One check per unique kg_id, sent together in a single bulk call
         assert len(authz.check_calls) == 2
+        assert len(authz.bulk_calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_nested_and_cross_row_kg_ids_share_one_bulk_call(self) -> None:
+        """All kg_ids in a result set, including map values, cost one bulk call."""
+        authz = FakeAuthorizationProvider(authorized_kg_ids={"kg-1"})
+        enclave = MCPQuerySecureEnclave(authz=authz, user_id="user-123")
+
+        rows = [
+            {
+                "node": {
+                    "id": "1",
+                    "label": "Person",
+                    "properties": {"knowledge_graph_id": "kg-1"},
+                }
+            },
+            {
+                "m": {
+                    "edge": {
+                        "id": "10",
+                        "label": "KNOWS",
+                        "start_id": "1",
+                        "end_id": "2",
+                        "properties": {"knowledge_graph_id": "kg-2"},
+                    }
+                }
+            },
+        ]
+        result = await _redact(enclave, rows)
+
+        assert len(authz.bulk_calls) == 1
+        assert {req.resource for req in authz.bulk_calls[0]} == {
+            "knowledge_graph:kg-1",
+            "knowledge_graph:kg-2",
+        }
+        assert "properties" in result[0]["node"]
+        assert result[1]["m"]["edge"]["_redacted"] is True
+
+        # A second call on the same enclave reuses the cached results
+        await _redact(enclave, rows)
+        assert len(authz.bulk_calls) == 1
 
 
 class TestAuthorizationFailSafe:
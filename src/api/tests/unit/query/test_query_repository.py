@@ -1,5 +1,6 @@
 """Unit tests for QueryGraphRepository."""
 
+from contextlib import contextmanager
 from unittest.mock import MagicMock, create_autospec
 
 import pytest
@@ -16,7 +17,10 @@ from query.domain.value_objects import (
     QueryForbiddenError,
     QueryTimeoutError,
 )
-from query.infrastructure.query_repository import QueryGraphRepository
+from query.infrastructure.query_repository import (
+    ConnectOnUseQueryGraphRepository,
+    QueryGraphRepository,
+)
 
 
 @pytest.fixture
@@ -757,3 +761,44 @@ class TestTenantGraphRouting:
         # A valid read-only query against a non-existent graph must raise
         with pytest.raises(QueryExecutionError):
             repository.execute_cypher("MATCH (n) RETURN n")
+
+
+class TestConnectOnUseQueryGraphRepository:
+    """Tests for per-query client checkout."""
+
+    def test_releases_client_after_each_query(self, mock_client, mock_transaction):
+        """Each query should enter and exit its own client context."""
+        mock_client.transaction.return_value.__enter__.return_value = mock_transaction
+        mock_transaction.execute_cypher.return_value = CypherResult(
+            rows=[], row_count=0
+        )
+        events: list[str] = []
+
+        @contextmanager
+        def client_context():
+            events.append("connect")
+            yield mock_client
+            events.append("disconnect")
+
+        repository = ConnectOnUseQueryGraphRepository(client_context)
+        repository.execute_cypher("MATCH (n) RETURN n")
+        repository.execute_cypher("MATCH (n) RETURN n")
+
+        assert events == ["connect", "disconnect", "connect", "disconnect"]
+
+    def test_releases_client_when_query_is_rejected(self, mock_client):
+        """A rejected query must still return its client."""
+        events: list[str] = []
+
+        @contextmanager
+        def client_context():
+            try:
+                yield mock_client
+            finally:
+                events.append("disconnect")
+
+        repository = ConnectOnUseQueryGraphRepository(client_context)
+        with pytest.raises(QueryForbiddenError):
+            repository.execute_cypher("CREATE (n) RETURN n")
+
+        assert events == ["disconnect"]
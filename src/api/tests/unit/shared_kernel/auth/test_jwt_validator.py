@@ -650,3 +650,237 @@ class TestJWTValidatorThreadSafety:
         # Due to the lock, concurrent requests should wait for the first fetch
         # Note: This may vary based on timing, but should be <= 4 (at most 2 full fetches)
         assert fetch_count <= 4
+
+
+def _response_mock(json_data: dict[str, Any]) -> MagicMock:
+    response = MagicMock()
+    response.json.return_value = json_data
+    response.raise_for_status = MagicMock()
+    return response
+
+
+OPENID_CONFIG = {
+    "issuer": TEST_ISSUER,
+    "jwks_uri": f"{TEST_ISSUER}/protocol/openid-connect/certs",
+}
+
+
+class _FakeClock:
+    """Manually advanced wall clock (epoch seconds)."""
+
+    def __init__(self) -> None:
+        self.now = datetime.now(tz=timezone.utc).timestamp()
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestJWTValidatorClaimsCache:
+    """Tests for caching the claims of validated tokens."""
+
+    @pytest.fixture
+    def mock_probe(self) -> MagicMock:
+        return MagicMock(spec=JWTValidatorProbe)
+
+    @pytest.fixture
+    def clock(self) -> _FakeClock:
+        return _FakeClock()
+
+    @pytest.fixture
+    def validator(self, mock_probe: MagicMock, clock: _FakeClock) -> JWTValidator:
+        return JWTValidator(
+            issuer_url=TEST_ISSUER,
+            audience=TEST_AUDIENCE,
+            probe=mock_probe,
+            claims_cache_max_entries=2,
+            claims_cache_ttl=timedelta(minutes=5),
+            clock=clock,
+        )
+
+    @pytest.fixture
+    def mock_client(self):
+        with patch("httpx.AsyncClient") as mock_client_class:
+            client = AsyncMock()
+            mock_client_class.return_value.__aenter__.return_value = client
+            client.get.side_effect = lambda url, **kwargs: _response_mock(
+                OPENID_CONFIG
+                if "openid-configuration" in url
+                else create_jwks_response()
+            )
+            yield client
+
+    @pytest.mark.asyncio
+    async def test_repeated_token_skips_verification(
+        self, validator: JWTValidator, mock_probe: MagicMock, mock_client
+    ) -> None:
+        """The same token is only verified once while cached."""
+        token = create_test_token()
+
+        with patch(
+            "shared_kernel.auth.jwt_validator.jwt.decode", wraps=jwt.decode
+        ) as decode:
+            first = await validator.validate_token(token)
+            second = await validator.validate_token(token)
+
+        assert first == second
+        assert decode.call_count == 1
+        mock_probe.claims_cache_miss.assert_called_once()
+        mock_probe.claims_cache_hit.assert_called_once_with(user_id="user-123")
+
+    @pytest.mark.asyncio
+    async def test_entry_expires_with_token(
+        self,
+        validator: JWTValidator,
+        mock_probe: MagicMock,
+        clock: _FakeClock,
+        mock_client,
+    ) -> None:
+        """A cached token is fully validated again once its exp has passed."""
+        token = create_test_token(exp_delta=timedelta(seconds=60))
+        await validator.validate_token(token)
+
+        clock.now += 59
+        await validator.validate_token(token)
+        clock.now += 2
+        await validator.validate_token(token)
+
+        assert mock_probe.claims_cache_hit.call_count == 1
+        assert mock_probe.claims_cache_miss.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_entry_expires_after_ttl(
+        self,
+        validator: JWTValidator,
+        mock_probe: MagicMock,
+        clock: _FakeClock,
+        mock_client,
+    ) -> None:
+        """Long-lived tokens are re-verified once the cache TTL elapses."""
+        token = create_test_token(exp_delta=timedelta(hours=1))
+        await validator.validate_token(token)
+
+        clock.now += 301
+        await validator.validate_token(token)
+
+        assert mock_probe.claims_cache_miss.call_count == 2
+        mock_probe.claims_cache_hit.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_entry_is_evicted(
+        self, validator: JWTValidator, mock_probe: MagicMock, mock_client
+    ) -> None:
+        """The cache holds at most claims_cache_max_entries tokens."""
+        tokens = [create_test_token(sub=f"user-{i}") for i in range(3)]
+        for token in tokens:
+            await validator.validate_token(token)
+
+        await validator.validate_token(tokens[0])
+
+        assert mock_probe.claims_cache_miss.call_count == 4
+
+    @pytest.mark.asyncio
+    async def test_invalid_tokens_are_not_cached(
+        self, validator: JWTValidator, mock_client
+    ) -> None:
+        """Failed validations are repeated, not remembered."""
+        token = create_test_token(audience="wrong-audience")
+
+        for _ in range(2):
+            with pytest.raises(InvalidTokenError):
+                await validator.validate_token(token)
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(
+        self, mock_probe: MagicMock, mock_client
+    ) -> None:
+        """Without claims_cache_max_entries every token is verified."""
+        validator = JWTValidator(
+            issuer_url=TEST_ISSUER,
+            audience=TEST_AUDIENCE,
+            probe=mock_probe,
+        )
+        token = create_test_token()
+
+        await validator.validate_token(token)
+        await validator.validate_token(token)
+
+        assert mock_probe.token_validated.call_count == 2
+        mock_probe.claims_cache_hit.assert_not_called()
+
+
+class TestJWTValidatorJWKSRefreshAhead:
+    """Tests for refreshing the JWKS before the cache expires."""
+
+    @pytest.mark.asyncio
+    async def test_refreshes_in_background_near_expiry(self) -> None:
+        """Near expiry, cached keys are served while a refresh runs."""
+        mock_probe = MagicMock(spec=JWTValidatorProbe)
+        validator = JWTValidator(
+            issuer_url=TEST_ISSUER,
+            audience=TEST_AUDIENCE,
+            probe=mock_probe,
+            jwks_cache_ttl=timedelta(hours=1),
+            jwks_refresh_ahead=timedelta(minutes=5),
+        )
+
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client.get.side_effect = lambda url, **kwargs: _response_mock(
+                OPENID_CONFIG
+                if "openid-configuration" in url
+                else create_jwks_response()
+            )
+
+            await validator.validate_token(create_test_token())
+            assert mock_client.get.call_count == 2
+
+            # Age the cache into the refresh window
+            validator._jwks_fetched_at = datetime.now(tz=timezone.utc) - timedelta(
+                minutes=56
+            )
+            claims = await validator.validate_token(create_test_token(sub="user-2"))
+            assert claims.sub == "user-2"
+
+            assert validator._jwks_refresh_task is not None
+            await validator._jwks_refresh_task
+
+        assert mock_client.get.call_count == 4
+        assert mock_probe.jwks_fetched.call_count == 2
+        assert validator._is_cache_valid()
+        assert not validator._is_cache_due_for_refresh()
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_keeps_cached_keys(self) -> None:
+        """A failed background refresh leaves the cached JWKS in place."""
+        import httpx
+
+        mock_probe = MagicMock(spec=JWTValidatorProbe)
+        validator = JWTValidator(
+            issuer_url=TEST_ISSUER,
+            audience=TEST_AUDIENCE,
+            probe=mock_probe,
+            jwks_cache_ttl=timedelta(hours=1),
+            jwks_refresh_ahead=timedelta(minutes=5),
+        )
+
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client.get.side_effect = [
+                _response_mock(OPENID_CONFIG),
+                _response_mock(create_jwks_response()),
+                httpx.ConnectError("issuer unavailable"),
+            ]
+
+            await validator.validate_token(create_test_token())
+            validator._jwks_fetched_at = datetime.now(tz=timezone.utc) - timedelta(
+                minutes=56
+            )
+            claims = await validator.validate_token(create_test_token(sub="user-2"))
+            assert validator._jwks_refresh_task is not None
+            await validator._jwks_refresh_task
+
+        assert claims.sub == "user-2"
+        mock_probe.jwks_fetch_failed.assert_called_once()
+        assert validator._is_cache_valid()
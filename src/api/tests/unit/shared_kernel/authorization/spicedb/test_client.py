@@ -1,14 +1,37 @@
-"""Unit tests for SpiceDB client input validation."""
+"""Unit tests for SpiceDB client input validation and bulk checks."""
+
+from unittest.mock import AsyncMock
 
 import pytest
+from authzed.api.v1 import (
+    CheckBulkPermissionsPair,
+    CheckBulkPermissionsRequest,
+    CheckBulkPermissionsResponse,
+    CheckBulkPermissionsResponseItem,
+    CheckPermissionRequest,
+    WriteRelationshipsResponse,
+    ZedToken,
+)
+from authzed.api.v1.permission_service_pb2 import CheckPermissionResponse
+from google.rpc.status_pb2 import Status
 
+from shared_kernel.authorization.observability import DefaultAuthorizationProbe
+from shared_kernel.authorization.protocols import CheckRequest
 from shared_kernel.authorization.spicedb.client import (
+    BULK_CHECK_CHUNK_SIZE,
+    WRITE_RELATIONSHIPS_CHUNK_SIZE,
     SpiceDBClient,
     _build_relationship_update,
     _parse_reference,
     _parse_subject_reference,
     RelationshipOperation,
 )
+from shared_kernel.authorization.spicedb.consistency import (
+    ConsistencyMode,
+    ZedTokenStore,
+)
+from shared_kernel.authorization.spicedb.exceptions import SpiceDBPermissionError
+from shared_kernel.authorization.types import RelationshipSpec
 
 
 class TestParseReference:
@@ -145,3 +168,314 @@ class TestReadRelationshipsValidation:
                 resource_id="123",
                 subject_id="abc",
             )
+
+
+class _FakePermissionsStub:
+    """Fake gRPC stub answering CheckBulkPermissions from a set of grants."""
+
+    def __init__(self, granted: set[str], errored: set[str] | None = None):
+        self.granted = granted
+        self.errored = errored or set()
+        self.bulk_requests: list[CheckBulkPermissionsRequest] = []
+
+    async def CheckBulkPermissions(
+        self, request: CheckBulkPermissionsRequest
+    ) -> CheckBulkPermissionsResponse:
+        self.bulk_requests.append(request)
+        pairs = []
+        for item in request.items:
+            resource = f"{item.resource.object_type}:{item.resource.object_id}"
+            if resource in self.errored:
+                pairs.append(
+                    CheckBulkPermissionsPair(
+                        request=item, error=Status(code=13, message="boom")
+                    )
+                )
+                continue
+            permissionship = (
+                CheckPermissionResponse.PERMISSIONSHIP_HAS_PERMISSION
+                if resource in self.granted
+                else CheckPermissionResponse.PERMISSIONSHIP_NO_PERMISSION
+            )
+            pairs.append(
+                CheckBulkPermissionsPair(
+                    request=item,
+                    item=CheckBulkPermissionsResponseItem(
+                        permissionship=permissionship
+                    ),
+                )
+            )
+        return CheckBulkPermissionsResponse(pairs=pairs)
+
+
+class _RecordingProbe(DefaultAuthorizationProbe):
+    """Authorization probe that records check events."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.checked: list[tuple[str, bool]] = []
+        self.failed: list[str] = []
+        self.bulk_completed: list[tuple[int, int]] = []
+
+    def permission_checked(self, resource, permission, subject, granted) -> None:
+        self.checked.append((resource, granted))
+
+    def permission_check_failed(self, resource, permission, subject, error) -> None:
+        self.failed.append(resource)
+
+    def bulk_check_completed(self, total_requests, permitted_count) -> None:
+        self.bulk_completed.append((total_requests, permitted_count))
+
+
+def _kg_requests(count: int) -> list[CheckRequest]:
+    return [
+        CheckRequest(
+            resource=f"knowledge_graph:kg-{i}", permission="view", subject="user:alice"
+        )
+        for i in range(count)
+    ]
+
+
+class TestBulkCheckPermission:
+    """Tests for bulk_check_permission on the CheckBulkPermissions API."""
+
+    @pytest.fixture
+    def probe(self) -> _RecordingProbe:
+        return _RecordingProbe()
+
+    def _client(self, stub: _FakePermissionsStub, probe) -> SpiceDBClient:
+        client = SpiceDBClient(
+            endpoint="localhost:50051",
+            preshared_key="test_key",
+            use_tls=False,
+            probe=probe,
+        )
+        client._client = stub  # type: ignore[assignment]
+        return client
+
+    @pytest.mark.asyncio
+    async def test_returns_permitted_resources(self, probe):
+        """Only resources with HAS_PERMISSION are returned."""
+        stub = _FakePermissionsStub(granted={"knowledge_graph:kg-1"})
+        client = self._client(stub, probe)
+
+        result = await client.bulk_check_permission(_kg_requests(3))
+
+        assert result == {"knowledge_graph:kg-1"}
+        assert probe.checked == [
+            ("knowledge_graph:kg-0", False),
+            ("knowledge_graph:kg-1", True),
+            ("knowledge_graph:kg-2", False),
+        ]
+        assert probe.bulk_completed == [(3, 1)]
+
+    @pytest.mark.asyncio
+    async def test_page_of_200_costs_two_rpcs(self, probe):
+        """Requests are chunked instead of sent one RPC per item."""
+        stub = _FakePermissionsStub(granted={"knowledge_graph:kg-150"})
+        client = self._client(stub, probe)
+
+        result = await client.bulk_check_permission(_kg_requests(200))
+
+        assert result == {"knowledge_graph:kg-150"}
+        assert [len(r.items) for r in stub.bulk_requests] == [
+            BULK_CHECK_CHUNK_SIZE,
+            200 - BULK_CHECK_CHUNK_SIZE,
+        ]
+        assert all(r.consistency.fully_consistent for r in stub.bulk_requests)
+
+    @pytest.mark.asyncio
+    async def test_empty_requests_make_no_rpc(self, probe):
+        stub = _FakePermissionsStub(granted=set())
+        client = self._client(stub, probe)
+
+        assert await client.bulk_check_permission([]) == set()
+        assert stub.bulk_requests == []
+        assert probe.bulk_completed == [(0, 0)]
+
+    @pytest.mark.asyncio
+    async def test_item_error_raises(self, probe):
+        """An error on any item fails the whole check, as sequential checks did."""
+        stub = _FakePermissionsStub(
+            granted={"knowledge_graph:kg-0"}, errored={"knowledge_graph:kg-1"}
+        )
+        client = self._client(stub, probe)
+
+        with pytest.raises(SpiceDBPermissionError):
+            await client.bulk_check_permission(_kg_requests(2))
+
+        assert probe.failed == ["knowledge_graph:kg-1"]
+
+
+class _FakeConsistencyStub(_FakePermissionsStub):
+    """Fake gRPC stub that also answers writes and single checks with tokens."""
+
+    def __init__(self) -> None:
+        super().__init__(granted=set())
+        self.check_requests: list[CheckPermissionRequest] = []
+        self.write_requests: list = []
+        self._revision = 0
+
+    async def WriteRelationships(self, request) -> WriteRelationshipsResponse:
+        self.write_requests.append(request)
+        self._revision += 1
+        return WriteRelationshipsResponse(
+            written_at=ZedToken(token=f"rev-{self._revision}")
+        )
+
+    async def CheckPermission(
+        self, request: CheckPermissionRequest
+    ) -> CheckPermissionResponse:
+        self.check_requests.append(request)
+        return CheckPermissionResponse(
+            checked_at=ZedToken(token=f"rev-{self._revision}"),
+            permissionship=CheckPermissionResponse.PERMISSIONSHIP_NO_PERMISSION,
+        )
+
+
+class TestReadConsistency:
+    """Tests that reads use the ZedToken set for the current context."""
+
+    @pytest.fixture(autouse=True)
+    def _reset_read_token(self):
+        yield
+        ZedTokenStore().read_at_least_as_fresh(None)
+
+    def _client(self, stub, **kwargs) -> SpiceDBClient:
+        kwargs.setdefault("consistency", ConsistencyMode.AT_LEAST_AS_FRESH)
+        client = SpiceDBClient(
+            endpoint="localhost:50051",
+            preshared_key="test_key",
+            use_tls=False,
+            **kwargs,
+        )
+        client._client = stub
+        return client
+
+    @pytest.mark.asyncio
+    async def test_check_is_at_least_as_fresh_as_the_tenant_token(self):
+        stub = _FakeConsistencyStub()
+        client = self._client(stub)
+
+        await client.check_permission("group:g1", "view", "user:alice")
+        client._token_store.read_at_least_as_fresh("tenant-rev")
+        await client.check_permission("group:g1", "view", "user:alice")
+
+        first, second = stub.check_requests
+        assert first.consistency.WhichOneof("requirement") == "fully_consistent"
+        assert second.consistency.at_least_as_fresh.token == "tenant-rev"
+
+    @pytest.mark.asyncio
+    async def test_own_writes_do_not_set_the_read_token(self):
+        """Only tokens recorded per tenant by the outbox are read against."""
+        stub = _FakeConsistencyStub()
+        client = self._client(stub)
+
+        await client.write_relationship("group:g1", "member_relation", "user:alice")
+        await client.check_permission("group:g1", "view", "user:alice")
+
+        assert stub.check_requests[0].consistency.fully_consistent
+
+    @pytest.mark.asyncio
+    async def test_capture_reports_write_tokens(self):
+        """The outbox handler learns the token of the writes it made."""
+        stub = _FakeConsistencyStub()
+        store = ZedTokenStore()
+        client = self._client(stub, token_store=store)
+
+        with store.capture_writes() as tokens:
+            await client.write_relationship("group:g1", "member_relation", "user:alice")
+
+        assert tokens == ["rev-1"]
+
+    @pytest.mark.asyncio
+    async def test_bulk_check_uses_token(self):
+        stub = _FakeConsistencyStub()
+        client = self._client(stub)
+
+        client._token_store.read_at_least_as_fresh("tenant-rev")
+        await client.bulk_check_permission(_kg_requests(1))
+
+        (request,) = stub.bulk_requests
+        assert request.consistency.at_least_as_fresh.token == "tenant-rev"
+
+    @pytest.mark.asyncio
+    async def test_fully_consistent_by_default(self):
+        """Clients built without a mode ignore the context token."""
+        stub = _FakeConsistencyStub()
+        client = SpiceDBClient(
+            endpoint="localhost:50051", preshared_key="test_key", use_tls=False
+        )
+        client._client = stub  # type: ignore[assignment]
+
+        client._token_store.read_at_least_as_fresh("tenant-rev")
+        await client.check_permission("group:g1", "view", "user:alice")
+
+        assert stub.check_requests[0].consistency.fully_consistent
+
+    @pytest.mark.asyncio
+    async def test_failed_write_reports_no_token(self):
+        """A write that may have committed without a token captures nothing."""
+        stub = _FakeConsistencyStub()
+        store = ZedTokenStore()
+        client = self._client(stub, token_store=store)
+
+        stub.WriteRelationships = AsyncMock(side_effect=RuntimeError("deadline"))
+        with store.capture_writes() as tokens, pytest.raises(SpiceDBPermissionError):
+            await client.write_relationship("group:g1", "member_relation", "user:bob")
+
+        assert tokens == []
+
+
+class TestUpdateRelationships:
+    """Tests for mixed, chunked relationship updates."""
+
+    def _client(self, stub) -> SpiceDBClient:
+        client = SpiceDBClient(
+            endpoint="localhost:50051",
+            preshared_key="test_key",
+            use_tls=False,
+        )
+        client._client = stub
+        return client
+
+    @pytest.mark.asyncio
+    async def test_writes_and_deletes_share_one_request(self):
+        stub = _FakeConsistencyStub()
+        client = self._client(stub)
+
+        await client.update_relationships(
+            writes=[RelationshipSpec("group:g1", "member", "user:alice")],
+            deletes=[RelationshipSpec("group:g1", "member", "user:bob")],
+        )
+
+        (request,) = stub.write_requests
+        assert [u.operation for u in request.updates] == [
+            RelationshipOperation.WRITE,
+            RelationshipOperation.DELETE,
+        ]
+
+    @pytest.mark.asyncio
+    async def test_large_updates_are_chunked(self):
+        stub = _FakeConsistencyStub()
+        client = self._client(stub)
+        deletes = [
+            RelationshipSpec("workspace:ws1", "member", f"user:u{i}")
+            for i in range(WRITE_RELATIONSHIPS_CHUNK_SIZE + 1)
+        ]
+
+        await client.update_relationships(writes=[], deletes=deletes)
+
+        assert [len(r.updates) for r in stub.write_requests] == [
+            WRITE_RELATIONSHIPS_CHUNK_SIZE,
+            1,
+        ]
+
+    @pytest.mark.asyncio
+    async def test_empty_update_makes_no_rpc(self):
+        stub = _FakeConsistencyStub()
+        client = self._client(stub)
+
+        await client.update_relationships(writes=[], deletes=[])
+
+        assert stub.write_requests == []
@@ -0,0 +1,119 @@
+"""Unit tests for ZedToken-based SpiceDB read consistency."""
+
+import asyncio
+from collections.abc import Iterator
+from contextvars import copy_context
+
+import pytest
+from authzed.api.v1 import ZedToken
+
+from shared_kernel.authorization.spicedb.consistency import (
+    ConsistencyMode,
+    ZedTokenStore,
+)
+
+
+def _write(store: ZedTokenStore, token: str) -> None:
+    with store.write() as observe:
+        observe(ZedToken(token=token))
+
+
+@pytest.fixture
+def store() -> Iterator[ZedTokenStore]:
+    store = ZedTokenStore()
+    yield store
+    store.read_at_least_as_fresh(None)
+
+
+class TestZedTokenStore:
+    """Tests for ZedTokenStore token tracking and Consistency selection."""
+
+    def test_fully_consistent_until_a_token_is_known(self, store: ZedTokenStore):
+        consistency = store.consistency(ConsistencyMode.AT_LEAST_AS_FRESH)
+
+        assert consistency.WhichOneof("requirement") == "fully_consistent"
+
+    def test_reads_at_least_as_fresh_as_the_context_token(self, store: ZedTokenStore):
+        store.read_at_least_as_fresh("tenant-rev")
+
+        consistency = store.consistency(ConsistencyMode.AT_LEAST_AS_FRESH)
+
+        assert consistency.WhichOneof("requirement") == "at_least_as_fresh"
+        assert consistency.at_least_as_fresh.token == "tenant-rev"
+
+    def test_context_token_does_not_leak_into_other_contexts(
+        self, store: ZedTokenStore
+    ):
+        """A request's tenant token is invisible to concurrent requests."""
+        copy_context().run(store.read_at_least_as_fresh, "tenant-rev")
+
+        consistency = store.consistency(ConsistencyMode.AT_LEAST_AS_FRESH)
+
+        assert consistency.WhichOneof("requirement") == "fully_consistent"
+
+    def test_writes_do_not_change_read_consistency(self, store: ZedTokenStore):
+        """Write tokens reach reads only once recorded for a tenant."""
+        _write(store, "t1")
+
+        consistency = store.consistency(ConsistencyMode.AT_LEAST_AS_FRESH)
+
+        assert consistency.WhichOneof("requirement") == "fully_consistent"
+
+    def test_capture_collects_write_tokens_in_order(self, store: ZedTokenStore):
+        with store.capture_writes() as tokens:
+            _write(store, "t1")
+            _write(store, "t2")
+        _write(store, "t3")
+
+        assert tokens == ["t1", "t2"]
+
+    @pytest.mark.asyncio
+    async def test_capture_ignores_writes_of_concurrent_tasks(
+        self, store: ZedTokenStore
+    ):
+        """Concurrent outbox handlers each capture only their own writes."""
+        first_capturing = asyncio.Event()
+        second_written = asyncio.Event()
+
+        async def first() -> list[str]:
+            with store.capture_writes() as tokens:
+                first_capturing.set()
+                await second_written.wait()
+                _write(store, "first")
+            return tokens
+
+        async def second() -> list[str]:
+            await first_capturing.wait()
+            with store.capture_writes() as tokens:
+                _write(store, "second")
+            second_written.set()
+            return tokens
+
+        assert await asyncio.gather(first(), second()) == [["first"], ["second"]]
+
+    def test_nested_capture_takes_the_inner_writes(self, store: ZedTokenStore):
+        with store.capture_writes() as outer:
+            with store.capture_writes() as inner:
+                _write(store, "inner")
+            _write(store, "outer")
+
+        assert outer == ["outer"]
+        assert inner == ["inner"]
+
+    def test_empty_tokens_are_ignored(self, store: ZedTokenStore):
+        with store.capture_writes() as tokens, store.write() as observe:
+            observe(ZedToken())
+
+        assert tokens == []
+
+    def test_fully_consistent_mode_ignores_token(self, store: ZedTokenStore):
+        store.read_at_least_as_fresh("tenant-rev")
+
+        consistency = store.consistency(ConsistencyMode.FULLY_CONSISTENT)
+
+        assert consistency.WhichOneof("requirement") == "fully_consistent"
+
+    def test_minimize_latency_mode(self, store: ZedTokenStore):
+        consistency = store.consistency(ConsistencyMode.MINIMIZE_LATENCY)
+
+        assert consistency.WhichOneof("requirement") == "minimize_latency"
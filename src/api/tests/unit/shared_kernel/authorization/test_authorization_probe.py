@@ -125,6 +125,55 @@ class TestBulkCheckCompleted:
         assert call_args[1]["permitted_count"] == 7
 
 
+class TestDecisionCacheEvents:
+    """Tests for the permission decision cache probe methods."""
+
+    def test_logs_cache_hit_with_scope(self):
+        """Test that a cache hit is logged with the layer that served it."""
+        mock_logger = Mock()
+        probe = DefaultAuthorizationProbe(logger=mock_logger)
+
+        probe.decision_cache_hit(
+            resource="workspace:ws1",
+            permission="view",
+            subject="user:alice",
+            scope="shared",
+        )
+
+        mock_logger.debug.assert_called_once()
+        call_args = mock_logger.debug.call_args
+        assert call_args[0][0] == "authorization_decision_cache_hit"
+        assert call_args[1]["scope"] == "shared"
+        assert call_args[1]["resource"] == "workspace:ws1"
+
+    def test_logs_cache_miss(self):
+        """Test that a cache miss is logged."""
+        mock_logger = Mock()
+        probe = DefaultAuthorizationProbe(logger=mock_logger)
+
+        probe.decision_cache_miss(
+            resource="workspace:ws1",
+            permission="view",
+            subject="user:alice",
+        )
+
+        call_args = mock_logger.debug.call_args
+        assert call_args[0][0] == "authorization_decision_cache_miss"
+        assert call_args[1]["permission"] == "view"
+
+    def test_logs_cache_eviction(self):
+        """Test that evictions are logged with reason and count."""
+        mock_logger = Mock()
+        probe = DefaultAuthorizationProbe(logger=mock_logger)
+
+        probe.decision_cache_evicted(reason="expired", count=3)
+
+        call_args = mock_logger.debug.call_args
+        assert call_args[0][0] == "authorization_decision_cache_evicted"
+        assert call_args[1]["reason"] == "expired"
+        assert call_args[1]["count"] == 3
+
+
 class TestWithContext:
     """Tests for with_context method."""
 
@@ -0,0 +1,282 @@
+"""Unit tests for permission decision caching.
+
+Uses the InMemoryAuthorizationProvider fake as the wrapped provider, counting
+the checks that reach it to tell cache hits from misses.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from shared_kernel.authorization.caching import (
+    CachingAuthorizationProvider,
+    PermissionDecisionCache,
+    permission_decision_scope,
+)
+from shared_kernel.authorization.protocols import CheckRequest
+from shared_kernel.authorization.types import RelationshipSpec
+from tests.fakes.authorization import InMemoryAuthorizationProvider
+
+
+class _CountingProvider(InMemoryAuthorizationProvider):
+    """InMemoryAuthorizationProvider that counts single permission checks."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.check_calls = 0
+        self.fail_checks = False
+
+    async def check_permission(
+        self,
+        resource: str,
+        permission: str,
+        subject: str,
+    ) -> bool:
+        self.check_calls += 1
+        if self.fail_checks:
+            raise RuntimeError("SpiceDB unavailable")
+        return await super().check_permission(resource, permission, subject)
+
+
+class _FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def inner() -> _CountingProvider:
+    return _CountingProvider()
+
+
+@pytest.fixture
+def clock() -> _FakeClock:
+    return _FakeClock()
+
+
+@pytest.fixture
+def shared_cache(clock: _FakeClock) -> PermissionDecisionCache:
+    return PermissionDecisionCache(max_entries=2, ttl_seconds=5, clock=clock)
+
+
+class TestRequestScopedMemo:
+    """Tests for the request-scoped decision memo."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_check_in_scope_hits_memo(
+        self, inner: _CountingProvider
+    ) -> None:
+        await inner.write_relationship("workspace:ws1", "member", "user:alice")
+        provider = CachingAuthorizationProvider(inner)
+
+        with permission_decision_scope():
+            assert await provider.check_permission(
+                "workspace:ws1", "view", "user:alice"
+            )
+            assert await provider.check_permission(
+                "workspace:ws1", "view", "user:alice"
+            )
+
+        assert inner.check_calls == 1
+
+    @pytest.mark.asyncio
+    async def test_memo_does_not_outlive_scope(self, inner: _CountingProvider) -> None:
+        provider = CachingAuthorizationProvider(inner)
+
+        with permission_decision_scope():
+            await provider.check_permission("workspace:ws1", "view", "user:alice")
+        with permission_decision_scope():
+            await provider.check_permission("workspace:ws1", "view", "user:alice")
+
+        assert inner.check_calls == 2
+
+    @pytest.mark.asyncio
+    async def test_no_caching_outside_scope_without_shared_cache(
+        self, inner: _CountingProvider
+    ) -> None:
+        provider = CachingAuthorizationProvider(inner)
+
+        await provider.check_permission("workspace:ws1", "view", "user:alice")
+        await provider.check_permission("workspace:ws1", "view", "user:alice")
+
+        assert inner.check_calls == 2
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_cached(self, inner: _CountingProvider) -> None:
+        provider = CachingAuthorizationProvider(inner)
+        inner.fail_checks = True
+
+        with permission_decision_scope():
+            with pytest.raises(RuntimeError):
+                await provider.check_permission("workspace:ws1", "view", "user:alice")
+            inner.fail_checks = False
+            assert not await provider.check_permission(
+                "workspace:ws1", "view", "user:alice"
+            )
+
+        assert inner.check_calls == 2
+
+    @pytest.mark.asyncio
+    async def test_write_through_provider_invalidates_memo(
+        self, inner: _CountingProvider
+    ) -> None:
+        provider = CachingAuthorizationProvider(inner)
+
+        with permission_decision_scope():
+            assert not await provider.check_permission(
+                "workspace:ws1", "view", "user:alice"
+            )
+            await provider.write_relationships(
+                [RelationshipSpec("workspace:ws1", "member", "user:alice")]
+            )
+            assert await provider.check_permission(
+                "workspace:ws1", "view", "user:alice"
+            )
+
+
+class TestBulkCheckCaching:
+    """Tests for bulk checks answered partly from the caches."""
+
+    @pytest.mark.asyncio
+    async def test_only_uncached_checks_reach_provider(
+        self, inner: _CountingProvider
+    ) -> None:
+        await inner.write_relationship("knowledge_graph:kg1", "viewer", "user:alice")
+        provider = CachingAuthorizationProvider(inner)
+        kg1 = CheckRequest("knowledge_graph:kg1", "view", "user:alice")
+        kg2 = CheckRequest("knowledge_graph:kg2", "view", "user:alice")
+
+        with permission_decision_scope():
+            assert await provider.bulk_check_permission([kg1]) == {
+                "knowledge_graph:kg1"
+            }
+            assert await provider.bulk_check_permission([kg1, kg2]) == {
+                "knowledge_graph:kg1"
+            }
+            # Single checks are answered from bulk results too
+            assert not await provider.check_permission(
+                "knowledge_graph:kg2", "view", "user:alice"
+            )
+
+        assert inner.bulk_check_calls == [[kg1], [kg2]]
+
+    @pytest.mark.asyncio
+    async def test_fully_cached_bulk_check_skips_provider(
+        self, inner: _CountingProvider
+    ) -> None:
+        provider = CachingAuthorizationProvider(inner)
+        kg1 = CheckRequest("knowledge_graph:kg1", "view", "user:alice")
+
+        with permission_decision_scope():
+            await provider.bulk_check_permission([kg1])
+            assert await provider.bulk_check_permission([kg1]) == set()
+
+        assert len(inner.bulk_check_calls) == 1
+
+
+class TestSharedCache:
+    """Tests for the cross-request PermissionDecisionCache."""
+
+    @pytest.mark.asyncio
+    async def test_shared_cache_serves_later_requests(
+        self, inner: _CountingProvider, shared_cache: PermissionDecisionCache
+    ) -> None:
+        provider = CachingAuthorizationProvider(inner, shared_cache=shared_cache)
+
+        with permission_decision_scope():
+            await provider.check_permission("workspace:ws1", "view", "user:alice")
+        with permission_decision_scope():
+            await provider.check_permission("workspace:ws1", "view", "user:alice")
+
+        assert inner.check_calls == 1
+
+    def test_entries_expire_after_ttl(
+        self, shared_cache: PermissionDecisionCache, clock: _FakeClock
+    ) -> None:
+        key = ("workspace:ws1", "view", "user:alice")
+        shared_cache.put(key, True)
+
+        clock.now = 4.9
+        assert shared_cache.get(key) is True
+        clock.now = 5.0
+        assert shared_cache.get(key) is None
+
+    def test_least_recently_used_entry_is_evicted(
+        self, shared_cache: PermissionDecisionCache
+    ) -> None:
+        a = ("workspace:a", "view", "user:alice")
+        b = ("workspace:b", "view", "user:alice")
+        c = ("workspace:c", "view", "user:alice")
+        shared_cache.put(a, True)
+        shared_cache.put(b, True)
+        shared_cache.get(a)
+        shared_cache.put(c, True)
+
+        assert shared_cache.get(a) is True
+        assert shared_cache.get(b) is None
+        assert shared_cache.get(c) is True
+
+
+class TestInvalidation:
+    """Tests for dropping decisions affected by relationship changes."""
+
+    @pytest.fixture
+    def cache(self) -> PermissionDecisionCache:
+        cache = PermissionDecisionCache(max_entries=10, ttl_seconds=60)
+        cache.put(("workspace:ws1", "view", "user:alice"), True)
+        cache.put(("workspace:ws1", "view", "user:bob"), False)
+        cache.put(("workspace:ws2", "view", "user:bob"), True)
+        return cache
+
+    def test_user_subject_drops_that_user_and_resource(
+        self, cache: PermissionDecisionCache
+    ) -> None:
+        cache.invalidate(resource="workspace:ws1", subject="user:alice")
+
+        assert cache.get(("workspace:ws1", "view", "user:alice")) is None
+        assert cache.get(("workspace:ws1", "view", "user:bob")) is None
+        assert cache.get(("workspace:ws2", "view", "user:bob")) is True
+
+    def test_subject_relation_clears_everything(
+        self, cache: PermissionDecisionCache
+    ) -> None:
+        cache.invalidate(resource="workspace:ws9", subject="group:g1#member")
+
+        assert cache.get(("workspace:ws2", "view", "user:bob")) is None
+
+    def test_unknown_subject_clears_everything(
+        self, cache: PermissionDecisionCache
+    ) -> None:
+        cache.invalidate(resource=None, subject=None)
+
+        assert cache.get(("workspace:ws2", "view", "user:bob")) is None
+
+    @pytest.mark.asyncio
+    async def test_update_relationships_invalidates_writes_and_deletes(
+        self, inner: _CountingProvider, cache: PermissionDecisionCache
+    ) -> None:
+        provider = CachingAuthorizationProvider(inner, shared_cache=cache)
+
+        await provider.update_relationships(
+            writes=[RelationshipSpec("workspace:ws2", "member", "user:carol")],
+            deletes=[RelationshipSpec("workspace:ws9", "member", "user:alice")],
+        )
+
+        assert cache.get(("workspace:ws1", "view", "user:alice")) is None
+        assert cache.get(("workspace:ws2", "view", "user:bob")) is None
+
+    @pytest.mark.asyncio
+    async def test_delete_by_filter_clears_shared_cache(
+        self, inner: _CountingProvider, cache: PermissionDecisionCache
+    ) -> None:
+        provider = CachingAuthorizationProvider(inner, shared_cache=cache)
+
+        await provider.delete_relationships_by_filter(
+            resource_type="workspace", resource_id="ws1"
+        )
+
+        assert cache.get(("workspace:ws2", "view", "user:bob")) is None
@@ -0,0 +1,268 @@
+"""Unit tests for ContentBlobStore and store-backed JobPackages.
+
+Spec: specs/shared-kernel/job-package.spec.md
+Requirement: Content-Addressable Storage
+"""
+
+from __future__ import annotations
+
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from shared_kernel.job_package.blob_store import ContentBlobStore, collect_garbage_in
+from shared_kernel.job_package.builder import JobPackageBuilder
+from shared_kernel.job_package.checksum import compute_content_checksum
+from shared_kernel.job_package.reader import JobPackageReader
+from shared_kernel.job_package.value_objects import (
+    AdapterCheckpoint,
+    ChangeOperation,
+    ChangesetEntry,
+    ContentRef,
+    SyncMode,
+)
+
+
+def _build_package(
+    work_dir: Path,
+    files: dict[str, bytes],
+    blob_store: ContentBlobStore | None,
+    spool_dir: Path | None = None,
+) -> Path:
+    builder = JobPackageBuilder(
+        data_source_id="ds-01",
+        knowledge_graph_id="kg-01",
+        sync_mode=SyncMode.FULL_REFRESH,
+        spool_dir=spool_dir,
+        blob_store=blob_store,
+    )
+    for path, content in files.items():
+        ref = builder.add_content(content)
+        builder.add_changeset_entry(
+            ChangesetEntry(
+                operation=ChangeOperation.ADD,
+                id=path,
+                type="io.kartograph.change.file",
+                path=path,
+                content_ref=ref,
+                content_type="text/x-python",
+                metadata={},
+            )
+        )
+    builder.set_checkpoint(AdapterCheckpoint(schema_version="1.0.0", data={}))
+    return builder.build(work_dir)
+
+
+def _blob_names(store: ContentBlobStore, work_dir: Path) -> set[str]:
+    objects_dir = work_dir / "blobs" / store.tenant_id / "objects"
+    return {path.name for path in objects_dir.rglob("*") if path.is_file()}
+
+
+class TestContentBlobStore:
+    """Writing and reading individual blobs."""
+
+    def test_put_bytes_stores_content_once(self, tmp_path: Path):
+        store = ContentBlobStore(work_dir=tmp_path, tenant_id="tenant-a")
+        ref = ContentRef.from_bytes(b"hello")
+
+        assert store.put_bytes(b"hello", ref) is True
+        assert store.put_bytes(b"hello", ref) is False
+        with store.open(ref) as blob:
+            assert blob.read() == b"hello"
+        assert store.blob_path(ref).parent.name == ref.hex_digest[:2]
+
+    def test_put_rejects_content_not_matching_ref(self, tmp_path: Path):
+        store = ContentBlobStore(work_dir=tmp_path, tenant_id="tenant-a")
+        ref = ContentRef.from_bytes(b"expected")
+        source = tmp_path / "source"
+        source.write_bytes(b"something else")
+
+        with pytest.raises(ValueError):
+            store.put_bytes(b"something else", ref)
+        with pytest.raises(ValueError):
+            store.put_file(source, ref)
+
+        assert not store.contains(ref)
+        assert _blob_names(store, tmp_path) == set()
+
+    def test_open_missing_blob_raises_key_error(self, tmp_path: Path):
+        store = ContentBlobStore(work_dir=tmp_path, tenant_id="tenant-a")
+
+        with pytest.raises(KeyError):
+            store.open(ContentRef.from_bytes(b"absent"))
+
+    @pytest.mark.parametrize("tenant_id", ["", "../other", "a/b", "."])
+    def test_rejects_tenant_ids_that_are_not_plain_identifiers(
+        self, tmp_path: Path, tenant_id: str
+    ):
+        with pytest.raises(ValueError):
+            ContentBlobStore(work_dir=tmp_path, tenant_id=tenant_id)
+
+
+class TestStoreBackedPackages:
+    """Packages whose content lives in the blob store.
+
+    Scenario: Cross-package content store
+    """
+
+    def test_archive_references_content_instead_of_embedding_it(self, tmp_path: Path):
+        store = ContentBlobStore(work_dir=tmp_path, tenant_id="tenant-a")
+        archive_path = _build_package(tmp_path, {"src/a.py": b"a = 1\n"}, store)
+
+        with zipfile.ZipFile(archive_path) as zf:
+            assert not [name for name in zf.namelist() if name.startswith("content/")]
+        manifest = JobPackageReader(archive_path).read_manifest()
+        assert manifest.content_store == "tenant-a"
+        assert manifest.format_version == "1.1.0"
+        assert store.contains(ContentRef.from_bytes(b"a = 1\n"))
+
+    def test_repeated_build_writes_only_new_content(self, tmp_path: Path):
+        store = ContentBlobStore(work_dir=tmp_path, tenant_id="tenant-a")
+        _build_package(tmp_path, {"a.py": b"a", "b.py": b"b"}, store)
+        unchanged_blob = store.blob_path(ContentRef.from_bytes(b"a"))
+        mtime = unchanged_blob.stat().st_mtime_ns
+
+        _build_package(tmp_path, {"a.py": b"a", "b.py": b"b2"}, store)
+
+        assert unchanged_blob.stat().st_mtime_ns == mtime
+        assert len(_blob_names(store, tmp_path)) == 3
+
+    def test_spooled_content_is_moved_into_store(self, tmp_path: Path):
+        store = ContentBlobStore(work_dir=tmp_path, tenant_id="tenant-a")
+        spool_dir = tmp_path / "spool"
+
+        archive_path = _build_package(
+            tmp_path, {"a.py": b"spooled"}, store, spool_dir=spool_dir
+        )
+
+        content = JobPackageReader(archive_path).read_content(
+            ContentRef.from_bytes(b"spooled")
+        )
+        assert content == b"spooled"
+        assert not list(spool_dir.iterdir())
+
+    def test_reader_resolves_content_from_store(self, tmp_path: Path):
+        store = ContentBlobStore(work_dir=tmp_path, tenant_id="tenant-a")
+        archive_path = _build_package(
+            tmp_path, {"src/a.py": b"a = 1\n", "src/b.py": b"b = 2\n"}, store
+        )
+        dest = tmp_path / "out"
+
+        with JobPackageReader(archive_path) as reader:
+            assert reader.read_content(ContentRef.from_bytes(b"a = 1\n")) == b"a = 1\n"
+            targets = [(e.path, e.content_ref) for e in reader.iter_changeset()]
+            assert reader.extract_many(targets, dest) == 2
+
+        assert (dest / "src/b.py").read_bytes() == b"b = 2\n"
+
+    def test_reader_verifies_store_content(self, tmp_path: Path):
+        store = ContentBlobStore(work_dir=tmp_path, tenant_id="tenant-a")
+        archive_path = _build_package(tmp_path, {"a.py": b"original"}, store)
+        ref = ContentRef.from_bytes(b"original")
+        store.blob_path(ref).write_bytes(b"CORRUPTED DATA")
+
+        with pytest.raises(ValueError, match="[Ii]ntegrity"):
+            JobPackageReader(archive_path).read_content(ref)
+
+    def test_extract_archive_writes_content_directory(self, tmp_path: Path):
+        store = ContentBlobStore(work_dir=tmp_path, tenant_id="tenant-a")
+        archive_path = _build_package(tmp_path, {"a.py": b"a", "b.py": b"a"}, store)
+        dest = tmp_path / "context"
+
+        JobPackageReader(archive_path).extract_archive(dest)
+
+        ref = ContentRef.from_bytes(b"a")
+        assert (dest / "content" / ref.filename).read_bytes() == b"a"
+        assert (dest / "manifest.json").is_file()
+        assert (dest / "changeset.jsonl").is_file()
+
+    def test_content_checksum_matches_embedded_package(self, tmp_path: Path):
+        """The checksum is defined the same way whether or not content is embedded."""
+        store = ContentBlobStore(work_dir=tmp_path, tenant_id="tenant-a")
+        files = {"a.py": b"a", "b.py": b"b"}
+        _build_package(tmp_path, {"a.py": b"a"}, store)
+        stored = _build_package(tmp_path, files, store, spool_dir=tmp_path / "spool")
+        (tmp_path / "embedded").mkdir()
+        embedded = _build_package(tmp_path / "embedded", files, None)
+        dest = tmp_path / "context"
+
+        with JobPackageReader(stored) as reader:
+            reader.extract_archive(dest)
+            manifest = reader.read_manifest()
+
+        assert manifest.content_checksum == compute_content_checksum(dest / "content")
+        assert (
+            manifest.content_checksum
+            == JobPackageReader(embedded).read_manifest().content_checksum
+        )
+
+    def test_tenants_do_not_share_blobs(self, tmp_path: Path):
+        store_a = ContentBlobStore(work_dir=tmp_path, tenant_id="tenant-a")
+        store_b = ContentBlobStore(work_dir=tmp_path, tenant_id="tenant-b")
+        _build_package(tmp_path, {"a.py": b"shared"}, store_a)
+
+        assert not store_b.contains(ContentRef.from_bytes(b"shared"))
+
+
+class TestCollectGarbage:
+    """Releasing blobs once the packages referencing them are gone.
+
+    Scenario: Content store retention
+    """
+
+    def test_keeps_blobs_of_existing_packages(self, tmp_path: Path):
+        store = ContentBlobStore(work_dir=tmp_path, tenant_id="tenant-a")
+        _build_package(tmp_path, {"a.py": b"a"}, store)
+
+        collection = store.collect_garbage()
+
+        assert collection.removed_blobs == 0
+        assert store.contains(ContentRef.from_bytes(b"a"))
+
+    def test_removed_archive_releases_only_its_own_blobs(self, tmp_path: Path):
+        store = ContentBlobStore(work_dir=tmp_path, tenant_id="tenant-a")
+        old_archive = _build_package(tmp_path, {"a.py": b"a", "b.py": b"b"}, store)
+        _build_package(tmp_path, {"a.py": b"a", "b.py": b"b2"}, store)
+        old_archive.unlink()
+
+        collection = store.collect_garbage()
+
+        assert collection.released_packages == 1
+        assert collection.removed_blobs == 1
+        assert collection.removed_bytes == 1
+        assert not store.contains(ContentRef.from_bytes(b"b"))
+        assert store.contains(ContentRef.from_bytes(b"a"))
+        assert store.contains(ContentRef.from_bytes(b"b2"))
+
+    def test_failed_build_releases_its_references(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        store = ContentBlobStore(work_dir=tmp_path, tenant_id="tenant-a")
+
+        def _fail(*args, **kwargs):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(JobPackageBuilder, "_write_json", _fail)
+        with pytest.raises(OSError, match="disk full"):
+            _build_package(tmp_path, {"a.py": b"a"}, store)
+
+        assert not list(tmp_path.glob("*.zip"))
+        assert store.collect_garbage().removed_blobs == 1
+
+    def test_collects_every_tenant_under_work_dir(self, tmp_path: Path):
+        store_a = ContentBlobStore(work_dir=tmp_path, tenant_id="tenant-a")
+        store_b = ContentBlobStore(work_dir=tmp_path, tenant_id="tenant-b")
+        _build_package(tmp_path, {"a.py": b"a"}, store_a).unlink()
+        _build_package(tmp_path, {"b.py": b"b"}, store_b).unlink()
+        kept = _build_package(tmp_path, {"c.py": b"c"}, store_b)
+
+        collection = collect_garbage_in(tmp_path)
+
+        assert collection.released_packages == 2
+        assert collection.removed_blobs == 2
+        assert kept.is_file()
+        assert store_b.contains(ContentRef.from_bytes(b"c"))
+
+    def test_collecting_an_empty_work_dir_is_a_no_op(self, tmp_path: Path):
+        assert collect_garbage_in(tmp_path).released_packages == 0
@@ -6,13 +6,16 @@ Requirement: Package Structure, Changeset Format, Content-Addressable Storage
 
 from __future__ import annotations
 
+import io
 import json
+import random
 import zipfile
 from pathlib import Path
 
 import pytest
 
 from shared_kernel.job_package.builder import JobPackageBuilder
+from shared_kernel.job_package.checksum import compute_content_checksum
 from shared_kernel.job_package.value_objects import (
     AdapterCheckpoint,
     ChangeOperation,
@@ -336,6 +339,139 @@ class TestJobPackageBuilderContentAddressable:
         record = json.loads(lines[0])
         assert record["content_ref"].startswith("sha256:")
 
+    def test_spooled_content_file_matches_in_memory_content(self, tmp_path: Path):
+        """Content registered as a file packages exactly like in-memory bytes."""
+        content = b"spooled content"
+        entry, ref = _make_entry(content=content)
+        spooled = tmp_path / "spool" / ref.hex_digest
+        spooled.parent.mkdir()
+        spooled.write_bytes(content)
+        checkpoint = AdapterCheckpoint(schema_version="1.0.0", data={})
+
+        archives = []
+        for name, register in (
+            ("memory", lambda b: b.add_content(content)),
+            ("file", lambda b: b.add_content_file(spooled, ref)),
+        ):
+            builder = JobPackageBuilder(
+                data_source_id="ds-01",
+                knowledge_graph_id="kg-01",
+                sync_mode=SyncMode.FULL_REFRESH,
+            )
+            register(builder)
+            builder.add_changeset_entry(entry)
+            builder.set_checkpoint(checkpoint)
+            out_dir = tmp_path / name
+            out_dir.mkdir()
+            with zipfile.ZipFile(builder.build(out_dir)) as zf:
+                archives.append(
+                    (
+                        json.loads(zf.read("manifest.json"))["content_checksum"],
+                        zf.read(f"content/{ref.hex_digest}"),
+                    )
+                )
+
+        assert archives[0] == archives[1]
+        assert archives[1][1] == content
+
+
+class TestJobPackageBuilderStreaming:
+    """Tests for disk-backed content and store-only compression."""
+
+    def _build(self, builder: JobPackageBuilder, entries, out_dir: Path) -> Path:
+        for entry in entries:
+            builder.add_changeset_entry(entry)
+        builder.set_checkpoint(AdapterCheckpoint(schema_version="1.0.0", data={}))
+        out_dir.mkdir(exist_ok=True)
+        return builder.build(out_dir)
+
+    def test_spool_dir_keeps_content_on_disk_until_build(self, tmp_path: Path):
+        builder = JobPackageBuilder(
+            data_source_id="ds-01",
+            knowledge_graph_id="kg-01",
+            sync_mode=SyncMode.FULL_REFRESH,
+            spool_dir=tmp_path / "spool",
+        )
+        ref = builder.add_content(b"spooled bytes")
+        streamed_ref = builder.add_content_stream(io.BytesIO(b"streamed bytes"))
+        spooled = list((tmp_path / "spool").rglob("*"))
+        assert any(path.name == ref.hex_digest for path in spooled)
+        assert any(path.name == streamed_ref.hex_digest for path in spooled)
+
+        entry, _ = _make_entry(content=b"spooled bytes")
+        streamed_entry, _ = _make_entry(content=b"streamed bytes", item_id="item-2")
+        archive_path = self._build(builder, [entry, streamed_entry], tmp_path / "out")
+
+        with zipfile.ZipFile(archive_path) as zf:
+            assert zf.read(f"content/{ref.hex_digest}") == b"spooled bytes"
+            assert zf.read(f"content/{streamed_ref.hex_digest}") == b"streamed bytes"
+        # The spool is cleaned up once the archive is written
+        assert list((tmp_path / "spool").iterdir()) == []
+
+    def test_checksum_matches_extracted_content_directory(self, tmp_path: Path):
+        builder = JobPackageBuilder(
+            data_source_id="ds-01",
+            knowledge_graph_id="kg-01",
+            sync_mode=SyncMode.FULL_REFRESH,
+            spool_dir=tmp_path / "spool",
+        )
+        entries = []
+        for i in range(5):
+            content = f"file {i}\n".encode() * (i + 1)
+            builder.add_content(content)
+            entries.append(_make_entry(content=content, item_id=f"item-{i}")[0])
+        archive_path = self._build(builder, entries, tmp_path / "out")
+
+        with zipfile.ZipFile(archive_path) as zf:
+            zf.extractall(tmp_path / "extracted")
+            manifest = json.loads(zf.read("manifest.json"))
+
+        assert manifest["content_checksum"] == compute_content_checksum(
+            tmp_path / "extracted" / "content"
+        )
+
+    def test_incompressible_content_is_stored(self, tmp_path: Path):
+        builder = JobPackageBuilder(
+            data_source_id="ds-01",
+            knowledge_graph_id="kg-01",
+            sync_mode=SyncMode.FULL_REFRESH,
+        )
+        text = b"def main():\n    return 42\n" * 400
+        noise = random.Random(0).randbytes(16384)
+        png = b"\x89PNG\r\n\x1a\n" + b"\x00" * 1024
+        refs = [builder.add_content(c) for c in (text, noise, png)]
+        entries = [
+            ChangesetEntry(
+                operation=ChangeOperation.ADD,
+                id=f"item-{i}",
+                type="io.kartograph.change.file",
+                path=path,
+                content_ref=ref,
+                content_type=content_type,
+                metadata={},
+            )
+            for i, (ref, path, content_type) in enumerate(
+                zip(
+                    refs,
+                    ["src/main.py", "data/blob.bin", "docs/logo.png"],
+                    ["text/x-python", "application/octet-stream", "image/png"],
+                )
+            )
+        ]
+        archive_path = self._build(builder, entries, tmp_path / "out")
+
+        with zipfile.ZipFile(archive_path) as zf:
+            compress_types = [
+                zf.getinfo(f"content/{ref.hex_digest}").compress_type for ref in refs
+            ]
+            assert zf.read(f"content/{refs[1].hex_digest}") == noise
+
+        assert compress_types == [
+            zipfile.ZIP_DEFLATED,
+            zipfile.ZIP_STORED,
+            zipfile.ZIP_STORED,
+        ]
+
 
 class TestJobPackageBuilderChangeset:
     """Tests for changeset JSONL format.
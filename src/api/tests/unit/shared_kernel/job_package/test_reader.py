@@ -13,7 +13,11 @@ from pathlib import Path
 import pytest
 
 from shared_kernel.job_package.builder import JobPackageBuilder
-from shared_kernel.job_package.reader import JobPackageReader
+from shared_kernel.job_package.reader import (
+    JobPackageReader,
+    PackageExtraction,
+    extract_packages,
+)
 from shared_kernel.job_package.value_objects import (
     AdapterCheckpoint,
     ChangeOperation,
@@ -289,3 +293,128 @@ class TestJobPackageReaderPathSafety:
         evil_zip = self._build_tampered_zip(tmp_path, "/evil")
         with pytest.raises(ValueError):
             JobPackageReader(evil_zip)
+
+
+class TestJobPackageReaderHandle:
+    """Tests for the context-managed, single-handle reader.
+
+    Scenario: Persistent archive handle
+    """
+
+    def test_context_manager_opens_archive_once(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """All reads inside a with block share one ZipFile."""
+        archive_path = _build_simple_package(tmp_path)
+        reader = JobPackageReader(archive_path)
+        opened: list[object] = []
+        original = zipfile.ZipFile
+
+        def _tracking_zipfile(*args, **kwargs):
+            zf = original(*args, **kwargs)
+            opened.append(zf)
+            return zf
+
+        monkeypatch.setattr(zipfile, "ZipFile", _tracking_zipfile)
+        with reader:
+            reader.read_manifest()
+            for entry in reader.iter_changeset():
+                reader.read_content(entry.content_ref)
+            reader.read_checkpoint()
+
+        assert len(opened) == 1
+
+    def test_reader_usable_after_close(self, tmp_path: Path):
+        """Outside a with block the reader opens the archive per call."""
+        archive_path = _build_simple_package(tmp_path)
+        with JobPackageReader(archive_path) as reader:
+            pass
+
+        assert reader.read_manifest().entry_count == 1
+
+
+def _tamper_content(archive_path: Path, tampered_path: Path) -> None:
+    with (
+        zipfile.ZipFile(archive_path) as zf_in,
+        zipfile.ZipFile(tampered_path, "w") as zf_out,
+    ):
+        for item in zf_in.infolist():
+            data = zf_in.read(item.filename)
+            if item.filename.startswith("content/"):
+                data = b"CORRUPTED DATA"
+            zf_out.writestr(item, data)
+
+
+class TestJobPackageReaderExtractMany:
+    """Tests for streaming content straight to disk.
+
+    Scenario: Bulk extraction
+    """
+
+    def test_extract_many_writes_files(self, tmp_path: Path):
+        archive_path = _build_simple_package(tmp_path)
+        ref = ContentRef.from_bytes(b"hello reader")
+        dest = tmp_path / "out"
+
+        with JobPackageReader(archive_path) as reader:
+            written = reader.extract_many(
+                [("src/reader.py", ref), ("copies/reader.py", ref)], dest
+            )
+
+        assert written == 2
+        assert (dest / "src/reader.py").read_bytes() == b"hello reader"
+        assert (dest / "copies/reader.py").read_bytes() == b"hello reader"
+        assert not list(dest.rglob("*.part"))
+
+    def test_extract_many_verifies_integrity_during_copy(self, tmp_path: Path):
+        """A hash mismatch raises and leaves no file behind."""
+        tampered_path = tmp_path / "tampered.zip"
+        _tamper_content(_build_simple_package(tmp_path), tampered_path)
+        ref = ContentRef.from_bytes(b"hello reader")
+        dest = tmp_path / "out"
+
+        with (
+            JobPackageReader(tampered_path) as reader,
+            pytest.raises(ValueError, match="[Ii]ntegrity"),
+        ):
+            reader.extract_many([("src/reader.py", ref)], dest)
+
+        assert not any(path.is_file() for path in dest.rglob("*"))
+
+    def test_extract_many_rejects_unsafe_destination(self, tmp_path: Path):
+        archive_path = _build_simple_package(tmp_path)
+        ref = ContentRef.from_bytes(b"hello reader")
+
+        with pytest.raises(ValueError):
+            JobPackageReader(archive_path).extract_many(
+                [("../escape.py", ref)], tmp_path / "out"
+            )
+
+        assert not (tmp_path / "escape.py").exists()
+
+
+class TestExtractPackages:
+    """Tests for extracting several packages in parallel.
+
+    Scenario: Bulk extraction
+    """
+
+    def test_extracts_each_package_in_input_order(self, tmp_path: Path):
+        ref = ContentRef.from_bytes(b"hello reader")
+        for i in range(3):
+            (tmp_path / f"pkg-{i}").mkdir()
+        extractions = [
+            PackageExtraction(
+                archive_path=_build_simple_package(tmp_path / f"pkg-{i}"),
+                targets=(("src/reader.py", ref),) * (i + 1),
+                dest=tmp_path / "out" / f"repo-{i}",
+            )
+            for i in range(3)
+        ]
+
+        counts = extract_packages(extractions, max_workers=3)
+
+        assert counts == [1, 2, 3]
+        for i in range(3):
+            output = tmp_path / "out" / f"repo-{i}" / "src/reader.py"
+            assert output.read_bytes() == b"hello reader"
@@ -90,6 +90,21 @@ class TestOutboxWorkerProbeProtocol:
         assert logs[0]["event_types"] == sorted({"GroupCreated", "MemberAdded"})
         assert logs[0]["event_count"] == 2
 
+    def test_batch_processed_logs_throughput_and_lag(self):
+        """batch_processed reports events per second and the oldest entry's age."""
+        import structlog.testing
+
+        probe = DefaultOutboxWorkerProbe()
+
+        with structlog.testing.capture_logs() as logs:
+            probe.batch_processed(50, duration_seconds=0.5, lag_seconds=2.25)
+
+        assert len(logs) == 1
+        assert logs[0]["event"] == "outbox_batch_processed"
+        assert logs[0]["count"] == 50
+        assert logs[0]["events_per_second"] == 100.0
+        assert logs[0]["lag_seconds"] == 2.25
+
     def test_default_probe_implements_all_protocol_methods(self):
         """DefaultOutboxWorkerProbe should implement all protocol methods."""
         probe = DefaultOutboxWorkerProbe()
@@ -102,10 +117,15 @@ class TestOutboxWorkerProbeProtocol:
         probe.event_processing_failed(uuid4(), "Error message", 1)
         probe.event_moved_to_dlq(uuid4(), "GroupCreated", "Max retries exceeded")
         probe.batch_processed(5)
+        probe.batch_processed(5, duration_seconds=0.5, lag_seconds=2.0)
         probe.listen_loop_started()
         probe.poll_loop_started()
         probe.poll_loop_error("Connection error")
         probe.handler_registered("SpiceDBEventHandler", frozenset({"GroupCreated"}))
+        probe.shards_assigned([0, 1], 4)
+        probe.shard_heartbeat_failed("Connection error")
+        probe.retention_completed(10, 2, 0.5)
+        probe.retention_failed("Connection error")
 
 
 class TestEventSourceProbeProtocol:
@@ -171,6 +191,21 @@ class TestEventSourceProbeProtocol:
         # Should not raise
         probe.listener_error("Connection refused")
 
+    def test_batch_processed_logs_throughput_and_lag(self):
+        """batch_processed reports events per second and the oldest entry's age."""
+        import structlog.testing
+
+        probe = DefaultOutboxWorkerProbe()
+
+        with structlog.testing.capture_logs() as logs:
+            probe.batch_processed(50, duration_seconds=0.5, lag_seconds=2.25)
+
+        assert len(logs) == 1
+        assert logs[0]["event"] == "outbox_batch_processed"
+        assert logs[0]["count"] == 50
+        assert logs[0]["events_per_second"] == 100.0
+        assert logs[0]["lag_seconds"] == 2.25
+
     def test_default_probe_implements_all_protocol_methods(self):
         """DefaultEventSourceProbe should implement all protocol methods."""
         probe = DefaultEventSourceProbe()
@@ -119,6 +119,26 @@ class TestAutoCreateGate:
             client.connect()
             mock_ensure.assert_called_once()
 
+    def test_connect_skips_setup_age_when_graph_already_checked(self, mock_db_settings):
+        """connect() with check_graph=False must not run age.setUpAge()."""
+        from unittest.mock import patch
+
+        mock_factory, mock_conn = self._make_mock_factory()
+
+        client = AgeGraphClient(
+            mock_db_settings, connection_factory=mock_factory, check_graph=False
+        )
+
+        with (
+            patch("age.setUpAge") as mock_setup,
+            patch(
+                "graph.infrastructure.age_client._register_agtype_parser"
+            ) as mock_register,
+        ):
+            client.connect()
+            mock_setup.assert_not_called()
+            mock_register.assert_called_once_with(mock_conn)
+
 
 class TestConnectionState:
     """Tests for connection state management."""
@@ -73,6 +73,7 @@ def mock_iam_settings_single_tenant():
     settings.single_tenant_mode = True
     settings.default_tenant_name = "default"
     settings.default_workspace_name = None
+    settings.api_key_usage_flush_interval_seconds = 30
     return settings
 
 
@@ -83,6 +84,7 @@ def mock_iam_settings_multi_tenant():
     settings.single_tenant_mode = False
     settings.default_tenant_name = "default"
     settings.default_workspace_name = None
+    settings.api_key_usage_flush_interval_seconds = 30
     return settings
 
 
@@ -105,6 +107,11 @@ def mock_outbox_settings_enabled():
     settings.poll_interval_seconds = 30
     settings.batch_size = 100
     settings.max_retries = 5
+    settings.shard_count = 0
+    settings.archive_after_hours = 24
+    settings.archive_retention_days = 30
+    settings.retention_interval_seconds = 600
+    settings.retention_batch_size = 5000
     return settings
 
 
@@ -311,6 +318,7 @@ class TestSingleTenantBootstrap:
         mock_iam_settings.single_tenant_mode = True
         mock_iam_settings.default_tenant_name = "acme-corp"
         mock_iam_settings.default_workspace_name = None  # triggers fallback
+        mock_iam_settings.api_key_usage_flush_interval_seconds = 30
 
         mock_bootstrap_instance = AsyncMock()
         mock_bootstrap_cls = MagicMock(return_value=mock_bootstrap_instance)
@@ -500,7 +508,7 @@ class TestOutboxWorkerLifecycle:
     ):
         """GIVEN the outbox worker is running
         WHEN the application shuts down
-        THEN the worker stops gracefully.
+        THEN the worker and the retention task stop gracefully.
         """
         from main import kartograph_lifespan
 
@@ -550,6 +558,7 @@ class TestOutboxWorkerLifecycle:
 
         # Worker should have been stopped during shutdown
         mock_worker.stop.assert_called_once()
+        assert app.state.outbox_retention_task.done()
 
 
 # ---------------------------------------------------------------------------